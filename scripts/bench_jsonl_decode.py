@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for export-stream JSONL splitting and decoding.
+
+Builds a synthetic Raw Export body, cuts it into fixed-size chunks the way
+``httpx`` hands over gzip-decoded data, and measures events/second for:
+
+- ``legacy``: the previous per-line ``bytearray`` reader + ``json.loads``
+- ``split+json``: ``jsonl.iter_lines`` + stdlib ``json``
+- ``split+<backend>``: ``jsonl.iter_records`` with the installed fast
+  backend (only when orjson or msgspec is available)
+
+Usage:
+
+```
+uv run python scripts/bench_jsonl_decode.py [--events N] [--chunk-size BYTES]
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable, Iterator
+
+from mixpanel_headless._internal.jsonl import (
+    JSON_BACKEND,
+    _stdlib_loads,
+    iter_lines,
+    iter_records,
+)
+
+
+def _sample_event(n: int) -> dict[str, object]:
+    """Return a representative exported event."""
+    return {
+        "event": "Page View",
+        "properties": {
+            "time": 1_700_000_000 + n,
+            "distinct_id": f"user-{n % 5000}",
+            "$insert_id": f"{n:032x}",
+            "$browser": "Chrome",
+            "$city": "San Francisco",
+            "$current_url": "https://example.com/pricing?ref=nav",
+            "mp_lib": "web",
+            "plan": "pro",
+            "items": [1, 2, 3],
+        },
+    }
+
+
+def _legacy(chunks: list[bytes]) -> Iterator[object]:
+    """Reproduce the per-line reader that compacted the buffer on every line."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer.extend(chunk)
+        while True:
+            newline_pos = buffer.find(b"\n")
+            if newline_pos == -1:
+                break
+            line = bytes(buffer[:newline_pos])
+            del buffer[: newline_pos + 1]
+            line_str = line.decode("utf-8", errors="replace").strip()
+            if line_str:
+                yield json.loads(line_str)
+
+
+def _split_stdlib(chunks: list[bytes]) -> Iterator[object]:
+    """Chunk-level splitter with the stdlib decoder."""
+    return (_stdlib_loads(line) for line in iter_lines(chunks))
+
+
+def _split_fast(chunks: list[bytes]) -> Iterator[object]:
+    """Chunk-level splitter with the active backend."""
+    return iter_records(iter_lines(chunks))
+
+
+def _measure(
+    fn: Callable[[list[bytes]], Iterator[object]], chunks: list[bytes]
+) -> float:
+    """Return events/second for one full pass."""
+    start = time.perf_counter()
+    count = sum(1 for _ in fn(chunks))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = b"".join(
+        json.dumps(_sample_event(n)).encode() + b"\n" for n in range(args.events)
+    )
+    chunks = [
+        body[i : i + args.chunk_size] for i in range(0, len(body), args.chunk_size)
+    ]
+    cases: list[tuple[str, Callable[[list[bytes]], Iterator[object]]]] = [
+        ("legacy", _legacy),
+        ("split+json", _split_stdlib),
+    ]
+    if JSON_BACKEND != "json":
+        cases.append((f"split+{JSON_BACKEND}", _split_fast))
+
+    print(
+        f"{args.events:,} events, {len(body) / 1e6:.1f} MB, "
+        f"{args.chunk_size:,}-byte chunks"
+    )
+    baseline = 0.0
+    for name, fn in cases:
+        rate = max(_measure(fn, chunks) for _ in range(args.repeat))
+        baseline = baseline or rate
+        print(f"  {name:<16} {rate:>12,.0f} events/s  {rate / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
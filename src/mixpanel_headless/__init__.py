@@ -31,6 +31,7 @@ from mixpanel_headless._literal_types import (
     InsightsMode,
     MathType,
     PerUserAggregation,
+    QuerySpecKind,
     QueryTimeUnit,
     RetentionAlignment,
     RetentionMathType,
@@ -42,6 +43,7 @@ from mixpanel_headless._literal_types import (
     TimeUnit,
 )
 from mixpanel_headless.accounts import login_unified
+from mixpanel_headless.async_workspace import AsyncWorkspace
 from mixpanel_headless.auth_types import (
     Account,
     AccountType,
@@ -60,7 +62,9 @@ from mixpanel_headless.exceptions import (
     APIError,
     AuthenticationError,
     BookmarkValidationError,
+    BulkOperationError,
     BusinessContextValidationError,
+    CircuitOpenError,
     ConfigError,
     DateRangeTooLargeError,
     EventNotFoundError,
@@ -115,6 +119,7 @@ from mixpanel_headless.types import (
     BulkCreateSchemasResponse,
     # Data Governance types (Phase 027)
     BulkEventUpdate,
+    BulkOptions,
     BulkPatchResult,
     BulkPropertyUpdate,
     BulkUpdateAnomalyParams,
@@ -124,6 +129,7 @@ from mixpanel_headless.types import (
     BulkUpdatePropertiesParams,
     BusinessContext,
     BusinessContextChain,
+    ClientStats,
     Cohort,
     CohortBreakdown,
     CohortCreator,
@@ -155,6 +161,7 @@ from mixpanel_headless.types import (
     CustomPropertyRef,
     CustomPropertyResourceType,
     Dashboard,
+    DashboardReport,
     DashboardRow,
     DashboardRowContent,
     DataVolumeAnomaly,
@@ -166,12 +173,14 @@ from mixpanel_headless.types import (
     EventCountsResult,
     EventDefinition,
     EventDeletionRequest,
+    EventExportResult,
     Exclusion,
     Experiment,
     ExperimentConcludeParams,
     ExperimentCreator,
     ExperimentDecideParams,
     ExperimentStatus,
+    FamilyStats,
     FeatureFlag,
     FeatureFlagStatus,
     Filter,
@@ -215,8 +224,10 @@ from mixpanel_headless.types import (
     NumericSumResult,
     OAuthLoginResult,
     PaginatedResponse,
+    ParquetExportResult,
     PreviewDeletionFiltersParams,
     ProfilePageResult,
+    ProjectOutcome,
     ProjectWebhook,
     PropertyCountsResult,
     PropertyDefinition,
@@ -224,14 +235,20 @@ from mixpanel_headless.types import (
     PropertyResourceType,
     PropertySpec,
     PublicWorkspace,
+    QueryCacheConfig,
     QueryMeta,
+    QueryOutcome,
     QueryResult,
+    QuerySpec,
+    RateLimit,
     RcaSourceData,
     ReplaceSchemaEnforcementParams,
+    RequestEvent,
     RetentionCohortData,
     RetentionEvent,
     RetentionQueryResult,
     RetentionResult,
+    RetryPolicy,
     SavedCohort,
     SavedReportResult,
     SavedReportType,
@@ -279,6 +296,7 @@ __version__ = "0.1.1"
 __all__ = [
     # Core
     "Workspace",
+    "AsyncWorkspace",
     # Auth redesign (042) types
     "Account",
     "AccountType",
@@ -328,6 +346,7 @@ __all__ = [
     "FlowAnchorType",
     # Type aliases — insights
     "InsightsMode",
+    "QuerySpecKind",
     # Type aliases — filter types
     "CustomPropertyType",
     "FilterOperator",
@@ -364,6 +383,8 @@ __all__ = [
     "QueryError",
     "ServerError",
     "EventNotFoundError",
+    "BulkOperationError",
+    "CircuitOpenError",
     "DateRangeTooLargeError",
     "OAuthError",
     "RegionProbeError",
@@ -581,4 +602,20 @@ __all__ = [
     "TimeComparison",
     "FrequencyBreakdown",
     "FrequencyFilter",
+    # Export results
+    "EventExportResult",
+    "ParquetExportResult",
+    # Batch queries
+    "QuerySpec",
+    "QueryOutcome",
+    "DashboardReport",
+    "ProjectOutcome",
+    # HTTP client tuning
+    "RateLimit",
+    "BulkOptions",
+    "RetryPolicy",
+    "QueryCacheConfig",
+    "ClientStats",
+    "FamilyStats",
+    "RequestEvent",
 ]
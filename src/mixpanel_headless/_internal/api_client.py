@@ -4,6 +4,7 @@ Low-level HTTP client for all Mixpanel APIs. Handles:
 - Authentication via HTTP Basic auth (service accounts) or OAuth 2.0 Bearer tokens
 - Regional endpoint routing (US, EU, India)
 - Automatic rate limit handling with exponential backoff
+- Coalescing of concurrent identical read requests (single-flight)
 - Streaming JSONL parsing for large exports
 
 This is a private implementation detail. Users should use the Workspace class
@@ -12,19 +13,25 @@ or service layer instead of accessing this module directly.
 
 from __future__ import annotations
 
+import gzip
+import itertools
 import json
 import logging
+import math
 import os
 import random
 import re
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Collection, Generator, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, Any, Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
 from urllib.parse import quote
 
 import httpx
 
+from mixpanel_headless._internal import json_stream
 from mixpanel_headless._internal.auth.account import (
     Account,
     OAuthBrowserAccount,
@@ -38,10 +45,37 @@ from mixpanel_headless._internal.auth.session import (
     WorkspaceRef,
 )
 from mixpanel_headless._internal.auth.token_resolver import OnDiskTokenResolver
+from mixpanel_headless._internal.bulk import (
+    DEFAULT_BATCH_SIZES,
+    GZIP_MIN_BYTES,
+    run_batches,
+)
 from mixpanel_headless._internal.client_metadata import (
     QUERY_ORIGIN,
     get_user_agent,
 )
+from mixpanel_headless._internal.json_stream import JsonPath
+from mixpanel_headless._internal.jsonl import iter_lines, iter_records
+from mixpanel_headless._internal.metrics import (
+    ConnectionTrace,
+    EventHook,
+    RequestMetrics,
+)
+from mixpanel_headless._internal.rate_limit import RateLimiter
+from mixpanel_headless._internal.resilience import (
+    IDEMPOTENT_METHODS,
+    CircuitBreaker,
+    RetryBudget,
+    retry_delay,
+)
+from mixpanel_headless._internal.sharding import day_shards, iter_parallel
+from mixpanel_headless._internal.signed_upload import (
+    UPLOAD_CHUNK_SIZE,
+    ProgressCallback,
+    compress_to_tempfile,
+    upload_file,
+)
+from mixpanel_headless._internal.single_flight import SingleFlight, request_key
 from mixpanel_headless.exceptions import (
     AuthenticationError,
     MixpanelHeadlessError,
@@ -50,7 +84,14 @@ from mixpanel_headless.exceptions import (
     ServerError,
     WorkspaceScopeError,
 )
-from mixpanel_headless.types import ProfilePageResult, PublicWorkspace
+from mixpanel_headless.types import (
+    BulkOptions,
+    ClientStats,
+    ProfilePageResult,
+    PublicWorkspace,
+    RateLimit,
+    RetryPolicy,
+)
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -63,7 +104,9 @@ def _iter_jsonl_lines(response: httpx.Response) -> Iterator[str]:
 
     The httpx iter_lines() method can incorrectly split lines at chunk boundaries,
     especially with gzip-compressed responses. This function uses iter_bytes() with
-    manual buffering to handle incomplete lines correctly.
+    chunk-level buffering (``jsonl.LineSplitter``) to handle incomplete lines
+    correctly. ``export_events`` skips the ``str`` round trip entirely and
+    decodes raw line bytes with ``jsonl.iter_records``.
 
     Args:
         response: An httpx streaming Response object (from client.stream()).
@@ -79,27 +122,157 @@ def _iter_jsonl_lines(response: httpx.Response) -> Iterator[str]:
                 event = json.loads(line)
         ```
     """
-    # Use bytearray for efficient in-place buffer extension (bytes would copy on each +=)
-    buffer = bytearray()
-    for chunk in response.iter_bytes():
-        buffer.extend(chunk)
-        # Extract complete lines from buffer
-        while True:
-            newline_pos = buffer.find(b"\n")
-            if newline_pos == -1:
-                break
-            line = bytes(buffer[:newline_pos])
-            del buffer[: newline_pos + 1]
-            line_str = line.decode("utf-8", errors="replace").strip()
-            if line_str:
-                yield line_str
-    # Handle any remaining data in buffer (final line without trailing newline)
-    if buffer:
-        line_str = bytes(buffer).decode("utf-8", errors="replace").strip()
+    for line in iter_lines(response.iter_bytes()):
+        line_str = line.decode("utf-8", errors="replace").strip()
         if line_str:
             yield line_str
 
 
+def _profile_page_result(response: dict[str, Any], page: int) -> ProfilePageResult:
+    """Wrap a raw Engage page response in a :class:`ProfilePageResult`.
+
+    Args:
+        response: Parsed JSON body from ``POST /api/2.0/engage``.
+        page: Zero-based page index that was requested.
+
+    Returns:
+        ProfilePageResult with profiles, session_id, and page metadata.
+    """
+    profiles = response.get("results", [])
+    returned_session_id = response.get("session_id")
+    has_more = returned_session_id is not None
+
+    # Extract pagination metadata for pre-computed page approach
+    total = response.get("total", 0)
+    page_size = response.get("page_size", 1000)
+
+    return ProfilePageResult(
+        profiles=profiles,
+        session_id=returned_session_id,
+        page=page,
+        has_more=has_more,
+        total=total,
+        page_size=page_size,
+    )
+
+
+def _validate_profile_export(
+    *,
+    distinct_id: str | None,
+    distinct_ids: list[str] | None,
+    cohort_id: str | None,
+    behaviors: list[dict[str, Any]] | None,
+    as_of_timestamp: int | None,
+    include_all_users: bool,
+) -> None:
+    """Validate the filter arguments of the profile export methods.
+
+    Args:
+        distinct_id: Single user ID to fetch.
+        distinct_ids: User IDs to fetch.
+        cohort_id: Cohort to filter by.
+        behaviors: Behavioral filter definitions.
+        as_of_timestamp: Unix timestamp for a point-in-time query.
+        include_all_users: Whether non-members are included.
+
+    Raises:
+        ValueError: If mutually exclusive parameters are provided together,
+            include_all_users is used without cohort_id, behaviors is not a
+            list, or as_of_timestamp is in the future.
+    """
+    # Validate mutually exclusive parameters
+    if distinct_id is not None and distinct_ids is not None:
+        raise ValueError(
+            "distinct_id and distinct_ids are mutually exclusive. "
+            "Provide only one to fetch specific profiles."
+        )
+
+    if behaviors is not None and cohort_id is not None:
+        raise ValueError(
+            "behaviors and cohort_id are mutually exclusive. "
+            "Use behaviors for behavioral filtering or cohort_id for cohort membership."
+        )
+
+    if include_all_users and cohort_id is None:
+        raise ValueError(
+            "include_all_users requires cohort_id. "
+            "This parameter is only valid for cohort membership queries."
+        )
+
+    # Validate behaviors type
+    if behaviors is not None and not isinstance(behaviors, list):
+        raise ValueError("behaviors must be a list of behavioral filter dictionaries.")
+
+    # Validate as_of_timestamp is not in the future
+    if as_of_timestamp is not None:
+        current_time = int(time.time())
+        if as_of_timestamp > current_time:
+            raise ValueError(
+                "as_of_timestamp cannot be in the future. "
+                "Provide a Unix timestamp in the past to query historical profile state."
+            )
+
+
+def _check_export_replay(
+    event: dict[str, Any] | None,
+    expected_insert_id: str | None,
+    delivered: int,
+) -> None:
+    """Verify a replayed export lines up with what was already delivered.
+
+    After a dropped export stream is reissued, the first ``delivered`` events
+    of the replay are skipped. The last skipped event must be the same event
+    the caller last received, otherwise skipping would drop or repeat data.
+
+    Args:
+        event: The replay's event at position ``delivered``, or ``None`` if
+            the replay ended before reaching it.
+        expected_insert_id: ``$insert_id`` of the last event delivered to
+            the caller, or ``None`` if it had none (count-only check).
+        delivered: Number of events already delivered.
+
+    Raises:
+        MixpanelHeadlessError: With code ``EXPORT_RESUME_MISMATCH`` if the
+            replay is shorter or its boundary event differs.
+    """
+    if event is None:
+        raise MixpanelHeadlessError(
+            "Export replay ended before the previously delivered position; "
+            "cannot resume without gaps or duplicates",
+            code="EXPORT_RESUME_MISMATCH",
+            details={"delivered": delivered},
+        )
+    actual = _event_insert_id(event)
+    if expected_insert_id is not None and actual != expected_insert_id:
+        raise MixpanelHeadlessError(
+            "Export replay diverged from the interrupted stream; "
+            "cannot resume without gaps or duplicates",
+            code="EXPORT_RESUME_MISMATCH",
+            details={
+                "delivered": delivered,
+                "expected_insert_id": expected_insert_id,
+                "actual_insert_id": actual,
+            },
+        )
+
+
+def _event_insert_id(event: dict[str, Any]) -> str | None:
+    """Return an exported event's ``$insert_id``, if present.
+
+    Args:
+        event: Raw event with ``event`` and ``properties`` keys.
+
+    Returns:
+        The ``$insert_id`` string, or ``None``.
+    """
+    properties = event.get("properties")
+    if isinstance(properties, dict):
+        insert_id = properties.get("$insert_id")
+        if insert_id is not None:
+            return str(insert_id)
+    return None
+
+
 # Regional endpoint configuration
 # Each region has separate URLs for query APIs and export/data APIs
 ENDPOINTS: dict[str, dict[str, str]] = {
@@ -151,6 +324,9 @@ class MixpanelAPIClient:
         export_timeout: float = 600.0,
         max_retries: int = 3,
         token_resolver: TokenResolver | None = None,
+        rate_limits: Mapping[str, RateLimit] | None = None,
+        bulk: BulkOptions | None = None,
+        retry: RetryPolicy | None = None,
         _transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the API client.
@@ -162,6 +338,14 @@ class MixpanelAPIClient:
             max_retries: Maximum retry attempts for rate-limited requests.
             token_resolver: For OAuth accounts; defaults to
                 :class:`OnDiskTokenResolver`.
+            rate_limits: Per-family client-side limits (keys ``query``,
+                ``export``, ``engage``, ``app``) merged over the defaults.
+                Shared by every thread using this client.
+            bulk: Batching, concurrency and compression for bulk App API
+                methods. Defaults to :class:`BulkOptions` defaults.
+            retry: Retries for ``5xx`` and transport errors on idempotent
+                requests, and per-host circuit breaking. Defaults to
+                :class:`RetryPolicy` defaults.
             _transport: Internal parameter for testing with MockTransport.
         """
         self._token_resolver: TokenResolver = token_resolver or OnDiskTokenResolver()
@@ -177,7 +361,17 @@ class MixpanelAPIClient:
         self._timeout = timeout
         self._export_timeout = export_timeout
         self._max_retries = max_retries
+        self._rate_limiter = RateLimiter(rate_limits)
+        self._single_flight = SingleFlight()
+        self._metrics = RequestMetrics()
+        self._bulk = bulk or BulkOptions()
+        self._retry_policy = retry or RetryPolicy()
+        self._retry_budget = RetryBudget(self._retry_policy)
+        self._breaker = CircuitBreaker(self._retry_policy)
         self._client: httpx.Client | None = None
+        # False for clients derived by for_session(), which borrow the
+        # parent's connection pool and must not close it.
+        self._owns_client = True
         self._transport = _transport
         self._workspace_id: int | None = (
             session.workspace.id if session.workspace else None
@@ -231,6 +425,24 @@ class MixpanelAPIClient:
             path = f"/{path}"
         return f"{base}{path}"
 
+    def _api_family(self, url: str) -> str | None:
+        """Map a full URL back to its ``ENDPOINTS`` family for rate limiting.
+
+        Args:
+            url: Absolute request URL.
+
+        Returns:
+            The longest-matching family key (``engage`` wins over ``export``
+            for ``/api/2.0/engage``), or ``None`` for URLs outside
+            ``ENDPOINTS`` such as signed upload URLs.
+        """
+        family: str | None = None
+        matched = 0
+        for api_type, base in ENDPOINTS[self._session.account.region].items():
+            if url.startswith(base) and len(base) > matched:
+                family, matched = api_type, len(base)
+        return family
+
     def _ensure_client(self) -> httpx.Client:
         """Ensure the underlying HTTP client (connection pool) is initialized.
 
@@ -247,8 +459,48 @@ class MixpanelAPIClient:
                 timeout=self._timeout,
                 transport=self._transport,
             )
+            self._owns_client = True
         return self._client
 
+    def for_session(self, session: Session) -> MixpanelAPIClient:
+        """Return a client for ``session`` that shares this client's resources.
+
+        The derived client borrows this client's connection pool, token
+        resolver, rate limiter, metrics, retry budget and circuit breaker,
+        so many project snapshots can run side by side within one set of
+        limits. Everything else (auth header, workspace resolution,
+        in-flight request coalescing) is built fresh for ``session``.
+
+        Closing the derived client leaves the shared connection pool open;
+        it is released when this client is closed.
+
+        Args:
+            session: Session to bind, typically ``self.session.replace(...)``.
+
+        Returns:
+            A new client bound to ``session``.
+
+        Raises:
+            OAuthError: If ``session``'s account has no usable credentials.
+        """
+        derived = MixpanelAPIClient(
+            session=session,
+            timeout=self._timeout,
+            export_timeout=self._export_timeout,
+            max_retries=self._max_retries,
+            token_resolver=self._token_resolver,
+            bulk=self._bulk,
+            retry=self._retry_policy,
+            _transport=self._transport,
+        )
+        derived._rate_limiter = self._rate_limiter
+        derived._metrics = self._metrics
+        derived._retry_budget = self._retry_budget
+        derived._breaker = self._breaker
+        derived._client = self._ensure_client()
+        derived._owns_client = False
+        return derived
+
     def _request_headers(self, extra: dict[str, str]) -> dict[str, str]:
         """Compose the per-request header set: defaults → env → session → caller.
 
@@ -281,9 +533,14 @@ class MixpanelAPIClient:
         return headers
 
     def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client and release resources.
+
+        A client derived with :meth:`for_session` only drops its reference
+        to the shared connection pool.
+        """
         if self._client is not None:
-            self._client.close()
+            if self._owns_client:
+                self._client.close()
             self._client = None
 
     def __enter__(self) -> MixpanelAPIClient:
@@ -300,6 +557,245 @@ class MixpanelAPIClient:
         """Exit context manager, closing client."""
         self.close()
 
+    def stats(self) -> ClientStats:
+        """Return a snapshot of request metrics for this client.
+
+        Counts requests, errors, ``429`` responses, retries, backoff time,
+        bytes received (compressed and decoded), connection reuse and a
+        latency histogram per API family.
+
+        Returns:
+            Immutable metrics snapshot.
+
+        Example:
+            ```python
+            stats = client.stats()
+            query = stats.families.get("query")
+            if query:
+                print(query.requests, query.latency_quantile(0.95))
+            ```
+        """
+        return self._metrics.snapshot()
+
+    def reset_stats(self) -> None:
+        """Zero all request metrics. Registered event hooks are kept."""
+        self._metrics.reset()
+
+    def add_event_hook(self, hook: EventHook) -> None:
+        """Register a callback invoked after every request attempt.
+
+        The hook receives a :class:`~mixpanel_headless.types.RequestEvent`
+        on the requesting thread. Exceptions raised by hooks are logged and
+        ignored, so a faulty hook never fails a request.
+
+        Args:
+            hook: Callable taking one ``RequestEvent``.
+
+        Example:
+            ```python
+            client.add_event_hook(lambda e: print(e.family, e.elapsed))
+            ```
+        """
+        self._metrics.add_hook(hook)
+
+    def remove_event_hook(self, hook: EventHook) -> None:
+        """Unregister a callback added with :meth:`add_event_hook`.
+
+        Args:
+            hook: Previously registered callable.
+
+        Raises:
+            ValueError: If ``hook`` is not registered.
+        """
+        self._metrics.remove_hook(hook)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: str | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one request attempt and record it in metrics and the breaker.
+
+        Args:
+            method: HTTP method.
+            url: Full URL to request.
+            family: API family the URL belongs to (for metrics).
+            **kwargs: Passed through to ``httpx.Client.request``.
+
+        Returns:
+            The response, with its body read.
+
+        Raises:
+            CircuitOpenError: The URL's host breaker is open (nothing sent).
+            httpx.HTTPError: Transport failures (recorded before re-raising).
+        """
+        client = self._ensure_client()
+        host = self._breaker.check(url)
+        trace = ConnectionTrace()
+        ok = False
+        start = time.perf_counter()
+        try:
+            response = client.request(
+                method, url, extensions={"trace": trace}, **kwargs
+            )
+            ok = response.status_code not in self._retry_policy.statuses
+        except httpx.HTTPError:
+            self._metrics.observe(
+                family, method, url, None, time.perf_counter() - start, trace
+            )
+            raise
+        finally:
+            self._breaker.record(host, ok)
+        self._metrics.observe(
+            family, method, url, response, time.perf_counter() - start, trace
+        )
+        return response
+
+    def _send_resilient(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: str | None,
+        idempotent: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request under the rate limiter, retrying transient failures.
+
+        Responses with a status in ``RetryPolicy.statuses`` and transport
+        errors are retried with jittered backoff while the request is
+        ``idempotent``, retries remain, and the shared retry budget allows.
+        Backoff sleeps happen outside the rate limiter so they do not hold
+        a concurrency slot. Any other response (including ``429``) is
+        returned for the caller to handle.
+
+        Args:
+            method: HTTP method.
+            url: Full URL to request.
+            family: API family the URL belongs to.
+            idempotent: Whether the request is safe to re-send.
+            **kwargs: Passed through to ``httpx.Client.request``.
+
+        Returns:
+            The final response, with its body read.
+
+        Raises:
+            CircuitOpenError: The URL's host breaker is open.
+            httpx.HTTPError: Transport failure that was not retried.
+        """
+        policy = self._retry_policy
+        self._retry_budget.deposit()
+        retry = 0
+        while True:
+            try:
+                with self._rate_limiter.acquire(family):
+                    response = self._send(method, url, family=family, **kwargs)
+                if response.status_code not in policy.statuses:
+                    return response
+                failure = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                if not self._may_retry(idempotent, retry):
+                    raise
+                failure = type(e).__name__
+            else:
+                if not self._may_retry(idempotent, retry):
+                    return response
+            wait_time = retry_delay(policy, retry)
+            logger.warning(
+                "%s from %s %s, retrying in %.1f seconds (retry %d/%d)",
+                failure,
+                method,
+                url,
+                wait_time,
+                retry + 1,
+                policy.max_retries,
+            )
+            self._metrics.retry(family, wait_time)
+            time.sleep(wait_time)
+            retry += 1
+
+    def _may_retry(self, idempotent: bool, retry: int) -> bool:
+        """Decide whether a transient failure may be retried.
+
+        Args:
+            idempotent: Whether the request is safe to re-send.
+            retry: Retries already made for this request.
+
+        Returns:
+            True if retries remain and the shared budget allows one more.
+        """
+        return (
+            idempotent
+            and retry < self._retry_policy.max_retries
+            and self._retry_budget.withdraw()
+        )
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        family: str | None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[httpx.Response, Iterator[bytes]]]:
+        """Open a streamed request and record it in metrics once closed.
+
+        Args:
+            method: HTTP method.
+            url: Full URL to request.
+            family: API family the URL belongs to (for metrics).
+            **kwargs: Passed through to ``httpx.Client.stream``.
+
+        Yields:
+            The response and an iterator over its decoded body chunks.
+            Reading the body through the iterator lets the decoded size be
+            recorded.
+
+        Raises:
+            CircuitOpenError: The URL's host breaker is open (nothing sent).
+        """
+        client = self._ensure_client()
+        host = self._breaker.check(url)
+        trace = ConnectionTrace()
+        response: httpx.Response | None = None
+        decoded = 0
+        ok = False
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal decoded
+            if response is None:  # pragma: no cover — set before yielding
+                raise AssertionError("unreachable: chunks() runs after stream()")
+            for chunk in response.iter_bytes():
+                decoded += len(chunk)
+                yield chunk
+
+        start = time.perf_counter()
+        try:
+            with client.stream(
+                method, url, extensions={"trace": trace}, **kwargs
+            ) as response:
+                ok = response.status_code not in self._retry_policy.statuses
+                yield response, chunks()
+        except httpx.TransportError:
+            # A stream dropped mid-body counts against the host too
+            ok = False
+            raise
+        finally:
+            self._breaker.record(host, ok)
+            self._metrics.observe(
+                family,
+                method,
+                url,
+                response,
+                time.perf_counter() - start,
+                trace,
+                bytes_decoded=decoded or None,
+            )
+
     def _handle_response(
         self,
         response: httpx.Response,
@@ -479,6 +975,7 @@ class MixpanelAPIClient:
         form_data: dict[str, Any] | None = None,
         headers: dict[str, str],
         timeout: float | None = None,
+        coalesce: bool = False,
     ) -> Any:
         """Execute HTTP request with retry logic for rate limiting.
 
@@ -486,6 +983,10 @@ class MixpanelAPIClient:
         request(). Handles rate limiting with exponential backoff and error
         response parsing.
 
+        GET requests, and POSTs flagged with ``coalesce``, go through the
+        client's single-flight layer: concurrent callers issuing the same
+        method, URL, params and body share one network call.
+
         Args:
             method: HTTP method (GET, POST, etc.).
             url: Full URL to request.
@@ -494,6 +995,8 @@ class MixpanelAPIClient:
             form_data: Optional form-encoded request body.
             headers: Request headers (must include Authorization).
             timeout: Optional request timeout in seconds.
+            coalesce: Treat a non-GET request as idempotent and share it with
+                concurrent identical callers.
 
         Returns:
             Parsed JSON response.
@@ -505,18 +1008,81 @@ class MixpanelAPIClient:
             ServerError: Server-side errors (5xx).
             MixpanelHeadlessError: Network/connection errors.
         """
-        client = self._ensure_client()
-        request_body = json_data or form_data
         if params is None:
             params = {}
         params["query_origin"] = QUERY_ORIGIN
+
+        def send() -> Any:
+            return self._send_with_retry(
+                method,
+                url,
+                params=params,
+                json_data=json_data,
+                form_data=form_data,
+                headers=headers,
+                timeout=timeout,
+                idempotent=coalesce or method.upper() in IDEMPOTENT_METHODS,
+            )
+
+        if method.upper() != "GET" and not coalesce:
+            return send()
+        key = request_key(
+            method,
+            url,
+            params,
+            json_data if json_data is not None else form_data,
+            auth=headers.get("Authorization"),
+        )
+        return self._single_flight.do(key, send)
+
+    def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any],
+        json_data: dict[str, Any] | None,
+        form_data: dict[str, Any] | None,
+        headers: dict[str, str],
+        timeout: float | None,
+        idempotent: bool,
+    ) -> Any:
+        """Send one logical request, retrying on ``429``.
+
+        Transient ``5xx`` and transport failures are retried beneath this
+        loop by :meth:`_send_resilient` when ``idempotent`` is set.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            url: Full URL to request.
+            params: Query parameters (``query_origin`` already added).
+            json_data: Optional JSON request body.
+            form_data: Optional form-encoded request body.
+            headers: Request headers (must include Authorization).
+            timeout: Optional request timeout in seconds.
+            idempotent: Whether the request is safe to re-send.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            QueryError: Invalid parameters (400).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+        """
+        request_body = json_data or form_data
         request_headers = self._request_headers(headers)
+        family = self._api_family(url)
 
         for attempt in range(self._max_retries + 1):
             try:
-                response = client.request(
+                response = self._send_resilient(
                     method,
                     url,
+                    family=family,
+                    idempotent=idempotent,
                     params=params,
                     json=json_data,
                     data=form_data,
@@ -546,6 +1112,8 @@ class MixpanelAPIClient:
                     retry_after = self._parse_retry_after(response)
                     if retry_after is not None:
                         wait_time = float(retry_after)
+                        # Hold back sibling threads for the server's window too
+                        self._rate_limiter.penalize(family, wait_time)
                     else:
                         wait_time = self._calculate_backoff(attempt)
                     logger.warning(
@@ -554,6 +1122,7 @@ class MixpanelAPIClient:
                         attempt + 1,
                         self._max_retries,
                     )
+                    self._metrics.retry(family, wait_time)
                     time.sleep(wait_time)
                     continue
 
@@ -595,6 +1164,7 @@ class MixpanelAPIClient:
         form_data: dict[str, Any] | None = None,
         timeout: float | None = None,
         inject_project_id: bool = True,
+        coalesce: bool = False,
     ) -> Any:
         """Make an authenticated request with optional project_id injection.
 
@@ -611,6 +1181,8 @@ class MixpanelAPIClient:
             inject_project_id: If True (default), automatically adds project_id
                 to query params. Set to False for APIs where project_id is
                 already in the URL path (e.g., Lexicon Schemas API).
+            coalesce: Share a read-only POST with concurrent identical
+                callers (GETs are always shared).
 
         Returns:
             Parsed JSON response.
@@ -642,6 +1214,7 @@ class MixpanelAPIClient:
             form_data=form_data,
             headers={"Authorization": self._get_auth_header()},
             timeout=timeout,
+            coalesce=coalesce,
         )
 
     def request(
@@ -901,6 +1474,7 @@ class MixpanelAPIClient:
         json_body: dict[str, Any] | None = None,
         form_body: dict[str, str] | None = None,
         _raw: bool = False,
+        _gzip: bool = False,
     ) -> Any:
         """Make an authenticated request to the Mixpanel App API.
 
@@ -921,6 +1495,9 @@ class MixpanelAPIClient:
             _raw: If True, return the full response dict without unwrapping
                 the ``results`` field. Useful for endpoints that include
                 pagination metadata alongside results.
+            _gzip: If True, send a ``json_body`` of at least
+                ``GZIP_MIN_BYTES`` gzip-compressed with
+                ``Content-Encoding: gzip``.
 
         Returns:
             The ``results`` field from the response JSON if present,
@@ -965,7 +1542,16 @@ class MixpanelAPIClient:
         auth_header = self._get_auth_header()
         headers = self._request_headers({"Authorization": auth_header})
 
-        client = self._ensure_client()
+        encoded: bytes | None = None
+        if _gzip and json_body is not None:
+            raw_body = json.dumps(json_body, separators=(",", ":")).encode("utf-8")
+            if len(raw_body) >= GZIP_MIN_BYTES:
+                encoded = gzip.compress(raw_body, compresslevel=6)
+                headers = {
+                    **headers,
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                }
 
         # Pass through caller-supplied params only (no query_origin —
         # some App API endpoints reject unknown query parameters).
@@ -977,113 +1563,400 @@ class MixpanelAPIClient:
             form_body if form_body is not None else json_body
         )
 
-        for attempt in range(self._max_retries + 1):
-            try:
-                if form_body is not None:
-                    response = client.request(
-                        method,
-                        url,
-                        params=request_params,
-                        data=form_body,
-                        headers=headers,
-                        timeout=self._timeout,
-                    )
-                else:
-                    response = client.request(
+        family = self._api_family(url)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        body_kwargs: dict[str, Any]
+        if form_body is not None:
+            body_kwargs = {"data": form_body}
+        elif encoded is not None:
+            body_kwargs = {"content": encoded}
+        else:
+            body_kwargs = {"json": json_body}
+
+        def send() -> Any:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    response = self._send_resilient(
                         method,
                         url,
+                        family=family,
+                        idempotent=idempotent,
                         params=request_params,
-                        json=json_body,
                         headers=headers,
                         timeout=self._timeout,
+                        **body_kwargs,
                     )
 
-                # Handle 204 No Content
-                if response.status_code == 204:
-                    return {"status": "ok"}
+                    # Handle 204 No Content
+                    if response.status_code == 204:
+                        return {"status": "ok"}
 
-                # Handle 429 rate limiting with retry
-                if response.status_code == 429:
-                    if attempt >= self._max_retries:
+                    # Handle 429 rate limiting with retry
+                    if response.status_code == 429:
+                        if attempt >= self._max_retries:
+                            self._raise_app_error(response, method=method, url=url)
                         retry_after = self._parse_retry_after(response)
-                        response_body: str | dict[str, Any] | None = None
-                        try:
-                            response_body = response.json()
-                        except json.JSONDecodeError:
-                            response_body = (
-                                response.text[:500] if response.text else None
-                            )
-                        raise RateLimitError(
-                            "Rate limit exceeded after max retries",
-                            retry_after=retry_after,
-                            status_code=response.status_code,
-                            response_body=response_body,
-                            request_method=method,
-                            request_url=url,
+                        if retry_after is not None:
+                            wait_time = float(retry_after)
+                            # Hold back sibling threads for the server's window too
+                            self._rate_limiter.penalize(family, wait_time)
+                        else:
+                            wait_time = self._calculate_backoff(attempt)
+                        logger.warning(
+                            "Rate limited, retrying in %.1f seconds (attempt %d/%d)",
+                            wait_time,
+                            attempt + 1,
+                            self._max_retries,
                         )
-                    retry_after = self._parse_retry_after(response)
-                    if retry_after is not None:
-                        wait_time = float(retry_after)
-                    else:
-                        wait_time = self._calculate_backoff(attempt)
-                    logger.warning(
-                        "Rate limited, retrying in %.1f seconds (attempt %d/%d)",
-                        wait_time,
-                        attempt + 1,
-                        self._max_retries,
-                    )
-                    time.sleep(wait_time)
-                    continue
+                        self._metrics.retry(family, wait_time)
+                        time.sleep(wait_time)
+                        continue
 
-                # Handle 422 as QueryError
-                if response.status_code == 422:
-                    err_body: str | dict[str, Any] | None = None
-                    try:
-                        err_body = response.json()
-                    except json.JSONDecodeError:
-                        err_body = response.text[:500] if response.text else None
-                    error_msg = "Unprocessable entity"
-                    if isinstance(err_body, dict):
-                        error_msg = str(err_body.get("error", error_msg))
-                    raise QueryError(
-                        error_msg,
-                        status_code=422,
-                        response_body=err_body,
+                    if response.status_code >= 400:
+                        self._raise_app_error(
+                            response,
+                            method=method,
+                            url=url,
+                            params=request_params,
+                            body=request_body,
+                        )
+                    result = self._handle_response(
+                        response,
                         request_method=method,
                         request_url=url,
+                        request_params=request_params,
                         request_body=request_body,
                     )
 
-                # Delegate other error codes to _handle_response
-                result = self._handle_response(
-                    response,
-                    request_method=method,
-                    request_url=url,
-                    request_params=request_params,
-                    request_body=request_body,
-                )
+                    # Unwrap results field if present (unless _raw requested)
+                    if not _raw and isinstance(result, dict) and "results" in result:
+                        return result["results"]
+                    return result
 
-                # Unwrap results field if present (unless _raw requested)
-                if not _raw and isinstance(result, dict) and "results" in result:
-                    return result["results"]
-                return result
+                except httpx.HTTPError as e:
+                    raise MixpanelHeadlessError(
+                        f"HTTP error: {e}",
+                        code="HTTP_ERROR",
+                        details={
+                            "error": str(e),
+                            "request_method": method,
+                            "request_url": url,
+                        },
+                    ) from e
 
-            except httpx.HTTPError as e:
-                raise MixpanelHeadlessError(
-                    f"HTTP error: {e}",
-                    code="HTTP_ERROR",
-                    details={
-                        "error": str(e),
-                        "request_method": method,
-                        "request_url": url,
-                    },
-                ) from e
+            # Should not reach here, but satisfy type checker
+            raise RateLimitError(
+                "Rate limit exceeded after max retries",
+                request_method=method,
+                request_url=url,
+            )
 
-        # Should not reach here, but satisfy type checker
-        raise RateLimitError(
-            "Rate limit exceeded after max retries",
+        if method.upper() != "GET":
+            return send()
+        # Concurrent identical GETs (e.g. /me, get_bookmark) share one call.
+        # ``_raw`` is part of the key because it changes the returned shape.
+        key = request_key(method, url, request_params, {"_raw": _raw}, auth=auth_header)
+        return self._single_flight.do(key, send)
+
+    def _raise_app_error(
+        self,
+        response: httpx.Response,
+        *,
+        method: str,
+        url: str,
+        params: dict[str, str] | None = None,
+        body: dict[str, Any] | dict[str, str] | None = None,
+    ) -> NoReturn:
+        """Raise the exception for an App API error response.
+
+        Args:
+            response: Response with a status of 400 or above, body read.
+            method: HTTP method used.
+            url: Full request URL.
+            params: Query parameters sent.
+            body: Request body sent.
+
+        Raises:
+            RateLimitError: On 429 (retries already exhausted by the caller).
+            QueryError: On 422 and other 4xx statuses.
+            AuthenticationError: On 401.
+            ServerError: On 5xx.
+        """
+        response_body: str | dict[str, Any] | None = None
+        try:
+            response_body = response.json()
+        except json.JSONDecodeError:
+            response_body = response.text[:500] if response.text else None
+        if response.status_code == 429:
+            raise RateLimitError(
+                "Rate limit exceeded after max retries",
+                retry_after=self._parse_retry_after(response),
+                status_code=response.status_code,
+                response_body=response_body,
+                request_method=method,
+                request_url=url,
+            )
+        if response.status_code == 422:
+            error_msg = "Unprocessable entity"
+            if isinstance(response_body, dict):
+                error_msg = str(response_body.get("error", error_msg))
+            raise QueryError(
+                error_msg,
+                status_code=422,
+                response_body=response_body,
+                request_method=method,
+                request_url=url,
+                request_body=body,
+            )
+        self._handle_response(
+            response,
             request_method=method,
             request_url=url,
+            request_params=params,
+            request_body=body,
+        )
+        raise MixpanelHeadlessError(  # pragma: no cover - 4xx/5xx raised above
+            f"Unexpected status {response.status_code} from {method} {url}",
+            code="HTTP_ERROR",
+        )
+
+    @contextmanager
+    def _app_stream(
+        self, path: str, *, params: dict[str, str] | None = None
+    ) -> Iterator[Iterator[bytes]]:
+        """Stream the body of an App API GET without buffering it.
+
+        Retries ``429`` and transient failures like :meth:`app_request`
+        until the response status is known to be successful, then yields
+        the body chunks. Errors after the body has started are not retried.
+
+        Args:
+            path: API path (e.g., ``/me``).
+            params: Optional query parameters.
+
+        Yields:
+            The decoded response body chunks (none for ``204 No Content``).
+
+        Raises:
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            QueryError: Invalid parameters or resource not found (4xx).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+        """
+        url = self._build_url("app", path)
+        headers = self._request_headers({"Authorization": self._get_auth_header()})
+        family = self._api_family(url)
+        policy = self._retry_policy
+        self._retry_budget.deposit()
+        rate_limited = 0
+        retry = 0
+        started = False
+        while True:
+            try:
+                with (
+                    self._rate_limiter.acquire(family),
+                    self._stream(
+                        "GET",
+                        url,
+                        family=family,
+                        params=params,
+                        headers=headers,
+                        timeout=self._timeout,
+                    ) as (response, chunks),
+                ):
+                    status = response.status_code
+                    if status == 204:
+                        started = True
+                        yield iter(())
+                        return
+                    if status < 400:
+                        started = True
+                        yield chunks
+                        return
+                    response.read()
+                    if status == 429 and rate_limited < self._max_retries:
+                        retry_after = self._parse_retry_after(response)
+                        if retry_after is not None:
+                            wait_time = float(retry_after)
+                            self._rate_limiter.penalize(family, wait_time)
+                        else:
+                            wait_time = self._calculate_backoff(rate_limited)
+                        rate_limited += 1
+                    elif status in policy.statuses and self._may_retry(True, retry):
+                        wait_time = retry_delay(policy, retry)
+                        retry += 1
+                    else:
+                        self._raise_app_error(
+                            response, method="GET", url=url, params=params
+                        )
+            except httpx.HTTPError as e:
+                if (
+                    started
+                    or not isinstance(e, httpx.TransportError)
+                    or not self._may_retry(True, retry)
+                ):
+                    raise MixpanelHeadlessError(
+                        f"HTTP error: {e}",
+                        code="HTTP_ERROR",
+                        details={
+                            "error": str(e),
+                            "request_method": "GET",
+                            "request_url": url,
+                        },
+                    ) from e
+                wait_time = retry_delay(policy, retry)
+                retry += 1
+            logger.warning("Retrying GET %s in %.1f seconds", url, wait_time)
+            self._metrics.retry(family, wait_time)
+            time.sleep(wait_time)
+
+    def _app_get_json(
+        self,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        skip: Collection[JsonPath] = (),
+    ) -> Any:
+        """GET an App API resource, parsing the body as it streams in.
+
+        Subtrees matched by ``skip`` are dropped without being built, so a
+        large response never exists in memory as bytes, text and objects
+        at once. Concurrent identical calls share one request.
+
+        Args:
+            path: API path (e.g., ``/me``).
+            params: Optional query parameters.
+            skip: Path patterns, relative to the unwrapped ``results``
+                payload, of subtrees to drop (e.g.
+                ``("workspaces", "*", "member_list")``).
+
+        Returns:
+            The ``results`` field of the response if present, otherwise the
+            full body, as :meth:`app_request` returns it (``{"status":
+            "ok"}`` for an empty body).
+
+        Raises:
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            QueryError: Invalid parameters or resource not found (4xx).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network errors or malformed JSON.
+        """
+        # Patterns apply to the payload whether or not it is enveloped
+        patterns = [tuple(p) for p in skip] + [("results", *p) for p in skip]
+
+        def fetch() -> Any:
+            with self._app_stream(path, params=params) as chunks:
+                first = next(chunks, None)
+                if first is None:
+                    # 204 No Content, reported as app_request() does
+                    return {"status": "ok"}
+                try:
+                    result = json_stream.load(
+                        itertools.chain((first,), chunks), skip=patterns
+                    )
+                except json_stream.JSONStreamError as e:
+                    raise MixpanelHeadlessError(
+                        f"Invalid JSON response from GET {path}: {e}",
+                        code="INVALID_RESPONSE",
+                    ) from e
+            if isinstance(result, dict) and "results" in result:
+                return result["results"]
+            return result
+
+        key = request_key(
+            "GET",
+            self._build_url("app", path),
+            params,
+            {"skip": sorted(patterns)},
+            auth=self._get_auth_header(),
+        )
+        return self._single_flight.do(key, fetch)
+
+    def _app_iter_items(
+        self,
+        path: str,
+        targets: Collection[JsonPath],
+        *,
+        params: dict[str, str] | None = None,
+        skip: Collection[JsonPath] = (),
+        required: bool = False,
+    ) -> Iterator[Any]:
+        """Yield the elements of arrays in an App API response as they arrive.
+
+        The connection, and its rate-limiter slot, stay open until the
+        iterator is exhausted or closed.
+
+        Args:
+            path: API path.
+            targets: Path patterns, from the document root, of the arrays
+                to stream.
+            params: Optional query parameters.
+            skip: Path patterns to drop inside yielded elements.
+            required: Raise if a non-empty body holds no array at any
+                target path.
+
+        Yields:
+            Decoded array elements, in document order.
+
+        Raises:
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            QueryError: Invalid parameters or resource not found (4xx).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network errors or malformed JSON.
+            json_stream.MissingTargetError: If ``required`` and the body
+                holds no target array.
+        """
+        with self._app_stream(path, params=params) as chunks:
+            first = next(chunks, None)
+            if first is None:  # 204 No Content: nothing to yield
+                return
+            try:
+                yield from json_stream.iter_items(
+                    itertools.chain((first,), chunks),
+                    targets,
+                    skip=skip,
+                    required=required,
+                )
+            except json_stream.JSONStreamError as e:
+                raise MixpanelHeadlessError(
+                    f"Invalid JSON response from GET {path}: {e}",
+                    code="INVALID_RESPONSE",
+                ) from e
+
+    def _run_bulk(
+        self,
+        operation: str,
+        kind: str,
+        items: list[Any],
+        send: Callable[[list[Any]], Any],
+        *,
+        first_alone: bool = False,
+    ) -> list[Any]:
+        """Split a bulk call into batches and dispatch them concurrently.
+
+        Args:
+            operation: Public method name (for errors and logs).
+            kind: Key into ``DEFAULT_BATCH_SIZES``.
+            items: Items to send.
+            send: Sends one batch; called on worker threads.
+            first_alone: Send the first batch before the others start.
+
+        Returns:
+            One parsed response per batch, in order.
+
+        Raises:
+            BulkOperationError: If some batches of a multi-batch call failed.
+        """
+        return run_batches(
+            operation,
+            items,
+            send,
+            batch_size=self._bulk.batch_size or DEFAULT_BATCH_SIZES[kind],
+            workers=self._bulk.max_workers,
+            first_alone=first_alone,
         )
 
     @property
@@ -1244,6 +2117,7 @@ class MixpanelAPIClient:
         ``httpx.Client`` wrapping that transport is constructed lazily on
         first request. (For in-session axis swaps that preserve the existing
         ``httpx.Client`` instance itself, use :meth:`Workspace.use` instead.)
+        The rate limiter is shared too, so both clients draw on one budget.
 
         Args:
             project_id: The project ID to target.
@@ -1271,19 +2145,32 @@ class MixpanelAPIClient:
             export_timeout=self._export_timeout,
             max_retries=self._max_retries,
             token_resolver=self._token_resolver,
+            bulk=self._bulk,
+            retry=self._retry_policy,
             _transport=transport,
         )
+        # Same credentials, same server-side budget: share the limiter itself
+        new_client._rate_limiter = self._rate_limiter
         if workspace_id is not None:
             new_client.set_workspace_id(workspace_id)
         return new_client
 
-    def me(self) -> dict[str, Any]:
+    def me(self, *, skip: Collection[JsonPath] = ()) -> dict[str, Any]:
         """Call GET /api/app/me to retrieve the authenticated user's profile.
 
         The ``/me`` endpoint is NOT project-scoped — it returns information
         about the authenticated user, including all accessible organizations,
         projects, and workspaces.
 
+        The body is parsed as it streams in. For large organizations most of
+        it is workspace member lists; pass ``skip`` to drop them before they
+        are materialized.
+
+        Args:
+            skip: Path patterns of subtrees to omit, relative to the profile
+                (``"*"`` matches any key), e.g.
+                ``[("workspaces", "*", "member_list")]``.
+
         Returns:
             Raw JSON response dict from ``/api/app/me``.
 
@@ -1300,7 +2187,7 @@ class MixpanelAPIClient:
                 print(me_data.get("user_email"))
             ```
         """
-        result = self.app_request("GET", "/me")
+        result = self._app_get_json("/me", skip=skip)
         if not isinstance(result, dict):
             return {"results": result}
         return result
@@ -1342,6 +2229,43 @@ class MixpanelAPIClient:
     # Export API - Streaming
     # =========================================================================
 
+    def _export_params(
+        self,
+        from_date: str,
+        to_date: str,
+        *,
+        events: list[str] | None = None,
+        where: str | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        """Build the query parameters for a raw event export request.
+
+        Shared by :meth:`export_events` and the async client so both
+        encode the event filter and optional arguments identically.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD, inclusive).
+            to_date: End date (YYYY-MM-DD, inclusive).
+            events: Optional list of event names to filter.
+            where: Optional filter expression.
+            limit: Optional maximum number of events to return.
+
+        Returns:
+            Query parameter dict for the ``/export`` endpoint.
+        """
+        params: dict[str, Any] = {
+            "project_id": self._session.project.id,
+            "from_date": from_date,
+            "to_date": to_date,
+        }
+        if events:
+            params["event"] = json.dumps(events)
+        if where:
+            params["where"] = where
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
     def export_events(
         self,
         from_date: str,
@@ -1375,22 +2299,21 @@ class MixpanelAPIClient:
             RateLimitError: Rate limit exceeded after max retries.
             QueryError: Invalid parameters.
             ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network errors after max retries, or
+                ``EXPORT_RESUME_MISMATCH`` if a stream dropped mid-way and
+                the replay no longer matches what was already yielded.
+
+        Note:
+            If the connection drops after events have been yielded, the
+            request is reissued and the events already delivered are
+            skipped, so callers never see duplicates. The skip boundary is
+            verified against the last delivered event's ``$insert_id``.
         """
         url = self._build_url("export", "/export")
+        params = self._export_params(
+            from_date, to_date, events=events, where=where, limit=limit
+        )
 
-        params: dict[str, Any] = {
-            "project_id": self._session.project.id,
-            "from_date": from_date,
-            "to_date": to_date,
-        }
-        if events:
-            params["event"] = json.dumps(events)
-        if where:
-            params["where"] = where
-        if limit is not None:
-            params["limit"] = limit
-
-        client = self._ensure_client()
         headers = self._request_headers(
             {
                 "Authorization": self._get_auth_header(),
@@ -1398,17 +2321,30 @@ class MixpanelAPIClient:
             }
         )
 
-        # Stream with retry logic
+        # Stream with retry logic. ``delivered`` survives retries so a replay
+        # after a dropped connection skips what the caller already has.
+        delivered = 0
+        last_insert_id: str | None = None
+        backoff = 0.0
+        self._retry_budget.deposit()
         for attempt in range(self._max_retries + 1):
-            batch_count = 0  # Reset on each attempt
+            # Back off only after the 429's rate-limit slot has been released
+            if backoff:
+                time.sleep(backoff)
+                backoff = 0.0
+            replayed = 0
             try:
-                with client.stream(
-                    "GET",
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=self._export_timeout,
-                ) as response:
+                with (
+                    self._rate_limiter.acquire("export"),
+                    self._stream(
+                        "GET",
+                        url,
+                        family="export",
+                        params=params,
+                        headers=headers,
+                        timeout=self._export_timeout,
+                    ) as (response, chunks),
+                ):
                     if response.status_code == 429:
                         if attempt >= self._max_retries:
                             retry_after = self._parse_retry_after(response)
@@ -1423,9 +2359,11 @@ class MixpanelAPIClient:
                         retry_after = self._parse_retry_after(response)
                         if retry_after is not None:
                             wait_time = float(retry_after)
+                            self._rate_limiter.penalize("export", wait_time)
                         else:
                             wait_time = self._calculate_backoff(attempt)
-                        time.sleep(wait_time)
+                        self._metrics.retry("export", wait_time)
+                        backoff = wait_time
                         continue
 
                     if response.status_code == 401:
@@ -1462,31 +2400,109 @@ class MixpanelAPIClient:
                     # Use buffered JSONL reader instead of iter_lines().
                     # httpx iter_lines() can incorrectly split lines at gzip
                     # decompression chunk boundaries, causing JSON parse errors.
-                    # See: _iter_jsonl_lines docstring for implementation details.
-                    for line in _iter_jsonl_lines(response):
-                        try:
-                            event = json.loads(line)
-                            yield event
-                            batch_count += 1
-                            if on_batch and batch_count % 1000 == 0:
-                                on_batch(batch_count)
-                        except json.JSONDecodeError:
-                            logger.warning("Skipping malformed line: %s", line[:100])
-
+                    # Lines are decoded straight from bytes with the fastest
+                    # installed JSON backend (see _internal/jsonl.py).
+                    for event in iter_records(iter_lines(chunks)):
+                        if replayed < delivered:
+                            replayed += 1
+                            if replayed == delivered:
+                                _check_export_replay(event, last_insert_id, delivered)
+                            continue
+                        yield event
+                        delivered += 1
+                        replayed = delivered
+                        last_insert_id = _event_insert_id(event)
+                        if on_batch and delivered % 1000 == 0:
+                            on_batch(delivered)
+
+                    if replayed < delivered:
+                        _check_export_replay(None, last_insert_id, delivered)
                     # Call on_batch with final count if there was a partial batch
-                    if on_batch and batch_count % 1000 != 0:
-                        on_batch(batch_count)
+                    if on_batch and delivered % 1000 != 0:
+                        on_batch(delivered)
                     return  # Success, exit retry loop
 
             except httpx.HTTPError as e:
-                # Network/connection errors - retry if attempts remain
-                if attempt >= self._max_retries:
+                # Network/connection errors - retry if attempts remain;
+                # the replay resumes after the last delivered event.
+                if delivered:
+                    logger.warning(
+                        "Export stream dropped after %d events, resuming: %s",
+                        delivered,
+                        e,
+                    )
+                if attempt >= self._max_retries or not self._retry_budget.withdraw():
                     raise MixpanelHeadlessError(
                         f"HTTP error during export: {e}",
                         code="HTTP_ERROR",
                         details={"error": str(e)},
                     ) from e
-                time.sleep(self._calculate_backoff(attempt))
+                wait_time = self._calculate_backoff(attempt)
+                self._metrics.retry("export", wait_time)
+                time.sleep(wait_time)
+
+    def export_events_parallel(
+        self,
+        from_date: str,
+        to_date: str,
+        *,
+        events: list[str] | None = None,
+        where: str | None = None,
+        workers: int = 4,
+        ordered: bool = False,
+        buffer_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream events with one Export API request per day, fetched concurrently.
+
+        The date range is split into single-day shards that are downloaded
+        on a pool of ``workers`` threads (subject to the client's ``export``
+        rate limit). A bounded buffer per queue applies backpressure when the
+        consumer is slower than the network.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD, inclusive).
+            to_date: End date (YYYY-MM-DD, inclusive).
+            events: Optional list of event names to filter.
+            where: Optional filter expression.
+            workers: Maximum days downloaded concurrently.
+            ordered: If True, yield days in chronological order (each day
+                keeps the API's order). If False (default), yield events as
+                they arrive for maximum throughput.
+            buffer_size: Maximum events buffered per queue.
+
+        Yields:
+            Event dictionaries with 'event' and 'properties' keys.
+
+        Raises:
+            ValueError: If the date range is invalid or ``workers`` /
+                ``buffer_size`` is less than 1.
+            AuthenticationError: Invalid credentials.
+            RateLimitError: Rate limit exceeded after max retries.
+            QueryError: Invalid parameters.
+            ServerError: Server-side errors (5xx).
+
+        Example:
+            ```python
+            for event in client.export_events_parallel(
+                "2024-01-01", "2024-03-31", workers=8
+            ):
+                process(event)
+            ```
+        """
+        shards = day_shards(from_date, to_date)
+        # Create the pool up front so worker threads never race to build it
+        self._ensure_client()
+
+        def _fetch(shard: tuple[str, str]) -> Iterator[dict[str, Any]]:
+            return self.export_events(shard[0], shard[1], events=events, where=where)
+
+        return iter_parallel(
+            shards,
+            _fetch,
+            workers=workers,
+            ordered=ordered,
+            buffer_size=buffer_size,
+        )
 
     def export_profiles(
         self,
@@ -1541,39 +2557,14 @@ class MixpanelAPIClient:
             RateLimitError: Rate limit exceeded after max retries.
             ServerError: Server-side errors (5xx).
         """
-        # Validate mutually exclusive parameters
-        if distinct_id is not None and distinct_ids is not None:
-            raise ValueError(
-                "distinct_id and distinct_ids are mutually exclusive. "
-                "Provide only one to fetch specific profiles."
-            )
-
-        if behaviors is not None and cohort_id is not None:
-            raise ValueError(
-                "behaviors and cohort_id are mutually exclusive. "
-                "Use behaviors for behavioral filtering or cohort_id for cohort membership."
-            )
-
-        if include_all_users and cohort_id is None:
-            raise ValueError(
-                "include_all_users requires cohort_id. "
-                "This parameter is only valid for cohort membership queries."
-            )
-
-        # Validate behaviors type
-        if behaviors is not None and not isinstance(behaviors, list):
-            raise ValueError(
-                "behaviors must be a list of behavioral filter dictionaries."
-            )
-
-        # Validate as_of_timestamp is not in the future
-        if as_of_timestamp is not None:
-            current_time = int(time.time())
-            if as_of_timestamp > current_time:
-                raise ValueError(
-                    "as_of_timestamp cannot be in the future. "
-                    "Provide a Unix timestamp in the past to query historical profile state."
-                )
+        _validate_profile_export(
+            distinct_id=distinct_id,
+            distinct_ids=distinct_ids,
+            cohort_id=cohort_id,
+            behaviors=behaviors,
+            as_of_timestamp=as_of_timestamp,
+            include_all_users=include_all_users,
+        )
 
         # Handle empty distinct_ids list - return early without API call
         if distinct_ids is not None and len(distinct_ids) == 0:
@@ -1635,6 +2626,190 @@ class MixpanelAPIClient:
                 break
             page += 1
 
+    def export_profiles_parallel(
+        self,
+        *,
+        where: str | None = None,
+        cohort_id: str | None = None,
+        output_properties: list[str] | None = None,
+        distinct_id: str | None = None,
+        distinct_ids: list[str] | None = None,
+        group_id: str | None = None,
+        behaviors: list[dict[str, Any]] | None = None,
+        as_of_timestamp: int | None = None,
+        include_all_users: bool = False,
+        workers: int = 4,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream profiles from the Engage API, fetching pages concurrently.
+
+        Page 0 is fetched first for the query's ``session_id``, ``total``
+        and ``page_size``; the remaining pages are then requested with that
+        session on a pool of ``workers`` threads (subject to the client's
+        ``engage`` rate limit). Each page is yielded whole as soon as it
+        completes, so profiles keep the API's order within a page while
+        pages arrive in completion order. At most ``workers`` pages are
+        downloading and ``workers`` more are buffered at any time, so
+        memory stays bounded however many profiles the query matches.
+
+        When the response reports no ``total``, the remaining pages are
+        fetched one after another, as in :meth:`export_profiles`.
+
+        Args:
+            where: Optional filter expression.
+            cohort_id: Optional cohort ID to filter by.
+            output_properties: Optional list of property names to include.
+            distinct_id: Optional single user ID to fetch. Mutually exclusive
+                with distinct_ids.
+            distinct_ids: Optional list of user IDs to fetch. Mutually
+                exclusive with distinct_id. Duplicates are removed.
+            group_id: Optional group type identifier.
+            behaviors: Optional list of behavioral filters. Mutually
+                exclusive with cohort_id.
+            as_of_timestamp: Optional Unix timestamp for a point-in-time
+                query. Must be in the past.
+            include_all_users: Include non-members in cohort results. Only
+                valid when cohort_id is provided.
+            workers: Maximum pages downloaded concurrently.
+
+        Yields:
+            Profile dictionaries with '$distinct_id' and '$properties' keys.
+
+        Raises:
+            ValueError: If the filter arguments are invalid (see
+                :meth:`export_profiles`) or ``workers`` is less than 1.
+            AuthenticationError: Invalid credentials.
+            RateLimitError: Rate limit exceeded after max retries.
+            ServerError: Server-side errors (5xx).
+
+        Example:
+            ```python
+            for profile in client.export_profiles_parallel(workers=5):
+                process(profile)
+            ```
+        """
+        _validate_profile_export(
+            distinct_id=distinct_id,
+            distinct_ids=distinct_ids,
+            cohort_id=cohort_id,
+            behaviors=behaviors,
+            as_of_timestamp=as_of_timestamp,
+            include_all_users=include_all_users,
+        )
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if distinct_ids is not None and len(distinct_ids) == 0:
+            return
+
+        page_kwargs: dict[str, Any] = {
+            "where": where,
+            "cohort_id": cohort_id,
+            "output_properties": output_properties,
+            "group_id": group_id,
+            "behaviors": behaviors,
+            "as_of_timestamp": as_of_timestamp,
+            "include_all_users": include_all_users,
+            "distinct_id": distinct_id,
+            "distinct_ids": (
+                list(dict.fromkeys(distinct_ids)) if distinct_ids is not None else None
+            ),
+        }
+        first = self.export_profiles_page(0, **page_kwargs)
+        yield from first.profiles
+        if not first.has_more or not first.profiles:
+            return
+
+        if first.total <= 0 or first.page_size <= 0:
+            page = first
+            while page.has_more:
+                page = self.export_profiles_page(
+                    page.page + 1, page.session_id, **page_kwargs
+                )
+                if not page.profiles:
+                    return
+                yield from page.profiles
+            return
+
+        session_id = first.session_id
+        # Create the pool up front so worker threads never race to build it
+        self._ensure_client()
+
+        def _fetch(page: int) -> list[list[dict[str, Any]]]:
+            # One item per shard keeps each page contiguous in the output
+            return [self.export_profiles_page(page, session_id, **page_kwargs).profiles]
+
+        pages = range(1, math.ceil(first.total / first.page_size))
+        for profiles in iter_parallel(
+            pages, _fetch, workers=workers, buffer_size=workers
+        ):
+            yield from profiles
+
+    def _profiles_page_params(
+        self,
+        page: int,
+        session_id: str | None,
+        *,
+        where: str | None = None,
+        cohort_id: str | None = None,
+        output_properties: list[str] | None = None,
+        group_id: str | None = None,
+        behaviors: list[dict[str, Any]] | None = None,
+        as_of_timestamp: int | None = None,
+        include_all_users: bool = False,
+        sort_key: str | None = None,
+        sort_order: str | None = None,
+        search: str | None = None,
+        limit: int | None = None,
+        filter_by_cohort: str | None = None,
+        distinct_id: str | None = None,
+        distinct_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Build the form parameters for a single Engage page request.
+
+        Shared by :meth:`export_profiles_page` and the async client. See
+        :meth:`export_profiles_page` for the meaning of each argument.
+
+        Returns:
+            Form parameter dict for ``POST /api/2.0/engage``.
+        """
+        params: dict[str, Any] = {
+            "project_id": self._session.project.id,
+            "page": page,
+        }
+        if session_id:
+            params["session_id"] = session_id
+        if where:
+            params["where"] = where
+        # filter_by_cohort takes precedence over cohort_id
+        if filter_by_cohort:
+            params["filter_by_cohort"] = filter_by_cohort
+        elif cohort_id:
+            params["filter_by_cohort"] = json.dumps({"id": cohort_id})
+        if output_properties:
+            params["output_properties"] = json.dumps(output_properties)
+        if group_id:
+            params["data_group_id"] = group_id
+        if behaviors:
+            params["behaviors"] = json.dumps(behaviors)
+        if as_of_timestamp is not None:
+            params["as_of_timestamp"] = as_of_timestamp
+        # Send include_all_users when cohort_id or filter_by_cohort is set
+        # Must send explicitly because API defaults to True
+        if cohort_id or filter_by_cohort:
+            params["include_all_users"] = include_all_users
+        if sort_key:
+            params["sort_key"] = sort_key
+        if sort_order:
+            params["sort_order"] = sort_order
+        if search:
+            params["search"] = search
+        if limit is not None:
+            params["limit"] = limit
+        if distinct_id:
+            params["distinct_id"] = distinct_id
+        if distinct_ids:
+            params["distinct_ids"] = json.dumps(distinct_ids)
+        return params
+
     def export_profiles_page(
         self,
         page: int,
@@ -1717,63 +2892,65 @@ class MixpanelAPIClient:
             ```
         """
         url = self._build_url("engage", "")
+        params = self._profiles_page_params(
+            page,
+            session_id,
+            where=where,
+            cohort_id=cohort_id,
+            output_properties=output_properties,
+            group_id=group_id,
+            behaviors=behaviors,
+            as_of_timestamp=as_of_timestamp,
+            include_all_users=include_all_users,
+            sort_key=sort_key,
+            sort_order=sort_order,
+            search=search,
+            limit=limit,
+            filter_by_cohort=filter_by_cohort,
+            distinct_id=distinct_id,
+            distinct_ids=distinct_ids,
+        )
+        response = self._request("POST", url, data=params)
+        return _profile_page_result(response, page)
+
+    def _engage_stats_params(
+        self,
+        *,
+        where: str | None,
+        action: str,
+        filter_by_cohort: str | None,
+        segment_by_cohorts: dict[str, bool] | None,
+        group_id: str | None,
+        as_of_timestamp: int | None,
+        include_all_users: bool,
+    ) -> dict[str, Any]:
+        """Build the form parameters for an Engage stats request.
+
+        Shared by :meth:`engage_stats` and the async client. See
+        :meth:`engage_stats` for the meaning of each argument.
 
+        Returns:
+            Form parameter dict for ``POST /api/2.0/engage/stats``.
+        """
         params: dict[str, Any] = {
             "project_id": self._session.project.id,
-            "page": page,
+            "action": action,
         }
-        if session_id:
-            params["session_id"] = session_id
         if where:
-            params["where"] = where
-        # filter_by_cohort takes precedence over cohort_id
+            # Stats endpoint accepts "selector", not "where"
+            params["selector"] = where
         if filter_by_cohort:
             params["filter_by_cohort"] = filter_by_cohort
-        elif cohort_id:
-            params["filter_by_cohort"] = json.dumps({"id": cohort_id})
-        if output_properties:
-            params["output_properties"] = json.dumps(output_properties)
+        if segment_by_cohorts is not None:
+            params["segment_by_cohorts"] = json.dumps(segment_by_cohorts)
         if group_id:
             params["data_group_id"] = group_id
-        if behaviors:
-            params["behaviors"] = json.dumps(behaviors)
         if as_of_timestamp is not None:
             params["as_of_timestamp"] = as_of_timestamp
-        # Send include_all_users when cohort_id or filter_by_cohort is set
-        # Must send explicitly because API defaults to True
-        if cohort_id or filter_by_cohort:
+        if filter_by_cohort:
+            # Must send explicitly because API defaults to True
             params["include_all_users"] = include_all_users
-        if sort_key:
-            params["sort_key"] = sort_key
-        if sort_order:
-            params["sort_order"] = sort_order
-        if search:
-            params["search"] = search
-        if limit is not None:
-            params["limit"] = limit
-        if distinct_id:
-            params["distinct_id"] = distinct_id
-        if distinct_ids:
-            params["distinct_ids"] = json.dumps(distinct_ids)
-
-        response = self._request("POST", url, data=params)
-
-        profiles = response.get("results", [])
-        returned_session_id = response.get("session_id")
-        has_more = returned_session_id is not None
-
-        # Extract pagination metadata for pre-computed page approach
-        total = response.get("total", 0)
-        page_size = response.get("page_size", 1000)
-
-        return ProfilePageResult(
-            profiles=profiles,
-            session_id=returned_session_id,
-            page=page,
-            has_more=has_more,
-            total=total,
-            page_size=page_size,
-        )
+        return params
 
     def engage_stats(
         self,
@@ -1834,27 +3011,17 @@ class MixpanelAPIClient:
             ```
         """
         url = self._build_url("engage", "stats")
+        params = self._engage_stats_params(
+            where=where,
+            action=action,
+            filter_by_cohort=filter_by_cohort,
+            segment_by_cohorts=segment_by_cohorts,
+            group_id=group_id,
+            as_of_timestamp=as_of_timestamp,
+            include_all_users=include_all_users,
+        )
 
-        params: dict[str, Any] = {
-            "project_id": self._session.project.id,
-            "action": action,
-        }
-        if where:
-            # Stats endpoint accepts "selector", not "where"
-            params["selector"] = where
-        if filter_by_cohort:
-            params["filter_by_cohort"] = filter_by_cohort
-        if segment_by_cohorts is not None:
-            params["segment_by_cohorts"] = json.dumps(segment_by_cohorts)
-        if group_id:
-            params["data_group_id"] = group_id
-        if as_of_timestamp is not None:
-            params["as_of_timestamp"] = as_of_timestamp
-        if filter_by_cohort:
-            # Must send explicitly because API defaults to True
-            params["include_all_users"] = include_all_users
-
-        response = self._request("POST", url, data=params)
+        response = self._request("POST", url, data=params, coalesce=True)
         if not isinstance(response, dict):
             raise QueryError(
                 message=(
@@ -2036,7 +3203,7 @@ class MixpanelAPIClient:
         """
         # Note: POST method is unusual for read-only, but per API spec
         url = self._build_url("query", "/cohorts/list")
-        response = self._request("POST", url)
+        response = self._request("POST", url, coalesce=True)
         if isinstance(response, list):
             return response
         return []
@@ -2357,41 +3524,27 @@ class MixpanelAPIClient:
         result: dict[str, Any] = self._request("GET", url, params=params)
         return result
 
-    def query_saved_report(
-        self,
-        bookmark_id: int,
-        *,
-        bookmark_type: Literal[
-            "insights", "funnels", "retention", "flows"
-        ] = "insights",
-        from_date: str | None = None,
-        to_date: str | None = None,
-    ) -> dict[str, Any]:
-        """Query a saved report by bookmark type.
+    def _saved_report_target(
+        self,
+        bookmark_id: int,
+        bookmark_type: str,
+        from_date: str | None,
+        to_date: str | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Resolve the endpoint URL and query params for a saved report.
 
-        Routes to the appropriate Mixpanel API endpoint based on bookmark_type
-        and returns the raw API response.
+        Shared by :meth:`query_saved_report` and the async client. Funnels
+        get a default 30-day window derived from whichever bound is given.
 
         Args:
-            bookmark_id: Saved report identifier (from Mixpanel URL or list_bookmarks).
-            bookmark_type: Type of bookmark to query. Determines which API endpoint
-                is called. Defaults to 'insights'.
-            from_date: Start date (YYYY-MM-DD). Required for funnels, optional otherwise.
-                If not provided for funnels, defaults to 30 days ago.
-            to_date: End date (YYYY-MM-DD). Required for funnels, optional otherwise.
-                If not provided for funnels, defaults to today.
+            bookmark_id: Saved report identifier.
+            bookmark_type: One of ``insights``, ``funnels``, ``retention``,
+                or ``flows``.
+            from_date: Optional start date (YYYY-MM-DD).
+            to_date: Optional end date (YYYY-MM-DD).
 
         Returns:
-            Raw API response with report data. Structure varies by bookmark_type:
-            - insights: {headers, computed_at, date_range, series}
-            - funnels: {computed_at, data, meta}
-            - retention: {date: {first, counts, rates}}
-            - flows: {computed_at, steps, breakdowns, overallConversionRate}
-
-        Raises:
-            AuthenticationError: Invalid credentials.
-            QueryError: Invalid bookmark_id or report not found.
-            RateLimitError: Rate limit exceeded.
+            Tuple of ``(url, params)`` for the GET request.
         """
         if bookmark_type == "insights":
             url = self._build_url("query", "/insights")
@@ -2432,7 +3585,47 @@ class MixpanelAPIClient:
             # This shouldn't happen due to Literal type, but handle gracefully
             url = self._build_url("query", "/insights")
             params = {"bookmark_id": bookmark_id}
+        return url, params
+
+    def query_saved_report(
+        self,
+        bookmark_id: int,
+        *,
+        bookmark_type: Literal[
+            "insights", "funnels", "retention", "flows"
+        ] = "insights",
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> dict[str, Any]:
+        """Query a saved report by bookmark type.
+
+        Routes to the appropriate Mixpanel API endpoint based on bookmark_type
+        and returns the raw API response.
+
+        Args:
+            bookmark_id: Saved report identifier (from Mixpanel URL or list_bookmarks).
+            bookmark_type: Type of bookmark to query. Determines which API endpoint
+                is called. Defaults to 'insights'.
+            from_date: Start date (YYYY-MM-DD). Required for funnels, optional otherwise.
+                If not provided for funnels, defaults to 30 days ago.
+            to_date: End date (YYYY-MM-DD). Required for funnels, optional otherwise.
+                If not provided for funnels, defaults to today.
+
+        Returns:
+            Raw API response with report data. Structure varies by bookmark_type:
+            - insights: {headers, computed_at, date_range, series}
+            - funnels: {computed_at, data, meta}
+            - retention: {date: {first, counts, rates}}
+            - flows: {computed_at, steps, breakdowns, overallConversionRate}
 
+        Raises:
+            AuthenticationError: Invalid credentials.
+            QueryError: Invalid bookmark_id or report not found.
+            RateLimitError: Rate limit exceeded.
+        """
+        url, params = self._saved_report_target(
+            bookmark_id, bookmark_type, from_date, to_date
+        )
         result: dict[str, Any] = self._request("GET", url, params=params)
         return result
 
@@ -2497,6 +3690,7 @@ class MixpanelAPIClient:
             url,
             data=body,
             inject_project_id=False,
+            coalesce=True,
         )
         return result
 
@@ -2557,6 +3751,7 @@ class MixpanelAPIClient:
             url,
             data=body,
             inject_project_id=False,
+            coalesce=True,
         )
         return result
 
@@ -2938,13 +4133,18 @@ class MixpanelAPIClient:
             body: Bulk creation payload from
                 ``BulkCreateSchemasParams.model_dump()``.
 
+        Long ``entries`` lists are sent in concurrent batches. With
+        ``truncate``, only the first batch truncates and it is sent before
+        the others.
+
         Returns:
-            Dict with ``added`` and ``deleted`` counts.
+            Dict with ``added`` and ``deleted`` counts, summed over batches.
 
         Raises:
             AuthenticationError: Invalid credentials (401).
             QueryError: Validation error (400).
             RateLimitError: Rate limit exceeded (429).
+            BulkOperationError: Some batches failed.
 
         Example:
             ```python
@@ -2955,13 +4155,37 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("schemas")
-        result = self.app_request("POST", path, json_body=body)
-        if not isinstance(result, dict):
-            raise MixpanelHeadlessError(
-                f"Unexpected response from create_schemas_bulk: "
-                f"expected dict, got {type(result).__name__}",
-            )
-        return result
+        entries: list[Any] = body.get("entries", [])
+        truncate = bool(body.get("truncate"))
+        first_pending = True
+
+        def send(batch: list[Any]) -> dict[str, Any]:
+            nonlocal first_pending
+            batch_body = {**body, "entries": batch}
+            # Later batches must not wipe what earlier ones inserted; the
+            # truncating first batch always completes before they start.
+            if truncate and not first_pending:
+                batch_body["truncate"] = False
+            first_pending = False
+            result = self.app_request(
+                "POST", path, json_body=batch_body, _gzip=self._bulk.gzip
+            )
+            if not isinstance(result, dict):
+                raise MixpanelHeadlessError(
+                    f"Unexpected response from create_schemas_bulk: "
+                    f"expected dict, got {type(result).__name__}",
+                )
+            return result
+
+        results: list[dict[str, Any]] = self._run_bulk(
+            "create_schemas_bulk", "schemas", entries, send, first_alone=truncate
+        )
+        if len(results) == 1:
+            return results[0]
+        merged = dict(results[0])
+        for key in ("added", "deleted"):
+            merged[key] = sum(int(r.get(key, 0)) for r in results)
+        return merged
 
     def update_schema(
         self,
@@ -3018,12 +4242,16 @@ class MixpanelAPIClient:
             body: Bulk update payload from
                 ``BulkCreateSchemasParams.model_dump()``.
 
+        Long ``entries`` lists are sent in concurrent batches.
+
         Returns:
-            List of per-entry results with ``status`` ("ok" or "error").
+            List of per-entry results with ``status`` ("ok" or "error"),
+            concatenated across batches in input order.
 
         Raises:
             AuthenticationError: Invalid credentials (401).
             RateLimitError: Rate limit exceeded (429).
+            BulkOperationError: Some batches failed.
 
         Example:
             ```python
@@ -3032,13 +4260,25 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("schemas")
-        result = self.app_request("PATCH", path, json_body=body)
-        if not isinstance(result, list):
-            raise MixpanelHeadlessError(
-                f"Unexpected response from update_schemas_bulk: "
-                f"expected list, got {type(result).__name__}",
+
+        def send(batch: list[Any]) -> list[dict[str, Any]]:
+            result = self.app_request(
+                "PATCH",
+                path,
+                json_body={**body, "entries": batch},
+                _gzip=self._bulk.gzip,
             )
-        return result
+            if not isinstance(result, list):
+                raise MixpanelHeadlessError(
+                    f"Unexpected response from update_schemas_bulk: "
+                    f"expected list, got {type(result).__name__}",
+                )
+            return result
+
+        results = self._run_bulk(
+            "update_schemas_bulk", "schemas", body.get("entries", []), send
+        )
+        return [entry for batch in results for entry in batch]
 
     def delete_schemas(
         self,
@@ -3197,7 +4437,7 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path(f"dashboards/{dashboard_id}")
-        result = self.app_request("GET", path)
+        result = self._app_get_json(path)
         if not isinstance(result, dict):
             raise MixpanelHeadlessError(
                 f"Unexpected response from get_dashboard: "
@@ -3287,6 +4527,7 @@ class MixpanelAPIClient:
             QueryError: Invalid IDs or API error (400).
             ServerError: Server-side errors (5xx).
             MixpanelHeadlessError: Network/connection errors.
+            BulkOperationError: Some batches of a long list failed.
 
         Example:
             ```python
@@ -3295,7 +4536,14 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("dashboards/bulk-delete")
-        self.app_request("POST", path, json_body={"dashboard_ids": ids})
+        self._run_bulk(
+            "bulk_delete_dashboards",
+            "delete",
+            ids,
+            lambda batch: self.app_request(
+                "POST", path, json_body={"dashboard_ids": batch}, _gzip=self._bulk.gzip
+            ),
+        )
 
     def favorite_dashboard(self, dashboard_id: int) -> None:
         """Mark a dashboard as a favorite for the current user.
@@ -3906,24 +5154,68 @@ class MixpanelAPIClient:
                 bookmarks = client.list_bookmarks_v2(bookmark_type="funnels")
             ```
         """
+        return list(self.iter_bookmarks_v2(bookmark_type=bookmark_type, ids=ids))
+
+    def iter_bookmarks_v2(
+        self,
+        *,
+        bookmark_type: str | None = None,
+        ids: list[int] | None = None,
+        skip: Collection[JsonPath] = (),
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate bookmarks (saved reports) as the response streams in.
+
+        Same request as :meth:`list_bookmarks_v2`, but each bookmark is
+        yielded as soon as it is parsed, so a project with thousands of
+        reports never holds the whole listing in memory.
+
+        Args:
+            bookmark_type: Optional report-type filter (e.g., ``"insights"``,
+                ``"funnels"``, ``"retention"``).
+            ids: Optional list of bookmark IDs to retrieve.
+            skip: Bookmark keys to drop before they are materialized, as
+                one-element paths (e.g. ``[("params",)]``) or longer
+                paths into nested values.
+
+        Yields:
+            Bookmark dicts, in response order.
+
+        Raises:
+            AuthenticationError: Invalid or expired credentials (401).
+            QueryError: Invalid parameters (400/403).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network errors, malformed JSON, or a
+                response without a bookmark list.
+
+        Example:
+            ```python
+            with MixpanelAPIClient(credentials) as client:
+                names = [
+                    b["name"]
+                    for b in client.iter_bookmarks_v2(skip=[("params",)])
+                ]
+            ```
+        """
         path = self.maybe_scoped_path("bookmarks")
         params: dict[str, str] = {"v": "2"}
         if bookmark_type:
             params["type"] = bookmark_type
         if ids:
             params["ids"] = ",".join(str(i) for i in ids)
-        result = self.app_request("GET", path, params=params)
-        # v2 envelope: {"results": {"results": [...]}}
-        if isinstance(result, dict) and "results" in result:
-            inner = result["results"]
-            if isinstance(inner, list):
-                return inner
-        if isinstance(result, list):
-            return result
-        raise MixpanelHeadlessError(
-            f"Unexpected response from list_bookmarks_v2: "
-            f"expected list or v2 envelope, got {type(result).__name__}",
-        )
+        # v2 envelope {"results": {"results": [...]}}, the flat
+        # {"results": [...]} form, or a bare list
+        targets = [(), ("results",), ("results", "results")]
+        skip_paths = [(*t, "*", *p) for t in targets for p in skip]
+        try:
+            yield from self._app_iter_items(
+                path, targets, params=params, skip=skip_paths, required=True
+            )
+        except json_stream.MissingTargetError as e:
+            raise MixpanelHeadlessError(
+                "Unexpected response from list_bookmarks_v2: "
+                "expected list or v2 envelope",
+            ) from e
 
     def create_bookmark(self, body: dict[str, Any]) -> dict[str, Any]:
         """Create a new bookmark (saved report).
@@ -4045,7 +5337,7 @@ class MixpanelAPIClient:
         self.app_request("DELETE", path)
 
     def bulk_delete_bookmarks(self, ids: list[int]) -> None:
-        """Delete multiple bookmarks in a single request.
+        """Delete multiple bookmarks, in concurrent batches for long lists.
 
         Args:
             ids: List of bookmark IDs to delete.
@@ -4055,6 +5347,7 @@ class MixpanelAPIClient:
             QueryError: One or more IDs not found (400/404).
             RateLimitError: Rate limit exceeded after max retries (429).
             ServerError: Server-side errors (5xx).
+            BulkOperationError: Some batches of a long list failed.
 
         Example:
             ```python
@@ -4063,10 +5356,17 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("bookmarks/bulk-delete")
-        self.app_request("POST", path, json_body={"bookmark_ids": ids})
+        self._run_bulk(
+            "bulk_delete_bookmarks",
+            "delete",
+            ids,
+            lambda batch: self.app_request(
+                "POST", path, json_body={"bookmark_ids": batch}, _gzip=self._bulk.gzip
+            ),
+        )
 
     def bulk_update_bookmarks(self, entries: list[dict[str, Any]]) -> None:
-        """Update multiple bookmarks in a single request.
+        """Update multiple bookmarks, in concurrent batches for long lists.
 
         Args:
             entries: List of update dicts, each with ``id`` and fields to update.
@@ -4076,6 +5376,7 @@ class MixpanelAPIClient:
             QueryError: Invalid entries or IDs not found (400/404/422).
             RateLimitError: Rate limit exceeded after max retries (429).
             ServerError: Server-side errors (5xx).
+            BulkOperationError: Some batches of a long list failed.
 
         Example:
             ```python
@@ -4086,7 +5387,14 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("bookmarks/bulk-update")
-        self.app_request("POST", path, json_body={"bookmarks": entries})
+        self._run_bulk(
+            "bulk_update_bookmarks",
+            "bookmarks",
+            entries,
+            lambda batch: self.app_request(
+                "POST", path, json_body={"bookmarks": batch}, _gzip=self._bulk.gzip
+            ),
+        )
 
     def bookmark_linked_dashboard_ids(self, bookmark_id: int) -> list[int]:
         """Get dashboard IDs linked to a bookmark.
@@ -4336,7 +5644,7 @@ class MixpanelAPIClient:
         self.app_request("DELETE", path)
 
     def bulk_delete_cohorts(self, ids: list[int]) -> None:
-        """Delete multiple cohorts in a single request.
+        """Delete multiple cohorts, in concurrent batches for long lists.
 
         Args:
             ids: List of cohort IDs to delete.
@@ -4346,6 +5654,7 @@ class MixpanelAPIClient:
             RateLimitError: Rate limit exceeded after max retries (429).
             QueryError: One or more IDs not found (400/404).
             ServerError: Server-side errors (5xx).
+            BulkOperationError: Some batches of a long list failed.
 
         Example:
             ```python
@@ -4354,10 +5663,17 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("cohorts/bulk-delete")
-        self.app_request("POST", path, json_body={"cohort_ids": ids})
+        self._run_bulk(
+            "bulk_delete_cohorts",
+            "delete",
+            ids,
+            lambda batch: self.app_request(
+                "POST", path, json_body={"cohort_ids": batch}, _gzip=self._bulk.gzip
+            ),
+        )
 
     def bulk_update_cohorts(self, entries: list[dict[str, Any]]) -> None:
-        """Update multiple cohorts in a single request.
+        """Update multiple cohorts, in concurrent batches for long lists.
 
         Args:
             entries: List of cohort update dicts, each with ``id`` and
@@ -4368,6 +5684,7 @@ class MixpanelAPIClient:
             RateLimitError: Rate limit exceeded after max retries (429).
             QueryError: Invalid entries or IDs not found (400/404).
             ServerError: Server-side errors (5xx).
+            BulkOperationError: Some batches of a long list failed.
 
         Example:
             ```python
@@ -4378,7 +5695,14 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("cohorts/bulk-update")
-        self.app_request("POST", path, json_body={"cohorts": entries})
+        self._run_bulk(
+            "bulk_update_cohorts",
+            "cohorts",
+            entries,
+            lambda batch: self.app_request(
+                "POST", path, json_body={"cohorts": batch}, _gzip=self._bulk.gzip
+            ),
+        )
 
     # =========================================================================
     # Feature Flag CRUD (Phase 025)
@@ -5706,6 +7030,7 @@ class MixpanelAPIClient:
             QueryError: Validation error (400).
             ServerError: Server-side errors (5xx).
             MixpanelHeadlessError: Network/connection errors.
+            BulkOperationError: Some batches of a long list failed.
 
         Example:
             ```python
@@ -5714,7 +7039,14 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("alerts/custom/bulk-delete/")
-        self.app_request("POST", path, json_body={"alert_ids": ids})
+        self._run_bulk(
+            "bulk_delete_alerts",
+            "delete",
+            ids,
+            lambda batch: self.app_request(
+                "POST", path, json_body={"alert_ids": batch}, _gzip=self._bulk.gzip
+            ),
+        )
 
     def get_alert_count(self, *, alert_type: str | None = None) -> dict[str, Any]:
         """Get alert count and limits.
@@ -6035,14 +7367,18 @@ class MixpanelAPIClient:
             body: Dictionary with ``events`` key containing a list of
                 event definition updates.
 
+        Long ``events`` lists are sent in concurrent batches.
+
         Returns:
-            List of updated event definition dictionaries.
+            List of updated event definition dictionaries,
+            concatenated across batches in input order.
 
         Raises:
             AuthenticationError: Invalid credentials (401).
             QueryError: Validation error (400).
             ServerError: Server-side errors (5xx).
             MixpanelHeadlessError: Network/connection errors.
+            BulkOperationError: Some batches failed.
 
         Example:
             ```python
@@ -6056,13 +7392,28 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("data-definitions/events/")
-        result = self.app_request("PATCH", path, json_body=body)
-        if not isinstance(result, list):
-            raise MixpanelHeadlessError(
-                f"Unexpected response from bulk_update_event_definitions: "
-                f"expected list, got {type(result).__name__}",
+
+        def send(batch: list[Any]) -> list[dict[str, Any]]:
+            result = self.app_request(
+                "PATCH",
+                path,
+                json_body={**body, "events": batch},
+                _gzip=self._bulk.gzip,
             )
-        return result
+            if not isinstance(result, list):
+                raise MixpanelHeadlessError(
+                    f"Unexpected response from bulk_update_event_definitions: "
+                    f"expected list, got {type(result).__name__}",
+                )
+            return result
+
+        results = self._run_bulk(
+            "bulk_update_event_definitions",
+            "event_definitions",
+            body.get("events", []),
+            send,
+        )
+        return [item for batch in results for item in batch]
 
     def get_property_definitions(
         self,
@@ -6157,14 +7508,18 @@ class MixpanelAPIClient:
             body: Dictionary with ``properties`` key containing a list of
                 property definition updates.
 
+        Long ``properties`` lists are sent in concurrent batches.
+
         Returns:
-            List of updated property definition dictionaries.
+            List of updated property definition dictionaries,
+            concatenated across batches in input order.
 
         Raises:
             AuthenticationError: Invalid credentials (401).
             QueryError: Validation error (400).
             ServerError: Server-side errors (5xx).
             MixpanelHeadlessError: Network/connection errors.
+            BulkOperationError: Some batches failed.
 
         Example:
             ```python
@@ -6178,13 +7533,28 @@ class MixpanelAPIClient:
             ```
         """
         path = self.maybe_scoped_path("data-definitions/properties/")
-        result = self.app_request("PATCH", path, json_body=body)
-        if not isinstance(result, list):
-            raise MixpanelHeadlessError(
-                f"Unexpected response from bulk_update_property_definitions: "
-                f"expected list, got {type(result).__name__}",
+
+        def send(batch: list[Any]) -> list[dict[str, Any]]:
+            result = self.app_request(
+                "PATCH",
+                path,
+                json_body={**body, "properties": batch},
+                _gzip=self._bulk.gzip,
             )
-        return result
+            if not isinstance(result, list):
+                raise MixpanelHeadlessError(
+                    f"Unexpected response from bulk_update_property_definitions: "
+                    f"expected list, got {type(result).__name__}",
+                )
+            return result
+
+        results = self._run_bulk(
+            "bulk_update_property_definitions",
+            "property_definitions",
+            body.get("properties", []),
+            send,
+        )
+        return [item for batch in results for item in batch]
 
     def list_lexicon_tags(self) -> list[dict[str, Any]]:
         """List all Lexicon tags for the project.
@@ -6448,7 +7818,7 @@ class MixpanelAPIClient:
         ]
         types_to_export = export_types if export_types is not None else _default_types
         params = {"export_type": json.dumps(types_to_export)}
-        result = self.app_request("GET", path, params=params)
+        result = self._app_get_json(path, params=params)
         if isinstance(result, str):
             # Async export — returns status message
             return {"status": "pending", "message": result}
@@ -6932,17 +8302,7 @@ class MixpanelAPIClient:
                 client.upload_to_signed_url(info["url"], b"id,name\\n1,foo")
             ```
         """
-        # Use a clean client without default headers — the shared client
-        # may have custom headers (via MP_CUSTOM_HEADER_* env vars) that
-        # GCS includes in signature validation, causing
-        # SignatureDoesNotMatch errors.
-        if self._transport is not None:
-            # Test mode: use the mock transport
-            upload_client = httpx.Client(
-                transport=self._transport, timeout=self._timeout
-            )
-        else:
-            upload_client = httpx.Client(timeout=self._timeout)
+        upload_client = self._signed_url_client()
         try:
             response = upload_client.put(
                 url,
@@ -6957,6 +8317,110 @@ class MixpanelAPIClient:
             ) from e
         finally:
             upload_client.close()
+        self._check_signed_upload(response, url)
+
+    def upload_file_to_signed_url(
+        self,
+        url: str,
+        file_path: str | Path,
+        *,
+        compress: bool = False,
+        resumable: bool = False,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        """Stream a local CSV file to a signed GCS URL.
+
+        Unlike :meth:`upload_to_signed_url`, the file is never read into
+        memory: it is sent from disk ``chunk_size`` bytes at a time.
+        Transient failures (``RetryPolicy.statuses`` and transport errors)
+        are retried; see ``_internal/signed_upload.py`` for the transfer
+        modes.
+
+        Args:
+            url: Signed upload URL (from ``get_lookup_upload_url()``).
+            file_path: Path to the CSV file.
+            compress: Gzip the file (to a temporary file) and upload it with
+                ``Content-Encoding: gzip``.
+            resumable: Open a resumable upload session so a failure resumes
+                from the last persisted byte instead of restarting. Falls
+                back to a single streamed ``PUT`` when the URL does not
+                allow sessions.
+            chunk_size: Bytes read and sent per chunk. Must be a multiple
+                of 256 KiB when ``resumable`` is set.
+            progress: Optional callback receiving ``(bytes_sent,
+                total_bytes)`` of the (possibly compressed) payload.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: Invalid ``chunk_size``.
+            MixpanelHeadlessError: Upload failed (non-2xx response or
+                network error after retries).
+
+        Example:
+            ```python
+            with MixpanelAPIClient(credentials) as client:
+                info = client.get_lookup_upload_url()
+                client.upload_file_to_signed_url(
+                    info["url"], "products.csv", compress=True
+                )
+            ```
+        """
+        path = Path(file_path)
+        headers = {"Content-Type": "text/csv"}
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+        with (
+            compress_to_tempfile(path, chunk_size) if compress else path.open("rb")
+        ) as fh:
+            upload_client = self._signed_url_client()
+            try:
+                response = upload_file(
+                    upload_client,
+                    url,
+                    fh,
+                    headers=headers,
+                    policy=self._retry_policy,
+                    chunk_size=chunk_size,
+                    resumable=resumable,
+                    progress=progress,
+                )
+            except httpx.HTTPError as e:
+                raise MixpanelHeadlessError(
+                    f"Upload to signed URL failed: {e}",
+                    code="UPLOAD_ERROR",
+                    details={"url": url},
+                ) from e
+            finally:
+                upload_client.close()
+        self._check_signed_upload(response, url)
+
+    def _signed_url_client(self) -> httpx.Client:
+        """Create an HTTP client for signed-URL uploads.
+
+        Returns:
+            A fresh client without the shared client's default headers.
+        """
+        # Use a clean client without default headers — the shared client
+        # may have custom headers (via MP_CUSTOM_HEADER_* env vars) that
+        # GCS includes in signature validation, causing
+        # SignatureDoesNotMatch errors.
+        if self._transport is not None:
+            # Test mode: use the mock transport
+            return httpx.Client(transport=self._transport, timeout=self._timeout)
+        return httpx.Client(timeout=self._timeout)
+
+    @staticmethod
+    def _check_signed_upload(response: httpx.Response, url: str) -> None:
+        """Raise if a signed-URL upload was not accepted.
+
+        Args:
+            response: Final upload response.
+            url: Signed URL.
+
+        Raises:
+            MixpanelHeadlessError: Non-2xx response.
+        """
         if response.status_code >= 300:
             raise MixpanelHeadlessError(
                 f"Upload to signed URL failed with status "
@@ -7000,10 +8464,10 @@ class MixpanelAPIClient:
         path = self.maybe_scoped_path("data-definitions/lookup-tables/")
         url = self._build_url("app", path)
         auth_header = self._get_auth_header()
-        client = self._ensure_client()
-        response = client.request(
+        response = self._send(
             "POST",
             url,
+            family="app",
             data=form_data,
             headers=self._request_headers({"Authorization": auth_header}),
             timeout=self._timeout,
@@ -7196,17 +8660,11 @@ class MixpanelAPIClient:
         path = self.maybe_scoped_path("data-definitions/lookup-tables/download/")
         url = self._build_url("app", path)
         auth_header = self._get_auth_header()
-        client = self._ensure_client()
-        params: dict[str, str] = {
-            "data-group-id": str(data_group_id),
-        }
-        if file_name is not None:
-            params["file-name"] = file_name
-        if limit is not None:
-            params["limit"] = str(limit)
-        response = client.request(
+        params = self._lookup_download_params(data_group_id, file_name, limit)
+        response = self._send(
             "GET",
             url,
+            family="app",
             params=params,
             headers=self._request_headers({"Authorization": auth_header}),
             timeout=self._timeout,
@@ -7222,6 +8680,71 @@ class MixpanelAPIClient:
             )
         return response.content
 
+    def iter_lookup_table_bytes(
+        self,
+        data_group_id: int,
+        *,
+        file_name: str | None = None,
+        limit: int | None = None,
+    ) -> Generator[bytes, None, None]:
+        """Stream lookup table CSV data in chunks.
+
+        Same request as :meth:`download_lookup_table`, but the body is
+        yielded as it arrives instead of being buffered. ``429`` and
+        transient failures are retried until the body starts; the
+        connection stays open until the iterator is exhausted or closed.
+
+        Args:
+            data_group_id: Data group ID of the lookup table.
+            file_name: Optional file name filter.
+            limit: Optional row limit.
+
+        Yields:
+            Consecutive chunks of the CSV body.
+
+        Raises:
+            AuthenticationError: Invalid credentials (401).
+            QueryError: Table not found (404).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+
+        Example:
+            ```python
+            with MixpanelAPIClient(credentials) as client, open(
+                "table.csv", "wb"
+            ) as f:
+                for chunk in client.iter_lookup_table_bytes(42):
+                    f.write(chunk)
+            ```
+        """
+        path = self.maybe_scoped_path("data-definitions/lookup-tables/download/")
+        params = self._lookup_download_params(data_group_id, file_name, limit)
+        with self._app_stream(path, params=params) as chunks:
+            yield from chunks
+
+    @staticmethod
+    def _lookup_download_params(
+        data_group_id: int, file_name: str | None, limit: int | None
+    ) -> dict[str, str]:
+        """Build query parameters for the lookup table download endpoint.
+
+        Args:
+            data_group_id: Data group ID of the lookup table.
+            file_name: Optional file name filter.
+            limit: Optional row limit.
+
+        Returns:
+            Query parameters.
+        """
+        params: dict[str, str] = {
+            "data-group-id": str(data_group_id),
+        }
+        if file_name is not None:
+            params["file-name"] = file_name
+        if limit is not None:
+            params["limit"] = str(limit)
+        return params
+
     def get_lookup_download_url(self, data_group_id: int) -> str:
         """Get a download URL for lookup table data.
 
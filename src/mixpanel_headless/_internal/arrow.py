@@ -0,0 +1,442 @@
+"""Columnar (Apache Arrow) conversion for exported events and profiles.
+
+:class:`EventBatchBuilder` appends raw Export API events straight into
+per-column lists and emits ``pyarrow.RecordBatch`` objects, skipping the
+per-event normalized dict built by ``transform_event``
+(:class:`ProfileBatchBuilder` does the same for Engage profiles). Fixed
+event columns come first:
+
+- ``event_name``: string
+- ``event_time``: ``timestamp[us, UTC]`` from ``properties.time``
+- ``distinct_id``: string
+- ``insert_id``: string (null when the event has no ``$insert_id``)
+
+Every other property becomes its own column, typed from the values seen in
+the batch. Mixed types widen along ``null -> bool | int64 -> float64 ->
+string``; nested objects and lists, and integers beyond int64, are stored
+as text. A property
+whose name collides with a fixed column is stored as ``properties.<name>``.
+
+:func:`conform_batch` and :func:`widen_schema` reconcile batches whose
+types drifted, so writers can keep one schema per file.
+
+This module requires ``pyarrow``. It is a private implementation detail.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pyarrow as pa
+
+#: Fixed leading columns of an event batch, in order.
+EVENT_COLUMNS: tuple[str, ...] = (
+    "event_name",
+    "event_time",
+    "distinct_id",
+    "insert_id",
+)
+
+#: Properties promoted to fixed columns (see ``transforms.RESERVED_EVENT_KEYS``).
+_EVENT_PROMOTED = frozenset({"time", "distinct_id", "$insert_id"})
+
+#: Fixed leading columns of a profile batch, in order.
+PROFILE_COLUMNS: tuple[str, ...] = ("distinct_id", "last_seen")
+
+#: Profile properties promoted to fixed columns.
+_PROFILE_PROMOTED = frozenset({"$last_seen"})
+
+#: Arrow type for each inferred value kind. ``string`` columns hold only
+#: strings; ``text`` columns mix types or hold objects/lists and are
+#: rendered to strings when the batch is built.
+_KIND_TYPES: dict[str, pa.DataType] = {
+    "null": pa.null(),
+    "bool": pa.bool_(),
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "string": pa.string(),
+    "text": pa.string(),
+}
+
+#: Column kind for each decoded JSON value type; anything else (objects,
+#: lists) is ``text``.
+_KIND_BY_TYPE: dict[type, str] = {
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "string",
+}
+
+
+def _join_kinds(a: str, b: str) -> str:
+    """Return the narrowest kind that can hold values of both kinds.
+
+    Args:
+        a: First kind.
+        b: Second kind.
+
+    Returns:
+        The widened kind.
+    """
+    if a == b or b == "null":
+        return a
+    if a == "null":
+        return b
+    if {a, b} == {"int", "float"}:
+        return "float"
+    return "text"
+
+
+def _as_text(value: Any) -> str | None:
+    """Render a value for a string column.
+
+    Args:
+        value: A decoded JSON value.
+
+    Returns:
+        Strings unchanged, booleans as ``true``/``false``, everything else
+        as compact JSON; ``None`` stays null.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class _Column:
+    """Null-padded values for one flattened property column."""
+
+    __slots__ = ("kind", "values")
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self.kind = "null"
+        self.values: list[Any] = []
+
+    def to_array(self, rows: int) -> pa.Array:
+        """Convert to an Arrow array of ``rows`` entries.
+
+        Args:
+            rows: Number of rows in the batch.
+
+        Returns:
+            Array typed from the column's widened kind.
+        """
+        values = self.values
+        if len(values) < rows:
+            values.extend([None] * (rows - len(values)))
+        if self.kind == "int":
+            try:
+                return pa.array(values, type=pa.int64())
+            except OverflowError:
+                # Integers beyond int64 are kept losslessly as text
+                self.kind = "text"
+        if self.kind == "text":
+            values = [_as_text(v) for v in values]
+        return pa.array(values, type=_KIND_TYPES[self.kind])
+
+
+class PropertyColumns:
+    """Flattened, type-inferred property columns for a batch of records."""
+
+    def __init__(self, reserved: Iterable[str]) -> None:
+        """Initialize with no columns.
+
+        Args:
+            reserved: Fixed column names; colliding properties are stored as
+                ``properties.<name>``.
+        """
+        self._reserved = frozenset(reserved)
+        self._columns: dict[str, _Column] = {}
+
+    def add(self, row: int, properties: dict[str, Any], skip: frozenset[str]) -> None:
+        """Record one row's properties.
+
+        Args:
+            row: Zero-based row index within the batch.
+            properties: Property mapping for the row.
+            skip: Keys already promoted to fixed columns.
+        """
+        columns = self._columns
+        kinds = _KIND_BY_TYPE
+        for key, value in properties.items():
+            if value is None or key in skip:
+                continue
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = _Column()
+            kind = kinds.get(type(value), "text")
+            if kind != column.kind:
+                column.kind = _join_kinds(column.kind, kind)
+            values = column.values
+            if len(values) < row:
+                values.extend([None] * (row - len(values)))
+            values.append(value)
+
+    def arrays(self, rows: int) -> tuple[list[str], list[pa.Array]]:
+        """Build arrays for every column and reset.
+
+        Args:
+            rows: Number of rows in the batch.
+
+        Returns:
+            ``(names, arrays)`` in first-seen column order.
+        """
+        names = [
+            f"properties.{key}" if key in self._reserved else key
+            for key in self._columns
+        ]
+        arrays = [column.to_array(rows) for column in self._columns.values()]
+        self._columns = {}
+        return names, arrays
+
+
+def _event_time_micros(value: Any) -> int | None:
+    """Convert an export ``time`` (Unix seconds) to microseconds.
+
+    Args:
+        value: Raw ``properties.time`` value.
+
+    Returns:
+        Microseconds since the epoch, or ``None`` if missing or not numeric.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if isinstance(value, int):
+        return value * 1_000_000
+    return round(value * 1_000_000)
+
+
+def _text_or_none(value: Any) -> str | None:
+    """Coerce an identifier to ``str``, keeping ``None``."""
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+class EventBatchBuilder:
+    """Accumulate raw exported events into Arrow record batches.
+
+    Example:
+        ```python
+        builder = EventBatchBuilder()
+        for event in api_client.export_events("2024-01-01", "2024-01-01"):
+            builder.append(event)
+            if len(builder) >= 10_000:
+                yield builder.build()
+        if len(builder):
+            yield builder.build()
+        ```
+    """
+
+    def __init__(self, reserved: Iterable[str] = ()) -> None:
+        """Initialize an empty builder.
+
+        Args:
+            reserved: Extra column names (e.g. partition keys) that
+                properties must not use; such properties are stored as
+                ``properties.<name>``.
+        """
+        self._names: list[str | None] = []
+        self._times: list[int | None] = []
+        self._distinct_ids: list[str | None] = []
+        self._insert_ids: list[str | None] = []
+        self._properties = PropertyColumns((*EVENT_COLUMNS, *reserved))
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._names)
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Add one raw Export API event.
+
+        Args:
+            event: Event with ``event`` and ``properties`` keys.
+        """
+        properties = event.get("properties") or {}
+        self._properties.add(len(self._names), properties, _EVENT_PROMOTED)
+        self._names.append(_text_or_none(event.get("event")))
+        self._times.append(_event_time_micros(properties.get("time")))
+        self._distinct_ids.append(_text_or_none(properties.get("distinct_id")))
+        self._insert_ids.append(_text_or_none(properties.get("$insert_id")))
+
+    def build(self) -> pa.RecordBatch:
+        """Emit the buffered rows as a record batch and reset.
+
+        Returns:
+            Batch with the fixed event columns followed by property columns.
+        """
+        rows = len(self._names)
+        names, arrays = self._properties.arrays(rows)
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(self._names, type=pa.string()),
+                pa.array(self._times, type=pa.timestamp("us", tz="UTC")),
+                pa.array(self._distinct_ids, type=pa.string()),
+                pa.array(self._insert_ids, type=pa.string()),
+                *arrays,
+            ],
+            names=[*EVENT_COLUMNS, *names],
+        )
+        self._names = []
+        self._times = []
+        self._distinct_ids = []
+        self._insert_ids = []
+        return batch
+
+
+class ProfileBatchBuilder:
+    """Accumulate raw Engage profiles into Arrow record batches.
+
+    Columns are ``distinct_id`` and ``last_seen`` (both strings, as in
+    ``transform_profile``) followed by one column per profile property.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty builder."""
+        self._distinct_ids: list[str | None] = []
+        self._last_seen: list[str | None] = []
+        self._properties = PropertyColumns(PROFILE_COLUMNS)
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._distinct_ids)
+
+    def append(self, profile: dict[str, Any]) -> None:
+        """Add one raw Engage profile.
+
+        Args:
+            profile: Profile with ``$distinct_id`` and ``$properties`` keys.
+        """
+        properties = profile.get("$properties") or {}
+        self._properties.add(len(self._distinct_ids), properties, _PROFILE_PROMOTED)
+        self._distinct_ids.append(_text_or_none(profile.get("$distinct_id")))
+        self._last_seen.append(_text_or_none(properties.get("$last_seen")))
+
+    def build(self) -> pa.RecordBatch:
+        """Emit the buffered rows as a record batch and reset.
+
+        Returns:
+            Batch with the fixed profile columns followed by property columns.
+        """
+        rows = len(self._distinct_ids)
+        names, arrays = self._properties.arrays(rows)
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(self._distinct_ids, type=pa.string()),
+                pa.array(self._last_seen, type=pa.string()),
+                *arrays,
+            ],
+            names=[*PROFILE_COLUMNS, *names],
+        )
+        self._distinct_ids = []
+        self._last_seen = []
+        return batch
+
+
+def iter_batches(
+    records: Iterable[dict[str, Any]],
+    builder: EventBatchBuilder | ProfileBatchBuilder,
+    batch_size: int,
+) -> Iterator[pa.RecordBatch]:
+    """Group raw records into record batches of up to ``batch_size`` rows.
+
+    Each batch carries the property columns seen in its own rows, so
+    consecutive batches may have different schemas; use
+    :func:`widen_schema` and :func:`conform_batch` to align them.
+
+    Args:
+        records: Raw events or profiles.
+        builder: Builder matching the record kind.
+        batch_size: Maximum rows per batch.
+
+    Yields:
+        Record batches; the last one may be short.
+
+    Raises:
+        ValueError: If ``batch_size`` is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    for record in records:
+        builder.append(record)
+        if len(builder) >= batch_size:
+            yield builder.build()
+    if len(builder):
+        yield builder.build()
+
+
+def _join_types(a: pa.DataType, b: pa.DataType) -> pa.DataType:
+    """Return the narrowest Arrow type that can hold both types.
+
+    Args:
+        a: First type.
+        b: Second type.
+
+    Returns:
+        ``a`` if equal; the non-null type; ``float64`` for int/float;
+        otherwise ``string``.
+    """
+    if a == b or pa.types.is_null(b):
+        return a
+    if pa.types.is_null(a):
+        return b
+    if {a, b} == {pa.int64(), pa.float64()}:
+        return pa.float64()
+    return pa.string()
+
+
+def widen_schema(current: pa.Schema, incoming: pa.Schema) -> pa.Schema:
+    """Merge two schemas, widening types that disagree.
+
+    Args:
+        current: Schema already in use; its column order is kept.
+        incoming: Schema of a new batch; new columns are appended.
+
+    Returns:
+        A schema that every batch of either schema conforms to.
+    """
+    fields = {field.name: field.type for field in current}
+    for field in incoming:
+        existing = fields.get(field.name)
+        fields[field.name] = (
+            field.type if existing is None else _join_types(existing, field.type)
+        )
+    return pa.schema(list(fields.items()))
+
+
+def conform_batch(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch | None:
+    """Reshape a batch to ``schema`` without losing information.
+
+    Missing columns are filled with nulls and narrower types are cast up
+    (e.g. int64 into float64, anything into string).
+
+    Args:
+        batch: Batch to reshape.
+        schema: Target schema.
+
+    Returns:
+        The conformed batch, or ``None`` if ``batch`` has a column that
+        ``schema`` lacks or a type ``schema`` cannot hold.
+    """
+    if batch.schema == schema:
+        return batch
+    names = set(schema.names)
+    for field in batch.schema:
+        if field.name not in names:
+            return None
+        if (
+            _join_types(schema.field(field.name).type, field.type)
+            != schema.field(field.name).type
+        ):
+            return None
+    arrays = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index == -1:
+            arrays.append(pa.nulls(batch.num_rows, type=field.type))
+            continue
+        column = batch.column(index)
+        arrays.append(column if column.type == field.type else column.cast(field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
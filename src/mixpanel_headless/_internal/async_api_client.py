@@ -0,0 +1,936 @@
+"""Asynchronous Mixpanel API Client.
+
+``httpx.AsyncClient`` counterpart of :class:`MixpanelAPIClient` for callers
+that run many queries concurrently from an asyncio event loop instead of
+from OS threads. Covers the request core (retry on 429), the Export and
+Engage streaming paths, the inline query endpoints, and the App API.
+
+Everything that does not touch the network — auth header resolution,
+regional URL routing, header layering, error mapping, and request
+parameter encoding — is delegated to a dormant :class:`MixpanelAPIClient`
+so the two clients cannot drift apart. The sync client's connection pool
+is never opened.
+
+This is a private implementation detail. Users should use the
+AsyncWorkspace class instead of accessing this module directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any, Literal
+
+import httpx
+
+from mixpanel_headless._internal.api_client import (
+    MixpanelAPIClient,
+    _check_export_replay,
+    _event_insert_id,
+    _profile_page_result,
+)
+from mixpanel_headless._internal.auth.account import ServiceAccount, TokenResolver
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.client_metadata import QUERY_ORIGIN
+from mixpanel_headless._internal.jsonl import LineSplitter, loads
+from mixpanel_headless.exceptions import (
+    AuthenticationError,
+    MixpanelHeadlessError,
+    QueryError,
+    RateLimitError,
+)
+from mixpanel_headless.types import ProfilePageResult, PublicWorkspace
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+
+async def _aiter_jsonl_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Iterate over JSONL lines from an async streaming response.
+
+    Async counterpart of ``_iter_jsonl_lines``: buffers raw bytes so lines
+    split across (gzip-decoded) chunk boundaries are reassembled before
+    being decoded with ``jsonl.loads``.
+
+    Args:
+        response: An httpx streaming Response from ``AsyncClient.stream()``.
+
+    Yields:
+        Complete raw lines from the response, without trailing newlines.
+        Blank lines are skipped.
+    """
+    splitter = LineSplitter()
+    async for chunk in response.aiter_bytes():
+        for line in splitter.feed(chunk):
+            yield line
+    for line in splitter.flush():
+        yield line
+
+
+class AsyncMixpanelAPIClient:
+    """Low-level asynchronous HTTP client for Mixpanel APIs.
+
+    Mirrors the request semantics of :class:`MixpanelAPIClient` (429 retry
+    with ``Retry-After`` / exponential backoff, identical exception mapping)
+    on top of ``httpx.AsyncClient``. Most users won't use this directly —
+    they'll use :class:`~mixpanel_headless.AsyncWorkspace` instead.
+
+    Example:
+        ```python
+        from mixpanel_headless._internal.auth.resolver import resolve_session
+        from mixpanel_headless._internal.async_api_client import (
+            AsyncMixpanelAPIClient,
+        )
+
+        session = resolve_session()
+
+        async with AsyncMixpanelAPIClient(session=session) as client:
+            me = await client.me()
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Session,
+        timeout: float = 120.0,
+        export_timeout: float = 600.0,
+        max_retries: int = 3,
+        token_resolver: TokenResolver | None = None,
+        _transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the async API client.
+
+        Args:
+            session: Resolved Session (account + project + optional workspace).
+            timeout: Request timeout in seconds for regular requests.
+            export_timeout: Request timeout for export operations.
+            max_retries: Maximum retry attempts for rate-limited requests.
+            token_resolver: For OAuth accounts; defaults to
+                :class:`OnDiskTokenResolver`.
+            _transport: Internal parameter for testing with MockTransport.
+        """
+        self._core = MixpanelAPIClient(
+            session=session,
+            timeout=timeout,
+            export_timeout=export_timeout,
+            max_retries=max_retries,
+            token_resolver=token_resolver,
+        )
+        self._timeout = timeout
+        self._export_timeout = export_timeout
+        self._max_retries = max_retries
+        self._client: httpx.AsyncClient | None = None
+        self._transport = _transport
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure the underlying async connection pool is initialized.
+
+        Returns:
+            The httpx.AsyncClient instance (connection pool only).
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _auth_header(self) -> str:
+        """Resolve the Authorization header without blocking the event loop.
+
+        Service accounts return the cached ``Basic ...`` header directly.
+        OAuth resolution may refresh the token over HTTP while holding a
+        file lock, so it runs on a worker thread.
+
+        Returns:
+            Authorization header value appropriate for the auth method.
+
+        Raises:
+            OAuthError: An OAuth account's token cannot be re-resolved.
+        """
+        if isinstance(self._core.session.account, ServiceAccount):
+            return self._core._get_auth_header()
+        return await asyncio.to_thread(self._core._get_auth_header)
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client and release resources."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> AsyncMixpanelAPIClient:
+        """Enter async context manager."""
+        self._ensure_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager, closing the client."""
+        await self.aclose()
+
+    # =========================================================================
+    # Session accessors
+    # =========================================================================
+
+    @property
+    def session(self) -> Session:
+        """Return the resolved Session bound to this client."""
+        return self._core.session
+
+    @property
+    def project_id(self) -> str:
+        """Return the project ID from the bound Session."""
+        return self._core.project_id
+
+    @property
+    def region(self) -> str:
+        """Return the region code ('us', 'eu', or 'in') from the Session."""
+        return self._core.region
+
+    @property
+    def workspace_id(self) -> int | None:
+        """Return the explicit workspace ID, if set."""
+        return self._core.workspace_id
+
+    def set_workspace_id(self, workspace_id: int | None) -> None:
+        """Set or clear the explicit workspace ID for scoped requests.
+
+        Args:
+            workspace_id: Workspace ID to use, or None to clear.
+        """
+        self._core.set_workspace_id(workspace_id)
+
+    def maybe_scoped_path(self, domain_path: str) -> str:
+        """Build an optionally workspace-scoped App API path.
+
+        Args:
+            domain_path: Domain-relative path (e.g., ``"dashboards"``).
+
+        Returns:
+            ``/workspaces/{wid}/{domain_path}`` when a workspace is set,
+            otherwise ``/projects/{pid}/{domain_path}``.
+        """
+        return self._core.maybe_scoped_path(domain_path)
+
+    # =========================================================================
+    # Request core
+    # =========================================================================
+
+    async def _wait_for_retry(
+        self,
+        response: httpx.Response,
+        attempt: int,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Sleep before retrying a 429, or raise once retries are exhausted.
+
+        Args:
+            response: The 429 response.
+            attempt: Zero-based attempt number that produced ``response``.
+            method: HTTP method (for error context).
+            url: Request URL (for error context).
+            params: Request query parameters (for error context).
+
+        Raises:
+            RateLimitError: ``attempt`` is the final permitted attempt.
+        """
+        retry_after = self._core._parse_retry_after(response)
+        if attempt >= self._max_retries:
+            response_body: str | dict[str, Any] | None = None
+            try:
+                response_body = response.json()
+            except json.JSONDecodeError:
+                response_body = response.text[:500] if response.text else None
+            raise RateLimitError(
+                "Rate limit exceeded after max retries",
+                retry_after=retry_after,
+                status_code=response.status_code,
+                response_body=response_body,
+                request_method=method,
+                request_url=url,
+                request_params=params,
+            )
+        if retry_after is not None:
+            wait_time = float(retry_after)
+        else:
+            wait_time = self._core._calculate_backoff(attempt)
+        logger.warning(
+            "Rate limited, retrying in %.1f seconds (attempt %d/%d)",
+            wait_time,
+            attempt + 1,
+            self._max_retries,
+        )
+        await asyncio.sleep(wait_time)
+
+    async def _execute_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        form_data: dict[str, Any] | None = None,
+        headers: dict[str, str],
+        timeout: float | None = None,
+    ) -> Any:
+        """Execute an HTTP request with retry logic for rate limiting.
+
+        Async mirror of :meth:`MixpanelAPIClient._execute_with_retry`.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            url: Full URL to request.
+            params: Optional query parameters.
+            json_data: Optional JSON request body.
+            form_data: Optional form-encoded request body.
+            headers: Request headers (must include Authorization).
+            timeout: Optional request timeout in seconds.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            QueryError: Invalid parameters (400).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+        """
+        client = self._ensure_client()
+        request_body = json_data or form_data
+        if params is None:
+            params = {}
+        params["query_origin"] = QUERY_ORIGIN
+        request_headers = self._core._request_headers(headers)
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json_data,
+                    data=form_data,
+                    headers=request_headers,
+                    timeout=timeout or self._timeout,
+                )
+            except httpx.HTTPError as e:
+                raise MixpanelHeadlessError(
+                    f"HTTP error: {e}",
+                    code="HTTP_ERROR",
+                    details={
+                        "error": str(e),
+                        "request_method": method,
+                        "request_url": url,
+                        "request_params": params,
+                    },
+                ) from e
+
+            if response.status_code == 429:
+                await self._wait_for_retry(response, attempt, method, url, params)
+                continue
+
+            return self._core._handle_response(
+                response,
+                request_method=method,
+                request_url=url,
+                request_params=params,
+                request_body=request_body,
+            )
+
+        # Should not reach here, but satisfy type checker
+        raise RateLimitError(  # pragma: no cover
+            "Rate limit exceeded after max retries",
+            request_method=method,
+            request_url=url,
+            request_params=params,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        form_data: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        inject_project_id: bool = True,
+    ) -> Any:
+        """Make an authenticated request with optional project_id injection.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            url: Full URL to request.
+            params: Query parameters.
+            data: Request body as JSON (for POST).
+            form_data: Request body as form-encoded (for POST).
+            timeout: Override default timeout.
+            inject_project_id: If True (default), adds ``project_id`` to the
+                query params.
+
+        Returns:
+            Parsed JSON response.
+        """
+        if params is None:
+            params = {}
+        if inject_project_id:
+            params["project_id"] = self.project_id
+        return await self._execute_with_retry(
+            method,
+            url,
+            params=params,
+            json_data=data,
+            form_data=form_data,
+            headers={"Authorization": await self._auth_header()},
+            timeout=timeout,
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Make an authenticated request to any Mixpanel API endpoint.
+
+        Async mirror of :meth:`MixpanelAPIClient.request`.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.).
+            url: Full URL to request.
+            params: Optional query parameters.
+            json_body: Optional JSON request body.
+            headers: Optional additional headers (Authorization is added
+                automatically).
+            timeout: Optional request timeout in seconds.
+
+        Returns:
+            Parsed JSON response.
+        """
+        request_headers = {"Authorization": await self._auth_header()}
+        if headers:
+            request_headers.update(headers)
+        return await self._execute_with_retry(
+            method,
+            url,
+            params=params,
+            json_data=json_body,
+            headers=request_headers,
+            timeout=timeout,
+        )
+
+    # =========================================================================
+    # App API
+    # =========================================================================
+
+    async def app_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        json_body: dict[str, Any] | None = None,
+        form_body: dict[str, str] | None = None,
+        _raw: bool = False,
+    ) -> Any:
+        """Make an authenticated request to the Mixpanel App API.
+
+        Async mirror of :meth:`MixpanelAPIClient.app_request`: 204 becomes
+        ``{"status": "ok"}``, 422 becomes :class:`QueryError`, and the
+        ``results`` envelope is unwrapped unless ``_raw`` is set.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE, etc.).
+            path: API path (e.g., ``/projects/12345/dashboards``).
+            params: Optional query parameters.
+            json_body: Optional JSON request body.
+            form_body: Optional form-encoded request body.
+            _raw: If True, return the full response without unwrapping.
+
+        Returns:
+            The ``results`` field from the response JSON if present,
+            otherwise the full response body.
+
+        Raises:
+            ValueError: Both ``json_body`` and ``form_body`` were provided.
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: Rate limit exceeded after max retries (429).
+            QueryError: Invalid parameters or resource not found (400, 404, 422).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+        """
+        if json_body is not None and form_body is not None:
+            raise ValueError(
+                "app_request: json_body and form_body are mutually exclusive"
+            )
+
+        url = self._core._build_url("app", path)
+        headers = self._core._request_headers(
+            {"Authorization": await self._auth_header()}
+        )
+        client = self._ensure_client()
+        request_params: dict[str, str] = dict(params) if params else {}
+        request_body: dict[str, Any] | dict[str, str] | None = (
+            form_body if form_body is not None else json_body
+        )
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                if form_body is not None:
+                    response = await client.request(
+                        method,
+                        url,
+                        params=request_params,
+                        data=form_body,
+                        headers=headers,
+                        timeout=self._timeout,
+                    )
+                else:
+                    response = await client.request(
+                        method,
+                        url,
+                        params=request_params,
+                        json=json_body,
+                        headers=headers,
+                        timeout=self._timeout,
+                    )
+            except httpx.HTTPError as e:
+                raise MixpanelHeadlessError(
+                    f"HTTP error: {e}",
+                    code="HTTP_ERROR",
+                    details={
+                        "error": str(e),
+                        "request_method": method,
+                        "request_url": url,
+                    },
+                ) from e
+
+            if response.status_code == 204:
+                return {"status": "ok"}
+
+            if response.status_code == 429:
+                await self._wait_for_retry(response, attempt, method, url)
+                continue
+
+            if response.status_code == 422:
+                err_body: str | dict[str, Any] | None = None
+                try:
+                    err_body = response.json()
+                except json.JSONDecodeError:
+                    err_body = response.text[:500] if response.text else None
+                error_msg = "Unprocessable entity"
+                if isinstance(err_body, dict):
+                    error_msg = str(err_body.get("error", error_msg))
+                raise QueryError(
+                    error_msg,
+                    status_code=422,
+                    response_body=err_body,
+                    request_method=method,
+                    request_url=url,
+                    request_body=request_body,
+                )
+
+            result = self._core._handle_response(
+                response,
+                request_method=method,
+                request_url=url,
+                request_params=request_params,
+                request_body=request_body,
+            )
+            if not _raw and isinstance(result, dict) and "results" in result:
+                return result["results"]
+            return result
+
+        # Should not reach here, but satisfy type checker
+        raise RateLimitError(  # pragma: no cover
+            "Rate limit exceeded after max retries",
+            request_method=method,
+            request_url=url,
+        )
+
+    async def me(self) -> dict[str, Any]:
+        """Call GET /api/app/me to retrieve the authenticated user's profile.
+
+        Returns:
+            Raw JSON response dict from ``/api/app/me``.
+        """
+        result = await self.app_request("GET", "/me")
+        if not isinstance(result, dict):
+            return {"results": result}
+        return result
+
+    async def list_workspaces(self) -> list[PublicWorkspace]:
+        """List all public workspaces for the current project.
+
+        Returns:
+            List of PublicWorkspace models for the project.
+
+        Raises:
+            MixpanelHeadlessError: The response was not a list.
+        """
+        path = f"/projects/{self.project_id}/workspaces/public"
+        results = await self.app_request("GET", path)
+        if not isinstance(results, list):
+            raise MixpanelHeadlessError(
+                f"Unexpected response format from list_workspaces: "
+                f"expected list, got {type(results).__name__}",
+            )
+        return [PublicWorkspace.model_validate(ws) for ws in results]
+
+    async def get_dashboard(self, dashboard_id: int) -> dict[str, Any]:
+        """Get a single dashboard by ID.
+
+        Args:
+            dashboard_id: The numeric dashboard identifier.
+
+        Returns:
+            Dictionary representing the dashboard.
+
+        Raises:
+            MixpanelHeadlessError: The response was not a dict.
+        """
+        path = self.maybe_scoped_path(f"dashboards/{dashboard_id}")
+        result = await self.app_request("GET", path)
+        if not isinstance(result, dict):
+            raise MixpanelHeadlessError(
+                f"Unexpected response from get_dashboard: "
+                f"expected dict, got {type(result).__name__}",
+            )
+        return result
+
+    async def get_bookmark(self, bookmark_id: int) -> dict[str, Any]:
+        """Retrieve a single bookmark by ID.
+
+        Args:
+            bookmark_id: Unique identifier of the bookmark.
+
+        Returns:
+            Bookmark dict with ``id``, ``name``, ``type``, and ``params``.
+
+        Raises:
+            MixpanelHeadlessError: The response was not a dict.
+        """
+        path = self.maybe_scoped_path(f"bookmarks/{bookmark_id}")
+        result = await self.app_request("GET", path, params={"v": "2"})
+        if not isinstance(result, dict):
+            raise MixpanelHeadlessError(
+                f"Unexpected response from get_bookmark: "
+                f"expected dict, got {type(result).__name__}",
+            )
+        return result
+
+    # =========================================================================
+    # Export API - Streaming
+    # =========================================================================
+
+    async def export_events(
+        self,
+        from_date: str,
+        to_date: str,
+        *,
+        events: list[str] | None = None,
+        where: str | None = None,
+        limit: int | None = None,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream events from the Export API.
+
+        Async mirror of :meth:`MixpanelAPIClient.export_events`.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD, inclusive).
+            to_date: End date (YYYY-MM-DD, inclusive).
+            events: Optional list of event names to filter.
+            where: Optional filter expression.
+            limit: Optional maximum number of events to return (max 100000).
+            on_batch: Optional callback invoked with cumulative count every
+                1000 events, and once at the end for any remaining events.
+
+        Yields:
+            Event dictionaries with 'event' and 'properties' keys.
+            Malformed JSON lines are logged and skipped (not raised).
+
+        Raises:
+            AuthenticationError: Invalid credentials.
+            RateLimitError: Rate limit exceeded after max retries.
+            QueryError: Invalid parameters.
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network errors after max retries, or
+                ``EXPORT_RESUME_MISMATCH`` if a dropped stream's replay no
+                longer matches what was already yielded.
+        """
+        url = self._core._build_url("export", "/export")
+        params = self._core._export_params(
+            from_date, to_date, events=events, where=where, limit=limit
+        )
+        client = self._ensure_client()
+        headers = self._core._request_headers(
+            {
+                "Authorization": await self._auth_header(),
+                "Accept-Encoding": "gzip",
+            }
+        )
+
+        # ``delivered`` survives retries so a replay skips what was yielded
+        delivered = 0
+        last_insert_id: str | None = None
+        for attempt in range(self._max_retries + 1):
+            replayed = 0
+            try:
+                async with client.stream(
+                    "GET",
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self._export_timeout,
+                ) as response:
+                    if response.status_code == 429:
+                        await response.aread()
+                        await self._wait_for_retry(
+                            response, attempt, "GET", url, params
+                        )
+                        continue
+                    if response.status_code == 401:
+                        raise AuthenticationError(
+                            "Invalid credentials. Check username, secret, and project_id.",
+                            status_code=response.status_code,
+                            request_method="GET",
+                            request_url=url,
+                            request_params=params,
+                        )
+                    if response.status_code == 400:
+                        body = await response.aread()
+                        response_body: str | dict[str, Any] | None = None
+                        error_msg = "Unknown error"
+                        try:
+                            response_body = json.loads(body)
+                            if isinstance(response_body, dict):
+                                error_msg = response_body.get("error", "Unknown error")
+                        except json.JSONDecodeError:
+                            response_body = body.decode()[:500] if body else None
+                            error_msg = body.decode()[:200] if body else "Unknown error"
+                        raise QueryError(
+                            error_msg,
+                            status_code=response.status_code,
+                            response_body=response_body,
+                            request_method="GET",
+                            request_url=url,
+                            request_params=params,
+                        )
+
+                    response.raise_for_status()
+
+                    async for line in _aiter_jsonl_lines(response):
+                        try:
+                            event = loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(
+                                "Skipping malformed line: %s",
+                                line[:100].decode("utf-8", errors="replace"),
+                            )
+                            continue
+                        if replayed < delivered:
+                            replayed += 1
+                            if replayed == delivered:
+                                _check_export_replay(event, last_insert_id, delivered)
+                            continue
+                        yield event
+                        delivered += 1
+                        replayed = delivered
+                        last_insert_id = _event_insert_id(event)
+                        if on_batch and delivered % 1000 == 0:
+                            on_batch(delivered)
+
+                    if replayed < delivered:
+                        _check_export_replay(None, last_insert_id, delivered)
+                    if on_batch and delivered % 1000 != 0:
+                        on_batch(delivered)
+                    return
+
+            except httpx.HTTPError as e:
+                if attempt >= self._max_retries:
+                    raise MixpanelHeadlessError(
+                        f"HTTP error during export: {e}",
+                        code="HTTP_ERROR",
+                        details={"error": str(e)},
+                    ) from e
+                await asyncio.sleep(self._core._calculate_backoff(attempt))
+
+    async def export_profiles_page(
+        self,
+        page: int,
+        session_id: str | None = None,
+        **kwargs: Any,
+    ) -> ProfilePageResult:
+        """Fetch a single page of profiles from the Engage API.
+
+        Async mirror of :meth:`MixpanelAPIClient.export_profiles_page`;
+        accepts the same keyword filters (``where``, ``cohort_id``,
+        ``output_properties``, ``sort_key``, ``limit``, ...).
+
+        Args:
+            page: Zero-based page index to fetch.
+            session_id: Session ID from page 0 (None for the first page).
+            **kwargs: Engage filters forwarded to the shared parameter
+                builder.
+
+        Returns:
+            ProfilePageResult with profiles, session_id, page, and has_more.
+        """
+        url = self._core._build_url("engage", "")
+        params = self._core._profiles_page_params(page, session_id, **kwargs)
+        response = await self._request("POST", url, data=params)
+        return _profile_page_result(response, page)
+
+    async def engage_stats(
+        self,
+        *,
+        where: str | None = None,
+        action: str = "count()",
+        filter_by_cohort: str | None = None,
+        segment_by_cohorts: dict[str, bool] | None = None,
+        group_id: str | None = None,
+        as_of_timestamp: int | None = None,
+        include_all_users: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch aggregate statistics from the Engage API.
+
+        Async mirror of :meth:`MixpanelAPIClient.engage_stats`.
+
+        Args:
+            where: Filter expression.
+            action: Aggregation expression. Defaults to ``"count()"``.
+            filter_by_cohort: Pre-encoded JSON cohort filter string.
+            segment_by_cohorts: Cohort segmentation mapping.
+            group_id: Group analytics group identifier.
+            as_of_timestamp: Unix timestamp for point-in-time query.
+            include_all_users: Include non-members in cohort results.
+
+        Returns:
+            Raw response dict from the Engage API.
+
+        Raises:
+            QueryError: The response was not a dict.
+        """
+        url = self._core._build_url("engage", "stats")
+        params = self._core._engage_stats_params(
+            where=where,
+            action=action,
+            filter_by_cohort=filter_by_cohort,
+            segment_by_cohorts=segment_by_cohorts,
+            group_id=group_id,
+            as_of_timestamp=as_of_timestamp,
+            include_all_users=include_all_users,
+        )
+        response = await self._request("POST", url, data=params)
+        if not isinstance(response, dict):
+            raise QueryError(
+                message=(
+                    f"engage_stats returned unexpected response type "
+                    f"{type(response).__name__}: {response!r}"
+                ),
+                status_code=200,
+                response_body=str(response),
+            )
+        return response
+
+    # =========================================================================
+    # Query API
+    # =========================================================================
+
+    async def insights_query(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Execute an inline insights query via POST.
+
+        Args:
+            body: Request body containing 'bookmark', 'project_id', and
+                'queryLimits'.
+
+        Returns:
+            Raw API response with computed_at, date_range, headers, series,
+            and meta fields.
+        """
+        url = self._core._build_url("query", "/insights")
+        result: dict[str, Any] = await self._request(
+            "POST", url, data=body, inject_project_id=False
+        )
+        return result
+
+    async def arb_funnels_query(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Execute an inline flow query via the arb_funnels endpoint.
+
+        Args:
+            body: Request body containing ``bookmark``, ``project_id``, and
+                ``query_type``.
+
+        Returns:
+            Raw API response with steps, flows, and breakdowns.
+        """
+        url = self._core._build_url("query", "/arb_funnels")
+        result: dict[str, Any] = await self._request(
+            "POST", url, data=body, inject_project_id=False
+        )
+        return result
+
+    async def query_saved_report(
+        self,
+        bookmark_id: int,
+        *,
+        bookmark_type: Literal[
+            "insights", "funnels", "retention", "flows"
+        ] = "insights",
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> dict[str, Any]:
+        """Query a saved report by bookmark type.
+
+        Args:
+            bookmark_id: Saved report identifier.
+            bookmark_type: Type of bookmark to query.
+            from_date: Start date (YYYY-MM-DD). Used for funnels.
+            to_date: End date (YYYY-MM-DD). Used for funnels.
+
+        Returns:
+            Raw API response with report data.
+        """
+        url, params = self._core._saved_report_target(
+            bookmark_id, bookmark_type, from_date, to_date
+        )
+        result: dict[str, Any] = await self._request("GET", url, params=params)
+        return result
+
+    async def query_saved_flows(self, bookmark_id: int) -> dict[str, Any]:
+        """Query a saved flows report by bookmark ID.
+
+        Args:
+            bookmark_id: Saved flows report identifier.
+
+        Returns:
+            Raw API response with steps, breakdowns, and conversion rate.
+        """
+        url = self._core._build_url("query", "/arb_funnels")
+        params: dict[str, Any] = {
+            "bookmark_id": bookmark_id,
+            "query_type": "flows_sankey",
+        }
+        result: dict[str, Any] = await self._request("GET", url, params=params)
+        return result
@@ -88,6 +88,18 @@ def accounts_root() -> Path:
     return _storage_root() / "accounts"
 
 
+def cache_root() -> Path:
+    """Return the directory holding client-side caches.
+
+    Resolves to ``$MP_OAUTH_STORAGE_DIR/cache/`` when the env var is set,
+    else ``~/.mp/cache/``. Not created by this call.
+
+    Returns:
+        Absolute path to the cache root.
+    """
+    return _storage_root() / "cache"
+
+
 def account_dir(name: str) -> Path:
     """Return the per-account directory for ``name``.
 
@@ -10,6 +10,16 @@ tokens from inline ``SecretStr`` fields or environment variables.
 Browser-token refresh delegates to
 :meth:`mixpanel_headless._internal.auth.flow.OAuthFlow.refresh_tokens` and
 persists the new payload back to the per-account path atomically.
+Refresh is single-flight: an exclusive lock on
+``~/.mp/accounts/{name}/.refresh.lock`` (in-process lock plus advisory
+file lock) admits one refresher at a time, and everyone queued behind it
+re-reads ``tokens.json`` and reuses the token it persisted.
+
+Parsed browser tokens are cached in memory per resolver. A cached token is
+reused while it is outside the expiry buffer and a single ``lstat`` of the
+tokens file still matches the fingerprint taken when it was read; any
+rewrite, replacement, permission change or removal of the file sends the
+next call back through the full (symlink-checked) read.
 
 Reference: ``specs/042-auth-architecture-redesign/data-model.md``,
 ``contracts/python-api.md`` §5.
@@ -18,6 +28,8 @@ Reference: ``specs/042-auth-architecture-redesign/data-model.md``,
 from __future__ import annotations
 
 import os
+import stat
+from contextlib import ExitStack
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -31,11 +43,38 @@ from mixpanel_headless._internal.auth.storage import account_dir
 from mixpanel_headless._internal.auth.token import OAuthTokens, token_payload_bytes
 from mixpanel_headless._internal.io_utils import (
     atomic_write_bytes,
+    exclusive_lock,
     read_credential_bytes,
     reject_if_symlink,
 )
 from mixpanel_headless.exceptions import OAuthError
 
+#: Lock file in the account directory serializing browser-token refresh.
+_REFRESH_LOCK_NAME = ".refresh.lock"
+
+#: ``lstat`` fields identifying one version of a tokens file:
+#: ``(st_dev, st_ino, st_mtime_ns, st_size, st_mode)``.
+_Fingerprint = tuple[int, int, int, int, int]
+
+
+def _fingerprint(path: Path) -> _Fingerprint | None:
+    """Return the fingerprint of a regular file at ``path``.
+
+    Args:
+        path: File to probe (symlinks are not followed).
+
+    Returns:
+        The fingerprint, or ``None`` if the path is missing or is not a
+        regular file (so the caller takes the fully checked read path).
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, st.st_mode)
+
 
 def _account_tokens_path(name: str) -> Path:
     """Return ``<account-dir>/tokens.json`` for the given account name.
@@ -69,18 +108,32 @@ class OnDiskTokenResolver(TokenResolver):
     ``~/.mp/accounts/{name}/tokens.json`` atomically via
     ``atomic_write_bytes``. All failures surface as :class:`OAuthError`
     so callers can give actionable error messages.
+
+    Parsed browser tokens are cached per instance (see the module
+    docstring), so steady-state calls cost one ``lstat``.
     """
 
+    def __init__(self) -> None:
+        """Initialize with an empty token cache."""
+        # Entries are replaced whole; dict get/set are atomic, so readers
+        # on other threads see either the old or the new entry.
+        self._cache: dict[Path, tuple[_Fingerprint, OAuthTokens]] = {}
+
     def get_browser_token(self, name: str, region: Region) -> str:
         """Return a fresh access token for an :class:`OAuthBrowserAccount`.
 
         Reads ``~/.mp/accounts/{name}/tokens.json``, checks the recorded
         ``expires_at`` (with a 30s safety buffer), and returns the token
         if not expired. If expired, refreshes via
-        :meth:`_refresh_and_persist`; raises
+        :meth:`_refresh_single_flight` (one refresher per account across
+        threads and processes); raises
         :class:`OAuthError(code="OAUTH_REFRESH_ERROR")` if no refresh
         token is recorded.
 
+        A token cached by an earlier call is returned without reading the
+        file while the file's fingerprint is unchanged and the token is
+        outside the expiry buffer.
+
         Args:
             name: Account name (used to locate the tokens file).
             region: Mixpanel region (kept for parity with the protocol;
@@ -94,6 +147,40 @@ class OnDiskTokenResolver(TokenResolver):
                 without a refresh token, or refresh fails.
         """
         path = _account_tokens_path(name)
+        fingerprint = _fingerprint(path)
+        cached = self._cache.get(path)
+        if (
+            fingerprint is not None
+            and cached is not None
+            and cached[0] == fingerprint
+            and not cached[1].is_expired()
+        ):
+            return cached[1].access_token.get_secret_value()
+
+        tokens = self._read_tokens(name, path)
+        if tokens.is_expired():
+            return self._refresh_single_flight(name=name, region=region, path=path)
+
+        # Fingerprint taken before the read: if the file changed in between,
+        # the next call sees a mismatch and re-reads.
+        if fingerprint is not None:
+            self._cache[path] = (fingerprint, tokens)
+        return tokens.access_token.get_secret_value()
+
+    def _read_tokens(self, name: str, path: Path) -> OAuthTokens:
+        """Read and parse the per-account ``tokens.json``.
+
+        Args:
+            name: Account name (for error messages).
+            path: Per-account ``tokens.json``.
+
+        Returns:
+            The parsed tokens, expired or not.
+
+        Raises:
+            OAuthError: If the file is a symlink, missing, unreadable, or
+                malformed.
+        """
         # Probe for symlink before existence check. A dangling symlink at
         # this path would otherwise silently pass through ``exists()`` and
         # then hit ``read_credential_bytes`` with no signal that the path
@@ -146,30 +233,68 @@ class OnDiskTokenResolver(TokenResolver):
                     "validation_error": str(exc),
                 },
             ) from exc
+        return tokens
 
-        if tokens.is_expired():
-            if tokens.refresh_token is None:
+    def _refresh_single_flight(self, *, name: str, region: Region, path: Path) -> str:
+        """Refresh an expired browser token with at most one refresher at a time.
+
+        Takes :func:`exclusive_lock` on ``<account-dir>/.refresh.lock``,
+        which queues other threads of this process and other processes
+        alike, then re-reads ``tokens.json``. Waiters that find a token
+        persisted by the refresher ahead of them return it instead of
+        spending the (possibly rotated, single-use) refresh token again.
+
+        Args:
+            name: Account name (for error messages and the account dir).
+            region: Mixpanel region (selects the DCR base URL).
+            path: Per-account ``tokens.json``.
+
+        Returns:
+            A current access token (no ``Bearer`` prefix).
+
+        Raises:
+            OAuthError: If the lock cannot be taken, the re-read fails,
+                the token is expired without a refresh token, or refresh
+                fails.
+        """
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(exclusive_lock(path.parent / _REFRESH_LOCK_NAME))
+            except OSError as exc:
                 raise OAuthError(
-                    (
-                        f"OAuth access token for account '{name}' has "
-                        f"expired and no refresh token is available. "
-                        f"Re-run `mp account login {name}`."
-                    ),
-                    code="OAUTH_TOKEN_ERROR",
-                    details={
-                        "account_name": name,
-                        "region": region,
-                        "path": str(path),
-                    },
+                    f"Could not lock OAuth tokens for account '{name}' "
+                    f"for refresh: {exc}",
+                    code="OAUTH_REFRESH_ERROR",
+                    details={"account_name": name, "path": str(path)},
+                ) from exc
+            fingerprint = _fingerprint(path)
+            tokens = self._read_tokens(name, path)
+            if tokens.is_expired():
+                if tokens.refresh_token is None:
+                    raise OAuthError(
+                        (
+                            f"OAuth access token for account '{name}' has "
+                            f"expired and no refresh token is available. "
+                            f"Re-run `mp account login {name}`."
+                        ),
+                        code="OAUTH_TOKEN_ERROR",
+                        details={
+                            "account_name": name,
+                            "region": region,
+                            "path": str(path),
+                        },
+                    )
+                return self._refresh_and_persist(
+                    name=name,
+                    region=region,
+                    path=path,
+                    tokens=tokens,
                 )
-            return self._refresh_and_persist(
-                name=name,
-                region=region,
-                path=path,
-                tokens=tokens,
-            )
 
-        return tokens.access_token.get_secret_value()
+            # Another thread or process refreshed while we waited.
+            if fingerprint is not None:
+                self._cache[path] = (fingerprint, tokens)
+            return tokens.access_token.get_secret_value()
 
     def _refresh_and_persist(
         self,
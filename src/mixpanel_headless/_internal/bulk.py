@@ -0,0 +1,133 @@
+"""Batch splitting and concurrent dispatch for bulk App API endpoints.
+
+Bulk endpoints (schema registry, Lexicon definitions, bookmark, cohort,
+dashboard and alert bulk operations) accept a list of items in one request.
+Long lists are split into batches of at most ``batch_size`` items and sent
+on a small thread pool. Every batch runs to completion; if some fail, a
+:class:`~mixpanel_headless.exceptions.BulkOperationError` reports which
+items were applied and which were not. A batch succeeds or fails as a
+whole, so all items of a failed batch are reported as failed.
+
+A list that fits in one batch is sent exactly as before, and its error (if
+any) propagates unchanged.
+
+This is a private implementation detail. Users tune batching through
+:class:`~mixpanel_headless.types.BulkOptions`.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from mixpanel_headless.exceptions import BulkOperationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: Default items per request for each bulk endpoint. Sized so a batch of
+#: typical entries stays well below the App API's request payload limit.
+DEFAULT_BATCH_SIZES: dict[str, int] = {
+    "schemas": 500,
+    "event_definitions": 500,
+    "property_definitions": 500,
+    "bookmarks": 200,
+    "cohorts": 200,
+    "delete": 1000,
+}
+
+#: Bodies at least this large are gzip-compressed when ``BulkOptions.gzip``
+#: is set; smaller ones gain nothing from compression.
+GZIP_MIN_BYTES: int = 16 * 1024
+
+
+def chunked(items: Sequence[T], size: int) -> list[list[T]]:
+    """Split ``items`` into consecutive lists of at most ``size`` items.
+
+    Args:
+        items: Items to split.
+        size: Maximum items per chunk.
+
+    Returns:
+        Chunks in input order (a single empty chunk for empty input, so the
+        request is still sent).
+
+    Raises:
+        ValueError: If ``size`` is less than 1.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    if not items:
+        return [list(items)]
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def run_batches(
+    operation: str,
+    items: Sequence[T],
+    send: Callable[[list[T]], R],
+    *,
+    batch_size: int,
+    workers: int,
+    first_alone: bool = False,
+) -> list[R]:
+    """Send ``items`` in batches and return each batch's result in order.
+
+    Args:
+        operation: Name of the bulk method (for errors and logs).
+        items: Items to send.
+        send: Sends one batch and returns its parsed response. Called on
+            worker threads.
+        batch_size: Maximum items per batch.
+        workers: Maximum batches in flight at once.
+        first_alone: Send the first batch before the others start, for
+            operations whose first request has side effects the rest depend
+            on (e.g. ``truncate``). If it fails, nothing else is sent.
+
+    Returns:
+        One result per batch, in batch order.
+
+    Raises:
+        BulkOperationError: If any of several batches failed.
+        Exception: The original error when there is only one batch, or when
+            a ``first_alone`` batch fails.
+    """
+    batches = chunked(items, batch_size)
+    if len(batches) == 1:
+        return [send(batches[0])]
+
+    logger.debug(
+        "%s: sending %d items in %d batches", operation, len(items), len(batches)
+    )
+    outcomes: list[tuple[bool, Any]] = []
+    rest = batches
+    if first_alone:
+        outcomes.append((True, send(batches[0])))
+        rest = batches[1:]
+
+    def attempt(batch: list[T]) -> tuple[bool, Any]:
+        try:
+            return True, send(batch)
+        except Exception as e:
+            return False, e
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(rest))) as pool:
+        outcomes.extend(pool.map(attempt, rest))
+
+    paired = list(zip(batches, outcomes, strict=True))
+    failed = [(batch, out) for batch, (ok, out) in paired if not ok]
+    if not failed:
+        return [out for _ok, out in outcomes]
+    succeeded = [(batch, out) for batch, (ok, out) in paired if ok]
+    raise BulkOperationError(
+        operation,
+        succeeded_items=[item for batch, _ in succeeded for item in batch],
+        failed_items=[item for batch, _ in failed for item in batch],
+        failed_batches=[batch for batch, _ in failed],
+        results=[out for _, out in succeeded],
+        errors=[err for _, err in failed],
+    )
@@ -0,0 +1,275 @@
+"""Checkpointed, resumable event export to a JSONL file.
+
+Events are downloaded one day (shard) at a time and appended to the output
+file. After each shard is flushed and fsynced, a manifest next to the output
+(``<output>.manifest.json``) is atomically rewritten with that shard's
+date, filters, line count and byte count. Re-running the same export reads
+the manifest, truncates any partial shard left behind by a crash, and
+downloads only the shards that are not yet recorded.
+
+This is a private implementation detail. Users should use
+``Workspace.export_events_to_jsonl()`` instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mixpanel_headless._internal.io_utils import atomic_write_bytes
+from mixpanel_headless._internal.sharding import day_shards, iter_parallel
+from mixpanel_headless.exceptions import MixpanelHeadlessError
+from mixpanel_headless.types import EventExportResult
+
+if TYPE_CHECKING:
+    from mixpanel_headless._internal.api_client import MixpanelAPIClient
+
+logger = logging.getLogger(__name__)
+
+#: Manifest schema version, bumped on incompatible layout changes.
+MANIFEST_VERSION: int = 1
+
+
+def manifest_path_for(path: Path) -> Path:
+    """Return the manifest path that sits next to an export output file.
+
+    Args:
+        path: Export output file.
+
+    Returns:
+        ``<path>.manifest.json`` in the same directory.
+    """
+    return path.with_name(f"{path.name}.manifest.json")
+
+
+class ExportManifest:
+    """Completed-shard ledger for one export output file.
+
+    Shards are listed in the order they were appended to the output, so
+    the sum of their ``bytes`` is the length of the valid file prefix.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        events: list[str] | None,
+        where: str | None,
+        shards: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize a manifest.
+
+        Args:
+            path: Manifest file location.
+            events: Event-name filter shared by every shard.
+            where: Filter expression shared by every shard.
+            shards: Previously completed shard records, in file order.
+        """
+        self.path = path
+        self.events = sorted(events) if events else None
+        self.where = where
+        self.shards: list[dict[str, Any]] = shards or []
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        *,
+        events: list[str] | None,
+        where: str | None,
+    ) -> ExportManifest:
+        """Load an existing manifest, or start an empty one.
+
+        Args:
+            path: Manifest file location.
+            events: Event-name filter for this run.
+            where: Filter expression for this run.
+
+        Returns:
+            The manifest, with any previously completed shards.
+
+        Raises:
+            MixpanelHeadlessError: If the manifest is unreadable, from an
+                unknown version, or was written with different filters.
+        """
+        manifest = cls(path, events=events, where=where)
+        if not path.exists():
+            return manifest
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, json.JSONDecodeError) as exc:
+            raise MixpanelHeadlessError(
+                f"Cannot read export manifest {path}: {exc}",
+                code="CHECKPOINT_INVALID",
+                details={"manifest": str(path)},
+            ) from exc
+        if data.get("version") != MANIFEST_VERSION:
+            raise MixpanelHeadlessError(
+                f"Unsupported export manifest version in {path}",
+                code="CHECKPOINT_INVALID",
+                details={"manifest": str(path), "version": data.get("version")},
+            )
+        if data.get("events") != manifest.events or data.get("where") != where:
+            raise MixpanelHeadlessError(
+                "Export manifest was written with different filters; "
+                "use a new output path or delete the existing output and manifest",
+                code="CHECKPOINT_MISMATCH",
+                details={
+                    "manifest": str(path),
+                    "manifest_events": data.get("events"),
+                    "manifest_where": data.get("where"),
+                    "events": manifest.events,
+                    "where": where,
+                },
+            )
+        manifest.shards = list(data.get("shards", []))
+        return manifest
+
+    @property
+    def completed(self) -> set[str]:
+        """Return the ``from_date`` of every completed shard."""
+        return {shard["from_date"] for shard in self.shards}
+
+    @property
+    def total_lines(self) -> int:
+        """Return the total line count across completed shards."""
+        return sum(int(shard["lines"]) for shard in self.shards)
+
+    @property
+    def total_bytes(self) -> int:
+        """Return the committed output length in bytes."""
+        return sum(int(shard["bytes"]) for shard in self.shards)
+
+    def record(self, from_date: str, to_date: str, lines: int, size: int) -> None:
+        """Append a completed shard and persist the manifest atomically.
+
+        Args:
+            from_date: Shard start date.
+            to_date: Shard end date.
+            lines: Events written for the shard.
+            size: Bytes written for the shard.
+        """
+        self.shards.append(
+            {
+                "from_date": from_date,
+                "to_date": to_date,
+                "events": self.events,
+                "where": self.where,
+                "lines": lines,
+                "bytes": size,
+            }
+        )
+        payload = {
+            "version": MANIFEST_VERSION,
+            "events": self.events,
+            "where": self.where,
+            "shards": self.shards,
+        }
+        atomic_write_bytes(self.path, json.dumps(payload, indent=2).encode())
+
+
+def _reconcile_output(path: Path, manifest: ExportManifest) -> None:
+    """Trim a partial trailing shard so the file matches the manifest.
+
+    Args:
+        path: Export output file.
+        manifest: Loaded manifest for ``path``.
+
+    Raises:
+        MixpanelHeadlessError: If the file is shorter than the manifest
+            says, i.e. it was modified or replaced outside the exporter.
+    """
+    committed = manifest.total_bytes
+    size = path.stat().st_size if path.exists() else 0
+    if size < committed:
+        raise MixpanelHeadlessError(
+            f"Export output {path} is shorter than its manifest records "
+            f"({size} < {committed} bytes)",
+            code="CHECKPOINT_MISMATCH",
+            details={"path": str(path), "size": size, "committed": committed},
+        )
+    if size > committed:
+        logger.info(
+            "Discarding %d bytes of partial shard data from %s",
+            size - committed,
+            path,
+        )
+        with path.open("r+b") as fh:
+            fh.truncate(committed)
+
+
+def export_events_checkpointed(
+    api_client: MixpanelAPIClient,
+    path: Path,
+    *,
+    from_date: str,
+    to_date: str,
+    events: list[str] | None = None,
+    where: str | None = None,
+    workers: int = 1,
+) -> EventExportResult:
+    """Export raw events to JSONL, skipping shards a previous run completed.
+
+    Args:
+        api_client: Client used for the per-day Export API requests.
+        path: Output JSONL file (created or appended to).
+        from_date: Start date inclusive (YYYY-MM-DD).
+        to_date: End date inclusive (YYYY-MM-DD).
+        events: Optional event-name filter.
+        where: Optional filter expression.
+        workers: Days downloaded concurrently; shards are still appended
+            to the file in date order.
+
+    Returns:
+        Summary of the output file and what this run did.
+
+    Raises:
+        MixpanelHeadlessError: If the manifest is invalid or does not
+            match the output file or filters.
+        ValueError: If the date range is invalid.
+    """
+    manifest_path = manifest_path_for(path)
+    manifest = ExportManifest.load(manifest_path, events=events, where=where)
+    _reconcile_output(path, manifest)
+
+    all_shards = day_shards(from_date, to_date)
+    done = manifest.completed
+    pending = [shard for shard in all_shards if shard[0] not in done]
+
+    def _fetch(index: int) -> Iterator[tuple[int, bytes | None]]:
+        """Serialize one shard's events, then signal its completion."""
+        shard_from, shard_to = pending[index]
+        for event in api_client.export_events(
+            shard_from, shard_to, events=events, where=where
+        ):
+            yield index, (json.dumps(event, ensure_ascii=False) + "\n").encode()
+        yield index, None
+
+    lines = size = 0
+    with path.open("ab") as out:
+        for index, data in iter_parallel(
+            range(len(pending)), _fetch, workers=workers, ordered=True
+        ):
+            if data is None:
+                # The manifest must never record bytes that are not on disk
+                out.flush()
+                os.fsync(out.fileno())
+                manifest.record(*pending[index], lines, size)
+                lines = size = 0
+                continue
+            out.write(data)
+            lines += 1
+            size += len(data)
+
+    return EventExportResult(
+        path=path,
+        manifest_path=manifest_path,
+        lines=manifest.total_lines,
+        size_bytes=manifest.total_bytes,
+        shards_written=len(pending),
+        shards_skipped=len(all_shards) - len(pending),
+    )
@@ -0,0 +1,214 @@
+"""Window planning and result merging for split long-range queries.
+
+A long ``from_date``..``to_date`` range is cut into windows of at most
+``window_days`` days (aligned to bucket boundaries when the query buckets
+by week, month or quarter), each window is queried on its own, and the
+per-window results are summed back into one result for the whole range.
+
+Summing is only exact for additive measures such as event totals and
+property sums; callers must reject other math before splitting.
+
+This is a private implementation detail. Users should pass
+``window_days=`` to the ``Workspace`` query methods instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import Any, TypeVar
+
+from mixpanel_headless._literal_types import QueryTimeUnit
+from mixpanel_headless.types import (
+    EventCountsResult,
+    PropertyCountsResult,
+    QueryResult,
+    SegmentationResult,
+)
+
+R = TypeVar("R", EventCountsResult, PropertyCountsResult)
+
+
+def split_date_range(
+    from_date: str,
+    to_date: str,
+    *,
+    window_days: int,
+    unit: QueryTimeUnit = "day",
+) -> list[tuple[str, str]]:
+    """Split an inclusive date range into consecutive windows.
+
+    For ``week``, ``month`` and ``quarter`` units each window ends on the
+    last day of a bucket (a Sunday, or the end of a month or quarter)
+    whenever at least one whole bucket fits, so no bucket is split across
+    two windows.
+
+    Args:
+        from_date: Start date inclusive (YYYY-MM-DD).
+        to_date: End date inclusive (YYYY-MM-DD).
+        window_days: Maximum days per window.
+        unit: Time bucket of the query.
+
+    Returns:
+        ``(from, to)`` windows in ascending order covering the range.
+
+    Raises:
+        ValueError: If a date is malformed, ``from_date`` is after
+            ``to_date``, or ``window_days`` is less than 1.
+
+    Example:
+        ```python
+        split_date_range("2024-01-01", "2024-03-15", window_days=31, unit="month")
+        # [("2024-01-01", "2024-01-31"), ("2024-02-01", "2024-02-29"),
+        #  ("2024-03-01", "2024-03-15")]
+        ```
+    """
+    if window_days < 1:
+        raise ValueError("window_days must be at least 1")
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
+    if start > end:
+        raise ValueError(f"from_date ({from_date}) is after to_date ({to_date})")
+    windows: list[tuple[str, str]] = []
+    while start <= end:
+        stop = min(start + timedelta(days=window_days - 1), end)
+        if stop < end and unit in ("week", "month", "quarter"):
+            stop = _bucket_aligned_stop(start, stop, unit)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return windows
+
+
+def _bucket_aligned_stop(start: date, stop: date, unit: str) -> date:
+    """Pull ``stop`` back to the last bucket boundary after ``start``.
+
+    Args:
+        start: Window start.
+        stop: Latest allowed window end.
+        unit: ``week``, ``month`` or ``quarter``.
+
+    Returns:
+        The aligned end, or ``stop`` if no whole bucket fits.
+    """
+    following = stop + timedelta(days=1)
+    if unit == "week":
+        following -= timedelta(days=following.weekday())
+    else:
+        following = following.replace(day=1)
+        if unit == "quarter":
+            following = following.replace(month=(following.month - 1) // 3 * 3 + 1)
+    return following - timedelta(days=1) if following > start else stop
+
+
+def sum_series(parts: Sequence[Any]) -> Any:
+    """Add per-window series together, key by key.
+
+    Nested dicts are merged recursively and numbers on the same key are
+    added. Other leaf values keep the first window's value.
+
+    Args:
+        parts: Series from each window, in window order.
+
+    Returns:
+        The combined series.
+    """
+    merged: dict[str, Any] = {}
+    for part in parts:
+        for key, value in part.items():
+            if key not in merged:
+                merged[key] = value
+            elif isinstance(value, Mapping) and isinstance(merged[key], Mapping):
+                merged[key] = sum_series([merged[key], value])
+            elif _is_number(value) and _is_number(merged[key]):
+                merged[key] = merged[key] + value
+    return merged
+
+
+def _is_number(value: Any) -> bool:
+    """Return whether ``value`` is an int or float (not a bool)."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def merge_segmentation(
+    parts: Sequence[SegmentationResult], from_date: str, to_date: str
+) -> SegmentationResult:
+    """Combine per-window segmentation results.
+
+    Args:
+        parts: One result per window, in window order.
+        from_date: Start of the whole range.
+        to_date: End of the whole range.
+
+    Returns:
+        A result covering the whole range.
+    """
+    return replace(
+        parts[0],
+        from_date=from_date,
+        to_date=to_date,
+        total=sum(p.total for p in parts),
+        series=sum_series([p.series for p in parts]),
+    )
+
+
+def merge_counts(parts: Sequence[R], from_date: str, to_date: str) -> R:
+    """Combine per-window event or property count results.
+
+    Args:
+        parts: One result per window, in window order.
+        from_date: Start of the whole range.
+        to_date: End of the whole range.
+
+    Returns:
+        A result covering the whole range.
+    """
+    return replace(
+        parts[0],
+        from_date=from_date,
+        to_date=to_date,
+        series=sum_series([p.series for p in parts]),
+    )
+
+
+def merge_query(parts: Sequence[QueryResult], params: dict[str, Any]) -> QueryResult:
+    """Combine per-window insights results.
+
+    Args:
+        parts: One result per window, in window order.
+        params: Bookmark params for the whole range.
+
+    Returns:
+        A result covering the whole range. ``computed_at`` is the oldest
+        window's, so it never overstates the data's freshness.
+    """
+    return replace(
+        parts[0],
+        computed_at=min(p.computed_at for p in parts),
+        to_date=parts[-1].to_date,
+        series=sum_series([p.series for p in parts]),
+        params=params,
+    )
+
+
+def window_params(
+    params: dict[str, Any], from_date: str, to_date: str
+) -> dict[str, Any]:
+    """Return insights bookmark params narrowed to one date window.
+
+    Args:
+        params: Bookmark params for the whole range.
+        from_date: Window start (YYYY-MM-DD).
+        to_date: Window end (YYYY-MM-DD).
+
+    Returns:
+        A copy of ``params`` whose time section covers only the window.
+    """
+    sections = params["sections"]
+    time_entry = {
+        **sections["time"][0],
+        "dateRangeType": "between",
+        "value": [from_date, to_date],
+    }
+    time_entry.pop("window", None)
+    return {**params, "sections": {**sections, "time": [time_entry]}}
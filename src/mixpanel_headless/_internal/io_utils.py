@@ -12,6 +12,11 @@ guarantees atomicity-on-success, not survival across power loss
 mid-write. Adding ``fsync`` would cost 5–50 ms per CLI invocation
 for no win in the realistic failure modes for a desktop CLI.
 
+:func:`exclusive_lock` serializes read-modify-write sequences (e.g. an
+OAuth refresh that spends a single-use refresh token) across threads
+and processes: a per-path ``threading.Lock`` plus an advisory OS lock
+(``flock`` on POSIX, ``msvcrt.locking`` on Windows) on a lock file.
+
 :func:`read_credential_bytes` / :func:`read_credential_text` are the
 read-side mirror. On POSIX they walk every path component with
 ``openat(O_NOFOLLOW | O_CLOEXEC)`` so the kernel refuses to traverse
@@ -38,6 +43,8 @@ import os
 import stat
 import sys
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from mixpanel_headless.exceptions import ConfigError
@@ -46,6 +53,7 @@ __all__ = [
     "MAX_CREDENTIAL_BYTES",
     "CredentialPathError",
     "atomic_write_bytes",
+    "exclusive_lock",
     "read_capped_secret_from_stdin",
     "read_credential_bytes",
     "read_credential_text",
@@ -162,6 +170,86 @@ def atomic_write_bytes(path: Path, data: bytes, *, mode: int = 0o600) -> None:
         raise
 
 
+_PATH_LOCKS: dict[str, threading.Lock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_fd(fd: int) -> None:
+    """Block until an exclusive advisory lock on ``fd`` is held.
+
+    Args:
+        fd: Open file descriptor of the lock file.
+
+    Raises:
+        OSError: If the OS refuses the lock for a reason other than
+            contention.
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        # ``LK_LOCK`` gives up after ~10 s of contention; keep waiting.
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError as exc:
+                if exc.errno != errno.EDEADLOCK:
+                    raise
+    else:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+@contextmanager
+def exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``lock_path`` across threads and processes.
+
+    Threads of this process queue on a per-path :class:`threading.Lock`
+    first, so only one of them at a time waits on the OS lock; other
+    processes are excluded by an advisory lock on the lock file itself.
+    The lock file is created owner-only if missing, is never followed
+    through a symlink, and is left in place afterwards (removing it
+    would race with a process that has just opened it). Closing the fd
+    releases the OS lock, including when the holder crashes.
+
+    Args:
+        lock_path: Lock file path. Its parent directory must exist.
+
+    Yields:
+        Nothing; the lock is held for the body of the ``with`` block.
+
+    Raises:
+        FileNotFoundError: If ``lock_path.parent`` does not exist.
+        OSError: If the lock file cannot be opened (including when it
+            is a symlink) or locked.
+
+    Example:
+        ```python
+        with exclusive_lock(account_dir / ".refresh.lock"):
+            tokens = load()
+            if tokens.is_expired():
+                save(refresh(tokens))
+        ```
+    """
+    key = os.path.abspath(lock_path)
+    with _PATH_LOCKS_GUARD:
+        thread_lock = _PATH_LOCKS.setdefault(key, threading.Lock())
+    with thread_lock:
+        flags = (
+            os.O_RDWR
+            | os.O_CREAT
+            | getattr(os, "O_NOFOLLOW", 0)
+            | getattr(os, "O_CLOEXEC", 0)
+        )
+        fd = os.open(key, flags, 0o600)
+        try:
+            _lock_fd(fd)
+            yield
+        finally:
+            os.close(fd)
+
+
 class CredentialPathError(OSError):
     """Raised when a credential file fails a structural safety check.
 
@@ -0,0 +1,426 @@
+"""Incremental parsing of large JSON responses from byte chunks.
+
+Some App API responses (``/me`` for large organizations, Lexicon exports,
+bookmark listings, dashboards) run to tens of megabytes. Loading them with
+``response.json()`` holds the raw body, its decoded text and the full
+object tree at once. This module parses directly from the streamed body
+chunks instead:
+
+* :func:`load` builds the document but drops subtrees matched by ``skip``
+  patterns without keeping them (e.g. workspace ``member_list``).
+* :func:`iter_items` yields the elements of an array one at a time, so a
+  caller can process and discard items before the rest have arrived.
+
+Only the containers on the way to a skipped subtree or streamed array are
+walked in Python. Every other value is decoded in one call to the standard
+library's C scanner, directly from the buffered text, so parsing stays
+close to ``json.loads`` speed. A skipped container is consumed one child at
+a time, so memory is bounded by the retained values plus the largest
+single child of a skipped subtree.
+
+Paths are tuples of object keys from the document root; ``"*"`` matches
+any key or any array element. For example,
+``("results", "workspaces", "*", "member_list")`` matches the member list
+of every workspace in a ``/me`` envelope.
+
+This is a private implementation detail used by the API clients.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Collection, Iterable, Iterator
+from typing import Any
+
+#: A path pattern: object keys from the root, ``"*"`` as a wildcard.
+JsonPath = tuple[str, ...]
+
+# The stdlib decoder's C-accelerated primitives: ``scan_once(text, idx)``
+# decodes one value starting at ``idx`` and returns it with its end index;
+# ``scanstring(text, idx)`` decodes a string whose opening quote is at
+# ``idx - 1``.
+_scan_once: Callable[[str, int], tuple[Any, int]] = json.JSONDecoder().scan_once  # type: ignore[attr-defined]
+_scanstring: Callable[[str, int], tuple[str, int]] = json.decoder.scanstring  # type: ignore[attr-defined]
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may continue a number cut off at the buffer end
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+
+
+class JSONStreamError(ValueError):
+    """The streamed body is not valid JSON or ends early."""
+
+
+class MissingTargetError(ValueError):
+    """The document is valid JSON but holds no array at any target path."""
+
+
+def _matches(pattern: JsonPath, path: JsonPath) -> bool:
+    """Whether ``pattern`` matches ``path`` exactly."""
+    return len(pattern) == len(path) and all(
+        p in ("*", k) for p, k in zip(pattern, path, strict=True)
+    )
+
+
+def _leads_to(pattern: JsonPath, path: JsonPath) -> bool:
+    """Whether ``pattern`` matches a strict descendant of ``path``."""
+    return len(pattern) > len(path) and _matches(pattern[: len(path)], path)
+
+
+class _Reader:
+    """Buffered cursor over decoded body text."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """Initialize with an empty buffer.
+
+        Args:
+            chunks: Body chunks in order.
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, at_least: int = 1) -> bool:
+        """Append at least ``at_least`` more characters, dropping consumed ones.
+
+        Args:
+            at_least: Minimum number of characters to add before returning.
+
+        Returns:
+            False if the stream had already ended.
+        """
+        if self.eof:
+            return False
+        parts = [self.buf[self.pos :]]
+        added = 0
+        while added < at_least:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self.eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            added += len(text)
+        self.buf = "".join(parts)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str | None:
+        """Skip whitespace and return the next character without consuming it.
+
+        Returns:
+            The next character, or ``None`` at end of stream.
+        """
+        while True:
+            match = _WHITESPACE.match(self.buf, self.pos)
+            assert match is not None  # noqa: S101 - the pattern matches ""
+            self.pos = match.end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` after optional whitespace.
+
+        Args:
+            char: Expected character.
+
+        Raises:
+            JSONStreamError: If the next character differs.
+        """
+        if self.peek() != char:
+            raise self.error(f"expected {char!r}")
+        self.pos += 1
+
+    def error(self, message: str) -> JSONStreamError:
+        """Build an error describing the current position.
+
+        Args:
+            message: What went wrong.
+
+        Returns:
+            Error to raise.
+        """
+        context = self.buf[self.pos : self.pos + 40]
+        return JSONStreamError(f"{message} near {context!r}")
+
+    def _decode(self, scan: Callable[[str, int], tuple[Any, int]], at: int) -> Any:
+        """Run a C scanner at the cursor, buffering more text until it fits.
+
+        A failure, or a number that may continue past the buffer end, is
+        retried with a buffer at least twice as large, so a value of ``n``
+        characters costs ``O(n)`` scanning overall.
+
+        Args:
+            scan: ``_scan_once`` or ``_scanstring``.
+            at: Offset from the cursor at which to start scanning.
+
+        Returns:
+            The decoded value; the cursor is moved past it.
+
+        Raises:
+            JSONStreamError: If the value is malformed or truncated.
+        """
+        while True:
+            try:
+                value, end = scan(self.buf, self.pos + at)
+            except (StopIteration, json.JSONDecodeError) as e:
+                if self.fill(len(self.buf) - self.pos):
+                    continue
+                detail = e.msg if isinstance(e, json.JSONDecodeError) else "no value"
+                raise self.error(f"invalid or truncated JSON ({detail})") from e
+            if (
+                isinstance(value, int | float)
+                and _NUMBER_TAIL.fullmatch(self.buf, end)
+                and self.fill(len(self.buf) - self.pos)
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def read(self) -> Any:
+        """Decode and consume the value at the cursor.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            JSONStreamError: If the value is malformed or truncated.
+        """
+        if self.peek() is None:
+            raise self.error("unexpected end of JSON")
+        return self._decode(_scan_once, 0)
+
+    def skip(self) -> None:
+        """Consume the value at the cursor without keeping it.
+
+        Containers are consumed one child at a time.
+
+        Raises:
+            JSONStreamError: If the value is malformed or truncated.
+        """
+        first = self.peek()
+        if first == "{":
+            for _ in self.iter_keys():
+                self.read()
+        elif first == "[":
+            for _ in self.elements():
+                self.read()
+        else:
+            self.read()
+
+    def iter_keys(self) -> Iterator[str]:
+        """Iterate the keys of the object at the cursor.
+
+        The caller must consume each key's value before advancing.
+
+        Yields:
+            Object keys, in document order.
+
+        Raises:
+            JSONStreamError: If the object is malformed.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self.error("expected object key")
+            key = self._decode(_scanstring, 1)
+            self.expect(":")
+            yield key
+            nxt = self.peek()
+            if nxt == "}":
+                self.pos += 1
+                return
+            if nxt != ",":
+                raise self.error("expected ',' or '}'")
+            self.pos += 1
+
+    def elements(self) -> Iterator[None]:
+        """Iterate the elements of the array at the cursor.
+
+        The caller must consume each element before advancing.
+
+        Yields:
+            ``None`` once per element, with the cursor at the element.
+
+        Raises:
+            JSONStreamError: If the array is malformed.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            nxt = self.peek()
+            if nxt == "]":
+                self.pos += 1
+                return
+            if nxt != ",":
+                raise self.error("expected ',' or ']'")
+            self.pos += 1
+
+    def finish(self) -> None:
+        """Check that only whitespace remains.
+
+        Raises:
+            JSONStreamError: If data follows the document.
+        """
+        if self.peek() is not None:
+            raise self.error("extra data after JSON document")
+
+
+class _Walker:
+    """Builds values from a reader, dropping subtrees matched by ``skip``."""
+
+    def __init__(self, reader: _Reader, skip: Collection[JsonPath]) -> None:
+        """Initialize.
+
+        Args:
+            reader: Source of JSON tokens.
+            skip: Path patterns of subtrees to omit.
+        """
+        self.reader = reader
+        self.skip = tuple(skip)
+        self.found = False
+
+    def build(self, path: JsonPath) -> Any:
+        """Decode the value at the cursor, omitting skipped descendants.
+
+        Args:
+            path: Path of the value from the document root.
+
+        Returns:
+            The decoded value.
+        """
+        reader = self.reader
+        if not any(_leads_to(p, path) for p in self.skip):
+            return reader.read()
+        first = reader.peek()
+        if first == "{":
+            obj: dict[str, Any] = {}
+            for key in reader.iter_keys():
+                child = (*path, key)
+                if any(_matches(p, child) for p in self.skip):
+                    reader.skip()
+                else:
+                    obj[key] = self.build(child)
+            return obj
+        if first == "[":
+            arr: list[Any] = []
+            child = (*path, "*")
+            drop = any(_matches(p, child) for p in self.skip)
+            for _ in reader.elements():
+                if drop:
+                    reader.skip()
+                else:
+                    arr.append(self.build(child))
+            return arr
+        return reader.read()
+
+    def find(self, path: JsonPath, targets: Collection[JsonPath]) -> Iterator[Any]:
+        """Yield elements of arrays matched by ``targets``, skipping the rest.
+
+        Args:
+            path: Path of the value at the cursor.
+            targets: Path patterns of arrays to stream.
+
+        Yields:
+            Decoded elements of every matching array, in document order.
+        """
+        reader = self.reader
+        first = reader.peek()
+        if first == "[" and any(_matches(t, path) for t in targets):
+            self.found = True
+            child = (*path, "*")
+            for _ in reader.elements():
+                yield self.build(child)
+            return
+        if not any(_leads_to(t, path) for t in targets):
+            reader.skip()
+        elif first == "{":
+            for key in reader.iter_keys():
+                yield from self.find((*path, key), targets)
+        elif first == "[":
+            for _ in reader.elements():
+                yield from self.find((*path, "*"), targets)
+        else:
+            reader.skip()
+
+
+def load(chunks: Iterable[bytes], *, skip: Collection[JsonPath] = ()) -> Any:
+    """Parse a JSON document from byte chunks, omitting skipped subtrees.
+
+    Args:
+        chunks: UTF-8 encoded JSON split at arbitrary boundaries.
+        skip: Path patterns of object members or array elements to drop
+            without decoding.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        JSONStreamError: If the document is malformed or truncated.
+
+    Example:
+        ```python
+        me = load(
+            response.iter_bytes(),
+            skip=[("results", "workspaces", "*", "member_list")],
+        )
+        ```
+    """
+    reader = _Reader(chunks)
+    value = _Walker(reader, skip).build(())
+    reader.finish()
+    return value
+
+
+def iter_items(
+    chunks: Iterable[bytes],
+    targets: Collection[JsonPath],
+    *,
+    skip: Collection[JsonPath] = (),
+    required: bool = False,
+) -> Iterator[Any]:
+    """Yield the elements of the arrays at ``targets`` as they are parsed.
+
+    Everything outside the target arrays is scanned and discarded.
+    Patterns may overlap in shape, e.g. ``[("results", "results"),
+    ("results",)]`` streams whichever of the two holds an array.
+
+    Args:
+        chunks: UTF-8 encoded JSON split at arbitrary boundaries.
+        targets: Path patterns of the arrays to stream.
+        skip: Path patterns to drop inside yielded elements (element paths
+            end in ``"*"``, e.g. ``("results", "*", "params")``).
+        required: Raise if no target matched an array, instead of
+            yielding nothing.
+
+    Yields:
+        Decoded array elements, in document order.
+
+    Raises:
+        JSONStreamError: If the document is malformed or truncated.
+        MissingTargetError: If ``required`` and no target matched an array.
+
+    Example:
+        ```python
+        for bookmark in iter_items(response.iter_bytes(), [("results",)]):
+            handle(bookmark)
+        ```
+    """
+    reader = _Reader(chunks)
+    walker = _Walker(reader, skip)
+    yield from walker.find((), targets)
+    reader.finish()
+    if required and not walker.found:
+        raise MissingTargetError("no array at any target path")
@@ -0,0 +1,174 @@
+"""Chunk-level JSONL splitting and decoding for streamed export responses.
+
+Raw Export and profile streams arrive as (gzip-decoded) byte chunks whose
+boundaries fall anywhere inside a line. :class:`LineSplitter` splits each
+chunk in one pass and carries only the trailing partial line over to the
+next chunk, so the work per chunk is linear regardless of how many lines
+it holds.
+
+:func:`loads` parses a line's raw bytes with the fastest JSON library
+available: ``orjson`` or ``msgspec`` when installed, otherwise the
+standard library. Lines the fast backend rejects (``NaN`` tokens, invalid
+UTF-8) are retried with the standard library, so a line that parsed before
+still parses. One difference remains: orjson reads integers wider than 64
+bits as floats.
+
+This is a private implementation detail used by the API clients.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: ``(name, loads, errors)`` for one JSON decoder; ``errors`` are the
+#: exception types it raises for input it rejects.
+_Backend = tuple[str, Callable[[bytes], Any], tuple[type[Exception], ...]]
+
+
+def _stdlib_loads(line: bytes) -> Any:
+    """Parse one line with the standard library ``json`` module.
+
+    Args:
+        line: Raw line bytes.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON.
+    """
+    return json.loads(line.decode("utf-8", errors="replace"))
+
+
+def _select_backend() -> _Backend:
+    """Pick the fastest installed JSON decoder.
+
+    Returns:
+        The preferred backend among orjson, msgspec and the standard library.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return "orjson", orjson.loads, (orjson.JSONDecodeError,)
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        decoder = msgspec.json.Decoder()
+        return "msgspec", decoder.decode, (msgspec.DecodeError,)
+    return "json", _stdlib_loads, (json.JSONDecodeError,)
+
+
+#: Name of the active JSON backend: ``"orjson"``, ``"msgspec"`` or ``"json"``.
+JSON_BACKEND: str
+_fast_loads: Callable[[bytes], Any]
+_fast_errors: tuple[type[Exception], ...]
+JSON_BACKEND, _fast_loads, _fast_errors = _select_backend()
+
+
+def loads(line: bytes) -> Any:
+    """Parse one JSON document from raw bytes.
+
+    Args:
+        line: UTF-8 encoded JSON; surrounding whitespace is allowed.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON for the
+            standard library either.
+    """
+    try:
+        return _fast_loads(line)
+    except _fast_errors:
+        if _fast_loads is _stdlib_loads:
+            raise
+        return _stdlib_loads(line)
+
+
+class LineSplitter:
+    """Incrementally split a byte stream into non-blank lines.
+
+    Example:
+        ```python
+        splitter = LineSplitter()
+        for chunk in response.iter_bytes():
+            for line in splitter.feed(chunk):
+                handle(line)
+        for line in splitter.flush():
+            handle(line)
+        ```
+    """
+
+    __slots__ = ("_tail",)
+
+    def __init__(self) -> None:
+        """Initialize with an empty carry-over buffer."""
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk and return every line it completes.
+
+        Args:
+            chunk: Next bytes from the stream.
+
+        Returns:
+            Complete lines without their ``\\n`` terminator. Blank lines
+            are dropped; other whitespace (e.g. a trailing ``\\r``) is kept.
+        """
+        data = self._tail + chunk if self._tail else chunk
+        lines = data.split(b"\n")
+        self._tail = lines.pop()
+        return [line for line in lines if line and not line.isspace()]
+
+    def flush(self) -> list[bytes]:
+        """Return the final line if the stream did not end with a newline.
+
+        Returns:
+            Zero or one remaining line.
+        """
+        tail, self._tail = self._tail, b""
+        return [tail] if tail and not tail.isspace() else []
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the non-blank lines of a chunked byte stream.
+
+    Args:
+        chunks: Byte chunks, split at arbitrary positions.
+
+    Yields:
+        Complete lines as raw bytes.
+    """
+    splitter = LineSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.flush()
+
+
+def iter_records(lines: Iterable[bytes]) -> Iterator[Any]:
+    """Decode JSONL lines, logging and skipping malformed ones.
+
+    Args:
+        lines: Raw lines, e.g. from :func:`iter_lines`.
+
+    Yields:
+        One decoded JSON value per valid line.
+    """
+    for line in lines:
+        try:
+            yield loads(line)
+        except json.JSONDecodeError:
+            logger.warning(
+                "Skipping malformed line: %s",
+                line[:100].decode("utf-8", errors="replace"),
+            )
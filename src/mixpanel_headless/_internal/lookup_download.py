@@ -0,0 +1,75 @@
+"""File-like access to streamed lookup table downloads.
+
+The lookup table download endpoint returns CSV. :class:`ChunkReader`
+adapts the streamed response body to a binary file object, so it can be
+fed to ``csv`` (via :func:`iter_csv_rows`) or ``pyarrow.csv.open_csv``
+without the table ever being held in memory as one ``bytes`` object.
+
+This is a private implementation detail. Users should use the
+``Workspace`` lookup table download methods instead.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterable, Iterator
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only raw stream over an iterator of byte chunks.
+
+    Example:
+        ```python
+        reader = io.BufferedReader(ChunkReader([b"id,name\\n", b"1,a\\n"]))
+        reader.readline()  # b"id,name\\n"
+        ```
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """Initialize.
+
+        Args:
+            chunks: Body chunks in order.
+        """
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        """Return True; the stream supports reading."""
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        """Copy the next available bytes into ``buffer``.
+
+        Args:
+            buffer: Destination buffer.
+
+        Returns:
+            Number of bytes copied, ``0`` at end of stream.
+        """
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def iter_csv_rows(chunks: Iterable[bytes]) -> Iterator[dict[str, str]]:
+    """Parse streamed CSV bytes into rows keyed by the header.
+
+    Args:
+        chunks: UTF-8 CSV body chunks (a leading BOM is ignored).
+
+    Yields:
+        One dict per data row, in file order.
+    """
+    text = io.TextIOWrapper(
+        io.BufferedReader(ChunkReader(chunks)), encoding="utf-8-sig", newline=""
+    )
+    yield from csv.DictReader(text)
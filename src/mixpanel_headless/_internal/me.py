@@ -31,6 +31,7 @@ from mixpanel_headless.exceptions import AuthenticationError, ConfigError, Query
 if TYPE_CHECKING:
     from mixpanel_headless._internal.api_client import MixpanelAPIClient
     from mixpanel_headless._internal.auth.account import AccountType
+    from mixpanel_headless._internal.json_stream import JsonPath
 
 logger = logging.getLogger(__name__)
 
@@ -222,6 +223,17 @@ class MeResponse(BaseModel):
 # Default cache TTL: 24 hours
 _DEFAULT_TTL_SECONDS = 86400
 
+# Workspace fields holding every member of the workspace. Each can be
+# 10-30MB for large organizations and none is needed for project/workspace
+# discovery.
+_WORKSPACE_MEMBER_FIELDS = ("member_list", "unified_member_list")
+
+#: Skip patterns for ``MixpanelAPIClient.me`` that drop workspace member
+#: lists while the response is parsed, before they are materialized.
+ME_SKIP_PATHS: tuple[JsonPath, ...] = tuple(
+    ("workspaces", "*", field) for field in _WORKSPACE_MEMBER_FIELDS
+)
+
 
 class MeCache:
     """Disk-based, per-account cache for /me API responses.
@@ -385,15 +397,13 @@ class MeCache:
             ) from e
 
         # Add cache metadata, stripping bulky fields that bloat the cache.
-        # Workspace member_list and unified_member_list can be 10-30MB each
-        # (preserved by extra="allow") and are not needed for project/workspace
-        # discovery.
+        # Workspace member lists (preserved by extra="allow") are not needed
+        # for project/workspace discovery.
         data = response.model_dump(mode="json")
-        _STRIP_FROM_WORKSPACES = {"member_list", "unified_member_list"}
         if "workspaces" in data and isinstance(data["workspaces"], dict):
             for ws_data in data["workspaces"].values():
                 if isinstance(ws_data, dict):
-                    for key in _STRIP_FROM_WORKSPACES:
+                    for key in _WORKSPACE_MEMBER_FIELDS:
                         ws_data.pop(key, None)
         data["cached_at"] = time.time()
 
@@ -540,7 +550,7 @@ class MeService:
         # so the user gets the actionable next step, not a generic message.
         account_name = self._cache._account_name  # noqa: SLF001
         try:
-            raw = self._api_client.me()
+            raw = self._api_client.me(skip=ME_SKIP_PATHS)
         except AuthenticationError as exc:
             raise ConfigError(
                 f"Credentials for account '{account_name}' are invalid (401). "
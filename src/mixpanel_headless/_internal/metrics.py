@@ -0,0 +1,278 @@
+"""Request metrics and event hooks for ``MixpanelAPIClient``.
+
+A single :class:`RequestMetrics` is owned by each ``MixpanelAPIClient`` and
+shared by every thread issuing requests through it. The client's request
+paths (``_execute_with_retry``, ``app_request``, ``export_events``,
+``paginate_all`` and ``download_lookup_table``) report each attempt here;
+``client.stats()`` returns an immutable snapshot.
+
+Connection reuse is detected with httpcore's ``trace`` request extension:
+an attempt that never emits a ``connection.connect_tcp`` event was served
+from the pool. Transports that do not emit trace events (such as
+``httpx.MockTransport``) report reuse as unknown.
+
+This is a private implementation detail. Users read metrics through
+:class:`~mixpanel_headless.types.ClientStats` and
+:class:`~mixpanel_headless.types.RequestEvent`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from mixpanel_headless.types import (
+    LATENCY_BUCKETS,
+    ClientStats,
+    FamilyStats,
+    RequestEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Type of callbacks accepted by :meth:`RequestMetrics.add_hook`.
+EventHook = Callable[[RequestEvent], None]
+
+
+class ConnectionTrace:
+    """httpcore ``trace`` callback recording whether a connection was opened.
+
+    Example:
+        ```python
+        trace = ConnectionTrace()
+        response = client.get(url, extensions={"trace": trace})
+        trace.reused  # True, False, or None if no trace events arrived
+        ```
+    """
+
+    __slots__ = ("connected", "seen")
+
+    def __init__(self) -> None:
+        """Initialize with no events seen."""
+        self.connected = False
+        self.seen = False
+
+    def __call__(self, name: str, _info: dict[str, Any]) -> None:
+        """Record one trace event.
+
+        Args:
+            name: Event name, e.g. ``"connection.connect_tcp.started"``.
+            _info: Event details (unused).
+        """
+        self.seen = True
+        if name.startswith("connection.connect_"):
+            self.connected = True
+
+    @property
+    def reused(self) -> bool | None:
+        """Whether the request ran on a pooled connection, if known."""
+        return (not self.connected) if self.seen else None
+
+
+class _Counters:
+    """Mutable per-family counters behind a :class:`FamilyStats` snapshot."""
+
+    __slots__ = (
+        "backoff_seconds",
+        "bytes_decoded",
+        "bytes_received",
+        "connections_new",
+        "connections_reused",
+        "errors",
+        "histogram",
+        "latency_total",
+        "rate_limited",
+        "requests",
+        "retries",
+    )
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.backoff_seconds = 0.0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.connections_new = 0
+        self.connections_reused = 0
+        self.latency_total = 0.0
+        self.histogram = [0] * len(LATENCY_BUCKETS)
+
+    def freeze(self) -> FamilyStats:
+        """Return an immutable snapshot of the counters."""
+        return FamilyStats(
+            requests=self.requests,
+            errors=self.errors,
+            retries=self.retries,
+            rate_limited=self.rate_limited,
+            backoff_seconds=self.backoff_seconds,
+            bytes_received=self.bytes_received,
+            bytes_decoded=self.bytes_decoded,
+            connections_new=self.connections_new,
+            connections_reused=self.connections_reused,
+            latency_total=self.latency_total,
+            latency_histogram=tuple(self.histogram),
+        )
+
+
+class RequestMetrics:
+    """Thread-safe per-family request counters with event hooks.
+
+    Example:
+        ```python
+        metrics = RequestMetrics()
+        trace = ConnectionTrace()
+        start = time.perf_counter()
+        response = http_client.get(url, extensions={"trace": trace})
+        metrics.observe(
+            "query", "GET", url, response, time.perf_counter() - start, trace
+        )
+        metrics.snapshot().families["query"].requests  # 1
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters and no hooks."""
+        self._lock = threading.Lock()
+        self._families: dict[str, _Counters] = {}
+        self._hooks: list[EventHook] = []
+
+    def add_hook(self, hook: EventHook) -> None:
+        """Register a callback invoked with a :class:`RequestEvent` per attempt.
+
+        Hooks run synchronously on the requesting thread; exceptions they
+        raise are logged and swallowed.
+
+        Args:
+            hook: Callback to add.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: EventHook) -> None:
+        """Unregister a callback added with :meth:`add_hook`.
+
+        Args:
+            hook: Callback to remove.
+
+        Raises:
+            ValueError: If ``hook`` is not registered.
+        """
+        with self._lock:
+            self._hooks.remove(hook)
+
+    def _counters(self, family: str | None) -> _Counters:
+        """Return the counters for ``family``; caller must hold the lock.
+
+        Args:
+            family: API family key, or ``None`` for URLs outside ``ENDPOINTS``.
+
+        Returns:
+            Counters for the family (``other`` for ``None``).
+        """
+        key = family or "other"
+        counters = self._families.get(key)
+        if counters is None:
+            counters = self._families[key] = _Counters()
+        return counters
+
+    def observe(
+        self,
+        family: str | None,
+        method: str,
+        url: str,
+        response: httpx.Response | None,
+        elapsed: float,
+        trace: ConnectionTrace | None = None,
+        *,
+        bytes_decoded: int | None = None,
+    ) -> None:
+        """Record one completed request attempt and notify hooks.
+
+        Args:
+            family: API family key, or ``None``.
+            method: HTTP method.
+            url: Request URL (query string is dropped).
+            response: Response whose body has been read, or ``None`` if the
+                attempt failed in transport.
+            elapsed: Seconds from send to end of body.
+            trace: Connection trace passed to the request, if any.
+            bytes_decoded: Decoded body size for streamed responses; read
+                from ``response.content`` otherwise.
+        """
+        status = response.status_code if response is not None else None
+        received = 0
+        if response is not None:
+            received = response.num_bytes_downloaded
+            if bytes_decoded is None:
+                try:
+                    bytes_decoded = len(response.content)
+                except httpx.ResponseNotRead:
+                    bytes_decoded = 0
+        reused = trace.reused if trace is not None else None
+        event = RequestEvent(
+            family=family or "other",
+            method=method,
+            url=url.split("?", 1)[0],
+            status_code=status,
+            elapsed=elapsed,
+            bytes_received=received,
+            bytes_decoded=bytes_decoded or 0,
+            connection_reused=reused,
+        )
+        with self._lock:
+            c = self._counters(family)
+            c.requests += 1
+            if status is None or status >= 400:
+                c.errors += 1
+            if status == 429:
+                c.rate_limited += 1
+            c.bytes_received += event.bytes_received
+            c.bytes_decoded += event.bytes_decoded
+            if reused is True:
+                c.connections_reused += 1
+            elif reused is False:
+                c.connections_new += 1
+            c.latency_total += elapsed
+            c.histogram[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            hooks = list(self._hooks)
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Request event hook %r failed", hook)
+
+    def retry(self, family: str | None, slept: float) -> None:
+        """Record that a request is about to be re-sent after sleeping.
+
+        Args:
+            family: API family key, or ``None``.
+            slept: Backoff duration in seconds.
+        """
+        with self._lock:
+            c = self._counters(family)
+            c.retries += 1
+            c.backoff_seconds += slept
+
+    def snapshot(self) -> ClientStats:
+        """Return an immutable copy of all counters.
+
+        Returns:
+            Per-family metrics for every family that has seen traffic.
+        """
+        with self._lock:
+            return ClientStats(
+                families={k: c.freeze() for k, c in self._families.items()}
+            )
+
+    def reset(self) -> None:
+        """Zero all counters. Registered hooks are kept."""
+        with self._lock:
+            self._families.clear()
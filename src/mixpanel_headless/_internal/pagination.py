@@ -4,26 +4,23 @@ Provides a generic paginator that follows cursor-based pagination
 through App API responses. Used by domain-specific methods to iterate
 through all pages of results.
 
+Pages are fetched through ``MixpanelAPIClient.app_request``, so they share
+the client's connection pool, rate limiter, ``429`` handling and transient
+failure retries. With ``prefetch`` set, a background thread fetches the
+following pages while the caller consumes the current one.
+
 This is a private implementation detail. Users should use the Workspace
 class methods instead of accessing this module directly.
 """
 
 from __future__ import annotations
 
-import contextlib
 import logging
-import time
 from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
-import httpx
-
-from mixpanel_headless.exceptions import (
-    AuthenticationError,
-    MixpanelHeadlessError,
-    RateLimitError,
-    ServerError,
-)
+from mixpanel_headless._internal.sharding import iter_parallel
+from mixpanel_headless.exceptions import MixpanelHeadlessError
 
 if TYPE_CHECKING:
     from mixpanel_headless._internal.api_client import MixpanelAPIClient
@@ -34,15 +31,6 @@ logger = logging.getLogger(__name__)
 #: Prevents infinite loops when the server returns a non-null cursor indefinitely.
 MAX_PAGES: int = 10000
 
-#: Maximum number of retries for rate-limited (429) responses per page request.
-MAX_RATE_LIMIT_RETRIES: int = 3
-
-#: Base delay in seconds for exponential backoff on 429 retries.
-_BACKOFF_BASE: float = 1.0
-
-#: Maximum backoff delay in seconds.
-_BACKOFF_MAX: float = 60.0
-
 
 def paginate_all(
     client: MixpanelAPIClient,
@@ -50,6 +38,7 @@ def paginate_all(
     *,
     params: dict[str, str] | None = None,
     page_size: int = 100,
+    prefetch: int = 0,
 ) -> Iterator[Any]:
     """Iterate through all pages of a paginated App API response.
 
@@ -68,24 +57,30 @@ def paginate_all(
             }
         }
 
-    Since ``app_request()`` unwraps the ``results`` field, this function
-    makes a raw request to get the full response including pagination metadata.
+    Pages are requested with ``_raw=True`` so the pagination metadata is
+    kept alongside ``results``.
 
     Args:
         client: MixpanelAPIClient instance to use for requests.
         path: App API path (e.g., ``/projects/12345/dashboards``).
         params: Optional additional query parameters to include in each request.
         page_size: Number of items per page (default 100).
+        prefetch: Pages to fetch ahead of the consumer on a background
+            thread (default 0: fetch each page only when the previous one
+            has been consumed). Memory grows by up to ``prefetch + 1``
+            pages. Closing the iterator early stops the background fetch.
 
     Yields:
         Individual items from across all pages of results.
 
     Raises:
+        ValueError: If ``prefetch`` is negative.
         AuthenticationError: Invalid credentials (401).
         RateLimitError: Rate limit exceeded after max retries (429).
+        QueryError: Client errors (400, 404, 422).
         ServerError: Server-side errors (5xx).
-        MixpanelHeadlessError: Client errors (400, 404, 422), network/connection
-            errors, or pagination limit exceeded.
+        MixpanelHeadlessError: Network/connection errors, non-JSON
+            responses, or pagination limit exceeded.
 
     Example:
         ```python
@@ -94,9 +89,47 @@ def paginate_all(
                 client,
                 "/projects/12345/dashboards",
                 page_size=50,
+                prefetch=2,
             ))
         ```
     """
+    if prefetch < 0:
+        raise ValueError("prefetch must be non-negative")
+
+    def pages(_path: str) -> Iterator[list[Any]]:
+        return _iter_pages(client, path, params=params, page_size=page_size)
+
+    page_iter = (
+        iter_parallel([path], pages, workers=1, buffer_size=prefetch)
+        if prefetch
+        else pages(path)
+    )
+    for results in page_iter:
+        yield from results
+
+
+def _iter_pages(
+    client: MixpanelAPIClient,
+    path: str,
+    *,
+    params: dict[str, str] | None,
+    page_size: int,
+) -> Iterator[list[Any]]:
+    """Fetch pages sequentially, yielding each page's ``results`` list.
+
+    Args:
+        client: MixpanelAPIClient instance to use for requests.
+        path: App API path.
+        params: Optional additional query parameters.
+        page_size: Number of items per page.
+
+    Yields:
+        The ``results`` of each page, in order.
+
+    Raises:
+        MixpanelHeadlessError: Pagination limit exceeded, plus any error
+            raised by ``app_request``.
+    """
     next_cursor: str | None = None
     page_count = 0
 
@@ -118,107 +151,7 @@ def paginate_all(
         # query_origin is canonical telemetry — set last so caller params can't override it
         request_params["query_origin"] = "mixpanel-headless"
 
-        # Make the raw request to get full response with pagination
-        url = client._build_url("app", path)
-        auth_header = client._get_auth_header()
-        headers = {"Authorization": auth_header}
-
-        http_client = client._ensure_client()
-        response: httpx.Response | None = None
-
-        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
-            try:
-                response = http_client.request(
-                    "GET",
-                    url,
-                    params=request_params,
-                    headers=headers,
-                    timeout=client._timeout,
-                )
-            except httpx.HTTPError as exc:
-                raise MixpanelHeadlessError(
-                    f"Network error during pagination: {exc}",
-                    code="NETWORK_ERROR",
-                    details={"path": path, "error": str(exc)},
-                ) from exc
-
-            # Handle 429 with retry/backoff
-            if response.status_code == 429:
-                if attempt >= MAX_RATE_LIMIT_RETRIES:
-                    retry_after_raw = response.headers.get("Retry-After")
-                    retry_after: int | None = None
-                    if retry_after_raw:
-                        with contextlib.suppress(ValueError):
-                            retry_after = int(retry_after_raw)
-                    raise RateLimitError(
-                        "Rate limit exceeded after max retries during pagination",
-                        retry_after=retry_after,
-                        status_code=429,
-                        response_body=response.text,
-                        request_method="GET",
-                        request_url=url,
-                    )
-                retry_after_raw = response.headers.get("Retry-After")
-                wait_time: float
-                if retry_after_raw:
-                    try:
-                        wait_time = float(retry_after_raw)
-                    except ValueError:
-                        wait_time = min(_BACKOFF_BASE * (2**attempt), _BACKOFF_MAX)
-                else:
-                    wait_time = min(_BACKOFF_BASE * (2**attempt), _BACKOFF_MAX)
-                logger.warning(
-                    "Rate limited during pagination, retrying in %.1f seconds "
-                    "(attempt %d/%d)",
-                    wait_time,
-                    attempt + 1,
-                    MAX_RATE_LIMIT_RETRIES,
-                )
-                time.sleep(wait_time)
-                continue
-
-            # Not a 429 — break out of retry loop
-            break
-
-        # At this point response is guaranteed non-None
-        assert response is not None  # noqa: S101
-
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            status = exc.response.status_code
-            body = exc.response.text
-            if status == 401:
-                raise AuthenticationError(
-                    f"Authentication failed during pagination: {body}",
-                    status_code=status,
-                    response_body=body,
-                    request_method="GET",
-                    request_url=url,
-                ) from exc
-            if status >= 500:
-                raise ServerError(
-                    f"Server error during pagination: {body}",
-                    status_code=status,
-                    response_body=body,
-                    request_method="GET",
-                    request_url=url,
-                ) from exc
-            raise MixpanelHeadlessError(
-                f"HTTP {status} during pagination: {body}",
-                code="API_ERROR",
-                details={"status_code": status, "response_body": body},
-            ) from exc
-
-        try:
-            data = response.json()
-        except Exception as exc:
-            raise MixpanelHeadlessError(
-                f"Non-JSON response during pagination (content-type: "
-                f"{response.headers.get('content-type', 'unknown')})",
-                code="INVALID_RESPONSE",
-                details={"content_type": response.headers.get("content-type")},
-            ) from exc
+        data = client.app_request("GET", path, params=request_params, _raw=True)
 
         # Extract results
         results: list[Any] = []
@@ -227,7 +160,7 @@ def paginate_all(
         elif isinstance(data, list):
             results = data
 
-        yield from results
+        yield results
 
         # Check for next page
         pagination = data.get("pagination") if isinstance(data, dict) else None
@@ -0,0 +1,363 @@
+"""Stream raw events into a Hive-partitioned Parquet dataset.
+
+Layout::
+
+    <root>/event_date=2024-01-01/event_name=Sign%20Up/part-00000.parquet
+    <root>/_common_metadata
+
+Events are downloaded one day at a time. Each event name in the day gets
+an :class:`~mixpanel_headless._internal.arrow.EventBatchBuilder`; a builder
+is flushed as one Parquet row group when it reaches ``row_group_size``
+rows, or (largest first) when the rows buffered across all event names
+reach ``max_buffered_rows``, so memory stays bounded no matter how long
+the range or how many event names a day holds.
+
+A partition file keeps one schema. When a later row group adds a column
+or widens a type (e.g. int64 to float64), the current file is closed and
+the partition continues in a new ``part-NNNNN`` file with the widened
+schema. ``_common_metadata`` holds the schema unified across every file
+(including those from earlier runs), for readers that need one schema up
+front.
+
+A day is written to a staging directory and moved into place once it is
+complete, replacing any earlier export of the same day, so re-running a
+range is idempotent and an interrupted run never leaves a partial day.
+The earlier export is renamed aside rather than deleted until the new one
+is in place, and the next run restores it if a crash struck in between.
+
+This is a private implementation detail. Users should use
+``Workspace.export_events_to_parquet()`` instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from mixpanel_headless._internal.arrow import (
+    EventBatchBuilder,
+    conform_batch,
+    widen_schema,
+)
+from mixpanel_headless._internal.sharding import day_shards, iter_parallel
+from mixpanel_headless.types import ParquetExportResult
+
+if TYPE_CHECKING:
+    from mixpanel_headless._internal.api_client import MixpanelAPIClient
+
+logger = logging.getLogger(__name__)
+
+#: Directory (ignored by Parquet readers) holding days still being written.
+STAGING_DIR = "_staging"
+
+#: Suffix of a published day parked in the staging area while it is replaced.
+REPLACED_SUFFIX = ".replaced"
+
+#: Partition value used for events with an empty name, matching Hive.
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _partition_name(key: str, value: str) -> str:
+    """Return a URI-encoded Hive partition directory name.
+
+    Args:
+        key: Partition column.
+        value: Partition value.
+
+    Returns:
+        ``key=value`` with ``value`` percent-encoded.
+    """
+    return f"{key}={quote(value, safe='') if value else _NULL_PARTITION}"
+
+
+class _PartitionWriter:
+    """Parquet writer for one ``event_name`` partition of one day."""
+
+    def __init__(self, directory: Path, compression: str) -> None:
+        """Initialize without opening a file.
+
+        Args:
+            directory: Partition directory.
+            compression: Parquet compression codec.
+        """
+        self.directory = directory
+        self.compression = compression
+        self.schema: pa.Schema | None = None
+        self.files: list[Path] = []
+        self._writer: pq.ParquetWriter | None = None
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        """Append a row group, rolling to a new file if the schema widens.
+
+        Args:
+            batch: Rows for this partition (without ``event_name``).
+        """
+        conformed = None if self.schema is None else conform_batch(batch, self.schema)
+        if conformed is None:
+            self.close()
+            self.schema = (
+                batch.schema
+                if self.schema is None
+                else widen_schema(self.schema, batch.schema)
+            )
+            conformed = conform_batch(batch, self.schema)
+            if conformed is None:  # pragma: no cover - widen_schema() admits all
+                raise AssertionError(
+                    "unreachable: widen_schema() admits every batch column"
+                )
+        if self._writer is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"part-{len(self.files):05d}.parquet"
+            self._writer = pq.ParquetWriter(
+                path, self.schema, compression=self.compression
+            )
+            self.files.append(path)
+        self._writer.write_batch(conformed)
+
+    def close(self) -> None:
+        """Finish the current file, if any."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class _DayWriter:
+    """Buffers and writes one day's events, partitioned by event name."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        row_group_size: int,
+        max_buffered_rows: int,
+        compression: str,
+    ) -> None:
+        """Initialize an empty day.
+
+        Args:
+            directory: Staging directory for the day.
+            row_group_size: Rows per event name before a row group is written.
+            max_buffered_rows: Rows buffered across all event names before
+                the largest buffer is flushed early.
+            compression: Parquet compression codec.
+        """
+        self.directory = directory
+        self.row_group_size = row_group_size
+        self.max_buffered_rows = max_buffered_rows
+        self.compression = compression
+        self.rows = 0
+        self._buffered = 0
+        self._builders: dict[str, EventBatchBuilder] = {}
+        self._writers: dict[str, _PartitionWriter] = {}
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Buffer one event, flushing row groups as limits are reached.
+
+        Args:
+            event: Raw Export API event.
+        """
+        name = str(event.get("event") or "")
+        builder = self._builders.get(name)
+        if builder is None:
+            builder = self._builders[name] = EventBatchBuilder(("event_date",))
+        builder.append(event)
+        self.rows += 1
+        self._buffered += 1
+        if len(builder) >= self.row_group_size:
+            self._flush(name)
+        elif self._buffered >= self.max_buffered_rows:
+            self._flush(max(self._builders, key=lambda n: len(self._builders[n])))
+
+    def _flush(self, name: str) -> None:
+        """Write one event name's buffered rows as a row group.
+
+        Args:
+            name: Event name to flush.
+        """
+        builder = self._builders[name]
+        if not len(builder):
+            return
+        self._buffered -= len(builder)
+        batch = builder.build()
+        batch = batch.drop_columns(["event_name"])
+        writer = self._writers.get(name)
+        if writer is None:
+            writer = self._writers[name] = _PartitionWriter(
+                self.directory / _partition_name("event_name", name),
+                self.compression,
+            )
+        writer.write(batch)
+
+    def close(self) -> list[_PartitionWriter]:
+        """Flush every buffer and finish all files.
+
+        Returns:
+            The day's partition writers.
+        """
+        for name in list(self._builders):
+            self._flush(name)
+        for writer in self._writers.values():
+            writer.close()
+        return list(self._writers.values())
+
+
+def _replaced_path(staged: Path) -> Path:
+    """Return where a day's previous export is parked while it is replaced.
+
+    Args:
+        staged: The day's staging directory.
+
+    Returns:
+        Sibling of ``staged`` inside the staging area.
+    """
+    return staged.with_name(staged.name + REPLACED_SUFFIX)
+
+
+def _publish_day(staged: Path, final: Path) -> None:
+    """Replace a day's partition directory with its freshly staged copy.
+
+    The old directory is renamed aside before the new one is renamed into
+    place and only deleted afterwards, so a crash at any point leaves the
+    previous export recoverable by :func:`_recover_replaced_days`.
+
+    Args:
+        staged: Completed staging directory (may not exist if no events).
+        final: Published ``event_date=...`` directory.
+    """
+    replaced = _replaced_path(staged)
+    if final.exists():
+        if replaced.exists():
+            shutil.rmtree(replaced)
+        replaced.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(final, replaced)
+    if staged.exists():
+        os.replace(staged, final)
+    if replaced.exists():
+        shutil.rmtree(replaced)
+
+
+def _recover_replaced_days(staging: Path, root: Path) -> None:
+    """Put back days whose replacement was interrupted by a crash.
+
+    Args:
+        staging: Staging directory of the dataset.
+        root: Dataset root directory.
+    """
+    if not staging.exists():
+        return
+    for replaced in staging.glob(f"*{REPLACED_SUFFIX}"):
+        final = root / replaced.name.removesuffix(REPLACED_SUFFIX)
+        if final.exists():
+            shutil.rmtree(replaced)
+        else:
+            logger.warning("Restoring %s after an interrupted export", final.name)
+            os.replace(replaced, final)
+
+
+def export_events_to_parquet(
+    api_client: MixpanelAPIClient,
+    path: Path,
+    *,
+    from_date: str,
+    to_date: str,
+    events: list[str] | None = None,
+    where: str | None = None,
+    workers: int = 1,
+    row_group_size: int = 50_000,
+    max_buffered_rows: int = 200_000,
+    compression: str = "zstd",
+) -> ParquetExportResult:
+    """Export raw events to a Parquet dataset partitioned by date and event.
+
+    Args:
+        api_client: Client used for the per-day Export API requests.
+        path: Dataset root directory (created if missing).
+        from_date: Start date inclusive (YYYY-MM-DD).
+        to_date: End date inclusive (YYYY-MM-DD).
+        events: Optional event-name filter.
+        where: Optional filter expression.
+        workers: Days downloaded concurrently; days are written in order.
+        row_group_size: Target rows per Parquet row group.
+        max_buffered_rows: Upper bound on rows held in memory for a day.
+        compression: Parquet compression codec.
+
+    Returns:
+        Summary of the files written and the unified schema.
+
+    Raises:
+        ValueError: If the date range or a size limit is invalid.
+    """
+    if row_group_size < 1 or max_buffered_rows < 1:
+        raise ValueError("row_group_size and max_buffered_rows must be at least 1")
+    shards = day_shards(from_date, to_date)
+    staging = path / STAGING_DIR
+    _recover_replaced_days(staging, path)
+
+    def _fetch(index: int) -> Iterator[tuple[int, dict[str, Any] | None]]:
+        """Yield one day's events, then signal its completion."""
+        day_from, day_to = shards[index]
+        for event in api_client.export_events(
+            day_from, day_to, events=events, where=where
+        ):
+            yield index, event
+        yield index, None
+
+    def _day_writer(index: int) -> _DayWriter:
+        """Start a staging writer for day ``index``."""
+        directory = staging / _partition_name("event_date", shards[index][0])
+        if directory.exists():
+            shutil.rmtree(directory)
+        return _DayWriter(
+            directory,
+            row_group_size=row_group_size,
+            max_buffered_rows=max_buffered_rows,
+            compression=compression,
+        )
+
+    rows = 0
+    files: list[Path] = []
+    schema: pa.Schema | None = None
+    day = _day_writer(0)
+    for index, event in iter_parallel(
+        range(len(shards)), _fetch, workers=workers, ordered=True
+    ):
+        if event is not None:
+            day.append(event)
+            continue
+        writers = day.close()
+        rows += day.rows
+        final = path / day.directory.name
+        _publish_day(day.directory, final)
+        for writer in writers:
+            if writer.schema is None:  # never written to, so no files
+                continue
+            schema = (
+                writer.schema if schema is None else widen_schema(schema, writer.schema)
+            )
+            files.extend(final / f.relative_to(day.directory) for f in writer.files)
+        logger.debug("Wrote %d events for %s", day.rows, shards[index][0])
+        if index + 1 < len(shards):
+            day = _day_writer(index + 1)
+
+    if staging.exists():
+        shutil.rmtree(staging)
+    if schema is not None:
+        common = path / "_common_metadata"
+        if common.exists():
+            schema = widen_schema(pq.read_schema(common), schema)
+        pq.write_metadata(schema, common)
+    return ParquetExportResult(
+        path=path,
+        rows=rows,
+        files=files,
+        columns={field.name: str(field.type) for field in schema or []},
+        days_written=len(shards),
+    )
@@ -0,0 +1,375 @@
+"""On-disk cache for raw Query API responses.
+
+Each entry is one JSON file named after the SHA-256 of its key::
+
+    ~/.mp/cache/queries/3f1c...e9.json
+    {"kind": "query", "cached_at": 1704067200.0, "response": {...}}
+
+The key covers region, project, workspace, query type and the query
+params in canonical form. Before hashing, relative time ranges in bookmark
+params (``{"dateRangeType": "in the last", "window": {...}}``) are resolved
+to concrete ``between`` dates, so ``last=30`` issued today and tomorrow map
+to different entries while two calls made on the same day share one.
+Params that still carry a relative marker after resolution (e.g. an
+``"in the last"`` property filter) also fold today's date into the key.
+
+Raw responses are cached rather than typed results so a hit is transformed
+by the same code path as a fresh response. A file's mtime doubles as its
+last-access time: hits touch it, and once the directory outgrows
+``max_bytes`` the least recently used files are removed first. The
+directory's size is scanned once and then tracked as entries are written,
+so only a put that crosses ``max_bytes`` rescans it.
+
+"Today" is the current date in the project's timezone (UTC when it is not
+known), which is the calendar the API resolves relative ranges against.
+
+This is a private implementation detail. Users should pass
+``Workspace(query_cache=QueryCacheConfig(...))`` instead.
+"""
+
+from __future__ import annotations
+
+import calendar
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import stat
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from mixpanel_headless._internal.auth.storage import cache_root
+from mixpanel_headless._internal.io_utils import atomic_write_bytes
+from mixpanel_headless.exceptions import ConfigError
+from mixpanel_headless.types import QueryCacheConfig
+
+logger = logging.getLogger(__name__)
+
+#: Markers that make params depend on the current date.
+_RELATIVE_MARKERS = ('"in the last"', '"not in the last"', '"$now"')
+
+
+def mentions_relative_dates(params: Any) -> bool:
+    """Return whether params refer to dates relative to today.
+
+    Args:
+        params: Query params (any JSON-compatible value).
+
+    Returns:
+        ``True`` if a relative range or ``$now`` appears anywhere in them.
+    """
+    canonical = json.dumps(params, default=str)
+    return any(marker in canonical for marker in _RELATIVE_MARKERS)
+
+
+def project_now(tz_name: str | None) -> datetime:
+    """Return the current wall-clock time in a project's timezone.
+
+    Args:
+        tz_name: IANA timezone name (e.g. ``"US/Pacific"``), or ``None``.
+
+    Returns:
+        Naive local time in ``tz_name``, or in UTC when the name is missing
+        or unknown to this system.
+    """
+    zone: tzinfo = timezone.utc
+    if tz_name:
+        try:
+            zone = ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.debug("Unknown project timezone %r, using UTC", tz_name)
+    return datetime.now(zone).replace(tzinfo=None)
+
+
+def _months_before(day: date, months: int) -> date:
+    """Return ``day`` moved back by whole calendar months.
+
+    Args:
+        day: Anchor date.
+        months: Months to subtract.
+
+    Returns:
+        Same day-of-month ``months`` earlier, clamped to the month's end.
+    """
+    index = day.year * 12 + day.month - 1 - months
+    year, month = divmod(index, 12)
+    last = calendar.monthrange(year, month + 1)[1]
+    return date(year, month + 1, min(day.day, last))
+
+
+def _resolve_window(window: dict[str, Any], now: datetime) -> list[str] | None:
+    """Resolve an ``in the last`` window to concrete ``[from, to]`` values.
+
+    Args:
+        window: ``{"unit": ..., "value": N}`` from bookmark params.
+        now: Current local time.
+
+    Returns:
+        ``[from, to]`` dates (hours for hour windows), or ``None`` if the
+        window is not understood.
+    """
+    unit, value = window.get("unit"), window.get("value")
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        return None
+    today = now.date()
+    start: date
+    if unit == "hour":
+        end = now.replace(minute=0, second=0, microsecond=0)
+        first = end - timedelta(hours=value - 1)
+        return [first.strftime("%Y-%m-%dT%H"), end.strftime("%Y-%m-%dT%H")]
+    if unit == "day":
+        start = today - timedelta(days=value - 1)
+    elif unit == "week":
+        start = today - timedelta(weeks=value) + timedelta(days=1)
+    elif unit == "month":
+        start = _months_before(today, value) + timedelta(days=1)
+    elif unit == "quarter":
+        start = _months_before(today, 3 * value) + timedelta(days=1)
+    else:
+        return None
+    return [start.isoformat(), today.isoformat()]
+
+
+def resolve_relative_ranges(params: Any, now: datetime) -> Any:
+    """Return a copy of ``params`` with relative time sections made absolute.
+
+    ``{"dateRangeType": "in the last", "unit": u, "window": {...}}`` becomes
+    ``{"dateRangeType": "between", "unit": u, "value": [from, to]}``. Every
+    other value is copied unchanged.
+
+    Args:
+        params: Bookmark params (any JSON-compatible value).
+        now: Current local time.
+
+    Returns:
+        Normalized copy of ``params``.
+    """
+    if isinstance(params, list):
+        return [resolve_relative_ranges(item, now) for item in params]
+    if not isinstance(params, dict):
+        return params
+    window = params.get("window")
+    if params.get("dateRangeType") == "in the last" and isinstance(window, dict):
+        resolved = _resolve_window(window, now)
+        if resolved is not None:
+            rest = {
+                k: resolve_relative_ranges(v, now)
+                for k, v in params.items()
+                if k not in ("dateRangeType", "window")
+            }
+            return {**rest, "dateRangeType": "between", "value": resolved}
+    return {k: resolve_relative_ranges(v, now) for k, v in params.items()}
+
+
+class QueryCache:
+    """Size-bounded, TTL-based disk cache for raw Query API responses.
+
+    Args:
+        config: Public cache settings.
+
+    Example:
+        ```python
+        cache = QueryCache(QueryCacheConfig())
+        key = cache.key("query", {"project_id": "1"}, bookmark_params)
+        raw = cache.get("query", key)
+        if raw is None:
+            raw = api_client.insights_query(body)
+            cache.put("query", key, raw)
+        ```
+    """
+
+    def __init__(self, config: QueryCacheConfig) -> None:
+        """Initialize without touching the filesystem.
+
+        Args:
+            config: Public cache settings.
+        """
+        self._config = config
+        self._directory = (
+            config.directory
+            if config.directory is not None
+            else cache_root() / "queries"
+        )
+        # Bytes on disk, scanned on the first put and then tracked
+        self._size: int | None = None
+        self._size_lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the cache files."""
+        return self._directory
+
+    def enabled(self, kind: str) -> bool:
+        """Return whether results of ``kind`` are cached at all.
+
+        Args:
+            kind: Query type key.
+
+        Returns:
+            ``False`` when the type's TTL is zero.
+        """
+        return self._config.ttl_for(kind) > 0
+
+    def key(
+        self,
+        kind: str,
+        scope: dict[str, Any],
+        params: dict[str, Any],
+        *,
+        relative: bool = False,
+        now: datetime | None = None,
+    ) -> str:
+        """Build the cache key for one query.
+
+        Args:
+            kind: Query type key.
+            scope: Region, project and workspace the query runs against.
+            params: Query params; relative time sections are resolved.
+            relative: Force today's date into the key (for queries whose
+                range is decided server-side, such as saved reports).
+            now: Current wall-clock time in the project's timezone
+                (defaults to :func:`project_now` in UTC).
+
+        Returns:
+            Hex digest identifying the entry.
+        """
+        now = now or project_now(None)
+        normalized = resolve_relative_ranges(params, now)
+        canonical = json.dumps(
+            normalized, sort_keys=True, separators=(",", ":"), default=str
+        )
+        as_of = None
+        if relative or any(marker in canonical for marker in _RELATIVE_MARKERS):
+            as_of = now.date().isoformat()
+        material = json.dumps(
+            {"kind": kind, "scope": scope, "params": normalized, "as_of": as_of},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for ``key``.
+
+        Args:
+            key: Entry key.
+
+        Returns:
+            ``{directory}/{key}.json``.
+        """
+        return self._directory / f"{key}.json"
+
+    def get(self, kind: str, key: str) -> Any | None:
+        """Return a cached response, or ``None`` on a miss or expiry.
+
+        A hit refreshes the entry's access time for LRU eviction.
+
+        Args:
+            kind: Query type key (selects the TTL).
+            key: Entry key from :meth:`key`.
+
+        Returns:
+            The raw API response, or ``None``.
+        """
+        if not self.enabled(kind):
+            return None
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug("Corrupted query cache file %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            return None
+        cached_at = data.get("cached_at") if isinstance(data, dict) else None
+        if not isinstance(cached_at, (int, float)) or "response" not in data:
+            path.unlink(missing_ok=True)
+            return None
+        if time.time() - cached_at > self._config.ttl_for(kind):
+            path.unlink(missing_ok=True)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data["response"]
+
+    def put(self, kind: str, key: str, response: Any) -> None:
+        """Store a raw response, then evict down to ``max_bytes``.
+
+        Args:
+            kind: Query type key.
+            key: Entry key from :meth:`key`.
+            response: JSON-compatible API response.
+
+        Raises:
+            ConfigError: If the cache directory cannot be made private.
+        """
+        if not self.enabled(kind):
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        try:
+            os.chmod(self._directory, stat.S_IRWXU)  # 0o700
+        except OSError as e:
+            # Query results can hold user-level analytics data.
+            raise ConfigError(
+                f"Cannot enforce 0o700 on cache directory {self._directory}: {e}",
+                details={"path": str(self._directory)},
+            ) from e
+        payload = {"kind": kind, "cached_at": time.time(), "response": response}
+        data = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        path = self._path(key)
+        with self._size_lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            with contextlib.suppress(OSError):
+                self._size -= path.stat().st_size
+            atomic_write_bytes(path, data, mode=0o600)
+            self._size += len(data)
+            if self._size > self._config.max_bytes:
+                self._evict()
+
+    def _scan(self) -> tuple[list[tuple[float, int, Path]], int]:
+        """List the cache files with their mtimes and sizes.
+
+        Returns:
+            ``(mtime, size, path)`` entries and their total size in bytes.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self._directory.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        return entries, total
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under ``max_bytes``.
+
+        Rescans the directory, so entries written by other processes count
+        too. Caller holds ``_size_lock``.
+        """
+        entries, total = self._scan()
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self._config.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug("Evicted query cache entry %s", path.name)
+        self._size = total
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._size_lock:
+            for path in self._directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._size = 0
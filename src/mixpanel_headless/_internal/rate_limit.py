@@ -0,0 +1,167 @@
+"""Client-side rate limiting for Mixpanel API families.
+
+A single :class:`RateLimiter` is owned by each ``MixpanelAPIClient`` and
+shared by every thread issuing requests through it. Each API family
+(``query``, ``export``, ``engage``, ``app`` — the keys of ``ENDPOINTS``)
+gets an independent token bucket and concurrency cap, so fan-out callers
+queue locally rather than discovering the server's limit one ``429`` at a
+time.
+
+When a ``429`` does get through, :meth:`RateLimiter.penalize` closes the
+family until the server's ``Retry-After`` has elapsed, holding back every
+thread instead of only the one that was throttled.
+
+This is a private implementation detail. Users configure limits through
+:class:`~mixpanel_headless.types.RateLimit`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+from mixpanel_headless.types import RateLimit
+
+logger = logging.getLogger(__name__)
+
+#: Defaults derived from Mixpanel's published per-project limits. Only the
+#: concurrency caps are enforced by default (Query/Engage: 5 concurrent;
+#: Raw Export: 100 concurrent, 3 requests/second). Hourly quotas are left to
+#: the caller since enforcing them would stall bursty interactive use.
+DEFAULT_RATE_LIMITS: dict[str, RateLimit] = {
+    "query": RateLimit(max_concurrent=5),
+    "engage": RateLimit(max_concurrent=5),
+    "export": RateLimit(requests_per_second=3.0, burst=3, max_concurrent=100),
+    "app": RateLimit(),
+}
+
+
+class _Bucket:
+    """Token bucket plus in-flight counter for one API family."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        """Initialize a full bucket for ``limit``.
+
+        Args:
+            limit: Budget for this family.
+        """
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+
+    def delay(self, now: float) -> float | None:
+        """Return how long a new request must wait, refilling tokens first.
+
+        Args:
+            now: Current ``time.monotonic()`` value.
+
+        Returns:
+            ``0.0`` if a request may start now, a positive number of seconds
+            to wait, or ``None`` to wait until a concurrency slot frees up.
+        """
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        limit = self.limit
+        if limit.max_concurrent is not None and self.in_flight >= limit.max_concurrent:
+            return None
+        if limit.requests_per_second is not None:
+            elapsed = now - self.updated
+            self.tokens = min(
+                float(limit.burst), self.tokens + elapsed * limit.requests_per_second
+            )
+            self.updated = now
+            if self.tokens < 1.0:
+                return (1.0 - self.tokens) / limit.requests_per_second
+        return 0.0
+
+
+class RateLimiter:
+    """Thread-safe per-family token buckets with concurrency caps.
+
+    Families without a configured :class:`RateLimit` (or ``None`` family,
+    used for URLs outside ``ENDPOINTS``) pass through unthrottled.
+
+    Example:
+        ```python
+        limiter = RateLimiter({"query": RateLimit(max_concurrent=2)})
+        with limiter.acquire("query"):
+            response = http_client.post(url, json=body)
+        ```
+    """
+
+    def __init__(self, limits: Mapping[str, RateLimit] | None = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits: Per-family overrides merged over
+                :data:`DEFAULT_RATE_LIMITS`.
+        """
+        merged = dict(DEFAULT_RATE_LIMITS)
+        if limits:
+            merged.update(limits)
+        self._limits: dict[str, RateLimit] = merged
+        self._cond = threading.Condition()
+        self._buckets = {family: _Bucket(limit) for family, limit in merged.items()}
+
+    @property
+    def limits(self) -> dict[str, RateLimit]:
+        """Return a copy of the effective per-family limits."""
+        return dict(self._limits)
+
+    @contextmanager
+    def acquire(self, family: str | None) -> Iterator[None]:
+        """Block until ``family`` has budget, then hold a slot for the body.
+
+        Args:
+            family: API family key (``query``/``export``/``engage``/``app``),
+                or ``None`` to skip limiting.
+
+        Yields:
+            None. The concurrency slot is released when the block exits.
+        """
+        bucket = self._buckets.get(family) if family is not None else None
+        if bucket is None:
+            yield
+            return
+        waited = False
+        with self._cond:
+            while True:
+                wait = bucket.delay(time.monotonic())
+                if wait == 0.0:
+                    break
+                waited = True
+                self._cond.wait(timeout=wait)
+            if bucket.limit.requests_per_second is not None:
+                bucket.tokens -= 1.0
+            bucket.in_flight += 1
+        if waited:
+            logger.debug("Request queued locally by %s rate limit", family)
+        try:
+            yield
+        finally:
+            with self._cond:
+                bucket.in_flight -= 1
+                self._cond.notify_all()
+
+    def penalize(self, family: str | None, seconds: float) -> None:
+        """Hold back every request in ``family`` for ``seconds``.
+
+        Called when the server answers ``429`` with ``Retry-After`` so that
+        all threads honour the server's back-off, not just the one that was
+        throttled. Never shortens an existing penalty.
+
+        Args:
+            family: API family key, or ``None`` (no-op).
+            seconds: Back-off duration from ``Retry-After``.
+        """
+        bucket = self._buckets.get(family) if family is not None else None
+        if bucket is None or seconds <= 0:
+            return
+        with self._cond:
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+            self._cond.notify_all()
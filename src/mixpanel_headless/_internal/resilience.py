@@ -0,0 +1,193 @@
+"""Transient-failure retries and per-host circuit breaking.
+
+A single :class:`RetryBudget` and :class:`CircuitBreaker` are owned by each
+``MixpanelAPIClient`` and shared by every thread issuing requests through
+it.
+
+The budget caps retries of ``5xx`` responses and transport errors to a
+fraction of recent traffic: each request earns ``budget_ratio`` retries,
+each retry spends one. When a fan-out of hundreds of queries meets a
+degraded API, only a bounded number are retried instead of all of them.
+
+The breaker tracks consecutive failures per host. Once it opens, requests
+to that host raise :class:`~mixpanel_headless.exceptions.CircuitOpenError`
+immediately instead of parking worker threads in backoff sleeps. After the
+cooldown one probe request is let through; its outcome closes the breaker
+or re-opens it for another cooldown.
+
+This is a private implementation detail. Users configure behavior through
+:class:`~mixpanel_headless.types.RetryPolicy`.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+
+import httpx
+
+from mixpanel_headless.exceptions import CircuitOpenError
+from mixpanel_headless.types import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+#: Methods retried after a transient failure without further opt-in. PUT
+#: and DELETE are idempotent in principle, but a retry after a lost
+#: response can report ``404`` for a delete that succeeded, so only reads
+#: are retried by default; read-only query POSTs opt in explicitly.
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def retry_delay(policy: RetryPolicy, retry: int) -> float:
+    """Return a full-jitter backoff for the given zero-based retry number.
+
+    Args:
+        policy: Retry configuration.
+        retry: Zero-based retry number (0 for the first retry).
+
+    Returns:
+        A delay drawn uniformly from ``[0, min(backoff_max,
+        backoff_base * 2**retry)]``.
+    """
+    ceiling = min(policy.backoff_max, policy.backoff_base * (2**retry))
+    return random.uniform(0, ceiling)  # noqa: S311
+
+
+class RetryBudget:
+    """Thread-safe token bucket limiting retries to a share of requests.
+
+    Example:
+        ```python
+        budget = RetryBudget(RetryPolicy(budget_ratio=0.1, budget_min=2))
+        budget.deposit()        # on every request sent
+        if budget.withdraw():   # before every retry
+            ...
+        ```
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        """Initialize a full budget.
+
+        Args:
+            policy: Retry configuration supplying ratio and capacity.
+        """
+        self._ratio = policy.budget_ratio
+        self._capacity = float(policy.budget_min)
+        self._balance = self._capacity
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit the budget for one request sent."""
+        with self._lock:
+            self._balance = min(self._capacity, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry if available.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
+
+
+class _HostState:
+    """Breaker state for one host."""
+
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self) -> None:
+        """Initialize a closed breaker."""
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker driven by consecutive transient failures.
+
+    Example:
+        ```python
+        breaker = CircuitBreaker(RetryPolicy(breaker_threshold=3))
+        host = breaker.check(url)  # raises CircuitOpenError while open
+        ok = send(url).status_code < 500
+        breaker.record(host, ok)
+        ```
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        """Initialize with every host closed.
+
+        Args:
+            policy: Retry configuration supplying threshold and cooldown.
+        """
+        self._threshold = policy.breaker_threshold
+        self._cooldown = policy.breaker_cooldown
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def check(self, url: str) -> str:
+        """Admit a request to ``url``'s host or fail fast.
+
+        Every admitted request must be followed by :meth:`record`.
+
+        Args:
+            url: Full request URL.
+
+        Returns:
+            The host, to pass to :meth:`record`.
+
+        Raises:
+            CircuitOpenError: If the host's breaker is open, or half-open
+                with a probe already in flight.
+        """
+        host = httpx.URL(url).host
+        if self._threshold is None:
+            return host
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return host
+            remaining = state.opened_at + self._cooldown - time.monotonic()
+            if remaining > 0 or state.probing:
+                raise CircuitOpenError(host, max(remaining, 0.0))
+            state.probing = True
+            logger.info("Circuit half-open for %s, sending probe", host)
+            return host
+
+    def record(self, host: str, ok: bool) -> None:
+        """Record the outcome of a request admitted by :meth:`check`.
+
+        Args:
+            host: Host returned by :meth:`check`.
+            ok: False for a transient failure (retryable status or
+                transport error), True otherwise.
+        """
+        if self._threshold is None:
+            return
+        with self._lock:
+            state = self._hosts.get(host)
+            if ok:
+                if state is not None:
+                    if state.opened_at is not None:
+                        logger.info("Circuit closed for %s", host)
+                    del self._hosts[host]
+                return
+            if state is None:
+                state = self._hosts[host] = _HostState()
+            state.failures += 1
+            if state.probing or (
+                state.opened_at is None and state.failures >= self._threshold
+            ):
+                logger.warning(
+                    "Circuit open for %s after %d consecutive failures",
+                    host,
+                    state.failures,
+                )
+                state.opened_at = time.monotonic()
+            state.probing = False
@@ -0,0 +1,312 @@
+"""On-disk store of settled daily buckets for incremental query refresh.
+
+Daily timeseries queries are re-run with a sliding range (``last=90``
+every hour), yet only the last few days of the answer can still change.
+:func:`refresh_series` keeps the settled buckets of each query in a
+:class:`SeriesStore` entry and fetches only what the store cannot supply:
+the trailing mutable days plus any buckets newer than the entry::
+
+    ~/.mp/cache/series/3f1c...e9.json
+    {"since": "2024-01-01", "through": "2024-03-27",
+     "series": {"Login": {"2024-01-01": 12, ...}}, "extra": {...}}
+
+Entries are keyed by region, project, workspace, query type and the
+query params with the date range removed, so successive windows of the
+same query share one entry. Each save merges the settled buckets into the
+entry, so a 30-day and a 90-day chart of one query do not evict each
+other's buckets.
+
+Only date-keyed buckets are stored and returned. Range aggregates such
+as ``$overall`` cover whatever range was fetched and cannot be rebuilt
+from daily buckets for every math type, so they are dropped.
+
+This is a private implementation detail. Users should pass
+``incremental_days=`` to ``Workspace.query`` or ``Workspace.segmentation``
+instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import stat
+from collections.abc import Callable, Mapping
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from mixpanel_headless._internal.date_split import sum_series
+from mixpanel_headless._internal.io_utils import atomic_write_bytes
+from mixpanel_headless.exceptions import ConfigError
+
+logger = logging.getLogger(__name__)
+
+#: Bucket keys start with a date: ``2024-01-31`` or ``2024-01-31T00:00:00-08:00``.
+_BUCKET_KEY = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class SeriesStore:
+    """Directory of JSON files holding settled buckets, one per query.
+
+    Args:
+        directory: Directory holding the entry files.
+
+    Example:
+        ```python
+        store = SeriesStore(cache_root() / "series")
+        key = store.key("query", {"project_id": "1"}, params_without_dates)
+        entry = store.load(key)
+        ```
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize without touching the filesystem.
+
+        Args:
+            directory: Directory holding the entry files.
+        """
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the entry files."""
+        return self._directory
+
+    def key(self, kind: str, scope: dict[str, Any], params: dict[str, Any]) -> str:
+        """Build the entry key for one query.
+
+        Args:
+            kind: Query type key.
+            scope: Region, project and workspace the query runs against.
+            params: Query params without the date range.
+
+        Returns:
+            Hex digest identifying the entry.
+        """
+        material = json.dumps(
+            {"kind": kind, "scope": scope, "params": params},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for ``key``."""
+        return self._directory / f"{key}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return a stored entry, or ``None`` if absent or unreadable.
+
+        Args:
+            key: Entry key from :meth:`key`.
+
+        Returns:
+            The entry dict.
+        """
+        path = self._path(key)
+        try:
+            entry: dict[str, Any] = json.loads(path.read_bytes())
+            date.fromisoformat(entry["since"])
+            date.fromisoformat(entry["through"])
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
+            logger.debug("Corrupted series store file %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(entry.get("series"), dict):
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def save(self, key: str, entry: dict[str, Any]) -> None:
+        """Write an entry atomically.
+
+        Args:
+            key: Entry key from :meth:`key`.
+            entry: JSON-compatible entry.
+
+        Raises:
+            ConfigError: If the store directory cannot be made private.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        try:
+            os.chmod(self._directory, stat.S_IRWXU)  # 0o700
+        except OSError as e:
+            # Stored buckets are user-level analytics data.
+            raise ConfigError(
+                f"Cannot enforce 0o700 on cache directory {self._directory}: {e}",
+                details={"path": str(self._directory)},
+            ) from e
+        atomic_write_bytes(
+            self._path(key),
+            json.dumps(entry, separators=(",", ":"), default=str).encode("utf-8"),
+            mode=0o600,
+        )
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        for path in self._directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+def bucket_day(key: str) -> date | None:
+    """Return the day a series key stands for, or ``None`` for other keys.
+
+    Args:
+        key: Series key such as ``2024-01-31`` or ``2024-01-31T00:00:00Z``.
+
+    Returns:
+        The bucket's date.
+    """
+    if not _BUCKET_KEY.match(key):
+        return None
+    try:
+        return date.fromisoformat(key[:10])
+    except ValueError:
+        return None
+
+
+def buckets_between(series: Mapping[str, Any], start: date, end: date) -> Any:
+    """Return the part of a nested series whose buckets fall in a range.
+
+    Nested mappings (metrics, segments) are filtered recursively and
+    dropped when no bucket is left; leaf values keyed by anything other
+    than a date are dropped.
+
+    Args:
+        series: Nested ``{...: {bucket: value}}`` series.
+        start: First day kept.
+        end: Last day kept.
+
+    Returns:
+        The filtered series.
+    """
+    kept: dict[str, Any] = {}
+    for key, value in series.items():
+        if isinstance(value, Mapping):
+            nested = buckets_between(value, start, end)
+            if nested:
+                kept[key] = nested
+            continue
+        day = bucket_day(key)
+        if day is not None and start <= day <= end:
+            kept[key] = value
+    return kept
+
+
+def _merge_entry(
+    entry: dict[str, Any] | None,
+    series: dict[str, Any],
+    since: date,
+    through: date,
+    extra: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the entry to save from fresh settled buckets and the old entry.
+
+    Old buckets outside ``since``..``through`` are kept when the old range
+    overlaps or touches the new one; a disjoint old entry is replaced, so
+    an entry never has a gap.
+
+    Args:
+        entry: Stored entry, if any.
+        series: Series holding the settled buckets of ``since``..``through``.
+        since: First settled day.
+        through: Last settled day.
+        extra: Metadata of the latest fetch.
+
+    Returns:
+        The entry to save.
+    """
+    settled = buckets_between(series, since, through)
+    if entry is not None:
+        old_since = date.fromisoformat(entry["since"])
+        old_through = date.fromisoformat(entry["through"])
+        one_day = timedelta(days=1)
+        if old_since <= through + one_day and since <= old_through + one_day:
+            settled = sum_series(
+                [
+                    buckets_between(entry["series"], old_since, since - one_day),
+                    settled,
+                    buckets_between(entry["series"], through + one_day, old_through),
+                ]
+            )
+            since, through = min(since, old_since), max(through, old_through)
+    return {
+        "since": since.isoformat(),
+        "through": through.isoformat(),
+        "series": settled,
+        "extra": extra,
+    }
+
+
+def refresh_series(
+    store: SeriesStore,
+    key: str,
+    *,
+    from_date: date,
+    to_date: date,
+    mutable_days: int,
+    fetch: Callable[[date, date], tuple[dict[str, Any], dict[str, Any]]],
+    today: date | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], date | None]:
+    """Assemble a daily series from stored buckets plus a minimal fetch.
+
+    Buckets on or after ``today - mutable_days + 1`` are always fetched.
+    Older buckets come from the store when its entry reaches back to
+    ``from_date``; otherwise the whole range is fetched once to seed it.
+
+    Args:
+        store: Bucket store.
+        key: Entry key for this query.
+        from_date: First day of the requested range.
+        to_date: Last day of the requested range.
+        mutable_days: Trailing days that may still change.
+        fetch: Queries ``(start, end)`` and returns its series plus any
+            JSON-compatible metadata needed to rebuild the result.
+        today: Current date in the project's timezone (defaults to the
+            local date).
+
+    Returns:
+        The date-keyed series for the whole range, the metadata of the
+        latest fetch (or the stored copy when nothing was fetched), and
+        the first day fetched (``None`` when everything came from the
+        store).
+    """
+    today = today or date.today()
+    first_mutable = today - timedelta(days=mutable_days - 1)
+    entry = store.load(key)
+    fetch_from = from_date
+    stored: dict[str, Any] = {}
+    extra: dict[str, Any] = {}
+    if entry is not None and date.fromisoformat(entry["since"]) <= from_date:
+        through = date.fromisoformat(entry["through"])
+        fetch_from = max(from_date, min(through + timedelta(days=1), first_mutable))
+        stored = buckets_between(
+            entry["series"], from_date, min(to_date, fetch_from - timedelta(days=1))
+        )
+        extra = entry.get("extra", {})
+
+    fresh: dict[str, Any] = {}
+    fetched: date | None = None
+    if fetch_from <= to_date:
+        fresh, extra = fetch(fetch_from, to_date)
+        fetched = fetch_from
+    series: dict[str, Any] = buckets_between(
+        sum_series([stored, fresh]), from_date, to_date
+    )
+
+    settled_through = min(to_date, first_mutable - timedelta(days=1))
+    if settled_through >= from_date and fetched is not None:
+        store.save(key, _merge_entry(entry, series, from_date, settled_through, extra))
+    logger.debug(
+        "Incremental refresh %s..%s: fetched from %s",
+        from_date,
+        to_date,
+        fetched or "nothing",
+    )
+    return series, extra, fetched
@@ -3,8 +3,10 @@
 Provides methods to execute live queries against the Mixpanel Query API
 and transform responses into typed result objects with DataFrame support.
 
-Unlike DiscoveryService, this service does not cache results because
-analytics data changes frequently and queries should return fresh data.
+Unlike DiscoveryService, this service does not cache results in memory
+because analytics data changes frequently and queries should return fresh
+data. An opt-in, TTL-bounded disk cache (``QueryCache``) can be supplied for
+callers that repeat identical queries.
 """
 
 from __future__ import annotations
@@ -12,9 +14,10 @@ from __future__ import annotations
 import re
 import warnings
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from mixpanel_headless._internal.expressions import normalize_on_expression
+from mixpanel_headless._internal.query_cache import project_now
 from mixpanel_headless._literal_types import CountType, HourDayUnit, TimeUnit
 from mixpanel_headless.exceptions import QueryError
 from mixpanel_headless.types import (
@@ -42,7 +45,19 @@ from mixpanel_headless.types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from mixpanel_headless._internal.api_client import MixpanelAPIClient
+    from mixpanel_headless._internal.query_cache import QueryCache
+
+_ResultT = TypeVar(
+    "_ResultT",
+    QueryResult,
+    FunnelQueryResult,
+    RetentionQueryResult,
+    SegmentationResult,
+    SavedReportResult,
+)
 
 _STEP_PREFIX_RE = re.compile(r"^(\d+)\.\s*(.+)$")
 """Matches step names like ``"1. Signup"`` and captures (index, event_name)."""
@@ -678,8 +693,11 @@ class LiveQueryService:
     """Service for executing live queries against the Mixpanel Query API.
 
     Transforms raw API responses into typed result objects with DataFrame support.
-    Unlike DiscoveryService, results are not cached because analytics data
-    changes frequently and queries should return fresh data.
+    Unlike DiscoveryService, results are not cached by default because
+    analytics data changes frequently and queries should return fresh data.
+    When a :class:`QueryCache` is supplied, ``query``, ``query_funnel``,
+    ``query_retention``, ``segmentation`` and ``query_saved_report`` reuse
+    unexpired raw responses and report ``meta["cache_hit"]``.
 
     Example:
         ```python
@@ -694,13 +712,75 @@ class LiveQueryService:
         ```
     """
 
-    def __init__(self, api_client: MixpanelAPIClient) -> None:
+    def __init__(
+        self, api_client: MixpanelAPIClient, cache: QueryCache | None = None
+    ) -> None:
         """Initialize live query service.
 
         Args:
             api_client: Authenticated Mixpanel API client.
+            cache: Optional disk cache for raw query responses.
         """
         self._api_client = api_client
+        self._cache = cache
+
+    def _cached(
+        self,
+        kind: str,
+        params: dict[str, Any],
+        fetch: Callable[[], Any],
+        transform: Callable[[Any], _ResultT],
+        *,
+        project_id: int | str | None = None,
+        relative: bool = False,
+    ) -> _ResultT:
+        """Fetch a raw response through the cache and transform it.
+
+        Without a cache this is ``transform(fetch())``. With one, the raw
+        response is looked up by region, project, workspace and normalized
+        ``params`` first, and ``meta["cache_hit"]`` records the outcome.
+
+        Args:
+            kind: Query type key (selects the TTL).
+            params: Everything besides scope that determines the response.
+            fetch: Issues the API request.
+            transform: Builds the typed result from a raw response.
+            project_id: Project the query targets (defaults to the client's).
+            relative: Whether the range is resolved server-side, so the key
+                must change daily.
+
+        Returns:
+            The transformed result.
+        """
+        cache = self._cache
+        if cache is None or not cache.enabled(kind):
+            return transform(fetch())
+        scope = {
+            "region": self._api_client.region,
+            "project_id": str(
+                project_id if project_id is not None else self._api_client.project_id
+            ),
+            "workspace_id": self._api_client.workspace_id,
+        }
+        key = cache.key(
+            kind,
+            scope,
+            params,
+            relative=relative,
+            now=project_now(self._api_client.session.project.timezone),
+        )
+        raw = cache.get(kind, key)
+        hit = raw is not None
+        if raw is None:
+            raw = fetch()
+            # Transform before storing so error-as-200 responses that the
+            # transform rejects never reach the cache.
+            result = transform(raw)
+            cache.put(kind, key, raw)
+        else:
+            result = transform(raw)
+        result.meta["cache_hit"] = hit
+        return result
 
     def segmentation(
         self,
@@ -748,15 +828,28 @@ class LiveQueryService:
         # Normalize bare property names to filter expression syntax
         normalized_on = normalize_on_expression(on) if on else None
 
-        raw = self._api_client.segmentation(
-            event=event,
-            from_date=from_date,
-            to_date=to_date,
-            on=normalized_on,
-            unit=unit,
-            where=where,
+        return self._cached(
+            "segmentation",
+            {
+                "event": event,
+                "from_date": from_date,
+                "to_date": to_date,
+                "on": normalized_on,
+                "unit": unit,
+                "where": where,
+            },
+            lambda: self._api_client.segmentation(
+                event=event,
+                from_date=from_date,
+                to_date=to_date,
+                on=normalized_on,
+                unit=unit,
+                where=where,
+            ),
+            lambda raw: _transform_segmentation(
+                raw, event, from_date, to_date, unit, on
+            ),
         )
-        return _transform_segmentation(raw, event, from_date, to_date, unit, on)
 
     def funnel(
         self,
@@ -1082,13 +1175,23 @@ class LiveQueryService:
             print(result.df.head())
             ```
         """
-        raw = self._api_client.query_saved_report(
-            bookmark_id=bookmark_id,
-            bookmark_type=bookmark_type,
-            from_date=from_date,
-            to_date=to_date,
+        return self._cached(
+            "saved_report",
+            {
+                "bookmark_id": bookmark_id,
+                "bookmark_type": bookmark_type,
+                "from_date": from_date,
+                "to_date": to_date,
+            },
+            lambda: self._api_client.query_saved_report(
+                bookmark_id=bookmark_id,
+                bookmark_type=bookmark_type,
+                from_date=from_date,
+                to_date=to_date,
+            ),
+            lambda raw: _transform_saved_report(raw, bookmark_id, bookmark_type),
+            relative=from_date is None or to_date is None,
         )
-        return _transform_saved_report(raw, bookmark_id, bookmark_type)
 
     def query(
         self,
@@ -1126,8 +1229,13 @@ class LiveQueryService:
             "project_id": project_id,
             "queryLimits": {"limit": 3000},
         }
-        raw = self._api_client.insights_query(body)
-        return _transform_query_result(raw, bookmark_params)
+        return self._cached(
+            "query",
+            bookmark_params,
+            lambda: self._api_client.insights_query(body),
+            lambda raw: _transform_query_result(raw, bookmark_params),
+            project_id=project_id,
+        )
 
     def query_funnel(
         self,
@@ -1168,8 +1276,13 @@ class LiveQueryService:
             "project_id": project_id,
             "queryLimits": {"limit": 3000},
         }
-        raw = self._api_client.insights_query(body)
-        return _transform_funnel_result(raw, bookmark_params)
+        return self._cached(
+            "funnel",
+            bookmark_params,
+            lambda: self._api_client.insights_query(body),
+            lambda raw: _transform_funnel_result(raw, bookmark_params),
+            project_id=project_id,
+        )
 
     def query_retention(
         self,
@@ -1210,8 +1323,13 @@ class LiveQueryService:
             "project_id": project_id,
             "queryLimits": {"limit": 3000},
         }
-        raw = self._api_client.insights_query(body)
-        return _transform_retention_result(raw, bookmark_params)
+        return self._cached(
+            "retention",
+            bookmark_params,
+            lambda: self._api_client.insights_query(body),
+            lambda raw: _transform_retention_result(raw, bookmark_params),
+            project_id=project_id,
+        )
 
     def query_flow(
         self,
@@ -0,0 +1,186 @@
+"""Shard planning and bounded parallel iteration for streaming exports.
+
+A long export is split into independent shards (one per calendar day for
+the Raw Export API, one per page for the Engage API) that are fetched on a
+worker pool. Results are handed back to the consuming thread through
+bounded queues, so a slow consumer applies backpressure to the workers
+instead of letting buffered events grow without limit.
+
+This is a private implementation detail. Users should use
+``Workspace.stream_events(parallel=...)`` or
+``Workspace.stream_profiles(parallel=...)`` instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+#: Poll interval (seconds) for workers blocked on a full queue, so that they
+#: notice cancellation when the consumer stops early.
+_PUT_POLL_SECONDS: float = 0.1
+
+#: Sentinel marking the end of one shard's items.
+_SHARD_DONE = object()
+
+
+def day_shards(from_date: str, to_date: str) -> list[tuple[str, str]]:
+    """Split an inclusive date range into single-day ``(from, to)`` shards.
+
+    Args:
+        from_date: Start date inclusive (YYYY-MM-DD).
+        to_date: End date inclusive (YYYY-MM-DD).
+
+    Returns:
+        One ``(day, day)`` tuple per calendar day, in ascending order.
+
+    Raises:
+        ValueError: If a date is malformed or ``from_date`` is after
+            ``to_date``.
+
+    Example:
+        ```python
+        day_shards("2024-01-30", "2024-02-01")
+        # [("2024-01-30", "2024-01-30"), ("2024-01-31", "2024-01-31"),
+        #  ("2024-02-01", "2024-02-01")]
+        ```
+    """
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
+    if start > end:
+        raise ValueError(f"from_date ({from_date}) is after to_date ({to_date})")
+    days = [
+        (start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)
+    ]
+    return [(day, day) for day in days]
+
+
+def iter_parallel(
+    shards: Sequence[S],
+    fetch: Callable[[S], Iterable[T]],
+    *,
+    workers: int,
+    ordered: bool = False,
+    buffer_size: int = 1000,
+) -> Iterator[T]:
+    """Fetch shards concurrently and yield their items from one iterator.
+
+    With ``ordered=False`` items are yielded as soon as any worker produces
+    them, through a single queue of ``buffer_size`` items. With
+    ``ordered=True`` every shard gets its own queue of ``buffer_size`` items
+    and shards are drained strictly in input order; later shards keep
+    downloading into their buffers while earlier ones are consumed. Either
+    way at most ``workers`` shards are in flight and memory is bounded by
+    ``workers * buffer_size`` items.
+
+    The first exception raised by any ``fetch`` is re-raised in the caller
+    and the remaining shards are cancelled. Closing the returned iterator
+    early also cancels outstanding work.
+
+    Args:
+        shards: Shard descriptors, passed one at a time to ``fetch``.
+        fetch: Returns an iterable of items for one shard. Called on a
+            worker thread.
+        workers: Maximum shards fetched concurrently.
+        ordered: Yield items in shard order rather than arrival order.
+        buffer_size: Per-queue capacity in items.
+
+    Yields:
+        Items from every shard.
+
+    Raises:
+        ValueError: If ``workers`` or ``buffer_size`` is less than 1.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be at least 1")
+    if not shards:
+        return
+
+    stop = threading.Event()
+    shared: queue.Queue[Any] = queue.Queue(maxsize=buffer_size)
+    queues: list[queue.Queue[Any]] = (
+        [queue.Queue(maxsize=buffer_size) for _ in shards]
+        if ordered
+        else [shared] * len(shards)
+    )
+
+    def _put(q: queue.Queue[Any], item: Any) -> bool:
+        """Block until ``item`` is queued; return False if cancelled."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(index: int) -> None:
+        """Drain one shard into its queue, then post a completion marker."""
+        q = queues[index]
+        if stop.is_set():
+            return
+        items: Iterator[T] | None = None
+        try:
+            items = iter(fetch(shards[index]))
+            for item in items:
+                if not _put(q, item):
+                    return
+        except Exception as exc:
+            _put(q, (_SHARD_DONE, exc))
+            return
+        finally:
+            # Release the shard's HTTP stream promptly on early exit
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+        _put(q, (_SHARD_DONE, None))
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(workers, len(shards)), thread_name_prefix="mp-shard"
+    )
+    try:
+        for index in range(len(shards)):
+            executor.submit(_run, index)
+        if ordered:
+            for q in queues:
+                yield from _drain(q, shards_left=1)
+        else:
+            yield from _drain(shared, shards_left=len(shards))
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _drain(q: queue.Queue[Any], *, shards_left: int) -> Iterator[Any]:
+    """Yield items from ``q`` until ``shards_left`` completion markers arrive.
+
+    Args:
+        q: Queue fed by shard workers.
+        shards_left: Number of shards publishing into ``q``.
+
+    Yields:
+        Shard items in arrival order.
+
+    Raises:
+        Exception: The first error reported by a shard worker.
+    """
+    while shards_left:
+        item = q.get()
+        if isinstance(item, tuple) and len(item) == 2 and item[0] is _SHARD_DONE:
+            if item[1] is not None:
+                raise item[1]
+            shards_left -= 1
+            continue
+        yield item
@@ -0,0 +1,413 @@
+"""Streaming and resumable uploads of local files to signed storage URLs.
+
+Lookup table CSVs are uploaded to a signed Google Cloud Storage URL. The
+file is streamed from disk in ``chunk_size`` pieces rather than read into
+memory, so multi-gigabyte tables upload with bounded memory.
+
+Two transfer modes are supported:
+
+* **Single PUT** (always available): the whole file in one request with a
+  known ``Content-Length``. A transient failure restarts the transfer from
+  byte 0, re-reading the file from disk.
+* **Resumable session** (opt-in): a ``POST`` with ``x-goog-resumable:
+  start`` opens an upload session, and the file is sent in ``Content-Range``
+  chunks. After a failure the session is asked how many bytes it has
+  persisted and the upload continues from there. This only works when the
+  URL was signed for ``POST``; if the session cannot be opened the upload
+  falls back to a single PUT.
+
+This is a private implementation detail. Users should use
+``Workspace.upload_lookup_table()`` instead.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import IO
+
+import httpx
+
+from mixpanel_headless._internal.resilience import retry_delay
+from mixpanel_headless.types import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+#: Granularity required by GCS for every resumable chunk but the last.
+RESUMABLE_CHUNK_ALIGNMENT: int = 256 * 1024
+
+#: Default bytes read from disk and sent per chunk.
+UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024
+
+#: Called with ``(bytes_sent, total_bytes)`` as the upload advances.
+ProgressCallback = Callable[[int, int], None]
+
+
+def compress_to_tempfile(path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE) -> IO[bytes]:
+    """Gzip a file into an anonymous temporary file.
+
+    Compressing to disk first keeps memory bounded and gives the upload a
+    known ``Content-Length``.
+
+    Args:
+        path: File to compress.
+        chunk_size: Bytes copied per read.
+
+    Returns:
+        The compressed data, positioned at the start. Closing it deletes it.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+    """
+    tmp = tempfile.TemporaryFile()  # noqa: SIM115 - returned to the caller
+    try:
+        with (
+            path.open("rb") as src,
+            gzip.GzipFile(fileobj=tmp, mode="wb", compresslevel=6, mtime=0) as gz,
+        ):
+            shutil.copyfileobj(src, gz, chunk_size)
+        tmp.seek(0)
+    except BaseException:
+        tmp.close()
+        raise
+    return tmp
+
+
+def _iter_file(
+    fh: IO[bytes],
+    size: int,
+    chunk_size: int,
+    progress: ProgressCallback | None,
+) -> Iterator[bytes]:
+    """Yield a file's contents from the start, reporting progress.
+
+    Args:
+        fh: Seekable binary file.
+        size: Total bytes to send.
+        chunk_size: Bytes per chunk.
+        progress: Optional progress callback.
+
+    Yields:
+        Consecutive chunks of the file.
+    """
+    fh.seek(0)
+    sent = 0
+    while chunk := fh.read(chunk_size):
+        yield chunk
+        sent += len(chunk)
+        if progress is not None:
+            progress(sent, size)
+
+
+def _content_range(start: int, end: int, size: int) -> str:
+    """Build the ``Content-Range`` header for bytes ``[start, end)``."""
+    if end <= start:
+        return f"bytes */{size}"
+    return f"bytes {start}-{end - 1}/{size}"
+
+
+def _persisted(response: httpx.Response) -> int:
+    """Return the byte count a ``308`` says the session has persisted.
+
+    Args:
+        response: ``308 Resume Incomplete`` response.
+
+    Returns:
+        One past the last persisted byte (``0`` without a ``Range``).
+    """
+    header = response.headers.get("Range", "")
+    _, _, last = header.rpartition("-")
+    return int(last) + 1 if last.isdigit() else 0
+
+
+def _start_session(
+    client: httpx.Client,
+    url: str,
+    headers: Mapping[str, str],
+    *,
+    policy: RetryPolicy,
+) -> str | None:
+    """Try to open a resumable upload session on a signed URL.
+
+    Transient failures are retried like the uploads themselves.
+
+    Args:
+        client: Client used for the upload.
+        url: Signed URL.
+        headers: Object metadata headers (``Content-Type`` etc.).
+        policy: Retry configuration.
+
+    Returns:
+        The session URI, or ``None`` if the URL does not allow resumable
+        uploads.
+
+    Raises:
+        httpx.TransportError: Transport failure after the last retry.
+    """
+    retry = 0
+    while True:
+        try:
+            response = client.post(
+                url, headers={**headers, "x-goog-resumable": "start"}
+            )
+        except httpx.TransportError as e:
+            if retry >= policy.max_retries:
+                raise
+            failure = type(e).__name__
+        else:
+            location = response.headers.get("Location")
+            if response.status_code == 201 and location:
+                return str(location)
+            if (
+                response.status_code not in policy.statuses
+                or retry >= policy.max_retries
+            ):
+                logger.info(
+                    "Signed URL rejected a resumable session (status %d); "
+                    "uploading with a single PUT",
+                    response.status_code,
+                )
+                return None
+            failure = f"HTTP {response.status_code}"
+        wait_time = retry_delay(policy, retry)
+        logger.warning(
+            "%s opening resumable upload session, retrying in %.1f seconds "
+            "(retry %d/%d)",
+            failure,
+            wait_time,
+            retry + 1,
+            policy.max_retries,
+        )
+        time.sleep(wait_time)
+        retry += 1
+
+
+def _put_single(
+    client: httpx.Client,
+    url: str,
+    fh: IO[bytes],
+    size: int,
+    *,
+    headers: Mapping[str, str],
+    chunk_size: int,
+    policy: RetryPolicy,
+    progress: ProgressCallback | None,
+) -> httpx.Response:
+    """Stream the file in one PUT, restarting it on transient failures.
+
+    Args:
+        client: Client used for the upload.
+        url: Signed URL.
+        fh: Seekable binary file.
+        size: File size in bytes.
+        headers: Object metadata headers.
+        chunk_size: Bytes read per chunk.
+        policy: Retry configuration.
+        progress: Optional progress callback.
+
+    Returns:
+        The final response.
+
+    Raises:
+        httpx.TransportError: Transport failure after the last retry.
+    """
+    request_headers = {**headers, "Content-Length": str(size)}
+    retry = 0
+    while True:
+        try:
+            response = client.put(
+                url,
+                content=_iter_file(fh, size, chunk_size, progress),
+                headers=request_headers,
+            )
+        except httpx.TransportError as e:
+            if retry >= policy.max_retries:
+                raise
+            failure = type(e).__name__
+        else:
+            if (
+                response.status_code not in policy.statuses
+                or retry >= policy.max_retries
+            ):
+                return response
+            failure = f"HTTP {response.status_code}"
+        wait_time = retry_delay(policy, retry)
+        logger.warning(
+            "%s uploading to signed URL, restarting in %.1f seconds (retry %d/%d)",
+            failure,
+            wait_time,
+            retry + 1,
+            policy.max_retries,
+        )
+        time.sleep(wait_time)
+        retry += 1
+
+
+def _put_resumable(
+    client: httpx.Client,
+    session_url: str,
+    fh: IO[bytes],
+    size: int,
+    *,
+    chunk_size: int,
+    policy: RetryPolicy,
+    progress: ProgressCallback | None,
+) -> httpx.Response:
+    """Send the file in chunks to a resumable session.
+
+    After a transient failure the session is queried for its persisted
+    offset and the upload continues from there. ``policy.max_retries``
+    bounds consecutive failures; every chunk that lands resets the count.
+
+    Args:
+        client: Client used for the upload.
+        session_url: Session URI from :func:`_start_session`.
+        fh: Seekable binary file.
+        size: File size in bytes.
+        chunk_size: Bytes per chunk, a multiple of
+            ``RESUMABLE_CHUNK_ALIGNMENT``.
+        policy: Retry configuration.
+        progress: Optional progress callback.
+
+    Returns:
+        The final response.
+
+    Raises:
+        httpx.TransportError: Transport failure after the last retry.
+    """
+    offset = 0
+    retry = 0
+    query = False
+    while True:
+        try:
+            if query:
+                response = client.put(
+                    session_url, headers={"Content-Range": f"bytes */{size}"}
+                )
+            else:
+                end = min(offset + chunk_size, size)
+                fh.seek(offset)
+                response = client.put(
+                    session_url,
+                    content=fh.read(end - offset),
+                    headers={"Content-Range": _content_range(offset, end, size)},
+                )
+        except httpx.TransportError as e:
+            if retry >= policy.max_retries:
+                raise
+            failure = type(e).__name__
+        else:
+            if response.status_code < 300:
+                if progress is not None:
+                    progress(size, size)
+                return response
+            if response.status_code == 308:
+                persisted = _persisted(response)
+                if not query:
+                    retry = 0
+                    if progress is not None:
+                        progress(persisted, size)
+                offset, query = persisted, False
+                continue
+            if (
+                response.status_code not in policy.statuses
+                or retry >= policy.max_retries
+            ):
+                return response
+            failure = f"HTTP {response.status_code}"
+        wait_time = retry_delay(policy, retry)
+        logger.warning(
+            "%s uploading to signed URL at byte %d, resuming in %.1f seconds "
+            "(retry %d/%d)",
+            failure,
+            offset,
+            wait_time,
+            retry + 1,
+            policy.max_retries,
+        )
+        time.sleep(wait_time)
+        retry += 1
+        query = True
+
+
+def upload_file(
+    client: httpx.Client,
+    url: str,
+    fh: IO[bytes],
+    *,
+    headers: Mapping[str, str],
+    policy: RetryPolicy,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    resumable: bool = False,
+    progress: ProgressCallback | None = None,
+) -> httpx.Response:
+    """Upload a seekable file to a signed URL.
+
+    Args:
+        client: Client without default headers (they would break the URL's
+            signature).
+        url: Signed URL.
+        fh: Seekable binary file, read from the start.
+        headers: Object metadata headers (``Content-Type``, optionally
+            ``Content-Encoding``).
+        policy: Retry configuration for transient failures.
+        chunk_size: Bytes read and sent per chunk.
+        resumable: Try a resumable session first.
+        progress: Optional callback receiving ``(bytes_sent, total_bytes)``.
+
+    Returns:
+        The final response; the caller checks its status.
+
+    Raises:
+        ValueError: If ``chunk_size`` is not positive, or not a multiple
+            of ``RESUMABLE_CHUNK_ALIGNMENT`` when ``resumable`` is set.
+        httpx.TransportError: Transport failure after the last retry.
+
+    Example:
+        ```python
+        with open("table.csv", "rb") as fh, httpx.Client() as client:
+            response = upload_file(
+                client,
+                signed_url,
+                fh,
+                headers={"Content-Type": "text/csv"},
+                policy=RetryPolicy(),
+                resumable=True,
+            )
+        ```
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if resumable and chunk_size % RESUMABLE_CHUNK_ALIGNMENT:
+        raise ValueError(
+            f"chunk_size must be a multiple of {RESUMABLE_CHUNK_ALIGNMENT} "
+            f"for resumable uploads, got {chunk_size}"
+        )
+    size = fh.seek(0, 2)
+    if resumable:
+        session_url = _start_session(client, url, headers, policy=policy)
+        if session_url is not None:
+            return _put_resumable(
+                client,
+                session_url,
+                fh,
+                size,
+                chunk_size=chunk_size,
+                policy=policy,
+                progress=progress,
+            )
+    return _put_single(
+        client,
+        url,
+        fh,
+        size,
+        headers=headers,
+        chunk_size=chunk_size,
+        policy=policy,
+        progress=progress,
+    )
@@ -0,0 +1,152 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+A single :class:`SingleFlight` is owned by each ``MixpanelAPIClient``. When
+several threads issue the same request at the same time (same method, URL,
+params and body), the first caller becomes the leader and performs the
+network call; the others block until it finishes and receive the leader's
+parsed response, or re-raise its exception.
+
+Only concurrent duplicates are merged. Once the leader returns, the key is
+forgotten, so a later identical call goes to the network again. Callers
+decide which requests are safe to coalesce (GETs and read-only query POSTs).
+
+Followers receive deep copies of the response so that one caller mutating
+its result cannot affect another.
+
+This is a private implementation detail.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: dict[str, Any] | None,
+    body: Any,
+    *,
+    auth: str | None = None,
+) -> str:
+    """Build the coalescing key for one request.
+
+    Args:
+        method: HTTP method.
+        url: Absolute request URL.
+        params: Query parameters.
+        body: JSON or form request body.
+        auth: Authorization header value, so requests made under different
+            credentials are never merged.
+
+    Returns:
+        Hex digest identifying the request.
+    """
+    material = json.dumps(
+        [method.upper(), url, params or {}, body, auth],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    """One in-flight call shared by a leader and its followers."""
+
+    def __init__(self) -> None:
+        """Initialize an unfinished call."""
+        self.done = threading.Event()
+        self.followers = 0
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe coalescing of concurrent calls that share a key.
+
+    Example:
+        ```python
+        flight = SingleFlight()
+        key = request_key("GET", url, params, None)
+        data = flight.do(key, lambda: http_client.get(url, params=params).json())
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], _T]) -> _T:
+        """Run ``fn`` once for all concurrent callers sharing ``key``.
+
+        Args:
+            key: Coalescing key from :func:`request_key`.
+            fn: Performs the request and returns its parsed response.
+
+        Returns:
+            The leader's result (a deep copy for followers).
+
+        Raises:
+            Exception: Whatever ``fn`` raised in the leader.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.followers += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)  # type: ignore[no-any-return]
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            # Followers copy from this snapshot, never from the object the
+            # leader hands back and may go on to mutate.
+            if self._release(key, call):
+                call.result = copy.deepcopy(result)
+            return result
+        finally:
+            self._release(key, call)
+            call.done.set()
+
+    def _release(self, key: str, call: _Call) -> int:
+        """Stop new callers from joining ``call``. Safe to call twice.
+
+        Args:
+            key: Coalescing key.
+            call: The leader's call record.
+
+        Returns:
+            Number of followers that joined before the key was released.
+        """
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+                if call.followers:
+                    logger.debug(
+                        "Coalesced %d duplicate in-flight request(s)", call.followers
+                    )
+            return call.followers
@@ -501,6 +501,28 @@ InsightsMode = Literal["timeseries", "total", "table"]
 +------------+----------------------------------------------+
 """
 
+# =============================================================================
+# Batch Queries
+# =============================================================================
+
+QuerySpecKind = Literal[
+    "insights",
+    "funnel",
+    "retention",
+    "flow",
+    "segmentation",
+    "saved_report",
+    "saved_flows",
+]
+"""Query type of a ``QuerySpec`` run by ``Workspace.query_many``.
+
+Each kind maps to one Workspace method: ``insights`` → ``query``,
+``funnel`` → ``query_funnel``, ``retention`` → ``query_retention``,
+``flow`` → ``query_flow``, ``segmentation`` → ``segmentation``,
+``saved_report`` → ``query_saved_report`` and ``saved_flows`` →
+``query_saved_flows``.
+"""
+
 # =============================================================================
 # Filter Types
 # =============================================================================
@@ -617,6 +639,8 @@ __all__ = [
     "FlowAnchorType",
     # Insights mode
     "InsightsMode",
+    # Batch queries
+    "QuerySpecKind",
     # Filter types
     "CustomPropertyType",
     "FilterOperator",
@@ -0,0 +1,526 @@
+"""Asyncio facade for Mixpanel query and streaming operations.
+
+:class:`AsyncWorkspace` exposes the live-query and event-streaming surface
+of :class:`~mixpanel_headless.Workspace` as coroutines and async iterators,
+backed by a single ``httpx.AsyncClient`` connection pool. It is intended for
+services that refresh many reports concurrently from one event loop, where
+a thread per in-flight request would be too expensive.
+
+Session resolution and bookmark-params building are delegated to an
+ordinary :class:`Workspace` (both are pure, no network I/O), so every
+argument accepted by ``Workspace.query`` & co. behaves identically here.
+
+Example:
+    ```python
+    import asyncio
+
+    from mixpanel_headless import AsyncWorkspace
+
+
+    async def main() -> None:
+        async with AsyncWorkspace() as ws:
+            signups, logins = await asyncio.gather(
+                ws.query("Signup", last=7),
+                ws.query("Login", math="unique", last=7),
+            )
+            print(signups.df, logins.df)
+
+
+    asyncio.run(main())
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from mixpanel_headless._internal.async_api_client import AsyncMixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session as _Session
+from mixpanel_headless._internal.services.live_query import (
+    _transform_flow_result,
+    _transform_funnel_result,
+    _transform_query_result,
+    _transform_retention_result,
+)
+from mixpanel_headless._internal.transforms import transform_event, transform_profile
+from mixpanel_headless.exceptions import (
+    AuthenticationError,
+    QueryError,
+    RateLimitError,
+    ServerError,
+)
+from mixpanel_headless.types import (
+    CohortMetric,
+    FlowQueryResult,
+    FlowStep,
+    Formula,
+    FunnelQueryResult,
+    FunnelStep,
+    Metric,
+    QueryResult,
+    RetentionEvent,
+    RetentionQueryResult,
+    UserQueryResult,
+)
+from mixpanel_headless.workspace import Workspace, _validate_limit
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWorkspace:
+    """Asyncio entry point for Mixpanel live queries and event streaming.
+
+    Each query method accepts exactly the keyword arguments of its
+    :class:`Workspace` counterpart and returns the same typed result.
+
+    Examples:
+        ```python
+        async with AsyncWorkspace() as ws:
+            result = await ws.query_funnel(["Signup", "Purchase"], last=30)
+            print(result.overall_conversion_rate)
+
+            async for event in ws.stream_events(
+                from_date="2024-01-01", to_date="2024-01-31"
+            ):
+                process(event)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        account: str | None = None,
+        project: str | None = None,
+        workspace: int | None = None,
+        target: str | None = None,
+        session: _Session | None = None,
+        _api_client: AsyncMixpanelAPIClient | None = None,
+    ) -> None:
+        """Create a new AsyncWorkspace bound to a resolved :class:`Session`.
+
+        Resolution follows :class:`Workspace` exactly (env vars > kwargs >
+        target > bridge > ``[active]`` > ``Account.default_project``).
+
+        Args:
+            account: Named account from ``~/.mp/config.toml``.
+            project: Project ID override (digit string).
+            workspace: Workspace ID override (positive int).
+            target: Apply all three axes from ``[targets.NAME]``.
+            session: Pre-built :class:`Session` (full resolver bypass).
+            _api_client: Injected :class:`AsyncMixpanelAPIClient` for testing.
+
+        Raises:
+            ValueError: ``target=`` combined with any axis kwarg.
+            ConfigError: Account or project axis cannot be resolved.
+        """
+        # The sync Workspace resolves the session and builds bookmark
+        # params; its lazily-created HTTP client is never opened here.
+        self._builder = Workspace(
+            account=account,
+            project=project,
+            workspace=workspace,
+            target=target,
+            session=session,
+        )
+        self._session = self._builder.session
+        self._api_client: AsyncMixpanelAPIClient = (
+            _api_client
+            if _api_client is not None
+            else AsyncMixpanelAPIClient(session=self._session)
+        )
+
+    @property
+    def session(self) -> _Session:
+        """Return the bound :class:`Session`."""
+        return self._session
+
+    @property
+    def api(self) -> AsyncMixpanelAPIClient:
+        """Return the underlying async API client (escape hatch)."""
+        return self._api_client
+
+    async def __aenter__(self) -> AsyncWorkspace:
+        """Enter async context manager.
+
+        Returns:
+            Self for use in ``async with`` statements.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Exit async context manager, closing the connection pool."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client. Idempotent."""
+        await self._api_client.aclose()
+        self._builder.close()
+
+    def _insights_body(self, bookmark_params: dict[str, Any]) -> dict[str, Any]:
+        """Wrap bookmark params in the inline insights request envelope.
+
+        Args:
+            bookmark_params: Pre-built bookmark params dict.
+
+        Returns:
+            Request body for ``POST /api/query/insights``.
+        """
+        return {
+            "bookmark": bookmark_params,
+            "project_id": int(self._session.project.id),
+            "queryLimits": {"limit": 3000},
+        }
+
+    # =========================================================================
+    # LIVE QUERY METHODS
+    # =========================================================================
+
+    async def query(
+        self,
+        events: str
+        | Metric
+        | CohortMetric
+        | Formula
+        | Sequence[str | Metric | CohortMetric | Formula],
+        **kwargs: Any,
+    ) -> QueryResult:
+        """Run a typed insights query. See :meth:`Workspace.query`.
+
+        Args:
+            events: Event name(s), Metric, CohortMetric, or Formula objects.
+            **kwargs: Any keyword accepted by :meth:`Workspace.query`
+                except ``window_days`` and ``incremental_days``.
+
+        Returns:
+            QueryResult with series data, DataFrame, and metadata.
+
+        Raises:
+            BookmarkValidationError: If arguments violate validation rules.
+            AuthenticationError: Invalid credentials.
+            QueryError: Invalid query parameters.
+            RateLimitError: Rate limit exceeded.
+        """
+        params = self._builder.build_params(events, **kwargs)
+        raw = await self._api_client.insights_query(self._insights_body(params))
+        return _transform_query_result(raw, params)
+
+    async def query_funnel(
+        self,
+        steps: list[str | FunnelStep],
+        **kwargs: Any,
+    ) -> FunnelQueryResult:
+        """Run a typed funnel query. See :meth:`Workspace.query_funnel`.
+
+        Args:
+            steps: Funnel steps (event names or FunnelStep objects).
+            **kwargs: Any keyword accepted by :meth:`Workspace.query_funnel`.
+
+        Returns:
+            FunnelQueryResult with step data and conversion rates.
+
+        Raises:
+            BookmarkValidationError: If arguments violate validation rules.
+            AuthenticationError: Invalid credentials.
+            QueryError: Invalid query parameters.
+            RateLimitError: Rate limit exceeded.
+        """
+        params = self._builder.build_funnel_params(steps, **kwargs)
+        raw = await self._api_client.insights_query(self._insights_body(params))
+        return _transform_funnel_result(raw, params)
+
+    async def query_retention(
+        self,
+        born_event: str | RetentionEvent,
+        return_event: str | RetentionEvent,
+        **kwargs: Any,
+    ) -> RetentionQueryResult:
+        """Run a typed retention query. See :meth:`Workspace.query_retention`.
+
+        Args:
+            born_event: Event that defines cohort entry.
+            return_event: Event that defines return.
+            **kwargs: Any keyword accepted by :meth:`Workspace.query_retention`.
+
+        Returns:
+            RetentionQueryResult with cohort data and DataFrame.
+
+        Raises:
+            BookmarkValidationError: If arguments violate validation rules.
+            AuthenticationError: Invalid credentials.
+            QueryError: Invalid query parameters.
+            RateLimitError: Rate limit exceeded.
+        """
+        params = self._builder.build_retention_params(
+            born_event, return_event, **kwargs
+        )
+        raw = await self._api_client.insights_query(self._insights_body(params))
+        return _transform_retention_result(raw, params)
+
+    async def query_flow(
+        self,
+        event: str | FlowStep | Sequence[str | FlowStep],
+        **kwargs: Any,
+    ) -> FlowQueryResult:
+        """Run a typed flow query. See :meth:`Workspace.query_flow`.
+
+        Args:
+            event: Anchor event(s) as strings or FlowStep objects.
+            **kwargs: Any keyword accepted by :meth:`Workspace.query_flow`.
+
+        Returns:
+            FlowQueryResult with steps, flows, and breakdowns.
+
+        Raises:
+            BookmarkValidationError: If arguments violate validation rules.
+            AuthenticationError: Invalid credentials.
+            QueryError: Invalid query parameters or error-as-200.
+            RateLimitError: Rate limit exceeded.
+        """
+        mode: str = kwargs.get("mode", "sankey")
+        params = self._builder.build_flow_params(event, **kwargs)
+        if mode == "paths":
+            query_type = "flows_top_paths"
+        elif mode == "tree":
+            query_type = "flows"
+        else:
+            query_type = "flows_sankey"
+        body: dict[str, Any] = {
+            "bookmark": params,
+            "project_id": int(self._session.project.id),
+            "query_type": query_type,
+        }
+        raw = await self._api_client.arb_funnels_query(body)
+        return _transform_flow_result(raw, params, mode=mode)
+
+    async def query_user(self, **kwargs: Any) -> UserQueryResult:
+        """Query user profiles from the Engage API. See :meth:`Workspace.query_user`.
+
+        With ``parallel=True`` the remaining pages are fetched concurrently
+        on the event loop (at most ``workers``, capped at 5, in flight).
+
+        Args:
+            **kwargs: Any keyword accepted by :meth:`Workspace.query_user`.
+
+        Returns:
+            UserQueryResult with profiles or aggregate data.
+
+        Raises:
+            BookmarkValidationError: If any validation rule fails.
+            AuthenticationError: Invalid credentials (401).
+            RateLimitError: API rate limit exceeded (429).
+        """
+        params = self._builder.build_user_params(**kwargs)
+        mode = kwargs.get("mode", "aggregate")
+        limit: int | None = kwargs.get("limit", 1)
+
+        if mode == "aggregate":
+            response = await self._api_client.engage_stats(
+                **self._builder._build_stats_kwargs(params)
+            )
+            aggregate_data = response.get("results")
+            computed_at = response.get(
+                "computed_at", datetime.now(timezone.utc).isoformat()
+            )
+            total = 0
+            if isinstance(aggregate_data, (int, float)) and (
+                params.get("action") == "count()"
+            ):
+                total = int(aggregate_data)
+            return UserQueryResult(
+                computed_at=computed_at,
+                total=total,
+                profiles=[],
+                params=params,
+                meta={
+                    "action": params.get("action", "count()"),
+                    "segmented": "segment_by_cohorts" in params,
+                },
+                mode="aggregate",
+                aggregate_data=aggregate_data,
+            )
+
+        if kwargs.get("parallel", False) and limit != 1:
+            profiles, meta = await self._fetch_profiles_parallel(
+                params, limit, kwargs.get("workers", 5)
+            )
+        else:
+            profiles, meta = await self._fetch_profiles_sequential(params, limit)
+
+        return UserQueryResult(
+            computed_at=datetime.now(timezone.utc).isoformat(),
+            total=len(profiles),
+            profiles=profiles,
+            params=params,
+            meta=meta,
+            mode="profiles",
+            aggregate_data=None,
+        )
+
+    async def _fetch_profiles_sequential(
+        self,
+        params: dict[str, Any],
+        limit: int | None,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Fetch Engage pages one at a time until ``limit`` is reached.
+
+        Args:
+            params: Engage API params dict from ``build_user_params``.
+            limit: Maximum profiles to collect, or ``None`` for all.
+
+        Returns:
+            Tuple of ``(profiles, meta)``.
+        """
+        page_kwargs = self._builder._build_page_kwargs(params)
+        page_kwargs["limit"] = limit
+        result = await self._api_client.export_profiles_page(0, **page_kwargs)
+        profiles = [transform_profile(p) for p in result.profiles]
+        session_id = result.session_id
+        pages_fetched = 1
+        page = 0
+        while result.has_more and result.profiles:
+            if limit is not None and len(profiles) >= limit:
+                break
+            page += 1
+            result = await self._api_client.export_profiles_page(
+                page, session_id, **page_kwargs
+            )
+            if not result.profiles:
+                break
+            profiles.extend(transform_profile(p) for p in result.profiles)
+            pages_fetched += 1
+        return profiles[:limit], {
+            "session_id": session_id,
+            "pages_fetched": pages_fetched,
+            "parallel": False,
+        }
+
+    async def _fetch_profiles_parallel(
+        self,
+        params: dict[str, Any],
+        limit: int | None,
+        workers: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Fetch page 0, then the remaining Engage pages concurrently.
+
+        Mirrors ``Workspace._execute_user_query_parallel``: auth, rate-limit,
+        server, and query errors abort; any other per-page failure is
+        recorded in ``meta["failed_pages"]``.
+
+        Args:
+            params: Engage API params dict from ``build_user_params``.
+            limit: Maximum profiles to return, or ``None`` for all.
+            workers: Maximum concurrent page requests (capped at 5).
+
+        Returns:
+            Tuple of ``(profiles, meta)``.
+        """
+        capped_workers = min(workers, 5)
+        page_kwargs = self._builder._build_page_kwargs(params)
+        page0 = await self._api_client.export_profiles_page(0, **page_kwargs)
+        session_id = page0.session_id
+        page_size = page0.page_size or 1000
+        profiles = [transform_profile(p) for p in page0.profiles]
+
+        if limit is None:
+            pages_needed = math.ceil(page0.total / page_size)
+        else:
+            effective = min(limit, page0.total) if page0.total > 0 else limit
+            pages_needed = math.ceil(effective / page_size)
+
+        meta: dict[str, Any] = {
+            "session_id": session_id,
+            "pages_fetched": 1,
+            "failed_pages": [],
+            "parallel": True,
+            "workers": capped_workers,
+        }
+        if pages_needed <= 1 or not page0.has_more:
+            return profiles[:limit], meta
+
+        semaphore = asyncio.Semaphore(capped_workers)
+
+        async def _fetch_page(page_num: int) -> list[dict[str, Any]]:
+            """Fetch and normalize a single page under the semaphore."""
+            async with semaphore:
+                result = await self._api_client.export_profiles_page(
+                    page_num, session_id, **page_kwargs
+                )
+            return [transform_profile(p) for p in result.profiles]
+
+        page_nums = list(range(1, pages_needed))
+        outcomes = await asyncio.gather(
+            *(_fetch_page(p) for p in page_nums), return_exceptions=True
+        )
+        failed_pages: list[int] = []
+        for page_num, outcome in zip(page_nums, outcomes, strict=True):
+            if isinstance(
+                outcome, AuthenticationError | RateLimitError | ServerError | QueryError
+            ):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "Failed to fetch page %d (%s: %s), continuing with partial results",
+                    page_num,
+                    type(outcome).__name__,
+                    outcome,
+                )
+                failed_pages.append(page_num)
+                continue
+            profiles.extend(outcome)
+
+        meta["pages_fetched"] = pages_needed - len(failed_pages)
+        meta["failed_pages"] = failed_pages
+        return profiles[:limit], meta
+
+    # =========================================================================
+    # STREAMING METHODS
+    # =========================================================================
+
+    async def stream_events(
+        self,
+        *,
+        from_date: str,
+        to_date: str,
+        events: list[str] | None = None,
+        where: str | None = None,
+        limit: int | None = None,
+        raw: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream events from the Export API. See :meth:`Workspace.stream_events`.
+
+        Args:
+            from_date: Start date inclusive (YYYY-MM-DD format).
+            to_date: End date inclusive (YYYY-MM-DD format).
+            events: Optional list of event names to filter.
+            where: Optional Mixpanel filter expression.
+            limit: Optional maximum number of events to return (max 100000).
+            raw: If True, return events in raw Mixpanel API format.
+
+        Yields:
+            dict[str, Any]: Event dictionaries in normalized or raw format.
+
+        Raises:
+            AuthenticationError: If credentials are invalid.
+            RateLimitError: If rate limit exceeded after max retries.
+            QueryError: If filter expression is invalid.
+            ValueError: If limit is outside valid range (1-100000).
+        """
+        _validate_limit(limit)
+        async for event in self._api_client.export_events(
+            from_date=from_date,
+            to_date=to_date,
+            events=events,
+            where=where,
+            limit=limit,
+        ):
+            yield event if raw else transform_event(event)
@@ -832,6 +832,146 @@ class DateRangeTooLargeError(MixpanelHeadlessError):
         return self._max_days
 
 
+class BulkOperationError(MixpanelHeadlessError):
+    """Some batches of a chunked bulk request failed.
+
+    Large bulk calls (schema, Lexicon, bookmark, cohort, dashboard and
+    alert bulk endpoints) are split into batches sent concurrently. When
+    only some batches fail, this error reports which items were applied and
+    which were not instead of hiding the partial success behind the first
+    failure. A bulk call that fits in one batch raises that batch's original
+    error unchanged.
+
+    Failures are tracked per batch, not per item: the bulk endpoints accept
+    or reject a request as a whole, so every item of a failed batch is
+    listed in ``failed_items`` (and in the matching ``failed_batches``
+    entry), even if the error was caused by only one of them.
+
+    Example:
+        ```python
+        try:
+            ws.bulk_delete_cohorts(ids)
+        except BulkOperationError as e:
+            retry_ids = e.failed_items
+            print(f"{len(e.succeeded_items)} deleted, {len(retry_ids)} failed")
+        ```
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        *,
+        succeeded_items: list[Any],
+        failed_items: list[Any],
+        failed_batches: list[list[Any]],
+        results: list[Any],
+        errors: list[Exception],
+    ) -> None:
+        """Initialize BulkOperationError.
+
+        Args:
+            operation: Name of the bulk method that was called.
+            succeeded_items: Items from batches that were applied.
+            failed_items: Items from batches that failed.
+            failed_batches: The failed batches, parallel to ``errors``.
+            results: Parsed responses of the successful batches, in order.
+            errors: One exception per failed batch, in order.
+        """
+        self._operation = operation
+        self._succeeded_items = succeeded_items
+        self._failed_items = failed_items
+        self._failed_batches = failed_batches
+        self._results = results
+        self._errors = errors
+
+        message = (
+            f"{operation}: {len(failed_items)} of "
+            f"{len(failed_items) + len(succeeded_items)} items failed "
+            f"in {len(errors)} batch(es); first error: {errors[0]}"
+        )
+        details: dict[str, Any] = {
+            "operation": operation,
+            "succeeded": len(succeeded_items),
+            "failed": len(failed_items),
+            "errors": [str(e) for e in errors],
+        }
+        super().__init__(message, code="BULK_PARTIAL_FAILURE", details=details)
+
+    @property
+    def operation(self) -> str:
+        """Name of the bulk method that was called."""
+        return self._operation
+
+    @property
+    def succeeded_items(self) -> list[Any]:
+        """Items from batches the server applied."""
+        return self._succeeded_items
+
+    @property
+    def failed_items(self) -> list[Any]:
+        """Every item of every failed batch, in input order."""
+        return self._failed_items
+
+    @property
+    def failed_batches(self) -> list[list[Any]]:
+        """Items of each failed batch; ``failed_batches[i]`` got ``errors[i]``."""
+        return self._failed_batches
+
+    @property
+    def results(self) -> list[Any]:
+        """Parsed responses of the successful batches."""
+        return self._results
+
+    @property
+    def errors(self) -> list[Exception]:
+        """Exceptions raised by the failed batches."""
+        return self._errors
+
+
+class CircuitOpenError(MixpanelHeadlessError):
+    """A Mixpanel host is failing and requests to it are short-circuited.
+
+    Raised without contacting the server once a host has returned enough
+    consecutive transient failures (``502``/``503``/``504`` or network
+    errors) to open its circuit breaker. Requests resume automatically
+    after the cooldown; see :class:`~mixpanel_headless.types.RetryPolicy`.
+
+    Example:
+        ```python
+        try:
+            ws.segmentation("Signup", from_date="2024-01-01", to_date="2024-01-31")
+        except CircuitOpenError as e:
+            print(f"{e.host} is degraded; retry in {e.retry_after:.0f}s")
+        ```
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        """Initialize CircuitOpenError.
+
+        Args:
+            host: Host whose breaker is open (e.g. ``"data.mixpanel.com"``).
+            retry_after: Seconds until a probe request will be allowed.
+        """
+        self._host = host
+        self._retry_after = retry_after
+        super().__init__(
+            f"Circuit open for {host} after repeated failures; "
+            f"retry in {retry_after:.1f}s",
+            code="CIRCUIT_OPEN",
+            details={"host": host, "retry_after": retry_after},
+        )
+
+    @property
+    def host(self) -> str:
+        """Host whose breaker is open."""
+        return self._host
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until a probe request will be allowed."""
+        return self._retry_after
+
+
 # OAuth Exceptions
 
 
@@ -26,7 +26,16 @@ from datetime import date as dt_date
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, Any, Generic, Literal, TypedDict, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Generic,
+    Literal,
+    TypedDict,
+    TypeVar,
+    get_args,
+)
 
 from mixpanel_headless._literal_types import (
     CohortAggregationType as CohortAggregationType,
@@ -57,6 +66,7 @@ from mixpanel_headless._literal_types import FunnelOrder as FunnelOrder
 from mixpanel_headless._literal_types import InsightsMode as InsightsMode
 from mixpanel_headless._literal_types import MathType as MathType
 from mixpanel_headless._literal_types import PerUserAggregation as PerUserAggregation
+from mixpanel_headless._literal_types import QuerySpecKind as QuerySpecKind
 from mixpanel_headless._literal_types import RetentionAlignment as RetentionAlignment
 from mixpanel_headless._literal_types import RetentionMathType as RetentionMathType
 from mixpanel_headless._literal_types import RetentionMode as RetentionMode
@@ -73,6 +83,8 @@ from mixpanel_headless.auth_types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     import networkx as nx
 import pandas as pd
 from pydantic import (
@@ -290,6 +302,9 @@ class SegmentationResult(ResultWithDataFrame):
     For unsegmented queries, segment_name is "total".
     """
 
+    meta: dict[str, Any] = field(default_factory=dict)
+    """Client-side metadata (e.g. ``cache_hit`` when a query cache is set)."""
+
     @property
     def df(self) -> pd.DataFrame:
         """Convert to DataFrame with columns: date, segment, count.
@@ -1034,6 +1049,9 @@ class SavedReportResult:
     For Funnel reports: {count: {...}, overall_conv_ratio: {...}, ...}
     """
 
+    meta: dict[str, Any] = field(default_factory=dict)
+    """Client-side metadata (e.g. ``cache_hit`` when a query cache is set)."""
+
     _df_cache: pd.DataFrame | None = field(default=None, repr=False)
 
     @property
@@ -9592,12 +9610,19 @@ class QueryMeta(TypedDict, total=False):
         is_cached: Whether the result was served from cache.
         computation_time: Server-side computation time in milliseconds.
         query_id: Unique identifier for this query execution.
+        cache_hit: Whether the result came from the client-side query
+            cache (set only when ``Workspace(query_cache=...)`` is used).
+        incremental_from: First day fetched by an incremental refresh, or
+            ``None`` if every bucket came from the local store (set only
+            when ``incremental_days=`` is used).
     """
 
     sampling_factor: float
     is_cached: bool
     computation_time: float
     query_id: str
+    cache_hit: bool
+    incremental_from: str | None
 
 
 class FunnelStepData(TypedDict):
@@ -11803,3 +11828,804 @@ class OAuthLoginResult(BaseModel):
 
     client_path: Path
     """Where the DCR client info was persisted (``~/.mp/accounts/{name}/client.json``)."""
+
+
+# =============================================================================
+# HTTP Client Tuning Types
+# =============================================================================
+# Configuration values accepted by ``Workspace(...)`` and ``MixpanelAPIClient``
+# that shape how requests are scheduled on the wire.
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Client-side request budget for one API family.
+
+    Mixpanel enforces limits per API family (Query, Raw Export, Engage, App).
+    A ``RateLimit`` lets the client queue requests locally once the budget is
+    spent instead of sending them and being answered with ``429``.
+
+    ``requests_per_second`` drives a token bucket holding up to ``burst``
+    tokens; ``max_concurrent`` caps requests in flight at once. Either may
+    be ``None`` to leave that dimension unlimited.
+
+    Example:
+        ```python
+        from mixpanel_headless import RateLimit, Workspace
+
+        # Mixpanel's documented Query API budget: 60/hour, 5 concurrent
+        ws = Workspace(
+            rate_limits={
+                "query": RateLimit(
+                    requests_per_second=60 / 3600, burst=60, max_concurrent=5
+                ),
+            }
+        )
+        ```
+    """
+
+    requests_per_second: float | None = None
+    """Sustained request rate, or ``None`` for no rate limit."""
+
+    burst: int = 1
+    """Bucket capacity: requests that may start back-to-back after idling."""
+
+    max_concurrent: int | None = None
+    """Maximum requests in flight at once, or ``None`` for no cap."""
+
+    def __post_init__(self) -> None:
+        """Validate field ranges.
+
+        Raises:
+            ValueError: If a rate, burst, or concurrency value is not positive.
+        """
+        if self.requests_per_second is not None and self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        if self.max_concurrent is not None and self.max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+
+@dataclass(frozen=True)
+class BulkOptions:
+    """How bulk App API calls are split, dispatched and encoded.
+
+    Bulk methods such as ``create_schemas_bulk``,
+    ``bulk_update_event_definitions`` or ``bulk_delete_cohorts`` split long
+    item lists into batches below server payload limits and send them
+    concurrently. Partial failures raise
+    :class:`~mixpanel_headless.exceptions.BulkOperationError`.
+
+    Example:
+        ```python
+        from mixpanel_headless import BulkOptions, Workspace
+
+        ws = Workspace(bulk=BulkOptions(max_workers=8, gzip=True))
+        ws.bulk_update_event_definitions(params)  # 20k events, 8 at a time
+        ```
+    """
+
+    batch_size: int | None = None
+    """Items per request, or ``None`` for each endpoint's default."""
+
+    max_workers: int = 4
+    """Maximum batches in flight at once."""
+
+    gzip: bool = False
+    """Gzip-compress large JSON request bodies (``Content-Encoding: gzip``)."""
+
+    def __post_init__(self) -> None:
+        """Validate field ranges.
+
+        Raises:
+            ValueError: If ``batch_size`` or ``max_workers`` is not positive.
+        """
+        if self.batch_size is not None and self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries for transient server and network failures, plus circuit breaking.
+
+    Idempotent requests (GETs and read-only query POSTs) that fail with one
+    of ``statuses`` or a transport error (connection reset, timeout) are
+    retried with full-jitter exponential backoff. Retries draw on a shared
+    budget so a degraded API is not hit with a multiple of normal traffic.
+
+    Each host (``mixpanel.com``, ``data.mixpanel.com``, ...) has a circuit
+    breaker: after ``breaker_threshold`` consecutive failures it opens and
+    requests fail immediately with
+    :class:`~mixpanel_headless.exceptions.CircuitOpenError` for
+    ``breaker_cooldown`` seconds, after which one probe request is let
+    through to test recovery.
+
+    ``429`` responses are governed separately by the client's
+    ``max_retries`` and :class:`RateLimit`.
+
+    Example:
+        ```python
+        from mixpanel_headless import RetryPolicy, Workspace
+
+        ws = Workspace(retry=RetryPolicy(max_retries=5, breaker_cooldown=60))
+        ```
+    """
+
+    max_retries: int = 3
+    """Retries per request for retryable statuses and transport errors."""
+
+    statuses: frozenset[int] = frozenset({502, 503, 504})
+    """HTTP statuses treated as transient. ``500`` is excluded by default
+    because Mixpanel uses it for query errors that will not go away."""
+
+    backoff_base: float = 0.5
+    """Backoff ceiling for the first retry, in seconds; doubles per retry."""
+
+    backoff_max: float = 30.0
+    """Upper bound on any single backoff, in seconds."""
+
+    budget_ratio: float = 0.2
+    """Retries earned per request sent, shared by all threads."""
+
+    budget_min: int = 10
+    """Retries available when idle, and the cap on saved-up retries."""
+
+    breaker_threshold: int | None = 5
+    """Consecutive failures that open a host's breaker, or ``None`` to
+    disable circuit breaking."""
+
+    breaker_cooldown: float = 30.0
+    """Seconds an open breaker rejects requests before a probe."""
+
+    def __post_init__(self) -> None:
+        """Validate field ranges.
+
+        Raises:
+            ValueError: If a count, ratio, or duration is out of range.
+        """
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("backoff durations must be non-negative")
+        if self.budget_ratio < 0:
+            raise ValueError("budget_ratio must be non-negative")
+        if self.budget_min < 0:
+            raise ValueError("budget_min must be non-negative")
+        if self.breaker_threshold is not None and self.breaker_threshold < 1:
+            raise ValueError("breaker_threshold must be at least 1")
+        if self.breaker_cooldown < 0:
+            raise ValueError("breaker_cooldown must be non-negative")
+
+
+#: Default time-to-live, in seconds, for each cached query type.
+DEFAULT_QUERY_CACHE_TTLS: dict[str, float] = {
+    "query": 300,
+    "funnel": 300,
+    "retention": 900,
+    "segmentation": 300,
+    "saved_report": 300,
+}
+
+
+@dataclass(frozen=True)
+class QueryCacheConfig:
+    """Settings for the opt-in on-disk query result cache.
+
+    When passed as ``Workspace(query_cache=...)``, results of ``query``,
+    ``query_funnel``, ``query_retention``, ``segmentation`` and
+    ``query_saved_report`` are stored on disk and reused by identical
+    calls until their TTL runs out, saving rate-limited Query API calls.
+
+    Entries are keyed by region, project, workspace and the normalized
+    query params. Relative ranges such as ``last=30`` are resolved to
+    concrete dates first, so the same call made tomorrow is a new entry.
+    Cached results report ``meta["cache_hit"]``.
+
+    Example:
+        ```python
+        from mixpanel_headless import QueryCacheConfig, Workspace
+
+        ws = Workspace(
+            query_cache=QueryCacheConfig(ttl_seconds={"retention": 3600})
+        )
+        ws.query("Login", last=7)  # meta["cache_hit"] is False
+        ws.query("Login", last=7)  # meta["cache_hit"] is True
+        ```
+    """
+
+    ttl_seconds: Mapping[str, float] = field(default_factory=dict)
+    """Per-type TTLs (keys ``query``, ``funnel``, ``retention``,
+    ``segmentation``, ``saved_report``) merged over the defaults.
+    A TTL of ``0`` disables caching for that type."""
+
+    max_bytes: int = 256 * 1024 * 1024
+    """Total size bound; least recently used entries are evicted past it."""
+
+    directory: Path | None = None
+    """Cache directory, or ``None`` for ``~/.mp/cache/queries``."""
+
+    def __post_init__(self) -> None:
+        """Validate TTL keys and the size bound.
+
+        Raises:
+            ValueError: If a TTL key is unknown, a TTL is negative, or
+                ``max_bytes`` is not positive.
+        """
+        unknown = set(self.ttl_seconds) - set(DEFAULT_QUERY_CACHE_TTLS)
+        if unknown:
+            raise ValueError(
+                f"Unknown query cache type(s): {', '.join(sorted(unknown))}"
+            )
+        if any(ttl < 0 for ttl in self.ttl_seconds.values()):
+            raise ValueError("ttl_seconds values must not be negative")
+        if self.max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+
+    def ttl_for(self, kind: str) -> float:
+        """Return the effective TTL for one query type.
+
+        Args:
+            kind: Query type key.
+
+        Returns:
+            TTL in seconds.
+        """
+        return self.ttl_seconds.get(kind, DEFAULT_QUERY_CACHE_TTLS[kind])
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """One HTTP request as observed by ``MixpanelAPIClient`` instrumentation.
+
+    Delivered to hooks registered with ``client.add_event_hook()`` after
+    every request attempt, including ``429`` responses that are retried.
+    For streamed exports the event fires once the stream is consumed.
+
+    Example:
+        ```python
+        def log_slow(event: RequestEvent) -> None:
+            if event.elapsed > 5:
+                print(event.family, event.url, event.elapsed)
+
+        ws.api.add_event_hook(log_slow)
+        ```
+    """
+
+    family: str
+    """API family (``query``, ``export``, ``engage``, ``app``, or ``other``)."""
+
+    method: str
+    """HTTP method."""
+
+    url: str
+    """Request URL without query string."""
+
+    status_code: int | None
+    """Response status, or ``None`` if the request failed in transport."""
+
+    elapsed: float
+    """Seconds from sending the request to reading the full body."""
+
+    bytes_received: int = 0
+    """Body bytes read off the wire (compressed size)."""
+
+    bytes_decoded: int = 0
+    """Body bytes after content decoding (decompressed size)."""
+
+    connection_reused: bool | None = None
+    """Whether a pooled connection was reused, or ``None`` if unknown."""
+
+
+#: Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    math.inf,
+)
+
+
+@dataclass(frozen=True)
+class FamilyStats:
+    """Aggregated request metrics for one API family.
+
+    Example:
+        ```python
+        stats = ws.api.stats().families["query"]
+        print(stats.requests, stats.mean_latency, stats.latency_quantile(0.95))
+        ```
+    """
+
+    requests: int = 0
+    """Requests sent, including ones answered with ``429``."""
+
+    errors: int = 0
+    """Requests that failed in transport or returned a status >= 400."""
+
+    retries: int = 0
+    """Requests re-sent after a ``429`` or a dropped connection."""
+
+    rate_limited: int = 0
+    """Responses with status ``429``."""
+
+    backoff_seconds: float = 0.0
+    """Total time slept before retries."""
+
+    bytes_received: int = 0
+    """Body bytes read off the wire (compressed size)."""
+
+    bytes_decoded: int = 0
+    """Body bytes after content decoding (decompressed size)."""
+
+    connections_new: int = 0
+    """Requests that had to open a new connection."""
+
+    connections_reused: int = 0
+    """Requests served over an already-open pooled connection."""
+
+    latency_total: float = 0.0
+    """Sum of request latencies in seconds."""
+
+    latency_histogram: tuple[int, ...] = (0,) * len(LATENCY_BUCKETS)
+    """Request counts per :data:`LATENCY_BUCKETS` bucket."""
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean request latency in seconds (``0.0`` with no requests)."""
+        return self.latency_total / self.requests if self.requests else 0.0
+
+    def latency_quantile(self, q: float) -> float:
+        """Estimate a latency quantile from the histogram.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. ``0.95``).
+
+        Returns:
+            Upper bound of the bucket holding the quantile, in seconds
+            (``0.0`` with no requests).
+
+        Raises:
+            ValueError: If ``q`` is outside ``[0, 1]``.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        total = sum(self.latency_histogram)
+        if total == 0:
+            return 0.0
+        target = q * total
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_histogram, strict=True):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return LATENCY_BUCKETS[-1]  # pragma: no cover — loop always returns
+
+
+@dataclass(frozen=True)
+class ClientStats:
+    """Snapshot of ``MixpanelAPIClient`` request metrics.
+
+    Returned by ``client.stats()``. Counters accumulate from client creation
+    (or the last ``reset_stats()``) and are keyed by API family.
+
+    Example:
+        ```python
+        stats = ws.api.stats()
+        for family, s in stats.families.items():
+            print(family, s.requests, s.rate_limited, s.backoff_seconds)
+        print(stats.total.bytes_received)
+        ```
+    """
+
+    families: dict[str, FamilyStats] = field(default_factory=dict)
+    """Per-family metrics; families with no traffic are omitted."""
+
+    @property
+    def total(self) -> FamilyStats:
+        """Metrics summed over every family."""
+        items = list(self.families.values())
+        return FamilyStats(
+            requests=sum(s.requests for s in items),
+            errors=sum(s.errors for s in items),
+            retries=sum(s.retries for s in items),
+            rate_limited=sum(s.rate_limited for s in items),
+            backoff_seconds=sum(s.backoff_seconds for s in items),
+            bytes_received=sum(s.bytes_received for s in items),
+            bytes_decoded=sum(s.bytes_decoded for s in items),
+            connections_new=sum(s.connections_new for s in items),
+            connections_reused=sum(s.connections_reused for s in items),
+            latency_total=sum(s.latency_total for s in items),
+            latency_histogram=tuple(
+                sum(counts)
+                for counts in zip(*(s.latency_histogram for s in items), strict=True)
+            )
+            if items
+            else (0,) * len(LATENCY_BUCKETS),
+        )
+
+
+# =============================================================================
+# Export Result Types
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class EventExportResult:
+    """Summary of a checkpointed event export written to disk.
+
+    Counts cover the whole output file, including shards completed by
+    earlier runs that were skipped on resume.
+
+    Example:
+        ```python
+        result = ws.export_events_to_jsonl(
+            "events.jsonl", from_date="2024-01-01", to_date="2024-03-31"
+        )
+        print(result.lines, result.shards_written, result.shards_skipped)
+        ```
+    """
+
+    path: Path
+    """Output file the events were written to."""
+
+    manifest_path: Path
+    """Checkpoint manifest recording completed shards."""
+
+    lines: int
+    """Total events in the output file."""
+
+    size_bytes: int
+    """Total size of the output file in bytes."""
+
+    shards_written: int
+    """Shards downloaded by this run."""
+
+    shards_skipped: int
+    """Shards already complete from a previous run."""
+
+
+@dataclass(frozen=True)
+class ParquetExportResult:
+    """Summary of an event export written as a partitioned Parquet dataset.
+
+    The dataset is Hive-partitioned by ``event_date`` and ``event_name``.
+    ``columns`` is the schema unified across every file written, which is
+    also stored in ``<path>/_common_metadata``.
+
+    Example:
+        ```python
+        import pyarrow.dataset as ds
+
+        result = ws.export_events_to_parquet(
+            "lake/events", from_date="2024-01-01", to_date="2024-01-31"
+        )
+        table = ds.dataset(result.path, partitioning="hive").to_table()
+        ```
+    """
+
+    path: Path
+    """Dataset root directory."""
+
+    rows: int
+    """Events written by this run."""
+
+    files: list[Path]
+    """Parquet files written by this run."""
+
+    columns: dict[str, str]
+    """Column name to Arrow type for the unified schema (excluding the
+    ``event_date`` and ``event_name`` partition columns)."""
+
+    days_written: int
+    """Days exported (and replaced, if previously present) by this run."""
+
+
+# =============================================================================
+# Batch Query Types
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """One query to run with ``Workspace.query_many``.
+
+    ``kwargs`` are passed as keyword arguments to the Workspace method
+    selected by ``kind`` (see :data:`QuerySpecKind`). The class methods
+    take that method's leading arguments by name and position, so a spec
+    reads like the call it stands for.
+
+    Example:
+        ```python
+        from mixpanel_headless import QuerySpec
+
+        specs = [
+            QuerySpec.insights("Login", math="unique", last=7, label="logins"),
+            QuerySpec.funnel(["Signup", "Purchase"], last=30),
+            QuerySpec.saved_report(12345),
+        ]
+        ```
+    """
+
+    kind: QuerySpecKind
+    """Query type; selects the Workspace method to call."""
+
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    """Keyword arguments for the method."""
+
+    label: str | None = None
+    """Optional caller-chosen name, carried through to the outcome."""
+
+    def __post_init__(self) -> None:
+        """Validate the query type and its required arguments.
+
+        Raises:
+            ValueError: If ``kind`` is not a :data:`QuerySpecKind`, or
+                ``kwargs`` lacks an argument that method requires.
+        """
+        if self.kind not in _QUERY_SPEC_KINDS:
+            raise ValueError(
+                f"Unknown query kind {self.kind!r}; "
+                f"expected one of {', '.join(_QUERY_SPEC_KINDS)}"
+            )
+        missing = [k for k in _QUERY_SPEC_REQUIRED[self.kind] if k not in self.kwargs]
+        if missing:
+            raise ValueError(f"{self.kind} query requires {', '.join(missing)}")
+
+    @classmethod
+    def insights(
+        cls,
+        events: str
+        | Metric
+        | CohortMetric
+        | Formula
+        | Sequence[str | Metric | CohortMetric | Formula],
+        *,
+        label: str | None = None,
+        **kwargs: Any,
+    ) -> QuerySpec:
+        """Spec for ``Workspace.query`` (insights)."""
+        return cls("insights", {"events": events, **kwargs}, label)
+
+    @classmethod
+    def funnel(
+        cls,
+        steps: list[str | FunnelStep],
+        *,
+        label: str | None = None,
+        **kwargs: Any,
+    ) -> QuerySpec:
+        """Spec for ``Workspace.query_funnel``."""
+        return cls("funnel", {"steps": steps, **kwargs}, label)
+
+    @classmethod
+    def retention(
+        cls,
+        born_event: str | RetentionEvent,
+        return_event: str | RetentionEvent,
+        *,
+        label: str | None = None,
+        **kwargs: Any,
+    ) -> QuerySpec:
+        """Spec for ``Workspace.query_retention``."""
+        return cls(
+            "retention",
+            {"born_event": born_event, "return_event": return_event, **kwargs},
+            label,
+        )
+
+    @classmethod
+    def flow(
+        cls,
+        event: str | FlowStep | Sequence[str | FlowStep],
+        *,
+        label: str | None = None,
+        **kwargs: Any,
+    ) -> QuerySpec:
+        """Spec for ``Workspace.query_flow``."""
+        return cls("flow", {"event": event, **kwargs}, label)
+
+    @classmethod
+    def segmentation(
+        cls, event: str, *, label: str | None = None, **kwargs: Any
+    ) -> QuerySpec:
+        """Spec for ``Workspace.segmentation``."""
+        return cls("segmentation", {"event": event, **kwargs}, label)
+
+    @classmethod
+    def saved_report(
+        cls, bookmark_id: int, *, label: str | None = None, **kwargs: Any
+    ) -> QuerySpec:
+        """Spec for ``Workspace.query_saved_report``."""
+        return cls("saved_report", {"bookmark_id": bookmark_id, **kwargs}, label)
+
+    @classmethod
+    def saved_flows(cls, bookmark_id: int, *, label: str | None = None) -> QuerySpec:
+        """Spec for ``Workspace.query_saved_flows``."""
+        return cls("saved_flows", {"bookmark_id": bookmark_id}, label)
+
+
+_QUERY_SPEC_KINDS: tuple[str, ...] = get_args(QuerySpecKind)
+
+# Arguments each QuerySpec kind's Workspace method cannot run without
+_QUERY_SPEC_REQUIRED: dict[str, tuple[str, ...]] = {
+    "insights": ("events",),
+    "funnel": ("steps",),
+    "retention": ("born_event", "return_event"),
+    "flow": ("event",),
+    "segmentation": ("event", "from_date", "to_date"),
+    "saved_report": ("bookmark_id",),
+    "saved_flows": ("bookmark_id",),
+}
+
+
+@dataclass(frozen=True)
+class QueryOutcome:
+    """Result or error of one :class:`QuerySpec` run by ``Workspace.query_many``.
+
+    Exactly one of ``result`` and ``error`` is set. A failed query does not
+    stop the others; inspect ``ok`` or call :meth:`unwrap`.
+
+    Example:
+        ```python
+        outcomes = ws.query_many(specs)
+        for outcome in outcomes:
+            if outcome.ok:
+                print(outcome.spec.label, outcome.result.df.shape)
+            else:
+                print(outcome.spec.label, "failed:", outcome.error)
+        ```
+    """
+
+    spec: QuerySpec
+    """The spec that was run."""
+
+    result: Any = None
+    """Whatever the Workspace method returned, or ``None`` on failure."""
+
+    error: Exception | None = None
+    """The exception the query raised, or ``None`` on success."""
+
+    elapsed: float = 0.0
+    """Seconds spent on this query, including local rate-limit waits."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the query succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Return the result, re-raising the query's error if it failed.
+
+        Returns:
+            The query result.
+
+        Raises:
+            Exception: The error the query raised.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@dataclass(frozen=True)
+class DashboardReport:
+    """One report evaluated by ``Workspace.run_dashboard``.
+
+    Exactly one of ``result`` and ``error`` is set.
+
+    Example:
+        ```python
+        reports = ws.run_dashboard(1001)
+        for report in reports.values():
+            if report.ok:
+                print(report.name, report.elapsed, report.cached)
+        ```
+    """
+
+    bookmark_id: int
+    """Saved report (bookmark) ID."""
+
+    name: str
+    """Report name."""
+
+    report_type: str
+    """Bookmark type (``insights``, ``funnels``, ``retention``, ``flows``)."""
+
+    result: SavedReportResult | FlowsResult | None = None
+    """Query result, or ``None`` if the report failed."""
+
+    error: Exception | None = None
+    """The exception the query raised, or ``None`` on success."""
+
+    elapsed: float = 0.0
+    """Seconds spent computing the result (``0.0`` when served from cache)."""
+
+    cached: bool = False
+    """Whether the result was reused from an earlier run."""
+
+    modified: datetime | None = None
+    """The bookmark's last modification time, used to invalidate the cache."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the report was evaluated successfully."""
+        return self.error is None
+
+    def unwrap(self) -> SavedReportResult | FlowsResult:
+        """Return the result, re-raising the report's error if it failed.
+
+        Returns:
+            The report result.
+
+        Raises:
+            Exception: The error the query raised.
+        """
+        if self.error is not None:
+            raise self.error
+        if self.result is None:  # pragma: no cover — run_dashboard sets one
+            raise AssertionError("unreachable: a report without error has a result")
+        return self.result
+
+
+@dataclass(frozen=True)
+class ProjectOutcome:
+    """Result or error of one project run by ``Workspace.map_projects``.
+
+    Also returned by ``Workspace.map_targets``, with ``target`` set. Exactly
+    one of ``result`` and ``error`` is set.
+
+    Example:
+        ```python
+        outcomes = ws.map_projects(lambda p: len(p.events()))
+        for project_id, outcome in outcomes.items():
+            if outcome.ok:
+                print(project_id, outcome.result)
+            else:
+                print(project_id, "failed:", outcome.error)
+        ```
+    """
+
+    project_id: str
+    """Project the function ran against."""
+
+    result: Any = None
+    """Whatever the function returned, or ``None`` on failure."""
+
+    error: Exception | None = None
+    """The exception the function raised, or ``None`` on success."""
+
+    elapsed: float = 0.0
+    """Seconds spent running the function for this project."""
+
+    target: str | None = None
+    """Target name for ``map_targets`` runs, otherwise ``None``."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the function succeeded for this project."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Return the result, re-raising the project's error if it failed.
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            Exception: The error the function raised.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.result
@@ -26,18 +26,25 @@ Example:
 from __future__ import annotations
 
 import calendar
+import io
 import json
 import logging
 import math
 import time
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import replace
 from datetime import date as _date
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, TypeVar, overload
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
+    import pyarrow as pa
+
     from mixpanel_headless._internal.me import MeService
 
 from mixpanel_headless._internal.api_client import MixpanelAPIClient
@@ -64,6 +71,7 @@ from mixpanel_headless._internal.auth.session import (
 from mixpanel_headless._internal.auth.session import (
     WorkspaceRef as _WorkspaceRef,
 )
+from mixpanel_headless._internal.auth.storage import cache_root
 from mixpanel_headless._internal.bookmark_builders import (
     _build_composed_properties,
     build_date_range,
@@ -81,7 +89,16 @@ from mixpanel_headless._internal.bookmark_schema import (
     get_root_model_for_bookmark_type,
     validate_with_pydantic,
 )
+from mixpanel_headless._internal.checkpoint import export_events_checkpointed
 from mixpanel_headless._internal.config import ConfigManager
+from mixpanel_headless._internal.date_split import (
+    merge_counts,
+    merge_query,
+    merge_segmentation,
+    split_date_range,
+    window_params,
+)
+from mixpanel_headless._internal.lookup_download import ChunkReader, iter_csv_rows
 from mixpanel_headless._internal.query.user_builders import (
     extract_cohort_filter,
     filters_to_selector,
@@ -90,7 +107,14 @@ from mixpanel_headless._internal.query.user_validators import (
     validate_user_args,
     validate_user_params,
 )
+from mixpanel_headless._internal.query_cache import (
+    QueryCache,
+    mentions_relative_dates,
+    project_now,
+    resolve_relative_ranges,
+)
 from mixpanel_headless._internal.segfilter import build_segfilter_entry
+from mixpanel_headless._internal.series_store import SeriesStore, refresh_series
 from mixpanel_headless._internal.services.discovery import DiscoveryService
 from mixpanel_headless._internal.services.live_query import LiveQueryService
 from mixpanel_headless._internal.transforms import transform_event, transform_profile
@@ -149,6 +173,7 @@ from mixpanel_headless.types import (
     BookmarkType,
     BulkCreateSchemasParams,
     BulkCreateSchemasResponse,
+    BulkOptions,
     BulkPatchResult,
     BulkUpdateAnomalyParams,
     BulkUpdateBookmarkEntry,
@@ -181,6 +206,7 @@ from mixpanel_headless.types import (
     CustomProperty,
     CustomPropertyRef,
     Dashboard,
+    DashboardReport,
     DataVolumeAnomaly,
     DeleteSchemasResponse,
     DropFilter,
@@ -190,6 +216,7 @@ from mixpanel_headless.types import (
     EventCountsResult,
     EventDefinition,
     EventDeletionRequest,
+    EventExportResult,
     Exclusion,
     Experiment,
     ExperimentConcludeParams,
@@ -224,13 +251,19 @@ from mixpanel_headless.types import (
     NumericAverageResult,
     NumericBucketResult,
     NumericSumResult,
+    ParquetExportResult,
     PerUserAggregation,
     PreviewDeletionFiltersParams,
+    ProjectOutcome,
     ProjectWebhook,
     PropertyCountsResult,
     PropertyDefinition,
     PublicWorkspace,
+    QueryCacheConfig,
+    QueryOutcome,
     QueryResult,
+    QuerySpec,
+    RateLimit,
     ReplaceSchemaEnforcementParams,
     RetentionAlignment,
     RetentionEvent,
@@ -238,6 +271,7 @@ from mixpanel_headless.types import (
     RetentionMode,
     RetentionQueryResult,
     RetentionResult,
+    RetryPolicy,
     SavedCohort,
     SavedReportResult,
     SchemaEnforcementConfig,
@@ -277,10 +311,27 @@ from mixpanel_headless.types import (
 
 logger = logging.getLogger(__name__)
 
+_R = TypeVar("_R")
+
 # Limit validation bounds (Mixpanel API restriction)
 _MIN_LIMIT = 1
 _MAX_LIMIT = 100_000
 
+# Workspace method run by ``query_many`` for each ``QuerySpec.kind``
+_QUERY_SPEC_METHODS: dict[str, str] = {
+    "insights": "query",
+    "funnel": "query_funnel",
+    "retention": "query_retention",
+    "flow": "query_flow",
+    "segmentation": "segmentation",
+    "saved_report": "query_saved_report",
+    "saved_flows": "query_saved_flows",
+}
+
+# Date windows queried at once when ``window_days`` splits a long range;
+# matches the default Query API concurrency limit
+_WINDOW_WORKERS = 5
+
 
 def _validate_limit(limit: int | None) -> None:
     """Validate limit is within the allowed range.
@@ -302,6 +353,150 @@ def _validate_limit(limit: int | None) -> None:
         raise ValueError(f"limit must be at most {_MAX_LIMIT}, got {limit}")
 
 
+def _validate_stream_format(format: str, *, raw: bool, batch_size: int) -> None:
+    """Validate the output-format options of the streaming methods.
+
+    Args:
+        format: Requested output format.
+        raw: Whether raw API dicts were requested.
+        batch_size: Rows per Arrow batch.
+
+    Raises:
+        ValueError: If ``format`` is unknown, ``raw`` is combined with
+            ``format="arrow"``, or ``batch_size`` is less than 1.
+    """
+    if format not in ("dict", "arrow"):
+        raise ValueError(f"format must be 'dict' or 'arrow', got {format!r}")
+    if format == "arrow" and raw:
+        raise ValueError("raw cannot be combined with format='arrow'")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+
+def _import_arrow(feature: str) -> ModuleType:
+    """Import the Arrow conversion module, which requires pyarrow.
+
+    Args:
+        feature: Name of the calling feature, for the error message.
+
+    Returns:
+        The ``mixpanel_headless._internal.arrow`` module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        from mixpanel_headless._internal import arrow
+    except ImportError as exc:  # pragma: no cover - pyarrow is optional on 3.10
+        raise ImportError(f"{feature} requires pyarrow: pip install pyarrow") from exc
+    return arrow
+
+
+def _non_additive_query_reason(
+    events: Any,
+    *,
+    math: str,
+    per_user: str | None,
+    group_by: Any,
+    where: Any,
+    formula: str | None,
+    rolling: int | None,
+    cumulative: bool,
+    mode: str,
+    time_comparison: TimeComparison | None,
+) -> str | None:
+    """Explain why an insights query cannot be summed across date windows.
+
+    Only event totals and property sums (``math="total"`` without per-user
+    aggregation) add up exactly. Unique users, averages, percentiles,
+    formulas and whole-range analyses would be silently wrong if merged,
+    and so would breakdowns, since each window returns its own top
+    segments.
+
+    Args:
+        events: The ``events`` argument of :meth:`Workspace.query`.
+        math: Default math for plain-string events.
+        per_user: Default per-user aggregation.
+        group_by: Breakdowns.
+        where: Filters.
+        formula: Top-level formula expression.
+        rolling: Rolling window size.
+        cumulative: Whether cumulative analysis is on.
+        mode: Result shape.
+        time_comparison: Period-over-period comparison.
+
+    Returns:
+        The first non-additive setting, or ``None`` if the query can be split.
+    """
+    if mode == "table":
+        return "mode='table'"
+    if rolling is not None or cumulative:
+        return "rolling or cumulative analysis"
+    if time_comparison is not None:
+        return "time_comparison"
+    if formula is not None:
+        return "a formula"
+    items = (
+        [events]
+        if isinstance(events, str | Metric | CohortMetric | Formula)
+        else list(events)
+    )
+    item_math: str
+    item_per_user: str | None
+    for item in items:
+        if isinstance(item, Formula):
+            return "a formula"
+        if isinstance(item, CohortMetric):
+            return "a cohort metric"
+        if isinstance(item, Metric):
+            if item.segment_method == "first":
+                return "segment_method='first'"
+            item_math, item_per_user = item.math, item.per_user
+        else:
+            item_math, item_per_user = math, per_user
+        if item_math != "total":
+            return f"math={item_math!r}"
+        if item_per_user is not None:
+            return f"per_user={item_per_user!r}"
+    if group_by is not None and group_by != []:
+        return "group_by"
+    filters = where if isinstance(where, list) else [where]
+    if any(isinstance(f, FrequencyFilter) for f in filters):
+        return "a frequency filter"
+    return None
+
+
+def _non_additive_error(reason: str) -> ValueError:
+    """Build the error raised when ``window_days`` meets non-additive math.
+
+    Args:
+        reason: The offending setting, e.g. ``"math='unique'"``.
+
+    Returns:
+        ValueError to raise.
+    """
+    return ValueError(
+        f"window_days cannot split a query with {reason}: its values do not "
+        "add up across date windows. Query the whole range without "
+        "window_days instead."
+    )
+
+
+def _not_incremental_error(reason: str) -> ValueError:
+    """Build the error raised when ``incremental_days`` cannot be honored.
+
+    Args:
+        reason: The offending setting, e.g. ``"unit='week'"``.
+
+    Returns:
+        ValueError to raise.
+    """
+    return ValueError(
+        f"incremental_days cannot be used with {reason}: past buckets of "
+        "such a query are not stable, so they cannot be stored and reused."
+    )
+
+
 def _check_step_direction(
     value: int | None,
     name: str,
@@ -381,7 +576,12 @@ class Workspace:
         workspace: int | None = None,
         target: str | None = None,
         session: _Session | None = None,
+        rate_limits: Mapping[str, RateLimit] | None = None,
+        query_cache: QueryCacheConfig | None = None,
+        bulk: BulkOptions | None = None,
+        retry: RetryPolicy | None = None,
         _api_client: MixpanelAPIClient | None = None,
+        _query_cache: QueryCache | None = None,
     ) -> None:
         """Create a new Workspace bound to a resolved :class:`Session`.
 
@@ -397,7 +597,22 @@ class Workspace:
             target: Apply all three axes from ``[targets.NAME]``. Mutually
                 exclusive with ``account``/``project``/``workspace``.
             session: Pre-built :class:`Session` (full resolver bypass).
+            rate_limits: Per-API-family client-side limits (keys ``query``,
+                ``export``, ``engage``, ``app``) merged over the defaults.
+                Requests beyond the budget queue locally instead of being
+                sent and rejected with ``429``.
+            query_cache: Enables the on-disk query result cache for
+                ``query``, ``query_funnel``, ``query_retention``,
+                ``segmentation`` and ``query_saved_report``. Off by default.
+            bulk: Batch size, concurrency and gzip settings for bulk
+                schema, Lexicon, bookmark, cohort, dashboard and alert
+                methods.
+            retry: Retries for transient ``5xx`` and network failures on
+                read requests, and the per-host circuit breaker that fails
+                fast while an API host is degraded.
             _api_client: Injected :class:`MixpanelAPIClient` for testing.
+            _query_cache: Existing query cache to share; overrides
+                ``query_cache``.
 
         Raises:
             ValueError: ``target=`` combined with any axis kwarg.
@@ -415,6 +630,15 @@ class Workspace:
         self._discovery: DiscoveryService | None = None
         self._live_query: LiveQueryService | None = None
         self._me_service: MeService | None = None
+        self._query_cache = _query_cache or (
+            QueryCache(query_cache) if query_cache else None
+        )
+        self._series_store: SeriesStore | None = None
+        # run_dashboard results: bookmark id -> (bookmark modified, computed
+        # at monotonic time, result)
+        self._dashboard_results: dict[
+            int, tuple[datetime, float, SavedReportResult | FlowsResult]
+        ] = {}
 
         if session is not None:
             sess = session
@@ -466,10 +690,15 @@ class Workspace:
         self._session = sess
         self._account_name: str = sess.account.name
         self._initial_workspace_id = sess.workspace.id if sess.workspace else None
+        self._rate_limits = rate_limits
+        self._bulk = bulk
+        self._retry = retry
         if _api_client is not None:
             self._api_client: MixpanelAPIClient | None = _api_client
         else:
-            self._api_client = MixpanelAPIClient(session=sess)
+            self._api_client = MixpanelAPIClient(
+                session=sess, rate_limits=rate_limits, bulk=bulk, retry=retry
+            )
 
     # ---- v3 read-only properties --------------------------------------
 
@@ -619,6 +848,7 @@ class Workspace:
         self._discovery = None
         self._live_query = None
         self._me_service = None
+        self._dashboard_results.clear()
 
         if persist:
             self._persist_active()
@@ -694,11 +924,100 @@ class Workspace:
             MixpanelAPIClient instance.
         """
         if self._api_client is None:
-            self._api_client = MixpanelAPIClient(session=self._session)
+            self._api_client = MixpanelAPIClient(
+                session=self._session,
+                rate_limits=self._rate_limits,
+                bulk=self._bulk,
+                retry=self._retry,
+            )
             if self._initial_workspace_id is not None:
                 self._api_client.set_workspace_id(self._initial_workspace_id)
         return self._api_client
 
+    def _run_windows(
+        self,
+        windows: list[tuple[str, str]],
+        run: Callable[[str, str], _R],
+    ) -> list[_R]:
+        """Run one query per date window concurrently.
+
+        Args:
+            windows: ``(from_date, to_date)`` windows.
+            run: Queries one window.
+
+        Returns:
+            Per-window results, in window order.
+
+        Raises:
+            Exception: The first error from any window; partial results
+                are never merged.
+        """
+        logger.debug(
+            "Querying %s..%s in %d windows", windows[0][0], windows[-1][1], len(windows)
+        )
+        # Create the query service before fanning out so worker threads
+        # don't race its lazy initialization.
+        _ = self._live_query_service
+        with ThreadPoolExecutor(max_workers=min(_WINDOW_WORKERS, len(windows))) as pool:
+            return list(pool.map(lambda window: run(*window), windows))
+
+    def _get_series_store(self) -> SeriesStore:
+        """Get or create the store used by ``incremental_days`` refreshes.
+
+        Returns:
+            SeriesStore under the client cache root.
+        """
+        if self._series_store is None:
+            self._series_store = SeriesStore(cache_root() / "series")
+        return self._series_store
+
+    def _refresh_incremental(
+        self,
+        kind: str,
+        key_params: dict[str, Any],
+        *,
+        from_date: str,
+        to_date: str,
+        incremental_days: int,
+        fetch: Callable[[str, str], tuple[dict[str, Any], dict[str, Any]]],
+    ) -> tuple[dict[str, Any], dict[str, Any], str | None]:
+        """Assemble a daily series from stored buckets plus a minimal fetch.
+
+        Args:
+            kind: Query type key.
+            key_params: Query params without the date range.
+            from_date: Start date (YYYY-MM-DD).
+            to_date: End date (YYYY-MM-DD).
+            incremental_days: Trailing days that are always refetched.
+            fetch: Queries one ``(from_date, to_date)`` range and returns
+                its series and JSON-compatible result metadata.
+
+        Returns:
+            The whole range's series, the metadata of the latest fetch,
+            and the first day fetched (``None`` if nothing was).
+
+        Raises:
+            ValueError: If ``incremental_days`` is less than 1.
+        """
+        if incremental_days < 1:
+            raise ValueError("incremental_days must be at least 1")
+        store = self._get_series_store()
+        scope = {
+            "region": self._session.account.region,
+            "project_id": self._session.project.id,
+            "workspace_id": self._require_api_client().workspace_id,
+        }
+        series, extra, fetched = refresh_series(
+            store,
+            store.key(kind, scope, key_params),
+            from_date=_date.fromisoformat(from_date),
+            to_date=_date.fromisoformat(to_date),
+            mutable_days=incremental_days,
+            fetch=lambda start, end: fetch(start.isoformat(), end.isoformat()),
+            today=project_now(self._session.project.timezone).date(),
+        )
+        return series, extra, fetched.isoformat() if fetched else None
+
     def _require_api_client(self) -> MixpanelAPIClient:
         """Get API client (always available — created in ``__init__``).
 
@@ -919,7 +1238,9 @@ class Workspace:
     def _live_query_service(self) -> LiveQueryService:
         """Get or create live query service (lazy initialization)."""
         if self._live_query is None:
-            self._live_query = LiveQueryService(self._require_api_client())
+            self._live_query = LiveQueryService(
+                self._require_api_client(), cache=self._query_cache
+            )
         return self._live_query
 
     # =========================================================================
@@ -1168,6 +1489,18 @@ class Workspace:
         if self._discovery is not None:
             self._discovery.clear_cache()
 
+    def clear_query_cache(self) -> None:
+        """Remove every entry from the query result caches.
+
+        Clears the in-memory ``run_dashboard`` results, the buckets stored
+        for ``incremental_days=`` refreshes and, when the Workspace was
+        created with ``query_cache=``, the on-disk cache.
+        """
+        self._dashboard_results.clear()
+        self._get_series_store().clear()
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
     # =========================================================================
     # LEXICON SCHEMA METHODS
     # =========================================================================
@@ -1237,6 +1570,38 @@ class Workspace:
     # STREAMING METHODS
     # =========================================================================
 
+    @overload
+    def stream_events(
+        self,
+        *,
+        from_date: str,
+        to_date: str,
+        events: list[str] | None = ...,
+        where: str | None = ...,
+        limit: int | None = ...,
+        raw: bool = ...,
+        parallel: int | None = ...,
+        ordered: bool = ...,
+        format: Literal["dict"] = ...,
+        batch_size: int = ...,
+    ) -> Iterator[dict[str, Any]]: ...
+
+    @overload
+    def stream_events(
+        self,
+        *,
+        from_date: str,
+        to_date: str,
+        events: list[str] | None = ...,
+        where: str | None = ...,
+        limit: int | None = ...,
+        raw: bool = ...,
+        parallel: int | None = ...,
+        ordered: bool = ...,
+        format: Literal["arrow"],
+        batch_size: int = ...,
+    ) -> Iterator[pa.RecordBatch]: ...
+
     def stream_events(
         self,
         *,
@@ -1246,12 +1611,25 @@ class Workspace:
         where: str | None = None,
         limit: int | None = None,
         raw: bool = False,
-    ) -> Iterator[dict[str, Any]]:
+        parallel: int | None = None,
+        ordered: bool = False,
+        format: Literal["dict", "arrow"] = "dict",
+        batch_size: int = 10_000,
+    ) -> Iterator[Any]:
         """Stream events directly from Mixpanel API without storing.
 
         Yields events one at a time as they are received from the API.
         No database files or tables are created.
 
+        With ``format="arrow"``, yields ``pyarrow.RecordBatch`` objects of up
+        to ``batch_size`` events instead, built column-by-column from the raw
+        stream without a per-event dict. Columns are ``event_name``,
+        ``event_time`` (``timestamp[us, UTC]``), ``distinct_id``,
+        ``insert_id`` and one column per property, typed from the values in
+        the batch (mixed types widen to float64 or string; nested values are
+        JSON text). Each batch carries only the properties seen in its rows,
+        so schemas can differ between batches.
+
         Args:
             from_date: Start date inclusive (YYYY-MM-DD format).
             to_date: End date inclusive (YYYY-MM-DD format).
@@ -1260,16 +1638,29 @@ class Workspace:
             limit: Optional maximum number of events to return (max 100000).
             raw: If True, return events in raw Mixpanel API format.
                  If False (default), return normalized format with datetime objects.
+            parallel: If set, split the range into one request per day and
+                download up to this many days concurrently. Cannot be
+                combined with ``limit``.
+            ordered: With ``parallel``, yield days in chronological order
+                instead of interleaving events as they arrive.
+            format: ``"dict"`` (default) for one dict per event, or
+                ``"arrow"`` for ``pyarrow.RecordBatch`` objects.
+            batch_size: Maximum events per batch with ``format="arrow"``.
 
         Yields:
-            dict[str, Any]: Event dictionaries in normalized or raw format.
+            dict[str, Any]: Event dictionaries in normalized or raw format,
+            or ``pyarrow.RecordBatch`` objects with ``format="arrow"``.
 
         Raises:
             ConfigError: If API credentials are not available.
             AuthenticationError: If credentials are invalid.
             RateLimitError: If rate limit exceeded after max retries.
             QueryError: If filter expression is invalid.
-            ValueError: If limit is outside valid range (1-100000).
+            ImportError: If ``format="arrow"`` and pyarrow is not installed.
+            ValueError: If limit is outside valid range (1-100000),
+                ``parallel`` is combined with ``limit`` or is less than 1,
+                ``format`` is unknown, ``raw`` is combined with
+                ``format="arrow"``, or ``batch_size`` is less than 1.
 
         Example:
             ```python
@@ -1287,25 +1678,100 @@ class Workspace:
             ):
                 legacy_system.ingest(event)
             ```
+
+            Backfilling a quarter with eight concurrent day downloads:
+
+            ```python
+            for event in ws.stream_events(
+                from_date="2024-01-01", to_date="2024-03-31", parallel=8
+            ):
+                process(event)
+            ```
+
+            Handing Arrow batches to DuckDB or Polars:
+
+            ```python
+            for batch in ws.stream_events(
+                from_date="2024-01-01", to_date="2024-01-31", format="arrow"
+            ):
+                polars.from_arrow(batch)
+            ```
         """
         # Validate limit early to avoid wasted API calls
         _validate_limit(limit)
+        if parallel is not None and limit is not None:
+            raise ValueError("limit cannot be combined with parallel")
+        _validate_stream_format(format, raw=raw, batch_size=batch_size)
 
         api_client = self._require_api_client()
-        event_iterator = api_client.export_events(
-            from_date=from_date,
-            to_date=to_date,
-            events=events,
-            where=where,
-            limit=limit,
-        )
+        event_iterator: Iterator[dict[str, Any]]
+        if parallel is not None:
+            event_iterator = api_client.export_events_parallel(
+                from_date,
+                to_date,
+                events=events,
+                where=where,
+                workers=parallel,
+                ordered=ordered,
+            )
+        else:
+            event_iterator = api_client.export_events(
+                from_date=from_date,
+                to_date=to_date,
+                events=events,
+                where=where,
+                limit=limit,
+            )
 
-        if raw:
+        if format == "arrow":
+            arrow = _import_arrow("stream_events(format='arrow')")
+            yield from arrow.iter_batches(
+                event_iterator, arrow.EventBatchBuilder(), batch_size
+            )
+        elif raw:
             yield from event_iterator
         else:
             for event in event_iterator:
                 yield transform_event(event)
 
+    @overload
+    def stream_profiles(
+        self,
+        *,
+        where: str | None = ...,
+        cohort_id: str | None = ...,
+        output_properties: list[str] | None = ...,
+        raw: bool = ...,
+        distinct_id: str | None = ...,
+        distinct_ids: list[str] | None = ...,
+        group_id: str | None = ...,
+        behaviors: list[dict[str, Any]] | None = ...,
+        as_of_timestamp: int | None = ...,
+        include_all_users: bool = ...,
+        parallel: int | None = ...,
+        format: Literal["dict"] = ...,
+        batch_size: int = ...,
+    ) -> Iterator[dict[str, Any]]: ...
+
+    @overload
+    def stream_profiles(
+        self,
+        *,
+        where: str | None = ...,
+        cohort_id: str | None = ...,
+        output_properties: list[str] | None = ...,
+        raw: bool = ...,
+        distinct_id: str | None = ...,
+        distinct_ids: list[str] | None = ...,
+        group_id: str | None = ...,
+        behaviors: list[dict[str, Any]] | None = ...,
+        as_of_timestamp: int | None = ...,
+        include_all_users: bool = ...,
+        parallel: int | None = ...,
+        format: Literal["arrow"],
+        batch_size: int = ...,
+    ) -> Iterator[pa.RecordBatch]: ...
+
     def stream_profiles(
         self,
         *,
@@ -1319,12 +1785,26 @@ class Workspace:
         behaviors: list[dict[str, Any]] | None = None,
         as_of_timestamp: int | None = None,
         include_all_users: bool = False,
-    ) -> Iterator[dict[str, Any]]:
+        parallel: int | None = None,
+        format: Literal["dict", "arrow"] = "dict",
+        batch_size: int = 10_000,
+    ) -> Iterator[Any]:
         """Stream user profiles directly from Mixpanel API without storing.
 
         Yields profiles one at a time as they are received from the API.
         No database files or tables are created.
 
+        With ``parallel``, pages after the first are downloaded
+        concurrently using the first page's ``session_id`` and each page is
+        yielded as soon as it completes: profiles keep the API's order
+        within a page, pages arrive in completion order, and at most
+        ``2 * parallel`` pages are held in memory at once.
+
+        With ``format="arrow"``, yields ``pyarrow.RecordBatch`` objects of up
+        to ``batch_size`` profiles with ``distinct_id`` and ``last_seen``
+        columns followed by one column per property (typed as in
+        :meth:`stream_events`).
+
         Args:
             where: Optional Mixpanel filter expression for profile properties.
             cohort_id: Optional cohort ID to filter by. Only profiles that are
@@ -1348,15 +1828,24 @@ class Workspace:
                 a specific point in time. Must be in the past.
             include_all_users: If True, include all users and mark cohort membership.
                 Only valid when cohort_id is provided.
+            parallel: If set, download up to this many pages concurrently.
+            format: ``"dict"`` (default) for one dict per profile, or
+                ``"arrow"`` for ``pyarrow.RecordBatch`` objects.
+            batch_size: Maximum profiles per batch with ``format="arrow"``.
 
         Yields:
-            dict[str, Any]: Profile dictionaries in normalized or raw format.
+            dict[str, Any]: Profile dictionaries in normalized or raw format,
+            or ``pyarrow.RecordBatch`` objects with ``format="arrow"``.
 
         Raises:
             ConfigError: If API credentials are not available.
             AuthenticationError: If credentials are invalid.
             RateLimitError: If rate limit exceeded after max retries.
-            ValueError: If mutually exclusive parameters are provided.
+            ImportError: If ``format="arrow"`` and pyarrow is not installed.
+            ValueError: If mutually exclusive parameters are provided,
+                ``format`` is unknown, ``raw`` is combined with
+                ``format="arrow"``, or ``batch_size`` or ``parallel`` is less
+                than 1.
 
         Example:
             ```python
@@ -1396,26 +1885,202 @@ class Workspace:
             for company in ws.stream_profiles(group_id="companies"):
                 print(company)
             ```
+
+            Exporting a large population five pages at a time:
+
+            ```python
+            for profile in ws.stream_profiles(parallel=5):
+                sink.write(profile)
+            ```
         """
+        _validate_stream_format(format, raw=raw, batch_size=batch_size)
         api_client = self._require_api_client()
-        profile_iterator = api_client.export_profiles(
-            where=where,
-            cohort_id=cohort_id,
-            output_properties=output_properties,
-            distinct_id=distinct_id,
-            distinct_ids=distinct_ids,
-            group_id=group_id,
-            behaviors=behaviors,
-            as_of_timestamp=as_of_timestamp,
-            include_all_users=include_all_users,
-        )
-
-        if raw:
+        profile_iterator: Iterator[dict[str, Any]]
+        if parallel is not None:
+            profile_iterator = api_client.export_profiles_parallel(
+                where=where,
+                cohort_id=cohort_id,
+                output_properties=output_properties,
+                distinct_id=distinct_id,
+                distinct_ids=distinct_ids,
+                group_id=group_id,
+                behaviors=behaviors,
+                as_of_timestamp=as_of_timestamp,
+                include_all_users=include_all_users,
+                workers=parallel,
+            )
+        else:
+            profile_iterator = api_client.export_profiles(
+                where=where,
+                cohort_id=cohort_id,
+                output_properties=output_properties,
+                distinct_id=distinct_id,
+                distinct_ids=distinct_ids,
+                group_id=group_id,
+                behaviors=behaviors,
+                as_of_timestamp=as_of_timestamp,
+                include_all_users=include_all_users,
+            )
+
+        if format == "arrow":
+            arrow = _import_arrow("stream_profiles(format='arrow')")
+            yield from arrow.iter_batches(
+                profile_iterator, arrow.ProfileBatchBuilder(), batch_size
+            )
+        elif raw:
             yield from profile_iterator
         else:
             for profile in profile_iterator:
                 yield transform_profile(profile)
 
+    def export_events_to_jsonl(
+        self,
+        path: str | Path,
+        *,
+        from_date: str,
+        to_date: str,
+        events: list[str] | None = None,
+        where: str | None = None,
+        parallel: int | None = None,
+    ) -> EventExportResult:
+        """Export raw events to a JSONL file with resumable per-day checkpoints.
+
+        Each day is downloaded as its own shard and appended to ``path``.
+        After a shard is flushed, ``<path>.manifest.json`` records its date,
+        filters, line count and byte count. Re-running the same call after
+        an interruption discards any partially written day and downloads
+        only the days the manifest does not list, so a crash at day 80 of
+        90 costs one day of work rather than the whole range. Extending
+        ``to_date`` on a later run appends just the new days.
+
+        Args:
+            path: Output JSONL file (created, or resumed if a manifest exists).
+            from_date: Start date inclusive (YYYY-MM-DD format).
+            to_date: End date inclusive (YYYY-MM-DD format).
+            events: Optional list of event names to filter.
+            where: Optional Mixpanel filter expression.
+            parallel: Days downloaded concurrently (default 1). Days are
+                still appended in chronological order.
+
+        Returns:
+            EventExportResult with totals for the whole output file.
+
+        Raises:
+            ConfigError: If API credentials are not available.
+            AuthenticationError: If credentials are invalid.
+            RateLimitError: If rate limit exceeded after max retries.
+            QueryError: If filter expression is invalid.
+            MixpanelHeadlessError: If an existing manifest was written with
+                different filters or no longer matches the output file.
+            ValueError: If the date range is invalid or ``parallel`` < 1.
+
+        Example:
+            ```python
+            ws = Workspace()
+            result = ws.export_events_to_jsonl(
+                "backfill.jsonl", from_date="2024-01-01", to_date="2024-03-31",
+                parallel=4,
+            )
+            print(f"{result.lines} events, {result.shards_skipped} days resumed")
+            ```
+        """
+        return export_events_checkpointed(
+            self._require_api_client(),
+            Path(path),
+            from_date=from_date,
+            to_date=to_date,
+            events=events,
+            where=where,
+            workers=parallel or 1,
+        )
+
+    def export_events_to_parquet(
+        self,
+        path: str | Path,
+        *,
+        from_date: str,
+        to_date: str,
+        events: list[str] | None = None,
+        where: str | None = None,
+        parallel: int | None = None,
+        row_group_size: int = 50_000,
+        compression: str = "zstd",
+    ) -> ParquetExportResult:
+        """Export raw events to a Parquet dataset partitioned by date and event.
+
+        Events stream from the Export API straight into Arrow columns and
+        are written as Parquet row groups under
+        ``<path>/event_date=YYYY-MM-DD/event_name=<name>/``, without building
+        Python dicts or DataFrames per event. Each file has ``event_time``
+        (``timestamp[us, UTC]``), ``distinct_id`` and ``insert_id`` columns
+        plus one column per property, with types inferred from the data.
+        When a property's type drifts (e.g. int to float, or number to
+        string), the column is widened and the partition continues in a new
+        file; ``<path>/_common_metadata`` holds the unified schema. Nested
+        objects and lists are stored as JSON strings.
+
+        Memory is bounded by the rows buffered for one day (at most
+        ``4 * row_group_size``), not by the length of the range. Each day
+        is published atomically and replaces any earlier export of that
+        day, so re-running a range is safe.
+
+        Args:
+            path: Dataset root directory (created if missing).
+            from_date: Start date inclusive (YYYY-MM-DD format).
+            to_date: End date inclusive (YYYY-MM-DD format).
+            events: Optional list of event names to filter.
+            where: Optional Mixpanel filter expression.
+            parallel: Days downloaded concurrently (default 1).
+            row_group_size: Target rows per Parquet row group.
+            compression: Parquet compression codec (e.g. ``"zstd"``,
+                ``"snappy"``, ``"none"``).
+
+        Returns:
+            ParquetExportResult with the files written and unified schema.
+
+        Raises:
+            ConfigError: If API credentials are not available.
+            AuthenticationError: If credentials are invalid.
+            RateLimitError: If rate limit exceeded after max retries.
+            QueryError: If filter expression is invalid.
+            ImportError: If pyarrow is not installed.
+            ValueError: If the date range is invalid, ``parallel`` < 1 or
+                ``row_group_size`` < 1.
+
+        Example:
+            ```python
+            import pyarrow.dataset as ds
+
+            ws = Workspace()
+            result = ws.export_events_to_parquet(
+                "lake/events", from_date="2024-01-01", to_date="2024-01-31",
+                parallel=4,
+            )
+            table = ds.dataset(result.path, partitioning="hive").to_table()
+            ```
+        """
+        try:
+            from mixpanel_headless._internal.parquet_export import (
+                export_events_to_parquet,
+            )
+        except ImportError as exc:  # pragma: no cover - pyarrow is optional on 3.10
+            raise ImportError(
+                "export_events_to_parquet() requires pyarrow: pip install pyarrow"
+            ) from exc
+
+        return export_events_to_parquet(
+            self._require_api_client(),
+            Path(path),
+            from_date=from_date,
+            to_date=to_date,
+            events=events,
+            where=where,
+            workers=parallel or 1,
+            row_group_size=row_group_size,
+            max_buffered_rows=4 * row_group_size,
+            compression=compression,
+        )
+
     # =========================================================================
     # LIVE QUERY METHODS
     # =========================================================================
@@ -1429,6 +2094,8 @@ class Workspace:
         on: str | None = None,
         unit: Literal["day", "week", "month"] = "day",
         where: str | None = None,
+        window_days: int | None = None,
+        incremental_days: int | None = None,
     ) -> SegmentationResult:
         """Run a segmentation query against Mixpanel API.
 
@@ -1439,13 +2106,94 @@ class Workspace:
             on: Optional property to segment by.
             unit: Time unit for aggregation.
             where: Optional WHERE clause.
+            window_days: Split the date range into windows of at most this
+                many days, query them concurrently and sum the results into
+                one. Off by default; use it for multi-year ranges.
+                Cannot be combined with ``on``: each window would return
+                its own top segment values.
+            incremental_days: Refresh incrementally: daily buckets older
+                than the trailing ``incremental_days`` days are kept in a
+                local store (``~/.mp/cache/series``) and reused by later
+                calls, so only the trailing days and any new buckets are
+                fetched. Requires ``unit="day"`` and no ``on``.
 
         Returns:
             SegmentationResult with time-series data.
 
         Raises:
             ConfigError: If API credentials not available.
-        """
+            ValueError: If ``window_days`` or ``incremental_days`` is less
+                than 1, both are given, either is combined with ``on``, or
+                ``incremental_days`` is combined with a unit other than
+                ``"day"``.
+
+        Example:
+            ```python
+            # Hourly refresh of a 90-day chart fetches 3 days, not 90
+            result = ws.segmentation(
+                "Login",
+                from_date=(date.today() - timedelta(days=89)).isoformat(),
+                to_date=date.today().isoformat(),
+                incremental_days=3,
+            )
+            ```
+        """
+        if incremental_days is not None:
+            if window_days is not None:
+                raise ValueError("window_days and incremental_days cannot be combined")
+            if unit != "day":
+                raise _not_incremental_error(f"unit={unit!r}")
+            if on is not None:
+                raise _not_incremental_error("a segment property (on=)")
+            series, _extra, fetched = self._refresh_incremental(
+                "segmentation",
+                {"event": event, "on": on, "where": where},
+                from_date=from_date,
+                to_date=to_date,
+                incremental_days=incremental_days,
+                fetch=lambda start, end: (
+                    self._live_query_service.segmentation(
+                        event=event,
+                        from_date=start,
+                        to_date=end,
+                        on=on,
+                        unit=unit,
+                        where=where,
+                    ).series,
+                    {},
+                ),
+            )
+            return SegmentationResult(
+                event=event,
+                from_date=from_date,
+                to_date=to_date,
+                unit=unit,
+                segment_property=on,
+                total=sum(
+                    count for values in series.values() for count in values.values()
+                ),
+                series=series,
+                meta={"incremental_from": fetched},
+            )
+        if window_days is not None:
+            if on is not None:
+                raise _non_additive_error("a segment property (on=)")
+            windows = split_date_range(
+                from_date, to_date, window_days=window_days, unit=unit
+            )
+            if len(windows) > 1:
+                parts = self._run_windows(
+                    windows,
+                    lambda start, end: self.segmentation(
+                        event,
+                        from_date=start,
+                        to_date=end,
+                        on=on,
+                        unit=unit,
+                        where=where,
+                    ),
+                )
+                return merge_segmentation(parts, from_date, to_date)
         return self._live_query_service.segmentation(
             event=event,
             from_date=from_date,
@@ -1539,6 +2287,7 @@ class Workspace:
         to_date: str,
         type: Literal["general", "unique", "average"] = "general",
         unit: Literal["day", "week", "month"] = "day",
+        window_days: int | None = None,
     ) -> EventCountsResult:
         """Get event counts for multiple events.
 
@@ -1548,13 +2297,33 @@ class Workspace:
             to_date: End date (YYYY-MM-DD).
             type: Counting method.
             unit: Time unit.
+            window_days: Split the date range into windows of at most this
+                many days, query them concurrently and sum the results into
+                one. Off by default; use it for multi-year ranges.
+                Requires ``type="general"``.
 
         Returns:
             EventCountsResult with time-series per event.
 
         Raises:
             ConfigError: If API credentials not available.
-        """
+            ValueError: If ``window_days`` is less than 1 or combined with
+                unique or average counts, which cannot be summed.
+        """
+        if window_days is not None:
+            if type != "general":
+                raise _non_additive_error(f"type={type!r}")
+            windows = split_date_range(
+                from_date, to_date, window_days=window_days, unit=unit
+            )
+            if len(windows) > 1:
+                parts = self._run_windows(
+                    windows,
+                    lambda start, end: self.event_counts(
+                        events, from_date=start, to_date=end, type=type, unit=unit
+                    ),
+                )
+                return merge_counts(parts, from_date, to_date)
         return self._live_query_service.event_counts(
             events=events,
             from_date=from_date,
@@ -1574,6 +2343,7 @@ class Workspace:
         unit: Literal["day", "week", "month"] = "day",
         values: list[str] | None = None,
         limit: int | None = None,
+        window_days: int | None = None,
     ) -> PropertyCountsResult:
         """Get event counts broken down by property values.
 
@@ -1586,13 +2356,45 @@ class Workspace:
             unit: Time unit.
             values: Optional list of property values to include.
             limit: Maximum number of property values.
+            window_days: Split the date range into windows of at most this
+                many days, query them concurrently and sum the results into
+                one. Off by default; use it for multi-year ranges.
+                Requires ``type="general"`` and an explicit ``values``
+                list; otherwise each window would return its own top
+                ``limit`` values.
 
         Returns:
             PropertyCountsResult with time-series per property value.
 
         Raises:
             ConfigError: If API credentials not available.
-        """
+            ValueError: If ``window_days`` is less than 1, combined with
+                unique or average counts, which cannot be summed, or used
+                without ``values``.
+        """
+        if window_days is not None:
+            if type != "general":
+                raise _non_additive_error(f"type={type!r}")
+            if values is None:
+                raise _non_additive_error("top values instead of a values list")
+            windows = split_date_range(
+                from_date, to_date, window_days=window_days, unit=unit
+            )
+            if len(windows) > 1:
+                parts = self._run_windows(
+                    windows,
+                    lambda start, end: self.property_counts(
+                        event,
+                        property_name,
+                        from_date=start,
+                        to_date=end,
+                        type=type,
+                        unit=unit,
+                        values=values,
+                        limit=limit,
+                    ),
+                )
+                return merge_counts(parts, from_date, to_date)
         return self._live_query_service.property_counts(
             event=event,
             property_name=property_name,
@@ -2099,6 +2901,8 @@ class Workspace:
         mode: Literal["timeseries", "total", "table"] = "timeseries",
         time_comparison: TimeComparison | None = None,
         data_group_id: int | None = None,
+        window_days: int | None = None,
+        incremental_days: int | None = None,
     ) -> QueryResult:
         """Run a typed insights query against the Mixpanel API.
 
@@ -2152,12 +2956,31 @@ class Workspace:
             data_group_id: Optional data group ID for group-level
                 analytics. Scopes the query to a specific data group.
                 Default: ``None``.
+            window_days: Split the date range into windows of at most this
+                many days, query them concurrently and sum the results into
+                one. Off by default; use it for multi-year ranges.
+                Requires ``from_date``, ``to_date`` and additive math: event
+                totals or property sums (``math="total"``, no ``per_user``),
+                without ``group_by``, formulas, rolling, cumulative, time
+                comparison or frequency filters.
+            incremental_days: Refresh incrementally: daily buckets older
+                than the trailing ``incremental_days`` days are kept in a
+                local store (``~/.mp/cache/series``) and reused by later
+                calls, so only the trailing days and any new buckets are
+                fetched. Requires ``mode="timeseries"`` and ``unit="day"``,
+                and rejects ``group_by``, rolling, cumulative, time
+                comparison, frequency filters, and relative date filters,
+                whose past buckets change as the range moves. Only daily
+                buckets are returned; range aggregates such as
+                ``$overall`` are dropped.
 
         Returns:
             QueryResult with series data, DataFrame, and metadata.
 
         Raises:
-            ValueError: If arguments violate validation rules.
+            ValueError: If arguments violate validation rules, or
+                ``window_days`` or ``incremental_days`` is combined with
+                settings it cannot support.
             ConfigError: If credentials are not available.
             AuthenticationError: Invalid credentials.
             QueryError: Invalid query parameters.
@@ -2171,6 +2994,18 @@ class Workspace:
             result = ws.query("Login")
             print(result.df.head())
 
+            # Five-year daily trend, fetched in 90-day windows
+            result = ws.query(
+                "Purchase",
+                from_date="2020-01-01",
+                to_date="2024-12-31",
+                window_days=90,
+            )
+
+            # Hourly refresh of a 90-day KPI chart: only the last 3 days
+            # (and any new day) are fetched after the first call
+            result = ws.query("Signup", last=90, incremental_days=3)
+
             # With aggregation and time range
             result = ws.query("Login", math="unique", last=7, unit="day")
 
@@ -2210,11 +3045,145 @@ class Workspace:
             data_group_id=data_group_id,
         )
 
+        if incremental_days is not None:
+            if window_days is not None:
+                raise ValueError("window_days and incremental_days cannot be combined")
+            return self._query_incremental(
+                params,
+                incremental_days=incremental_days,
+                unit=unit,
+                mode=mode,
+                rolling=rolling,
+                cumulative=cumulative,
+                time_comparison=time_comparison,
+                group_by=group_by,
+                where=where,
+            )
+        if window_days is not None:
+            if from_date is None or to_date is None:
+                raise ValueError("window_days requires from_date and to_date")
+            reason = _non_additive_query_reason(
+                events,
+                math=math,
+                per_user=per_user,
+                group_by=group_by,
+                where=where,
+                formula=formula,
+                rolling=rolling,
+                cumulative=cumulative,
+                mode=mode,
+                time_comparison=time_comparison,
+            )
+            if reason is not None:
+                raise _non_additive_error(reason)
+            windows = split_date_range(
+                from_date, to_date, window_days=window_days, unit=unit
+            )
+            if len(windows) > 1:
+                project_id = int(self._session.project.id)
+                parts = self._run_windows(
+                    windows,
+                    lambda start, end: self._live_query_service.query(
+                        bookmark_params=window_params(params, start, end),
+                        project_id=project_id,
+                    ),
+                )
+                return merge_query(parts, params)
+
         return self._live_query_service.query(
             bookmark_params=params,
             project_id=int(self._session.project.id),
         )
 
+    def _query_incremental(
+        self,
+        params: dict[str, Any],
+        *,
+        incremental_days: int,
+        unit: QueryTimeUnit,
+        mode: str,
+        rolling: int | None,
+        cumulative: bool,
+        time_comparison: TimeComparison | None,
+        group_by: Any,
+        where: Any,
+    ) -> QueryResult:
+        """Run an insights query, reusing stored settled daily buckets.
+
+        Args:
+            params: Bookmark params for the whole range.
+            incremental_days: Trailing days that are always refetched.
+            unit: Time unit of the query.
+            mode: Result shape.
+            rolling: Rolling window size.
+            cumulative: Whether cumulative analysis is on.
+            time_comparison: Period-over-period comparison.
+            group_by: Breakdowns.
+            where: Filters.
+
+        Returns:
+            QueryResult for the whole range.
+
+        Raises:
+            ValueError: If the query's past buckets are not stable.
+        """
+        filters = where if isinstance(where, list) else [where]
+        if mode != "timeseries":
+            raise _not_incremental_error(f"mode={mode!r}")
+        if unit != "day":
+            raise _not_incremental_error(f"unit={unit!r}")
+        if rolling is not None or cumulative:
+            raise _not_incremental_error("rolling or cumulative analysis")
+        if time_comparison is not None:
+            raise _not_incremental_error("time_comparison")
+        if group_by is not None and group_by != []:
+            raise _not_incremental_error("group_by")
+        if any(isinstance(f, FrequencyFilter) for f in filters):
+            raise _not_incremental_error("frequency filters")
+        sections = {k: v for k, v in params["sections"].items() if k != "time"}
+        if mentions_relative_dates(sections):
+            raise _not_incremental_error("relative date filters")
+
+        time_entry = resolve_relative_ranges(
+            params["sections"]["time"][0],
+            project_now(self._session.project.timezone),
+        )
+        from_date, to_date = time_entry["value"]
+        project_id = int(self._session.project.id)
+
+        def fetch(start: str, end: str) -> tuple[dict[str, Any], dict[str, Any]]:
+            result = self._live_query_service.query(
+                bookmark_params=window_params(params, start, end),
+                project_id=project_id,
+            )
+            return result.series, {
+                "computed_at": result.computed_at,
+                "to_date": result.to_date,
+                "date_suffix": result.from_date[10:],
+                "headers": result.headers,
+                "meta": result.meta,
+            }
+
+        series, extra, fetched = self._refresh_incremental(
+            "query",
+            {**params, "sections": sections},
+            from_date=from_date,
+            to_date=to_date,
+            incremental_days=incremental_days,
+            fetch=fetch,
+        )
+        # Keep the response's date format (timezone offset) on both ends
+        suffix = str(extra.get("date_suffix", ""))
+        return QueryResult(
+            computed_at=str(extra.get("computed_at", "")),
+            from_date=from_date + suffix,
+            to_date=to_date + suffix,
+            headers=list(extra.get("headers", [])),
+            series=series,
+            params=params,
+            meta={**extra.get("meta", {}), "incremental_from": fetched},
+        )
+
     def build_params(
         self,
         events: str
@@ -4244,6 +5213,348 @@ class Workspace:
             data_group_id=data_group_id,
         )
 
+    # =========================================================================
+    # BATCH QUERIES
+    # =========================================================================
+
+    def query_many(
+        self,
+        specs: Sequence[QuerySpec],
+        *,
+        max_workers: int = 5,
+    ) -> list[QueryOutcome]:
+        """Run many queries concurrently and collect every outcome.
+
+        Each :class:`QuerySpec` is dispatched to the matching Workspace
+        method (``query``, ``query_funnel``, ``query_retention``,
+        ``query_flow``, ``segmentation``, ``query_saved_report`` or
+        ``query_saved_flows``) on a pool of ``max_workers`` threads sharing
+        this Workspace's HTTP client, so the client's per-family rate
+        limits, retries and query cache apply to every query. The API
+        budget is the client's ``query`` family; tighten it with
+        ``Workspace(rate_limits={"query": RateLimit(...)})``, e.g. to leave
+        Query API headroom for other jobs.
+
+        A failing query does not stop the rest: its exception is recorded
+        on its :class:`QueryOutcome` and the batch carries on.
+
+        Args:
+            specs: Queries to run.
+            max_workers: Maximum queries in flight at once. The client's
+                default Query API limit allows 5 concurrent requests;
+                more workers than that simply queue.
+
+        Returns:
+            One outcome per spec, in input order.
+
+        Raises:
+            ValueError: If ``max_workers`` is less than 1.
+
+        Example:
+            ```python
+            from mixpanel_headless import QuerySpec
+
+            outcomes = ws.query_many(
+                [
+                    QuerySpec.insights("Login", math="unique", label="dau"),
+                    QuerySpec.funnel(["Signup", "Purchase"], label="conv"),
+                    QuerySpec.retention("Signup", "Login", label="ret"),
+                ],
+            )
+            results = {o.spec.label: o.unwrap() for o in outcomes}
+            ```
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if not specs:
+            return []
+        # Create the shared client and query service before fanning out so
+        # worker threads don't race their lazy initialization.
+        _ = self._live_query_service
+
+        def run(spec: QuerySpec) -> QueryOutcome:
+            started = time.monotonic()
+            try:
+                method = getattr(self, _QUERY_SPEC_METHODS[spec.kind])
+                result = method(**spec.kwargs)
+            except Exception as e:
+                logger.debug("query_many: %s query failed: %s", spec.kind, e)
+                return QueryOutcome(
+                    spec=spec, error=e, elapsed=time.monotonic() - started
+                )
+            return QueryOutcome(
+                spec=spec, result=result, elapsed=time.monotonic() - started
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as pool:
+            outcomes = list(pool.map(run, specs))
+        failed = sum(1 for o in outcomes if not o.ok)
+        if failed:
+            logger.info("query_many: %d of %d queries failed", failed, len(specs))
+        return outcomes
+
+    def run_dashboard(
+        self,
+        dashboard_id: int,
+        *,
+        workers: int = 5,
+        cache_ttl: float = 300.0,
+        refresh: bool = False,
+    ) -> dict[int, DashboardReport]:
+        """Evaluate every report on a dashboard concurrently.
+
+        Reads the dashboard's reports with :meth:`get_dashboard`, looks up
+        their bookmarks in one :meth:`list_bookmarks_v2` call, and runs
+        them through :meth:`query_many` with :meth:`query_saved_report`
+        (or :meth:`query_saved_flows` for Flows reports).
+
+        Results are kept in memory on this Workspace. A later run reuses a
+        report's result while the bookmark's ``modified`` timestamp is
+        unchanged and the result is younger than ``cache_ttl``; editing the
+        report, ``refresh=True`` or :meth:`clear_query_cache` forces it to
+        be recomputed. A report that fails does not stop the others.
+
+        Args:
+            dashboard_id: Dashboard to evaluate.
+            workers: Maximum reports queried at once.
+            cache_ttl: Seconds a cached result stays valid, since the
+                underlying data keeps changing even when the report does
+                not. ``0`` disables caching.
+            refresh: Recompute every report, ignoring cached results.
+
+        Returns:
+            Bookmark ID to report outcome, in dashboard content order.
+
+        Raises:
+            ConfigError: If credentials are not available.
+            AuthenticationError: Invalid credentials (401).
+            QueryError: Dashboard not found (404).
+            ServerError: Server-side errors (5xx).
+            ValueError: If ``workers`` is less than 1.
+
+        Example:
+            ```python
+            reports = ws.run_dashboard(1001, workers=8)
+            for bookmark_id, report in reports.items():
+                if report.ok:
+                    print(report.name, report.elapsed, report.result.df.shape)
+                else:
+                    print(report.name, "failed:", report.error)
+            ```
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        dashboard = self.get_dashboard(dashboard_id)
+        contents = dashboard.contents if isinstance(dashboard.contents, dict) else {}
+        entries: dict[int, dict[str, Any]] = {}
+        for info in (contents.get("report") or {}).values():
+            if isinstance(info, dict) and isinstance(info.get("id"), int):
+                entries.setdefault(info["id"], info)
+        if not entries:
+            return {}
+        bookmarks = {b.id: b for b in self.list_bookmarks_v2(ids=list(entries))}
+
+        reports: dict[int, DashboardReport] = {}
+        pending: list[DashboardReport] = []
+        now = time.monotonic()
+        for bookmark_id, info in entries.items():
+            bookmark = bookmarks.get(bookmark_id)
+            report = DashboardReport(
+                bookmark_id=bookmark_id,
+                name=bookmark.name if bookmark else str(info.get("name", "")),
+                report_type=(
+                    bookmark.bookmark_type
+                    if bookmark
+                    else str(info.get("type", "insights"))
+                ),
+                modified=bookmark.modified if bookmark else None,
+            )
+            cached = self._dashboard_results.get(bookmark_id)
+            if (
+                not refresh
+                and cached is not None
+                and report.modified is not None
+                and cached[0] == report.modified
+                and now - cached[1] < cache_ttl
+            ):
+                reports[bookmark_id] = replace(report, result=cached[2], cached=True)
+            else:
+                pending.append(report)
+
+        specs = [
+            QuerySpec.saved_flows(r.bookmark_id)
+            if r.report_type == "flows"
+            else QuerySpec.saved_report(r.bookmark_id, bookmark_type=r.report_type)
+            for r in pending
+        ]
+        outcomes = self.query_many(specs, max_workers=workers)
+        finished = time.monotonic()
+        for report, outcome in zip(pending, outcomes, strict=True):
+            reports[report.bookmark_id] = replace(
+                report,
+                result=outcome.result,
+                error=outcome.error,
+                elapsed=outcome.elapsed,
+            )
+            if outcome.ok and report.modified is not None and cache_ttl > 0:
+                self._dashboard_results[report.bookmark_id] = (
+                    report.modified,
+                    finished,
+                    outcome.result,
+                )
+        return {bookmark_id: reports[bookmark_id] for bookmark_id in entries}
+
+    def map_projects(
+        self,
+        fn: Callable[[Workspace], Any],
+        projects: Iterable[str | _Project] | None = None,
+        *,
+        workers: int = 5,
+    ) -> dict[str, ProjectOutcome]:
+        """Run ``fn`` against many projects concurrently.
+
+        Each project gets its own :class:`Workspace`, built from a
+        ``session.replace(project=...)`` snapshot of this one, and ``fn``
+        is called with it on a pool of ``workers`` threads. The snapshots
+        share this Workspace's connection pool, token resolver and rate
+        limiter, so a sweep over hundreds of projects opens one set of
+        connections, refreshes OAuth tokens once and stays within one
+        request budget. This Workspace's session is never changed.
+
+        A project whose function raises does not stop the rest: its
+        exception is recorded on its :class:`ProjectOutcome`.
+
+        Args:
+            fn: Called once per project with that project's Workspace.
+                The Workspace is closed when ``fn`` returns.
+            projects: Project IDs or :class:`Project` records. Defaults to
+                every project in :meth:`projects`.
+            workers: Maximum projects processed at once.
+
+        Returns:
+            Project ID to outcome, in input order.
+
+        Raises:
+            ValueError: If ``workers`` is less than 1.
+
+        Example:
+            ```python
+            outcomes = ws.map_projects(lambda p: len(p.events()), workers=8)
+            failed = {pid: o.error for pid, o in outcomes.items() if not o.ok}
+            ```
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if projects is None:
+            projects = self.projects()
+        sessions: dict[str, _Session] = {}
+        for project in projects:
+            proj = _Project(id=project) if isinstance(project, str) else project
+            # Workspaces are project-scoped, so each snapshot resolves its own.
+            sessions.setdefault(
+                proj.id, self._session.replace(project=proj, workspace=None)
+            )
+        return self._map_sessions(fn, sessions, workers=workers, targets=False)
+
+    def map_targets(
+        self,
+        fn: Callable[[Workspace], Any],
+        targets: Iterable[str] | None = None,
+        *,
+        workers: int = 5,
+    ) -> dict[str, ProjectOutcome]:
+        """Run ``fn`` against many saved targets concurrently.
+
+        Like :meth:`map_projects`, but each Workspace is bound to a named
+        target's account, project and workspace, resolved the same way as
+        ``use(target=...)``. Targets may use different accounts; they still
+        share this Workspace's connection pool, token resolver and rate
+        limiter.
+
+        Args:
+            fn: Called once per target with that target's Workspace.
+            targets: Target names. Defaults to every configured target.
+            workers: Maximum targets processed at once.
+
+        Returns:
+            Target name to outcome, in input order.
+
+        Raises:
+            ConfigError: A target does not exist or its account is gone.
+            ValueError: If ``workers`` is less than 1.
+
+        Example:
+            ```python
+            outcomes = ws.map_targets(lambda t: t.me().user_email)
+            ```
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        cm = ConfigManager()
+        names = (
+            [t.name for t in cm.list_targets()] if targets is None else list(targets)
+        )
+        bridge = _load_bridge()
+        sessions = {
+            name: _resolve_session(target=name, config=cm, bridge=bridge)
+            for name in names
+        }
+        return self._map_sessions(fn, sessions, workers=workers, targets=True)
+
+    def _map_sessions(
+        self,
+        fn: Callable[[Workspace], Any],
+        sessions: Mapping[str, _Session],
+        *,
+        workers: int,
+        targets: bool,
+    ) -> dict[str, ProjectOutcome]:
+        """Run ``fn`` on a shared-client Workspace per session.
+
+        Args:
+            fn: Function to run.
+            sessions: Result key to session.
+            workers: Thread pool size.
+            targets: Whether the keys are target names.
+
+        Returns:
+            Key to outcome, in ``sessions`` order.
+        """
+        if not sessions:
+            return {}
+        # Derive every client before fanning out so worker threads don't
+        # race the shared connection pool's lazy initialization.
+        parent = self._get_api_client()
+        clients = {key: parent.for_session(s) for key, s in sessions.items()}
+
+        def run(key: str) -> ProjectOutcome:
+            session = sessions[key]
+            started = time.monotonic()
+            outcome = ProjectOutcome(
+                project_id=session.project.id, target=key if targets else None
+            )
+            try:
+                with Workspace(
+                    session=session,
+                    rate_limits=self._rate_limits,
+                    bulk=self._bulk,
+                    retry=self._retry,
+                    _api_client=clients[key],
+                    _query_cache=self._query_cache,
+                ) as ws:
+                    result = fn(ws)
+            except Exception as e:
+                logger.debug("map: %s failed: %s", key, e)
+                return replace(outcome, error=e, elapsed=time.monotonic() - started)
+            return replace(outcome, result=result, elapsed=time.monotonic() - started)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(sessions))) as pool:
+            outcomes = dict(zip(sessions, pool.map(run, sessions), strict=True))
+        failed = sum(1 for o in outcomes.values() if not o.ok)
+        if failed:
+            logger.info("map: %d of %d projects failed", failed, len(outcomes))
+        return outcomes
+
     # =========================================================================
     # ESCAPE HATCHES
     # =========================================================================
@@ -7551,12 +8862,15 @@ class Workspace:
         *,
         poll_interval: float = 2.0,
         max_poll_seconds: float = 300.0,
+        compress: bool = False,
+        resumable: bool = False,
+        progress: Callable[[int, int], None] | None = None,
     ) -> LookupTable:
         """Upload a CSV file as a new lookup table.
 
         Performs a 3-step upload process:
         1. Obtains a signed upload URL from the API.
-        2. Uploads the CSV file to the signed URL.
+        2. Streams the CSV file from disk to the signed URL.
         3. Registers the lookup table with the uploaded data.
 
         For files >= 5 MB, the API processes the upload asynchronously.
@@ -7567,6 +8881,11 @@ class Workspace:
                 (path to the CSV file), and optional ``data_group_id``.
             poll_interval: Seconds between status polls for async uploads.
             max_poll_seconds: Maximum seconds to wait for async processing.
+            compress: Gzip the file before uploading it.
+            resumable: Resume an interrupted upload from the last persisted
+                byte when the signed URL allows resumable sessions.
+            progress: Optional callback receiving ``(bytes_sent,
+                total_bytes)`` during the upload.
 
         Returns:
             The created ``LookupTable`` object.
@@ -7597,9 +8916,14 @@ class Workspace:
         # Step 1: Get signed upload URL
         url_info = client.get_lookup_upload_url()
 
-        # Step 2: Read and upload the CSV file
-        csv_bytes = Path(params.file_path).read_bytes()
-        client.upload_to_signed_url(url_info["url"], csv_bytes)
+        # Step 2: Stream the CSV file to the signed URL
+        client.upload_file_to_signed_url(
+            url_info["url"],
+            params.file_path,
+            compress=compress,
+            resumable=resumable,
+            progress=progress,
+        )
 
         # Step 3: Register the lookup table
         form_data: dict[str, str] = {
@@ -7881,6 +9205,168 @@ class Workspace:
             data_group_id, file_name=file_name, limit=limit
         )
 
+    def download_lookup_table_to_file(
+        self,
+        data_group_id: int,
+        destination: str | Path | BinaryIO,
+        *,
+        file_name: str | None = None,
+        limit: int | None = None,
+    ) -> int:
+        """Stream lookup table CSV data to a file without buffering it.
+
+        A path destination is written to ``<name>.part`` first and renamed
+        into place once the download completes, so an interrupted download
+        never leaves a truncated table behind.
+
+        Args:
+            data_group_id: Data group ID of the lookup table.
+            destination: Output path, or a binary file object to write to.
+            file_name: Optional file name filter.
+            limit: Optional row limit.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            ConfigError: If credentials are not available.
+            AuthenticationError: Invalid credentials (401).
+            QueryError: Table not found (404).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+
+        Example:
+            ```python
+            ws = Workspace()
+            size = ws.download_lookup_table_to_file(123, "products.csv")
+            ```
+        """
+        client = self._require_api_client()
+        chunks = closing(
+            client.iter_lookup_table_bytes(
+                data_group_id, file_name=file_name, limit=limit
+            )
+        )
+        if not isinstance(destination, str | Path):
+            written = 0
+            with chunks as body:
+                for chunk in body:
+                    destination.write(chunk)
+                    written += len(chunk)
+            return written
+
+        target = Path(destination)
+        partial = target.with_name(f"{target.name}.part")
+        try:
+            with chunks as body, partial.open("wb") as f:
+                written = 0
+                for chunk in body:
+                    f.write(chunk)
+                    written += len(chunk)
+            partial.replace(target)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return written
+
+    def iter_lookup_table_rows(
+        self,
+        data_group_id: int,
+        *,
+        file_name: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Iterate lookup table rows as the CSV streams in.
+
+        Only the rows not yet consumed are buffered, so memory stays flat
+        regardless of table size. Values are the raw CSV strings.
+
+        Args:
+            data_group_id: Data group ID of the lookup table.
+            file_name: Optional file name filter.
+            limit: Optional row limit.
+
+        Yields:
+            One dict per row, keyed by the CSV header.
+
+        Raises:
+            ConfigError: If credentials are not available.
+            AuthenticationError: Invalid credentials (401).
+            QueryError: Table not found (404).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+
+        Example:
+            ```python
+            ws = Workspace()
+            names = {
+                row["product_id"]: row["name"]
+                for row in ws.iter_lookup_table_rows(123)
+            }
+            ```
+        """
+        client = self._require_api_client()
+        yield from iter_csv_rows(
+            client.iter_lookup_table_bytes(
+                data_group_id, file_name=file_name, limit=limit
+            )
+        )
+
+    def download_lookup_table_arrow(
+        self,
+        data_group_id: int,
+        *,
+        file_name: str | None = None,
+        limit: int | None = None,
+    ) -> pa.Table:
+        """Download a lookup table into a ``pyarrow.Table``.
+
+        The CSV is parsed block by block with ``pyarrow.csv.open_csv`` as it
+        streams in, so the raw bytes are never held in memory alongside the
+        table. Column types are inferred by pyarrow.
+
+        Args:
+            data_group_id: Data group ID of the lookup table.
+            file_name: Optional file name filter.
+            limit: Optional row limit.
+
+        Returns:
+            The table's rows as an Arrow table.
+
+        Raises:
+            ConfigError: If credentials are not available.
+            AuthenticationError: Invalid credentials (401).
+            QueryError: Table not found (404).
+            ServerError: Server-side errors (5xx).
+            MixpanelHeadlessError: Network/connection errors.
+            ImportError: If pyarrow is not installed.
+
+        Example:
+            ```python
+            ws = Workspace()
+            old = ws.download_lookup_table_arrow(123)
+            new = ws.download_lookup_table_arrow(456)
+            added = set(new["product_id"].to_pylist()) - set(
+                old["product_id"].to_pylist()
+            )
+            ```
+        """
+        try:
+            import pyarrow.csv as pa_csv
+        except ImportError as exc:  # pragma: no cover - pyarrow is optional on 3.10
+            raise ImportError(
+                "download_lookup_table_arrow() requires pyarrow: pip install pyarrow"
+            ) from exc
+
+        client = self._require_api_client()
+        with closing(
+            client.iter_lookup_table_bytes(
+                data_group_id, file_name=file_name, limit=limit
+            )
+        ) as chunks:
+            reader = pa_csv.open_csv(io.BufferedReader(ChunkReader(chunks)))
+            return reader.read_all()
+
     def get_lookup_download_url(self, data_group_id: int) -> str:
         """Get a signed download URL for a lookup table.
 
@@ -9518,25 +11004,7 @@ class Workspace:
             APIError: Other API communication errors.
         """
         api_client = self._require_api_client()
-
-        stats_kwargs: dict[str, Any] = {}
-        if "where" in params:
-            stats_kwargs["where"] = params["where"]
-        if "action" in params:
-            stats_kwargs["action"] = params["action"]
-        if "filter_by_cohort" in params:
-            stats_kwargs["filter_by_cohort"] = params["filter_by_cohort"]
-        if "segment_by_cohorts" in params:
-            raw = params["segment_by_cohorts"]
-            stats_kwargs["segment_by_cohorts"] = (
-                json.loads(raw) if isinstance(raw, str) else raw
-            )
-        if "data_group_id" in params:
-            stats_kwargs["group_id"] = params["data_group_id"]
-        if "as_of_timestamp" in params:
-            stats_kwargs["as_of_timestamp"] = params["as_of_timestamp"]
-        if "include_all_users" in params:
-            stats_kwargs["include_all_users"] = params["include_all_users"]
+        stats_kwargs = self._build_stats_kwargs(params)
 
         response = api_client.engage_stats(**stats_kwargs)
 
@@ -9699,6 +11167,35 @@ class Workspace:
             },
         )
 
+    def _build_stats_kwargs(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Extract engage_stats kwargs from engage params dict.
+
+        Args:
+            params: Engage API params dict.
+
+        Returns:
+            Keyword arguments for ``engage_stats()``.
+        """
+        stats_kwargs: dict[str, Any] = {}
+        if "where" in params:
+            stats_kwargs["where"] = params["where"]
+        if "action" in params:
+            stats_kwargs["action"] = params["action"]
+        if "filter_by_cohort" in params:
+            stats_kwargs["filter_by_cohort"] = params["filter_by_cohort"]
+        if "segment_by_cohorts" in params:
+            raw = params["segment_by_cohorts"]
+            stats_kwargs["segment_by_cohorts"] = (
+                json.loads(raw) if isinstance(raw, str) else raw
+            )
+        if "data_group_id" in params:
+            stats_kwargs["group_id"] = params["data_group_id"]
+        if "as_of_timestamp" in params:
+            stats_kwargs["as_of_timestamp"] = params["as_of_timestamp"]
+        if "include_all_users" in params:
+            stats_kwargs["include_all_users"] = params["include_all_users"]
+        return stats_kwargs
+
     def _build_page_kwargs(self, params: dict[str, Any]) -> dict[str, Any]:
         """Extract export_profiles_page kwargs from engage params dict.
 
@@ -432,7 +432,7 @@ class TestAccountAddDerivedName:
 
         monkeypatch.setenv("MP_SECRET", "team-secret")
 
-        def _fake_me(self: object) -> dict[str, object]:
+        def _fake_me(self: object, **_kwargs: object) -> dict[str, object]:
             return {
                 "user_id": 1,
                 "user_email": "u@example.com",
@@ -467,7 +467,7 @@ class TestAccountAddDerivedName:
 
         monkeypatch.setenv("MP_SECRET", "s")
 
-        def _fake_me(self: object) -> dict[str, object]:
+        def _fake_me(self: object, **_kwargs: object) -> dict[str, object]:
             return {
                 "user_id": 1,
                 "user_email": "u@example.com",
@@ -523,7 +523,7 @@ class TestAccountAddDerivedName:
         monkeypatch.setenv("MP_SECRET", "s")
         called = {"count": 0}
 
-        def _spy_me(self: object) -> dict[str, object]:
+        def _spy_me(self: object, **_kwargs: object) -> dict[str, object]:
             # If NAME is supplied, derivation should not run, so /me
             # should NOT be called by accounts.add. (It can still be
             # called by other discovery paths, but not the derive_name
@@ -594,7 +594,7 @@ class TestProjectListScopeHint:
             ],
         )
 
-        def _raise_403(self: object) -> dict[str, object]:
+        def _raise_403(self: object, **_kwargs: object) -> dict[str, object]:
             raise QueryError("Permission denied", status_code=403)
 
         monkeypatch.setattr(api_client_mod.MixpanelAPIClient, "me", _raise_403)
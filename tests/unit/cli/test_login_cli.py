@@ -49,7 +49,7 @@ def _stub_me(monkeypatch: pytest.MonkeyPatch, payload: dict[str, object]) -> Non
     """Patch ``MixpanelAPIClient.me`` to return a canned payload."""
     from mixpanel_headless._internal import api_client as api_client_mod
 
-    def _fake_me(self: object) -> dict[str, object]:
+    def _fake_me(self: object, **_kwargs: object) -> dict[str, object]:
         return payload
 
     monkeypatch.setattr(api_client_mod.MixpanelAPIClient, "me", _fake_me)
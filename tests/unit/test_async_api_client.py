@@ -0,0 +1,268 @@
+"""Unit tests for AsyncMixpanelAPIClient.
+
+Async code is driven with ``asyncio.run`` so the suite does not depend on
+an asyncio pytest plugin.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from mixpanel_headless._internal.async_api_client import AsyncMixpanelAPIClient
+from mixpanel_headless._internal.auth.account import OAuthTokenAccount
+from mixpanel_headless._internal.auth.session import Project, Session
+from mixpanel_headless.exceptions import (
+    AuthenticationError,
+    MixpanelHeadlessError,
+    QueryError,
+    RateLimitError,
+)
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _client(
+    session: Session,
+    handler: Callable[[httpx.Request], httpx.Response],
+    **kwargs: Any,
+) -> AsyncMixpanelAPIClient:
+    """Build an async client backed by an httpx.MockTransport."""
+    return AsyncMixpanelAPIClient(
+        session=session, _transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+async def _collect(client: AsyncMixpanelAPIClient, **kwargs: Any) -> list[Any]:
+    """Drain ``export_events`` into a list and close the client."""
+    async with client:
+        return [e async for e in client.export_events(**kwargs)]
+
+
+class TestAsyncRequest:
+    """Tests for the JSON request path."""
+
+    def test_insights_query_posts_body_with_auth(
+        self, test_credentials: Session
+    ) -> None:
+        """insights_query should POST the body as-is with Basic auth."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"series": {}})
+
+        async def run() -> dict[str, Any]:
+            async with _client(test_credentials, handler) as client:
+                return await client.insights_query({"bookmark": {}})
+
+        result = asyncio.run(run())
+
+        assert result == {"series": {}}
+        assert seen[0].method == "POST"
+        assert seen[0].url.path == "/api/query/insights"
+        assert "project_id" not in seen[0].url.params
+        assert seen[0].headers["Authorization"].startswith("Basic ")
+        assert json.loads(seen[0].content) == {"bookmark": {}}
+
+    def test_rate_limit_retries_then_succeeds(self, test_credentials: Session) -> None:
+        """A 429 should be retried after sleeping for Retry-After seconds."""
+        calls = {"n": 0}
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                return httpx.Response(429, headers={"Retry-After": "2"})
+            return httpx.Response(200, json={"ok": True})
+
+        async def run() -> Any:
+            async with _client(test_credentials, handler) as client:
+                return await client.insights_query({})
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            result = asyncio.run(run())
+
+        assert result == {"ok": True}
+        assert calls["n"] == 2
+        sleep.assert_called_once_with(2)
+
+    def test_rate_limit_exhausted_raises(self, test_credentials: Session) -> None:
+        """Exhausting retries on 429 should raise RateLimitError."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        async def run() -> Any:
+            async with _client(test_credentials, handler, max_retries=1) as client:
+                return await client.insights_query({})
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(run())
+
+    def test_401_raises_authentication_error(self, test_credentials: Session) -> None:
+        """A 401 response should raise AuthenticationError."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(401, json={"error": "bad creds"})
+
+        async def run() -> Any:
+            async with _client(test_credentials, handler) as client:
+                return await client.insights_query({})
+
+        with pytest.raises(AuthenticationError):
+            asyncio.run(run())
+
+    def test_app_request_unwraps_results(self, test_credentials: Session) -> None:
+        """App API responses should be unwrapped from the results envelope."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/app/projects/12345/dashboards/7"
+            return httpx.Response(
+                200, json={"status": "ok", "results": {"id": 7, "title": "D"}}
+            )
+
+        async def run() -> dict[str, Any]:
+            async with _client(test_credentials, handler) as client:
+                return await client.get_dashboard(7)
+
+        assert asyncio.run(run()) == {"id": 7, "title": "D"}
+
+    def test_oauth_header_resolved_off_event_loop(self) -> None:
+        """OAuth token resolution (which may refresh and lock) runs in a thread."""
+        session = Session(
+            account=OAuthTokenAccount(
+                name="oauth", region="us", token=SecretStr("tok")
+            ),
+            project=Project(id="12345"),
+        )
+        threads: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"series": {}})
+
+        async def run() -> int:
+            async with _client(session, handler) as client:
+                original = client._core._get_auth_header
+
+                def resolve() -> str:
+                    threads.append(threading.get_ident())
+                    return original()
+
+                with patch.object(client._core, "_get_auth_header", resolve):
+                    await client.insights_query({"bookmark": {}})
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+
+        assert threads and threads[0] != loop_thread
+
+
+class TestAsyncExportEvents:
+    """Tests for the streaming export path."""
+
+    def test_streams_jsonl_and_skips_malformed(self, test_credentials: Session) -> None:
+        """Events should stream line by line, skipping malformed lines."""
+        body = b'{"event": "A", "properties": {}}\nnot-json\n{"event": "B"}\n'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.host == "data.mixpanel.com"
+            assert request.url.params["from_date"] == "2024-01-01"
+            assert request.url.params["event"] == '["A", "B"]'
+            return httpx.Response(200, content=body)
+
+        events = asyncio.run(
+            _collect(
+                _client(test_credentials, handler),
+                from_date="2024-01-01",
+                to_date="2024-01-02",
+                events=["A", "B"],
+            )
+        )
+
+        assert [e["event"] for e in events] == ["A", "B"]
+
+    def test_400_raises_query_error(self, test_credentials: Session) -> None:
+        """A 400 during export should raise QueryError with the API message."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"error": "bad where"})
+
+        with pytest.raises(QueryError, match="bad where"):
+            asyncio.run(
+                _collect(
+                    _client(test_credentials, handler),
+                    from_date="2024-01-01",
+                    to_date="2024-01-01",
+                )
+            )
+
+    def test_transport_error_exhausted_raises(self, test_credentials: Session) -> None:
+        """Persistent transport errors should surface as HTTP_ERROR."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("boom", request=request)
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(MixpanelHeadlessError) as exc_info,
+        ):
+            asyncio.run(
+                _collect(
+                    _client(test_credentials, handler, max_retries=1),
+                    from_date="2024-01-01",
+                    to_date="2024-01-01",
+                )
+            )
+        assert exc_info.value.code == "HTTP_ERROR"
+
+
+class TestAsyncProfilesPage:
+    """Tests for Engage paging."""
+
+    def test_export_profiles_page_parses_result(
+        self, test_credentials: Session
+    ) -> None:
+        """A single Engage page should parse into ProfilePageResult."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "POST"
+            body = json.loads(request.content)
+            assert body["page"] == 1
+            assert body["session_id"] == "s-1"
+            return httpx.Response(
+                200,
+                json={
+                    "results": [{"$distinct_id": "u1", "$properties": {}}],
+                    "session_id": "s-1",
+                    "page_size": 1000,
+                    "total": 1001,
+                },
+            )
+
+        async def run() -> Any:
+            async with _client(test_credentials, handler) as client:
+                return await client.export_profiles_page(1, "s-1")
+
+        page = asyncio.run(run())
+
+        assert page.session_id == "s-1"
+        assert page.page == 1
+        assert len(page.profiles) == 1
@@ -0,0 +1,272 @@
+"""Unit tests for AsyncWorkspace.
+
+Requests are served by an ``httpx.MockTransport`` behind a real
+:class:`AsyncMixpanelAPIClient`, so these tests cover the full path from
+param building through the async client to the typed result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from mixpanel_headless import AsyncWorkspace
+from mixpanel_headless._internal.async_api_client import AsyncMixpanelAPIClient
+from mixpanel_headless._internal.auth.account import ServiceAccount
+from mixpanel_headless._internal.auth.session import Project, Session
+from mixpanel_headless.exceptions import AuthenticationError, QueryError
+from mixpanel_headless.types import FlowQueryResult, QueryResult, UserQueryResult
+
+# ---- 042 redesign: canonical fake Session for Workspace(session=…) ----
+_TEST_SESSION = Session(
+    account=ServiceAccount(
+        name="test_account",
+        region="us",
+        username="test_user",
+        secret=SecretStr("test_secret"),
+        default_project="12345",
+    ),
+    project=Project(id="12345"),
+)
+
+TIMESERIES_RESPONSE: dict[str, Any] = {
+    "computed_at": "2024-01-31T12:00:00+00:00",
+    "date_range": {
+        "from_date": "2024-01-01T00:00:00-07:00",
+        "to_date": "2024-01-31T23:59:59.999000-07:00",
+    },
+    "headers": ["$metric"],
+    "series": {
+        "Login [Total Events]": {
+            "2024-01-01T00:00:00-07:00": 100,
+            "2024-01-02T00:00:00-07:00": 200,
+        },
+    },
+    "meta": {"min_sampling_factor": 1.0},
+}
+
+
+def _workspace(handler: Callable[[httpx.Request], httpx.Response]) -> AsyncWorkspace:
+    """Build an AsyncWorkspace whose client is served by ``handler``."""
+    client = AsyncMixpanelAPIClient(
+        session=_TEST_SESSION, _transport=httpx.MockTransport(handler)
+    )
+    return AsyncWorkspace(session=_TEST_SESSION, _api_client=client)
+
+
+class TestAsyncQuery:
+    """Tests for the insights-backed query coroutines."""
+
+    def test_query_returns_query_result(self) -> None:
+        """query() should POST the built bookmark and return a QueryResult."""
+        bodies: list[dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=TIMESERIES_RESPONSE)
+
+        async def run() -> QueryResult:
+            async with _workspace(handler) as ws:
+                return await ws.query("Login", last=7)
+
+        result = asyncio.run(run())
+
+        assert isinstance(result, QueryResult)
+        assert "Login [Total Events]" in result.series
+        assert bodies[0]["project_id"] == 12345
+        assert bodies[0]["queryLimits"] == {"limit": 3000}
+        assert bodies[0]["bookmark"] == result.params
+
+    def test_concurrent_queries_share_one_client(self) -> None:
+        """asyncio.gather over several queries should issue one request each."""
+        calls = {"n": 0}
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            calls["n"] += 1
+            return httpx.Response(200, json=TIMESERIES_RESPONSE)
+
+        async def run() -> list[QueryResult]:
+            async with _workspace(handler) as ws:
+                return list(
+                    await asyncio.gather(*(ws.query("Login") for _ in range(5)))
+                )
+
+        results = asyncio.run(run())
+
+        assert len(results) == 5
+        assert calls["n"] == 5
+
+    def test_error_as_200_raises_query_error(self) -> None:
+        """An error field in a 200 response should raise QueryError."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"error": "bad metric"})
+
+        async def run() -> QueryResult:
+            async with _workspace(handler) as ws:
+                return await ws.query("Login")
+
+        with pytest.raises(QueryError):
+            asyncio.run(run())
+
+    @pytest.mark.parametrize(
+        ("mode", "query_type"),
+        [
+            ("sankey", "flows_sankey"),
+            ("paths", "flows_top_paths"),
+        ],
+    )
+    def test_query_flow_routes_query_type(self, mode: str, query_type: str) -> None:
+        """query_flow() should select the arb_funnels query_type from mode."""
+        bodies: list[dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/query/arb_funnels"
+            bodies.append(json.loads(request.content))
+            return httpx.Response(
+                200,
+                json={"computed_at": "2024-01-01", "steps": [], "flows": []},
+            )
+
+        async def run() -> FlowQueryResult:
+            async with _workspace(handler) as ws:
+                return await ws.query_flow("Login", mode=mode)
+
+        result = asyncio.run(run())
+
+        assert isinstance(result, FlowQueryResult)
+        assert bodies[0]["query_type"] == query_type
+
+
+class TestAsyncQueryUser:
+    """Tests for query_user()."""
+
+    def test_aggregate_count(self) -> None:
+        """Aggregate mode should call engage stats and expose the count."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/2.0/engage/stats"
+            return httpx.Response(
+                200, json={"results": 42, "computed_at": "2024-01-01T00:00:00"}
+            )
+
+        async def run() -> UserQueryResult:
+            async with _workspace(handler) as ws:
+                return await ws.query_user(mode="aggregate")
+
+        result = asyncio.run(run())
+
+        assert result.mode == "aggregate"
+        assert result.total == 42
+
+    def test_parallel_profiles_fetches_remaining_pages(self) -> None:
+        """Parallel mode should fetch pages 1..N concurrently with page 0's session."""
+        seen_pages: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            page = body["page"]
+            seen_pages.append(page)
+            if page > 0:
+                assert body["session_id"] == "s-1"
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"$distinct_id": f"u{page}-{i}", "$properties": {}}
+                        for i in range(2)
+                    ],
+                    "session_id": "s-1",
+                    "page_size": 2,
+                    "total": 6,
+                },
+            )
+
+        async def run() -> UserQueryResult:
+            async with _workspace(handler) as ws:
+                return await ws.query_user(
+                    mode="profiles", limit=None, parallel=True, workers=3
+                )
+
+        result = asyncio.run(run())
+
+        assert sorted(seen_pages) == [0, 1, 2]
+        assert [p["distinct_id"] for p in result.profiles] == [
+            "u0-0",
+            "u0-1",
+            "u1-0",
+            "u1-1",
+            "u2-0",
+            "u2-1",
+        ]
+        assert result.meta["failed_pages"] == []
+
+    def test_parallel_auth_error_propagates(self) -> None:
+        """An auth failure on a later page should abort the query."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if json.loads(request.content)["page"] > 0:
+                return httpx.Response(401, json={"error": "expired"})
+            return httpx.Response(
+                200,
+                json={
+                    "results": [{"$distinct_id": "u", "$properties": {}}],
+                    "session_id": "s-1",
+                    "page_size": 1,
+                    "total": 3,
+                },
+            )
+
+        async def run() -> UserQueryResult:
+            async with _workspace(handler) as ws:
+                return await ws.query_user(mode="profiles", limit=None, parallel=True)
+
+        with pytest.raises(AuthenticationError):
+            asyncio.run(run())
+
+
+class TestAsyncStreamEvents:
+    """Tests for stream_events()."""
+
+    def test_yields_normalized_events(self) -> None:
+        """stream_events() should yield transformed events by default."""
+        body = b'{"event": "A", "properties": {"distinct_id": "u1", "time": 1}}\n'
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body)
+
+        async def run() -> list[dict[str, Any]]:
+            async with _workspace(handler) as ws:
+                return [
+                    e
+                    async for e in ws.stream_events(
+                        from_date="2024-01-01", to_date="2024-01-01"
+                    )
+                ]
+
+        events = asyncio.run(run())
+
+        assert events[0]["event_name"] == "A"
+        assert events[0]["distinct_id"] == "u1"
+
+    def test_invalid_limit_raises(self) -> None:
+        """Out-of-range limits should raise before any request is made."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            raise AssertionError("no request expected")
+
+        async def run() -> None:
+            async with _workspace(handler) as ws:
+                async for _ in ws.stream_events(
+                    from_date="2024-01-01", to_date="2024-01-01", limit=0
+                ):
+                    pass
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
@@ -0,0 +1,229 @@
+"""Unit tests for bulk App API batching, dispatch and gzip bodies."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from mixpanel_headless import BulkOperationError, BulkOptions
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.bulk import GZIP_MIN_BYTES, chunked, run_batches
+from mixpanel_headless.exceptions import QueryError
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def oauth_credentials() -> Session:
+    """Create OAuth credentials for App API testing."""
+    return make_session(project_id="12345", region="us", oauth_token="test-oauth-token")
+
+
+def _body(request: httpx.Request) -> Any:
+    """Decode a JSON request body, gunzipping it if needed."""
+    content = request.content
+    if request.headers.get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content)
+
+
+class TestChunked:
+    """Tests for list splitting."""
+
+    def test_splits_in_order(self) -> None:
+        """Chunks should preserve order and respect the size."""
+        assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    def test_empty_input_is_one_empty_chunk(self) -> None:
+        """An empty list should still produce one request."""
+        assert chunked([], 10) == [[]]
+
+    def test_rejects_non_positive_size(self) -> None:
+        """A size below 1 should raise ValueError."""
+        with pytest.raises(ValueError):
+            chunked([1], 0)
+
+
+class TestRunBatches:
+    """Tests for concurrent batch dispatch."""
+
+    def test_single_batch_error_propagates_unchanged(self) -> None:
+        """A list that fits in one batch should raise the original error."""
+
+        def send(_batch: list[int]) -> None:
+            raise QueryError("bad")
+
+        with pytest.raises(QueryError):
+            run_batches("op", [1, 2], send, batch_size=10, workers=2)
+
+    def test_results_in_batch_order(self) -> None:
+        """Results should come back in input order regardless of timing."""
+        results = run_batches(
+            "op", list(range(7)), lambda b: sum(b), batch_size=2, workers=4
+        )
+        assert results == [1, 5, 9, 6]
+
+    def test_partial_failure_reports_items(self) -> None:
+        """A failing batch should not stop the others and should be reported."""
+
+        def send(batch: list[int]) -> list[int]:
+            if 3 in batch:
+                raise QueryError("bad batch")
+            return batch
+
+        with pytest.raises(BulkOperationError) as exc_info:
+            run_batches("op", [1, 2, 3, 4, 5], send, batch_size=2, workers=2)
+
+        err = exc_info.value
+        assert err.failed_items == [3, 4]
+        assert err.failed_batches == [[3, 4]]
+        assert err.succeeded_items == [1, 2, 5]
+        assert err.results == [[1, 2], [5]]
+        assert isinstance(err.errors[0], QueryError)
+        assert err.code == "BULK_PARTIAL_FAILURE"
+
+    def test_first_alone_runs_before_others(self) -> None:
+        """With first_alone, no other batch may start before the first ends."""
+        order: list[str] = []
+        lock = threading.Lock()
+
+        def send(batch: list[int]) -> None:
+            with lock:
+                order.append(f"start {batch[0]}")
+            with lock:
+                order.append(f"end {batch[0]}")
+
+        run_batches("op", [1, 2, 3], send, batch_size=1, workers=3, first_alone=True)
+        assert order[:2] == ["start 1", "end 1"]
+
+
+class TestBulkOptions:
+    """Tests for BulkOptions validation."""
+
+    @pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"max_workers": 0}])
+    def test_non_positive_values_rejected(self, kwargs: dict[str, int]) -> None:
+        """Zero batch size or workers should raise ValueError."""
+        with pytest.raises(ValueError):
+            BulkOptions(**kwargs)
+
+
+class TestClientBulkMethods:
+    """Tests for MixpanelAPIClient bulk method wiring."""
+
+    def _client(
+        self,
+        credentials: Session,
+        bodies: list[Any],
+        *,
+        options: BulkOptions,
+        response: Any = None,
+    ) -> MixpanelAPIClient:
+        """Client recording every decoded request body."""
+        lock = threading.Lock()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = _body(request)
+            with lock:
+                bodies.append(body)
+            results = response(body) if callable(response) else response
+            return httpx.Response(200, json={"status": "ok", "results": results})
+
+        return MixpanelAPIClient(
+            session=credentials,
+            bulk=options,
+            _transport=httpx.MockTransport(handler),
+        )
+
+    def test_bulk_delete_is_split(self, oauth_credentials: Session) -> None:
+        """Long id lists should be sent in batch_size chunks."""
+        bodies: list[Any] = []
+        client = self._client(
+            oauth_credentials, bodies, options=BulkOptions(batch_size=3)
+        )
+
+        with client:
+            client.bulk_delete_cohorts(list(range(7)))
+
+        sent = sorted(body["cohort_ids"] for body in bodies)
+        assert sent == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_definition_results_are_concatenated(
+        self, oauth_credentials: Session
+    ) -> None:
+        """Per-item results from every batch should be returned in order."""
+        bodies: list[Any] = []
+        client = self._client(
+            oauth_credentials,
+            bodies,
+            options=BulkOptions(batch_size=2),
+            response=lambda body: [
+                {"name": e["name"], "status": "ok"} for e in body["events"]
+            ],
+        )
+        events = [{"name": f"E{i}"} for i in range(5)]
+
+        with client:
+            result = client.bulk_update_event_definitions({"events": events})
+
+        assert [r["name"] for r in result] == [f"E{i}" for i in range(5)]
+        assert len(bodies) == 3
+
+    def test_create_schemas_truncates_once_and_sums(
+        self, oauth_credentials: Session
+    ) -> None:
+        """Only the first batch may truncate; counts should be summed."""
+        bodies: list[Any] = []
+        client = self._client(
+            oauth_credentials,
+            bodies,
+            options=BulkOptions(batch_size=2),
+            response=lambda body: {
+                "added": len(body["entries"]),
+                "deleted": 10 if body["truncate"] else 0,
+            },
+        )
+        entries = [{"name": f"E{i}"} for i in range(5)]
+
+        with client:
+            result = client.create_schemas_bulk({"entries": entries, "truncate": True})
+
+        assert bodies[0]["truncate"] is True
+        assert bodies[0]["entries"] == entries[:2]
+        assert all(body["truncate"] is False for body in bodies[1:])
+        assert result == {"added": 5, "deleted": 10}
+
+    def test_gzip_large_bodies(self, oauth_credentials: Session) -> None:
+        """Large bodies should be gzipped when BulkOptions.gzip is set."""
+        encodings: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            encodings.append(request.headers.get("Content-Encoding"))
+            _body(request)
+            return httpx.Response(200, json={"status": "ok"})
+
+        client = MixpanelAPIClient(
+            session=oauth_credentials,
+            bulk=BulkOptions(gzip=True),
+            _transport=httpx.MockTransport(handler),
+        )
+        # One batch whose JSON body is comfortably over the gzip threshold.
+        big = [{"id": i, "name": "x" * 1024} for i in range(32)]
+        assert len(json.dumps(big)) > GZIP_MIN_BYTES
+
+        with client:
+            client.bulk_update_bookmarks(big)
+            client.bulk_update_bookmarks([{"id": 1}])
+
+        assert encodings == ["gzip", None]
+
+    def test_with_project_carries_options(self, oauth_credentials: Session) -> None:
+        """with_project() should keep the bulk options."""
+        options = BulkOptions(max_workers=8)
+        client = MixpanelAPIClient(session=oauth_credentials, bulk=options)
+
+        assert client.with_project("999")._bulk == options
@@ -0,0 +1,212 @@
+"""Unit tests for checkpointed, resumable event export."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal import checkpoint
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.checkpoint import (
+    ExportManifest,
+    export_events_checkpointed,
+    manifest_path_for,
+)
+from mixpanel_headless.exceptions import MixpanelHeadlessError, QueryError
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _day_handler(
+    requested: list[str], fail_on: str | None = None
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve two events per day, optionally failing one day with a 400."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        day = request.url.params["from_date"]
+        requested.append(day)
+        if day == fail_on:
+            return httpx.Response(400, json={"error": "boom"})
+        lines = "".join(
+            json.dumps({"event": "E", "properties": {"day": day, "n": n}}) + "\n"
+            for n in range(2)
+        )
+        return httpx.Response(200, content=lines.encode())
+
+    return handler
+
+
+def _client(
+    session: Session, handler: Callable[[httpx.Request], httpx.Response]
+) -> MixpanelAPIClient:
+    """Build a client backed by an httpx.MockTransport."""
+    return MixpanelAPIClient(session=session, _transport=httpx.MockTransport(handler))
+
+
+class TestExportEventsCheckpointed:
+    """Tests for export_events_checkpointed()."""
+
+    def test_writes_events_and_manifest(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """A full run should write every day and record each shard."""
+        out = tmp_path / "events.jsonl"
+        requested: list[str] = []
+
+        with _client(test_credentials, _day_handler(requested)) as client:
+            result = export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-03"
+            )
+
+        assert result.lines == 6
+        assert result.size_bytes == out.stat().st_size
+        assert result.shards_written == 3
+        assert result.shards_skipped == 0
+        manifest = json.loads(manifest_path_for(out).read_text())
+        assert [s["from_date"] for s in manifest["shards"]] == [
+            "2024-01-01",
+            "2024-01-02",
+            "2024-01-03",
+        ]
+        assert all(s["lines"] == 2 for s in manifest["shards"])
+
+    def test_shard_is_fsynced_before_recording(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Each shard reaches disk before the manifest claims it."""
+        out = tmp_path / "events.jsonl"
+        calls: list[str] = []
+        record = ExportManifest.record
+
+        def tracked_record(self: ExportManifest, *args: Any) -> None:
+            calls.append("record")
+            record(self, *args)
+
+        with (
+            _client(test_credentials, _day_handler([])) as client,
+            patch.object(checkpoint.os, "fsync", lambda _fd: calls.append("fsync")),
+            patch.object(ExportManifest, "record", tracked_record),
+        ):
+            export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-02"
+            )
+
+        assert calls == ["fsync", "record", "fsync", "record"]
+
+    def test_resume_skips_completed_days(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """After a failure, a rerun should fetch only the missing days."""
+        out = tmp_path / "events.jsonl"
+        first: list[str] = []
+        with (
+            _client(test_credentials, _day_handler(first, fail_on="2024-01-03")) as c,
+            pytest.raises(QueryError),
+        ):
+            export_events_checkpointed(
+                c, out, from_date="2024-01-01", to_date="2024-01-04"
+            )
+
+        second: list[str] = []
+        with _client(test_credentials, _day_handler(second)) as client:
+            result = export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-04"
+            )
+
+        assert second == ["2024-01-03", "2024-01-04"]
+        assert result.shards_skipped == 2
+        assert result.lines == 8
+        days = [json.loads(line)["properties"]["day"] for line in out.open()]
+        assert days == sorted(days)
+        assert len(days) == 8
+
+    def test_partial_shard_is_truncated(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Bytes past the last recorded shard should be discarded on resume."""
+        out = tmp_path / "events.jsonl"
+        with _client(test_credentials, _day_handler([])) as client:
+            export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-01"
+            )
+        committed = out.stat().st_size
+        with out.open("ab") as fh:
+            fh.write(b'{"event": "half-writ')
+
+        with _client(test_credentials, _day_handler([])) as client:
+            result = export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-02"
+            )
+
+        assert result.size_bytes == out.stat().st_size
+        assert out.stat().st_size == committed * 2
+        for line in out.read_text().splitlines():
+            json.loads(line)
+
+    def test_filter_mismatch_rejected(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Resuming with different filters should raise CHECKPOINT_MISMATCH."""
+        out = tmp_path / "events.jsonl"
+        with _client(test_credentials, _day_handler([])) as client:
+            export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-01"
+            )
+            with pytest.raises(MixpanelHeadlessError) as exc_info:
+                export_events_checkpointed(
+                    client,
+                    out,
+                    from_date="2024-01-01",
+                    to_date="2024-01-02",
+                    where='properties["x"] == 1',
+                )
+
+        assert exc_info.value.code == "CHECKPOINT_MISMATCH"
+
+    def test_truncated_output_rejected(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """An output shorter than the manifest should not be silently reused."""
+        out = tmp_path / "events.jsonl"
+        with _client(test_credentials, _day_handler([])) as client:
+            export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-01"
+            )
+            out.write_bytes(b"")
+            with pytest.raises(MixpanelHeadlessError) as exc_info:
+                export_events_checkpointed(
+                    client, out, from_date="2024-01-01", to_date="2024-01-01"
+                )
+
+        assert exc_info.value.code == "CHECKPOINT_MISMATCH"
+
+    def test_parallel_workers_keep_day_order(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Concurrent downloads should still append days chronologically."""
+        out = tmp_path / "events.jsonl"
+        with _client(test_credentials, _day_handler([])) as client:
+            result = export_events_checkpointed(
+                client, out, from_date="2024-01-01", to_date="2024-01-05", workers=3
+            )
+
+        days = [json.loads(line)["properties"]["day"] for line in out.open()]
+        assert days == sorted(days)
+        assert result.lines == 10
@@ -0,0 +1,339 @@
+"""Tests for splitting long-range queries into date windows."""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import SecretStr
+
+from mixpanel_headless import Metric, Workspace
+from mixpanel_headless._internal.auth.account import ServiceAccount
+from mixpanel_headless._internal.auth.session import Project, Session
+from mixpanel_headless._internal.date_split import (
+    split_date_range,
+    sum_series,
+    window_params,
+)
+from mixpanel_headless.types import (
+    EventCountsResult,
+    QueryResult,
+    SegmentationResult,
+)
+
+_TEST_SESSION = Session(
+    account=ServiceAccount(
+        name="test_account",
+        region="us",
+        username="test_user",
+        secret=SecretStr("test_secret"),
+        default_project="12345",
+    ),
+    project=Project(id="12345"),
+)
+
+
+def _days(from_date: str, to_date: str) -> list[str]:
+    """Return every day in an inclusive range."""
+    start, end = date.fromisoformat(from_date), date.fromisoformat(to_date)
+    return [
+        (start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)
+    ]
+
+
+class _FakeService:
+    """LiveQueryService stand-in returning one count per day per window."""
+
+    def __init__(self) -> None:
+        """Initialize the call log."""
+        self.windows: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def _record(self, from_date: str, to_date: str) -> dict[str, int]:
+        """Log a window and return a count of 1 for each of its days."""
+        with self._lock:
+            self.windows.append((from_date, to_date))
+        return dict.fromkeys(_days(from_date, to_date), 1)
+
+    def segmentation(
+        self, *, event: str, from_date: str, to_date: str, **kw: Any
+    ) -> Any:
+        """Fake segmentation query."""
+        series = {event: self._record(from_date, to_date)}
+        return SegmentationResult(
+            event=event,
+            from_date=from_date,
+            to_date=to_date,
+            unit=kw["unit"],
+            segment_property=kw["on"],
+            total=len(series[event]),
+            series=series,
+        )
+
+    def event_counts(
+        self, *, events: list[str], from_date: str, to_date: str, **kw: Any
+    ) -> Any:
+        """Fake event counts query."""
+        counts = self._record(from_date, to_date)
+        return EventCountsResult(
+            events=events,
+            from_date=from_date,
+            to_date=to_date,
+            unit=kw["unit"],
+            type=kw["type"],
+            series={e: dict(counts) for e in events},
+        )
+
+    def query(self, *, bookmark_params: dict[str, Any], project_id: int) -> Any:
+        """Fake insights query reading the window from the params."""
+        from_date, to_date = bookmark_params["sections"]["time"][0]["value"]
+        counts = self._record(from_date, to_date)
+        return QueryResult(
+            computed_at=f"2025-01-01T00:00:{len(self.windows):02d}",
+            from_date=from_date,
+            to_date=to_date,
+            series={
+                "Login [Total Events]": counts,
+                "$overall": {"all": len(counts)},
+            },
+            params=bookmark_params,
+        )
+
+
+@pytest.fixture
+def service() -> _FakeService:
+    """Fake live query service."""
+    return _FakeService()
+
+
+@pytest.fixture
+def workspace(service: _FakeService) -> Workspace:
+    """Workspace whose live query service is ``service``."""
+    from mixpanel_headless._internal.api_client import MixpanelAPIClient
+
+    ws = Workspace(session=_TEST_SESSION, _api_client=MagicMock(spec=MixpanelAPIClient))
+    ws._live_query = service  # type: ignore[assignment]
+    return ws
+
+
+class TestSplitDateRange:
+    """Tests for split_date_range()."""
+
+    def test_day_windows(self) -> None:
+        """Windows are consecutive and at most window_days long."""
+        windows = split_date_range("2024-01-01", "2024-01-10", window_days=4)
+
+        assert windows == [
+            ("2024-01-01", "2024-01-04"),
+            ("2024-01-05", "2024-01-08"),
+            ("2024-01-09", "2024-01-10"),
+        ]
+
+    def test_month_alignment(self) -> None:
+        """Monthly queries are split on month boundaries."""
+        windows = split_date_range(
+            "2024-01-15", "2024-04-10", window_days=40, unit="month"
+        )
+
+        assert windows == [
+            ("2024-01-15", "2024-01-31"),
+            ("2024-02-01", "2024-02-29"),
+            ("2024-03-01", "2024-03-31"),
+            ("2024-04-01", "2024-04-10"),
+        ]
+
+    def test_week_alignment(self) -> None:
+        """Weekly queries end each window on a Sunday."""
+        windows = split_date_range(
+            "2024-01-03", "2024-02-10", window_days=14, unit="week"
+        )
+
+        assert [date.fromisoformat(end).weekday() for _, end in windows[:-1]] == [6, 6]
+
+    def test_invalid(self) -> None:
+        """Reversed ranges and non-positive windows are rejected."""
+        with pytest.raises(ValueError, match="after"):
+            split_date_range("2024-02-01", "2024-01-01", window_days=7)
+        with pytest.raises(ValueError, match="window_days"):
+            split_date_range("2024-01-01", "2024-02-01", window_days=0)
+
+
+class TestMerging:
+    """Tests for the series merge helpers."""
+
+    def test_sum_series(self) -> None:
+        """Nested numbers on the same key are added; new keys are kept."""
+        merged = sum_series(
+            [
+                {"A": {"d1": 1, "d2": 2}, "$overall": {"all": 3}},
+                {"A": {"d2": 5, "d3": 4}, "B": {"d3": 1}, "$overall": {"all": 9}},
+            ]
+        )
+
+        assert merged == {
+            "A": {"d1": 1, "d2": 7, "d3": 4},
+            "B": {"d3": 1},
+            "$overall": {"all": 12},
+        }
+
+    def test_window_params(self) -> None:
+        """Only the time section's range changes."""
+        params = {
+            "sections": {
+                "show": [{"x": 1}],
+                "time": [
+                    {
+                        "dateRangeType": "between",
+                        "unit": "week",
+                        "value": ["2020-01-01", "2024-12-31"],
+                    }
+                ],
+            },
+            "displayOptions": {"chartType": "line"},
+        }
+
+        narrowed = window_params(params, "2021-01-01", "2021-03-31")
+
+        assert narrowed["sections"]["time"] == [
+            {
+                "dateRangeType": "between",
+                "unit": "week",
+                "value": ["2021-01-01", "2021-03-31"],
+            }
+        ]
+        assert narrowed["sections"]["show"] is params["sections"]["show"]
+        assert params["sections"]["time"][0]["value"][0] == "2020-01-01"
+
+
+class TestWorkspaceWindowSplit:
+    """Tests for ``window_days=`` on the Workspace query methods."""
+
+    def test_segmentation(self, workspace: Workspace, service: _FakeService) -> None:
+        """Windows are queried separately and summed exactly."""
+        result = workspace.segmentation(
+            "Login", from_date="2021-01-01", to_date="2023-12-31", window_days=90
+        )
+
+        assert len(service.windows) == 13
+        assert result.from_date == "2021-01-01"
+        assert result.to_date == "2023-12-31"
+        assert result.total == 1095
+        assert result.series["Login"] == dict.fromkeys(
+            _days("2021-01-01", "2023-12-31"), 1
+        )
+
+    def test_short_range_is_not_split(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """A range that fits in one window runs as a single query."""
+        workspace.event_counts(
+            ["A"], from_date="2024-01-01", to_date="2024-01-31", window_days=90
+        )
+
+        assert service.windows == [("2024-01-01", "2024-01-31")]
+
+    def test_event_counts(self, workspace: Workspace, service: _FakeService) -> None:
+        """Every event's series covers the whole range."""
+        result = workspace.event_counts(
+            ["A", "B"], from_date="2024-01-01", to_date="2024-12-31", window_days=30
+        )
+
+        assert len(service.windows) == 13
+        assert sum(result.series["B"].values()) == 366
+
+    def test_unique_counts_rejected(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """Non-additive count types raise before any request."""
+        with pytest.raises(ValueError, match="type='unique'"):
+            workspace.event_counts(
+                ["A"],
+                from_date="2024-01-01",
+                to_date="2024-12-31",
+                type="unique",
+                window_days=30,
+            )
+        assert service.windows == []
+
+    def test_top_value_breakdowns_rejected(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """Per-window top-N breakdowns raise instead of merging wrongly."""
+        dates = {"from_date": "2024-01-01", "to_date": "2024-12-31"}
+        with pytest.raises(ValueError, match="segment property"):
+            workspace.segmentation("A", on="$browser", window_days=30, **dates)
+        with pytest.raises(ValueError, match="values list"):
+            workspace.property_counts("A", "$browser", window_days=30, **dates)
+        assert service.windows == []
+
+    def test_query(self, workspace: Workspace, service: _FakeService) -> None:
+        """Insights totals are summed; params describe the whole range."""
+        result = workspace.query(
+            "Login", from_date="2022-01-01", to_date="2023-12-31", window_days=180
+        )
+
+        assert len(service.windows) == 5
+        assert result.series["$overall"] == {"all": 730}
+        assert result.to_date == "2023-12-31"
+        assert result.computed_at.endswith(":01")
+        assert result.params["sections"]["time"][0]["value"] == [
+            "2022-01-01",
+            "2023-12-31",
+        ]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "reason"),
+        [
+            ({"math": "unique"}, "math='unique'"),
+            ({"events": Metric("Login", math="p90", property="x")}, "math='p90'"),
+            ({"cumulative": True}, "cumulative"),
+            ({"events": ["A", "B"], "formula": "A / B"}, "formula"),
+            ({"group_by": "$browser"}, "group_by"),
+        ],
+    )
+    def test_query_non_additive_rejected(
+        self,
+        workspace: Workspace,
+        service: _FakeService,
+        kwargs: dict[str, Any],
+        reason: str,
+    ) -> None:
+        """Non-additive insights queries raise a clear error."""
+        args: dict[str, Any] = {"events": "Login", **kwargs}
+        with pytest.raises(ValueError, match=reason):
+            workspace.query(
+                from_date="2022-01-01",
+                to_date="2023-12-31",
+                window_days=180,
+                **args,
+            )
+        assert service.windows == []
+
+    def test_query_requires_dates(self, workspace: Workspace) -> None:
+        """A relative ``last=`` range cannot be split."""
+        with pytest.raises(ValueError, match="from_date and to_date"):
+            workspace.query("Login", last=30, window_days=7)
+
+    def test_window_error_propagates(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """A failing window fails the whole call rather than merging partially."""
+        original = service.segmentation
+
+        def flaky(**kwargs: Any) -> Any:
+            if kwargs["from_date"] == "2024-03-01":
+                raise RuntimeError("boom")
+            return original(**kwargs)
+
+        service.segmentation = flaky  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError, match="boom"):
+            workspace.segmentation(
+                "Login",
+                from_date="2024-01-01",
+                to_date="2024-06-30",
+                unit="month",
+                window_days=31,
+            )
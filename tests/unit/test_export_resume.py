@@ -0,0 +1,175 @@
+"""Unit tests for duplicate-free resumption of dropped export streams."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.async_api_client import AsyncMixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless.exceptions import MixpanelHeadlessError
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _line(n: int, insert_id: str | None = None) -> bytes:
+    """Serialize one export event with a predictable ``$insert_id``."""
+    properties: dict[str, Any] = {"n": n}
+    properties["$insert_id"] = insert_id if insert_id is not None else f"id-{n}"
+    return (json.dumps({"event": "E", "properties": properties}) + "\n").encode()
+
+
+class _DroppingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Byte stream that yields some lines and then fails with a ReadError."""
+
+    def __init__(self, chunks: list[bytes], drop: bool) -> None:
+        """Initialize the stream.
+
+        Args:
+            chunks: Byte chunks to yield.
+            drop: Raise ``httpx.ReadError`` after the last chunk.
+        """
+        self._chunks = chunks
+        self._drop = drop
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield each chunk, then optionally drop the connection."""
+        yield from self._chunks
+        if self._drop:
+            raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Async variant of ``__iter__``."""
+        for chunk in self._chunks:
+            yield chunk
+        if self._drop:
+            raise httpx.ReadError("connection reset")
+
+
+def _handler(
+    attempts: list[list[bytes]],
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve one body per attempt; every body but the last drops mid-stream."""
+    calls = 0
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        chunks = attempts[min(calls, len(attempts) - 1)]
+        drop = calls < len(attempts) - 1
+        calls += 1
+        return httpx.Response(200, stream=_DroppingStream(chunks, drop))
+
+    return handler
+
+
+def _export(
+    session: Session, attempts: list[list[bytes]], **kwargs: Any
+) -> list[dict[str, Any]]:
+    """Run a sync export against the scripted attempts."""
+    client = MixpanelAPIClient(
+        session=session, _transport=httpx.MockTransport(_handler(attempts))
+    )
+    with (
+        client,
+        patch("mixpanel_headless._internal.api_client.time.sleep"),
+    ):
+        return list(client.export_events("2024-01-01", "2024-01-01", **kwargs))
+
+
+class TestExportResume:
+    """Tests for MixpanelAPIClient.export_events() mid-stream retries."""
+
+    def test_replay_skips_delivered_events(self, test_credentials: Session) -> None:
+        """A drop after some events should not yield those events twice."""
+        full = [_line(n) for n in range(5)]
+
+        events = _export(test_credentials, [full[:3], full])
+
+        assert [e["properties"]["n"] for e in events] == [0, 1, 2, 3, 4]
+
+    def test_repeated_drops_keep_position(self, test_credentials: Session) -> None:
+        """Several drops in a row should still deliver each event once."""
+        full = [_line(n) for n in range(6)]
+
+        events = _export(test_credentials, [full[:2], full[:4], full])
+
+        assert [e["properties"]["n"] for e in events] == list(range(6))
+
+    def test_on_batch_counts_cumulative(self, test_credentials: Session) -> None:
+        """Progress callbacks should report delivered events across retries."""
+        full = [_line(n) for n in range(4)]
+        counts: list[int] = []
+
+        _export(test_credentials, [full[:1], full], on_batch=counts.append)
+
+        assert counts == [4]
+
+    def test_diverged_replay_rejected(self, test_credentials: Session) -> None:
+        """A replay whose boundary $insert_id differs should raise."""
+        first = [_line(0), _line(1)]
+        replay = [_line(0), _line(1, insert_id="other"), _line(2)]
+
+        with pytest.raises(MixpanelHeadlessError) as exc_info:
+            _export(test_credentials, [first, replay])
+
+        assert exc_info.value.code == "EXPORT_RESUME_MISMATCH"
+        assert exc_info.value.details["expected_insert_id"] == "id-1"
+
+    def test_short_replay_rejected(self, test_credentials: Session) -> None:
+        """A replay with fewer events than were delivered should raise."""
+        first = [_line(n) for n in range(3)]
+
+        with pytest.raises(MixpanelHeadlessError) as exc_info:
+            _export(test_credentials, [first, first[:1]])
+
+        assert exc_info.value.code == "EXPORT_RESUME_MISMATCH"
+
+    def test_drop_before_first_event_retries_cleanly(
+        self, test_credentials: Session
+    ) -> None:
+        """A drop before any event is delivered should behave like a plain retry."""
+        full = [_line(n) for n in range(2)]
+
+        events = _export(test_credentials, [[], full])
+
+        assert len(events) == 2
+
+
+class TestAsyncExportResume:
+    """Tests for AsyncMixpanelAPIClient.export_events() mid-stream retries."""
+
+    def test_replay_skips_delivered_events(self, test_credentials: Session) -> None:
+        """The async client should resume without duplicates as well."""
+        full = [_line(n) for n in range(5)]
+
+        async def run() -> list[dict[str, Any]]:
+            client = AsyncMixpanelAPIClient(
+                session=test_credentials,
+                _transport=httpx.MockTransport(_handler([full[:3], full])),
+            )
+            async with client:
+                return [
+                    e async for e in client.export_events("2024-01-01", "2024-01-01")
+                ]
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            events = asyncio.run(run())
+
+        assert [e["properties"]["n"] for e in events] == [0, 1, 2, 3, 4]
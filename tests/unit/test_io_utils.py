@@ -41,6 +41,11 @@ Verifies (reads):
 - No fd leak across many rejections (symlink branch and mode branch)
 - Text variant round-trips UTF-8 and raises UnicodeDecodeError on bad bytes
 
+Verifies (locking):
+- ``exclusive_lock`` serializes threads on the same lock path
+- Another process holding the OS lock blocks the caller until released
+- The lock file is created owner-only and a symlinked lock file is refused
+
 Verifies (stdin):
 - Stdin reader returns whitespace-stripped value at the cap boundary
 - Stdin reader rejects payloads exceeding the cap with ConfigError
@@ -54,7 +59,10 @@ import io
 import os
 import platform
 import stat
+import subprocess
+import sys
 import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -66,6 +74,7 @@ from mixpanel_headless._internal.io_utils import (
     SECRET_STDIN_MAX_BYTES,
     CredentialPathError,
     atomic_write_bytes,
+    exclusive_lock,
     read_capped_secret_from_stdin,
     read_credential_bytes,
     read_credential_text,
@@ -754,6 +763,95 @@ class TestDirfdWalk:
         assert read_credential_bytes(link_dir / "creds.json") == b"x"
 
 
+class TestExclusiveLock:
+    """Tests for :func:`exclusive_lock`."""
+
+    def test_serializes_threads(self, tmp_path: Path) -> None:
+        """At most one thread is inside the lock at any time."""
+        lock_path = tmp_path / ".lock"
+        inside = 0
+        max_inside = 0
+        counter_lock = threading.Lock()
+
+        def worker() -> None:
+            nonlocal inside, max_inside
+            with exclusive_lock(lock_path):
+                with counter_lock:
+                    inside += 1
+                    max_inside = max(max_inside, inside)
+                time.sleep(0.01)
+                with counter_lock:
+                    inside -= 1
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert max_inside == 1
+
+    @_POSIX_ONLY
+    def test_blocks_while_another_process_holds_lock(self, tmp_path: Path) -> None:
+        """The advisory lock excludes other processes, not just threads."""
+        lock_path = tmp_path / ".lock"
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import fcntl, os, sys\n"
+                f"fd = os.open({str(lock_path)!r}, os.O_RDWR | os.O_CREAT, 0o600)\n"
+                "fcntl.flock(fd, fcntl.LOCK_EX)\n"
+                "print('locked', flush=True)\n"
+                "sys.stdin.readline()\n",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert holder.stdout is not None and holder.stdin is not None
+            assert holder.stdout.readline().strip() == "locked"
+            acquired = threading.Event()
+
+            def worker() -> None:
+                with exclusive_lock(lock_path):
+                    acquired.set()
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            assert not acquired.wait(timeout=0.2)
+
+            holder.stdin.write("\n")
+            holder.stdin.flush()
+            assert acquired.wait(timeout=5)
+            thread.join(timeout=5)
+        finally:
+            holder.kill()
+            holder.wait()
+
+    @_POSIX_ONLY
+    def test_lock_file_is_owner_only(self, tmp_path: Path) -> None:
+        """A fresh lock file is created with mode 0o600."""
+        lock_path = tmp_path / ".lock"
+
+        with exclusive_lock(lock_path):
+            pass
+
+        assert stat.S_IMODE(lock_path.stat().st_mode) == 0o600
+
+    @_POSIX_ONLY
+    def test_refuses_symlinked_lock_file(self, tmp_path: Path) -> None:
+        """A symlink planted at the lock path is not followed."""
+        target = tmp_path / "elsewhere"
+        target.write_bytes(b"")
+        lock_path = tmp_path / ".lock"
+        lock_path.symlink_to(target)
+
+        with pytest.raises(OSError), exclusive_lock(lock_path):
+            pass
+
+
 def _stub_stdin(monkeypatch: pytest.MonkeyPatch, payload: bytes) -> None:
     """Replace ``sys.stdin.buffer`` with a BytesIO carrying ``payload``."""
     import sys
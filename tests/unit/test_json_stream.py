@@ -0,0 +1,236 @@
+"""Unit tests for incremental JSON parsing of App API responses."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.json_stream import (
+    JSONStreamError,
+    MissingTargetError,
+    iter_items,
+    load,
+)
+from mixpanel_headless.exceptions import MixpanelHeadlessError, QueryError
+from tests.conftest import make_session
+
+ME_PAYLOAD: dict[str, Any] = {
+    "status": "ok",
+    "results": {
+        "user_id": 7,
+        "user_email": "a@example.com",
+        "workspaces": {
+            "1": {
+                "id": 1,
+                "name": "All",
+                "member_list": [{"id": n} for n in range(50)],
+            },
+            "2": {"id": 2, "name": "Team", "unified_member_list": ["x"] * 10},
+        },
+    },
+}
+
+
+def _chunks(value: Any, size: int) -> Iterator[bytes]:
+    """Encode ``value`` and split it into ``size``-byte chunks."""
+    raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+    for i in range(0, len(raw), size):
+        yield raw[i : i + size]
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _client(session: Session, handler: object) -> MixpanelAPIClient:
+    """Client backed by a mock transport."""
+    return MixpanelAPIClient(
+        session=session,
+        _transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+
+
+class TestLoad:
+    """Tests for json_stream.load."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 4096])
+    def test_matches_json_loads_at_any_chunk_size(self, size: int) -> None:
+        """Chunk boundaries inside strings, numbers and escapes are handled."""
+        doc = {
+            "a": [1, -2.5e3, 1.25, True, None],
+            "s": 'café ☃ "q" \\ \n',
+            "n": {"deep": [{"x": 12345678901234567890}]},
+            "e": [],
+            "o": {},
+        }
+        assert load(_chunks(doc, size)) == doc
+
+    @pytest.mark.parametrize("size", [1, 5, 4096])
+    def test_skip_drops_matching_subtrees(self, size: int) -> None:
+        """Wildcard skip patterns remove every matching member."""
+        skip = [
+            ("results", "workspaces", "*", "member_list"),
+            ("results", "workspaces", "*", "unified_member_list"),
+        ]
+
+        result = load(_chunks(ME_PAYLOAD, size), skip=skip)
+
+        assert result["results"]["workspaces"] == {
+            "1": {"id": 1, "name": "All"},
+            "2": {"id": 2, "name": "Team"},
+        }
+        assert result["results"]["user_id"] == 7
+
+    def test_skip_array_elements(self) -> None:
+        """A trailing wildcard under an array drops selected element keys."""
+        doc = {"items": [{"id": 1, "big": [1] * 5}, {"id": 2, "big": {}}]}
+
+        result = load(_chunks(doc, 4), skip=[("items", "*", "big")])
+
+        assert result == {"items": [{"id": 1}, {"id": 2}]}
+
+    @pytest.mark.parametrize(
+        "raw",
+        [b'{"a": [1, 2', b'{"a" 1}', b'{"a": 1} x', b"", b'{"a": "unterminated'],
+    )
+    def test_malformed_raises(self, raw: bytes) -> None:
+        """Truncated or invalid documents raise JSONStreamError."""
+        with pytest.raises(JSONStreamError):
+            load([raw], skip=[("a", "b")])
+
+
+class TestIterItems:
+    """Tests for json_stream.iter_items."""
+
+    def test_yields_elements_lazily(self) -> None:
+        """Elements are produced before the rest of the body is read."""
+        chunks = list(_chunks({"results": [{"id": n} for n in range(20)]}, 8))
+        consumed: list[bytes] = []
+
+        def source() -> Iterator[bytes]:
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        items = iter_items(source(), [("results",)])
+        assert next(items) == {"id": 0}
+        assert len(consumed) < len(chunks)
+        assert [item["id"] for item in items] == list(range(1, 20))
+
+    def test_alternative_targets_and_skip(self) -> None:
+        """Either envelope shape is streamed; skip applies inside items."""
+        doc = {"status": "ok", "results": {"results": [{"id": 1, "params": {}}]}}
+        targets = [("results",), ("results", "results")]
+        skip = [("results", "results", "*", "params")]
+
+        items = list(iter_items(_chunks(doc, 3), targets, skip=skip))
+
+        assert items == [{"id": 1}]
+
+    def test_required_target_missing_raises(self) -> None:
+        """With required=True, a document without a target array raises."""
+        doc = {"results": {"error": "x"}}
+        targets = [("results",), ("results", "results")]
+
+        assert list(iter_items(_chunks(doc, 4), targets)) == []
+        with pytest.raises(MissingTargetError):
+            list(iter_items(_chunks(doc, 4), targets, required=True))
+        assert (
+            list(iter_items(_chunks({"results": []}, 4), targets, required=True)) == []
+        )
+
+
+class TestClientStreaming:
+    """Tests for MixpanelAPIClient's streamed App API reads."""
+
+    def test_me_skips_member_lists(self, test_credentials: Session) -> None:
+        """me(skip=...) drops the matched subtrees from the profile."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=ME_PAYLOAD)
+
+        client = _client(test_credentials, handler)
+        with client:
+            me = client.me(skip=[("workspaces", "*", "member_list")])
+
+        assert me["workspaces"]["1"] == {"id": 1, "name": "All"}
+        assert "unified_member_list" in me["workspaces"]["2"]
+
+    def test_iter_bookmarks_v2_nested_envelope(self, test_credentials: Session) -> None:
+        """iter_bookmarks_v2 streams the v2 envelope's inner list."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={"results": {"results": [{"id": 1, "params": {"x": 1}}]}},
+            )
+
+        client = _client(test_credentials, handler)
+        with client:
+            bookmarks = list(client.iter_bookmarks_v2(skip=[("params",)]))
+
+        assert bookmarks == [{"id": 1}]
+
+    @pytest.mark.parametrize("body", [{"results": {"error": "x"}}, {"status": "ok"}])
+    def test_unexpected_bookmarks_shape_raises(
+        self, test_credentials: Session, body: dict[str, Any]
+    ) -> None:
+        """A listing without a bookmark array raises instead of yielding nothing."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=body)
+
+        client = _client(test_credentials, handler)
+        with (
+            client,
+            pytest.raises(MixpanelHeadlessError, match="Unexpected response"),
+        ):
+            client.list_bookmarks_v2()
+
+    def test_error_status_raises(self, test_credentials: Session) -> None:
+        """Error responses raise the same exceptions as app_request."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"error": "Dashboard not found"})
+
+        client = _client(test_credentials, handler)
+        with client, pytest.raises(QueryError, match="Dashboard not found"):
+            client.get_dashboard(1)
+
+    def test_invalid_json_raises(self, test_credentials: Session) -> None:
+        """A malformed body surfaces as an INVALID_RESPONSE error."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"results": {"id": ')
+
+        client = _client(test_credentials, handler)
+        with client, pytest.raises(MixpanelHeadlessError) as exc_info:
+            client.get_dashboard(1)
+
+        assert exc_info.value.code == "INVALID_RESPONSE"
+
+    def test_no_content_yields_empty_body(self, test_credentials: Session) -> None:
+        """A 204 streams no bytes; JSON readers see app_request's result."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(204)
+
+        client = _client(test_credentials, handler)
+        with client:
+            with client._app_stream("/me") as chunks:
+                assert list(chunks) == []
+            assert client.me() == {"status": "ok"}
+            assert list(client.iter_bookmarks_v2()) == []
@@ -0,0 +1,103 @@
+"""Unit tests for chunk-level JSONL splitting and decoding."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from mixpanel_headless._internal import jsonl
+from mixpanel_headless._internal.jsonl import (
+    LineSplitter,
+    iter_lines,
+    iter_records,
+    loads,
+)
+
+
+class TestLineSplitter:
+    """Tests for LineSplitter and iter_lines()."""
+
+    def test_lines_split_across_chunks(self) -> None:
+        """A line broken over several chunks should be reassembled."""
+        chunks = [b'{"a":', b" 1}\n{", b'"b": 2', b"}\n"]
+
+        assert list(iter_lines(chunks)) == [b'{"a": 1}', b'{"b": 2}']
+
+    def test_many_lines_in_one_chunk(self) -> None:
+        """Every line completed by a single chunk should be returned at once."""
+        splitter = LineSplitter()
+
+        assert splitter.feed(b"1\n2\n3\n4") == [b"1", b"2", b"3"]
+        assert splitter.flush() == [b"4"]
+
+    def test_blank_lines_skipped(self) -> None:
+        """Empty and whitespace-only lines should not be yielded."""
+        chunks = [b"\n1\n\n  \n", b"\r\n2\n"]
+
+        assert list(iter_lines(chunks)) == [b"1", b"2"]
+
+    def test_crlf_terminator_kept_for_decoder(self) -> None:
+        """A trailing carriage return should survive and still decode."""
+        (line,) = iter_lines([b'{"a": 1}\r\n'])
+
+        assert loads(line) == {"a": 1}
+
+    def test_flush_resets_state(self) -> None:
+        """flush() should leave the splitter empty for reuse."""
+        splitter = LineSplitter()
+        splitter.feed(b"partial")
+
+        assert splitter.flush() == [b"partial"]
+        assert splitter.flush() == []
+
+
+class TestLoads:
+    """Tests for backend-independent loads()."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (b'{"n": 9007199254740993}', {"n": 9007199254740993}),
+            (b'{"s": "caf\xc3\xa9"}', {"s": "café"}),
+            (b'{"s": "\xff"}', {"s": "�"}),
+        ],
+    )
+    def test_matches_stdlib(self, raw: bytes, expected: dict[str, object]) -> None:
+        """Results should not depend on which backend is installed."""
+        assert loads(raw) == expected
+
+    def test_nan_accepted(self) -> None:
+        """Non-standard NaN tokens should fall back to the stdlib parser."""
+        value = loads(b'{"x": NaN}')["x"]
+
+        assert value != value
+
+    def test_invalid_json_raises(self) -> None:
+        """Lines no backend can parse should raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"broken":')
+
+    def test_stdlib_only_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without a fast backend, loads() should use the stdlib directly."""
+        monkeypatch.setattr(jsonl, "_fast_loads", jsonl._stdlib_loads)
+        monkeypatch.setattr(jsonl, "_fast_errors", (json.JSONDecodeError,))
+
+        assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"nope")
+
+
+class TestIterRecords:
+    """Tests for iter_records()."""
+
+    def test_malformed_lines_skipped_and_logged(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Invalid lines should be logged and skipped without stopping."""
+        with caplog.at_level(logging.WARNING):
+            records = list(iter_records([b'{"a": 1}', b"{oops", b'{"a": 2}']))
+
+        assert records == [{"a": 1}, {"a": 2}]
+        assert "Skipping malformed line: {oops" in caplog.text
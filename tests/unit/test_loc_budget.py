@@ -25,10 +25,11 @@ cohorts / flags / experiments / alerts / data governance) that have
 nothing to do with auth. The original spec budget assumed an
 api_client split that didn't happen and is out of scope here.
 
-Current ballpark after the 043 rescue: 20 files / ~8,200 LoC.
-Re-run ``wc -l`` against ``_auth_subsystem_files()`` to get a fresh
-number; the budgets below carry ~7% headroom so a single cleanup
-PR doesn't trip the test, but a substantial bloat does.
+Current ballpark after the browser-token cache and refresh lock:
+20 files / ~8,950 LoC. Re-run ``wc -l`` against
+``_auth_subsystem_files()`` to get a fresh number; the LoC budget below
+carries ~100 lines (~1%) of headroom, so small fixes fit but any real
+feature work has to justify a new ceiling.
 """
 
 from __future__ import annotations
@@ -66,10 +67,10 @@ class TestLocBudget:
     FILE_COUNT_CAP = 20
     """Maximum number of auth-subsystem files. A 21st file fails this test."""
 
-    LOC_CAP = 8900
-    """Maximum total LoC across the auth subsystem (~7% headroom over current).
+    LOC_CAP = 9050
+    """Maximum total LoC across the auth subsystem (~1% headroom over current).
 
-    Bumped 6500 → 6700 → 8800 → 8900 by SEC-331 follow-up:
+    Bumped 6500 → 6700 → 8800 → 8900 by SEC-331 follow-up, then 9050:
     - 6500 → 6700 covered the two new files
       (``_internal/auth/region_probe.py``, ``_internal/auth/naming.py``)
       plus the relaxations in ``cli/commands/account.py`` /
@@ -82,6 +83,9 @@ class TestLocBudget:
       size cap checks in ``_enforce_credential_file_invariants``,
       ``_fchmod_no_follow`` in ``storage.py``, and the
       ``reject_if_symlink`` wires at the five call sites.
+    - 8900 → 9050 covers ``token_resolver.py``'s in-memory token cache
+      (lstat fingerprint) and single-flight refresh. The lock primitive
+      itself lives in ``_internal/io_utils.py``, outside this scope.
     See ``specs/043-frictionless-auth/plan.md`` §"Scale/Scope".
     """
 
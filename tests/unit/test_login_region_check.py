@@ -65,7 +65,7 @@ def _stub_me_with_eu_project(monkeypatch: pytest.MonkeyPatch) -> None:
     """Patch ``MixpanelAPIClient.me`` to return one EU-domain project."""
     from mixpanel_headless._internal import api_client as api_client_mod
 
-    def _fake_me(self: object) -> dict[str, object]:
+    def _fake_me(self: object, **_kwargs: object) -> dict[str, object]:
         return {
             "user_id": 7,
             "user_email": "alice@example.com",
@@ -146,7 +146,7 @@ class TestLoginRegionMismatch:
         accounts_ns.add("personal", type="oauth_browser", region="eu")
         _stub_pkce_flow(monkeypatch)
 
-        def _fake_me(self: object) -> dict[str, object]:
+        def _fake_me(self: object, **_kwargs: object) -> dict[str, object]:
             return {
                 "user_id": 7,
                 "user_email": "alice@example.com",
@@ -178,7 +178,7 @@ class TestLoginRegionMismatch:
         accounts_ns.add("personal", type="oauth_browser", region="us")
         _stub_pkce_flow(monkeypatch)
 
-        def _fake_me(self: object) -> dict[str, object]:
+        def _fake_me(self: object, **_kwargs: object) -> dict[str, object]:
             return {
                 "user_id": 7,
                 "user_email": "alice@example.com",
@@ -0,0 +1,153 @@
+"""Unit tests for streaming lookup table downloads."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.lookup_download import ChunkReader, iter_csv_rows
+from mixpanel_headless.exceptions import MixpanelHeadlessError, QueryError
+from mixpanel_headless.workspace import Workspace
+from tests.conftest import make_session
+
+CSV = "product_id,name\n" + "".join(f"{i},item {i}\n" for i in range(1000))
+
+
+def _stream(data: bytes, size: int = 97) -> Iterator[bytes]:
+    """Yield ``data`` in ``size``-byte pieces."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def _workspace(handler: object) -> Workspace:
+    """Workspace whose client is backed by a mock transport."""
+    session = make_session(project_id="12345", region="us", oauth_token="tok")
+    client = MixpanelAPIClient(
+        session=session,
+        _transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+    return Workspace(session=session, _api_client=client)
+
+
+def _csv_handler(request: httpx.Request) -> httpx.Response:
+    """Serve the lookup table CSV as a streamed body."""
+    assert request.url.params["data-group-id"] == "7"
+    return httpx.Response(200, stream=httpx.ByteStream(CSV.encode()))
+
+
+class TestChunkReader:
+    """Tests for the chunk iterator file adapter."""
+
+    def test_reads_across_chunks(self) -> None:
+        """Reads of any size reassemble the original bytes."""
+        data = CSV.encode()
+        reader = io.BufferedReader(ChunkReader(_stream(data)), buffer_size=64)
+
+        assert reader.read(10) + reader.read() == data
+
+    def test_iter_csv_rows(self) -> None:
+        """Quoted fields, split UTF-8 sequences and a BOM are handled."""
+        raw = '\ufeffid,name\n1,"a,b"\n2,é\n'.encode()
+
+        rows = list(iter_csv_rows(_stream(raw, 1)))
+
+        assert rows == [{"id": "1", "name": "a,b"}, {"id": "2", "name": "é"}]
+
+
+class TestWorkspaceLookupDownload:
+    """Tests for the Workspace streaming download methods."""
+
+    def test_to_path(self, tmp_path: Path) -> None:
+        """A path destination receives the whole table, with no .part left."""
+        target = tmp_path / "table.csv"
+
+        written = _workspace(_csv_handler).download_lookup_table_to_file(7, target)
+
+        assert target.read_text() == CSV
+        assert written == len(CSV)
+        assert not (tmp_path / "table.csv.part").exists()
+
+    def test_to_file_object(self) -> None:
+        """A file object destination is written in place."""
+        buffer = io.BytesIO()
+
+        _workspace(_csv_handler).download_lookup_table_to_file(7, buffer)
+
+        assert buffer.getvalue() == CSV.encode()
+
+    def test_failed_write_closes_stream(self) -> None:
+        """A write error on a file object closes the response promptly."""
+        closed: list[bool] = []
+
+        class Tracking(httpx.SyncByteStream):
+            def __iter__(self) -> Iterator[bytes]:
+                yield from _stream(CSV.encode())
+
+            def close(self) -> None:
+                closed.append(True)
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=Tracking())
+
+        class Full(io.BytesIO):
+            def write(self, _data: object) -> int:
+                raise OSError("disk full")
+
+        try:
+            _workspace(handler).download_lookup_table_to_file(7, Full())
+        except OSError:
+            # Checked while the traceback still references the frame, so
+            # garbage collection cannot have closed the stream instead.
+            assert closed
+        else:
+            pytest.fail("expected OSError")
+
+    def test_failed_download_leaves_no_file(self, tmp_path: Path) -> None:
+        """An error response leaves neither the target nor a partial file."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"error": "Lookup table not found"})
+
+        target = tmp_path / "table.csv"
+        with pytest.raises(QueryError):
+            _workspace(handler).download_lookup_table_to_file(7, target)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_dropped_stream_raises(self, tmp_path: Path) -> None:
+        """A connection lost mid-body raises and removes the partial file."""
+
+        class Dropping(httpx.SyncByteStream):
+            def __iter__(self) -> Iterator[bytes]:
+                yield CSV.encode()[:100]
+                raise httpx.ReadError("connection reset")
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=Dropping())
+
+        with pytest.raises(MixpanelHeadlessError):
+            _workspace(handler).download_lookup_table_to_file(7, tmp_path / "table.csv")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_iter_rows(self) -> None:
+        """Rows are yielded as dicts keyed by the header."""
+        rows = _workspace(_csv_handler).iter_lookup_table_rows(7)
+
+        assert next(rows) == {"product_id": "0", "name": "item 0"}
+        assert sum(1 for _ in rows) == 999
+
+    def test_arrow(self) -> None:
+        """download_lookup_table_arrow parses the stream into a Table."""
+        pytest.importorskip("pyarrow")
+
+        table = _workspace(_csv_handler).download_lookup_table_arrow(7)
+
+        assert table.num_rows == 1000
+        assert table.column_names == ["product_id", "name"]
+        assert table["product_id"].to_pylist()[:3] == [0, 1, 2]
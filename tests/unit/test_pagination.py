@@ -7,6 +7,7 @@ Tests for paginate_all() function that iterates through paginated App API respon
 from __future__ import annotations
 
 import itertools
+import threading
 from collections.abc import Callable
 from unittest.mock import patch
 
@@ -502,3 +503,110 @@ class TestPaginateAllRobustness:
         client = create_mock_client(oauth_credentials, handler)
         with client, pytest.raises(AuthenticationError):
             list(paginate_all(client, "/projects/12345/items"))
+
+
+# =============================================================================
+# Prefetch
+# =============================================================================
+
+
+def _paged_handler(
+    pages: int, fetched: list[str | None], gate: threading.Event | None = None
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Build a handler serving ``pages`` one-item pages with cursors ``c1..``.
+
+    Args:
+        pages: Number of pages to serve.
+        fetched: Receives the cursor of every request, in order.
+        gate: If given, requests after the first block until it is set.
+
+    Returns:
+        Mock HTTP handler function.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        fetched.append(cursor)
+        n = int(cursor[1:]) if cursor else 0
+        if gate is not None and n > 0:
+            gate.wait(timeout=5)
+        next_cursor = f"c{n + 1}" if n + 1 < pages else None
+        return httpx.Response(
+            200,
+            json={
+                "status": "ok",
+                "results": [{"id": n}],
+                "pagination": {"page_size": 1, "next_cursor": next_cursor},
+            },
+        )
+
+    return handler
+
+
+class TestPaginateAllPrefetch:
+    """Test paginate_all() background page prefetching."""
+
+    def test_prefetch_yields_same_items_in_order(
+        self, oauth_credentials: Session
+    ) -> None:
+        """Prefetching should not change what is yielded or its order."""
+        fetched: list[str | None] = []
+        client = create_mock_client(oauth_credentials, _paged_handler(5, fetched))
+
+        with client:
+            items = list(paginate_all(client, "/projects/12345/items", prefetch=2))
+
+        assert items == [{"id": n} for n in range(5)]
+        assert fetched == [None, "c1", "c2", "c3", "c4"]
+
+    def test_next_page_is_fetched_while_consuming(
+        self, oauth_credentials: Session
+    ) -> None:
+        """The second page should be requested before the caller asks for it."""
+        fetched: list[str | None] = []
+        gate = threading.Event()
+        client = create_mock_client(oauth_credentials, _paged_handler(3, fetched, gate))
+
+        with client:
+            items = paginate_all(client, "/projects/12345/items", prefetch=1)
+            assert next(items) == {"id": 0}
+            for _ in range(100):
+                if "c1" in fetched:
+                    break
+                threading.Event().wait(0.01)
+            assert "c1" in fetched
+            gate.set()
+            assert list(items) == [{"id": 1}, {"id": 2}]
+
+    def test_closing_early_stops_fetching(self, oauth_credentials: Session) -> None:
+        """Abandoning the iterator should not fetch every remaining page."""
+        fetched: list[str | None] = []
+        client = create_mock_client(oauth_credentials, _paged_handler(50, fetched))
+
+        with client:
+            items = paginate_all(client, "/projects/12345/items", prefetch=1)
+            assert next(items) == {"id": 0}
+            items.close()
+
+        assert len(fetched) < 50
+
+    def test_errors_propagate(self, oauth_credentials: Session) -> None:
+        """An error on a prefetched page should reach the caller."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("cursor"):
+                return httpx.Response(401, json={"error": "unauthorized"})
+            return httpx.Response(
+                200,
+                json={"results": [{"id": 0}], "pagination": {"next_cursor": "c1"}},
+            )
+
+        client = create_mock_client(oauth_credentials, handler)
+        with client, pytest.raises(AuthenticationError):
+            list(paginate_all(client, "/projects/12345/items", prefetch=2))
+
+    def test_negative_prefetch_rejected(self, oauth_credentials: Session) -> None:
+        """A negative prefetch depth should raise ValueError."""
+        client = create_mock_client(oauth_credentials, _paged_handler(1, []))
+        with client, pytest.raises(ValueError):
+            list(paginate_all(client, "/projects/12345/items", prefetch=-1))
@@ -0,0 +1,306 @@
+"""Unit tests for Arrow batch building and partitioned Parquet export."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient  # noqa: E402
+from mixpanel_headless._internal.arrow import (  # noqa: E402
+    EventBatchBuilder,
+    ProfileBatchBuilder,
+    conform_batch,
+    iter_batches,
+    widen_schema,
+)
+from mixpanel_headless._internal.auth.session import Session  # noqa: E402
+from mixpanel_headless._internal.parquet_export import (  # noqa: E402
+    REPLACED_SUFFIX,
+    STAGING_DIR,
+    export_events_to_parquet,
+)
+from tests.conftest import make_session  # noqa: E402
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _event(name: str, n: int, **properties: Any) -> dict[str, Any]:
+    """Build a raw export event."""
+    return {
+        "event": name,
+        "properties": {
+            "time": 1704067200 + n,
+            "distinct_id": f"user-{n}",
+            "$insert_id": f"id-{n}",
+            **properties,
+        },
+    }
+
+
+def _client(
+    session: Session, days: dict[str, list[dict[str, Any]]]
+) -> MixpanelAPIClient:
+    """Build a client whose export endpoint serves ``days[from_date]``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        events = days.get(request.url.params["from_date"], [])
+        body = "".join(json.dumps(e) + "\n" for e in events)
+        return httpx.Response(200, content=body.encode())
+
+    return MixpanelAPIClient(session=session, _transport=httpx.MockTransport(handler))
+
+
+def _export(
+    session: Session,
+    days: dict[str, list[dict[str, Any]]],
+    path: Path,
+    **kwargs: Any,
+) -> Any:
+    """Run a Parquet export over the days in ``days``."""
+    dates = sorted(days)
+    with _client(session, days) as client:
+        return export_events_to_parquet(
+            client, path, from_date=dates[0], to_date=dates[-1], **kwargs
+        )
+
+
+class TestEventBatchBuilder:
+    """Tests for EventBatchBuilder."""
+
+    def test_fixed_columns_and_types(self) -> None:
+        """Fixed columns should lead with the documented Arrow types."""
+        builder = EventBatchBuilder()
+        builder.append(_event("Sign Up", 0, plan="pro", seats=3))
+
+        batch = builder.build()
+
+        assert batch.schema.names[:4] == [
+            "event_name",
+            "event_time",
+            "distinct_id",
+            "insert_id",
+        ]
+        assert batch.schema.field("event_time").type == pa.timestamp("us", tz="UTC")
+        assert batch.column("event_time")[0].value == 1704067200 * 1_000_000
+        assert batch.schema.field("seats").type == pa.int64()
+        assert batch.to_pylist()[0]["plan"] == "pro"
+
+    def test_mixed_types_widen(self) -> None:
+        """Int+float should widen to float64 and number+string to string."""
+        builder = EventBatchBuilder()
+        builder.append(_event("E", 0, a=1, b=1))
+        builder.append(_event("E", 1, a=2.5, b="x"))
+
+        batch = builder.build()
+
+        assert batch.schema.field("a").type == pa.float64()
+        assert batch.schema.field("b").type == pa.string()
+        assert batch.column("b").to_pylist() == ["1", "x"]
+
+    def test_sparse_and_nested_properties(self) -> None:
+        """Absent properties are null; objects and lists become JSON text."""
+        builder = EventBatchBuilder()
+        builder.append(_event("E", 0, tags=["a", "b"]))
+        builder.append(_event("E", 1))
+
+        batch = builder.build()
+
+        assert batch.column("tags").to_pylist() == ['["a","b"]', None]
+
+    def test_colliding_property_renamed(self) -> None:
+        """A property named like a fixed column should not overwrite it."""
+        builder = EventBatchBuilder()
+        builder.append(_event("E", 0, event_name="shadow"))
+
+        row = builder.build().to_pylist()[0]
+
+        assert row["event_name"] == "E"
+        assert row["properties.event_name"] == "shadow"
+
+    def test_build_resets(self) -> None:
+        """build() should leave the builder empty."""
+        builder = EventBatchBuilder()
+        builder.append(_event("E", 0, a=1))
+        builder.build()
+
+        assert len(builder) == 0
+        assert builder.build().num_rows == 0
+
+
+class TestSchemaReconciliation:
+    """Tests for conform_batch() and widen_schema()."""
+
+    def test_conform_fills_and_casts(self) -> None:
+        """Missing columns become nulls and narrower types are cast up."""
+        schema = pa.schema([("a", pa.float64()), ("b", pa.string())])
+        batch = pa.RecordBatch.from_pydict({"a": pa.array([1], pa.int64())})
+
+        conformed = conform_batch(batch, schema)
+
+        assert conformed is not None
+        assert conformed.to_pylist() == [{"a": 1.0, "b": None}]
+
+    def test_conform_rejects_wider_batch(self) -> None:
+        """New columns or wider types cannot be conformed."""
+        schema = pa.schema([("a", pa.int64())])
+
+        assert conform_batch(pa.RecordBatch.from_pydict({"a": [1.5]}), schema) is None
+        assert (
+            conform_batch(pa.RecordBatch.from_pydict({"a": [1], "b": [2]}), schema)
+            is None
+        )
+
+    def test_widen_schema(self) -> None:
+        """Widening keeps column order and appends new columns."""
+        merged = widen_schema(
+            pa.schema([("a", pa.int64()), ("b", pa.bool_())]),
+            pa.schema([("b", pa.int64()), ("c", pa.string()), ("a", pa.float64())]),
+        )
+
+        assert merged == pa.schema(
+            [("a", pa.float64()), ("b", pa.string()), ("c", pa.string())]
+        )
+
+
+class TestExportEventsToParquet:
+    """Tests for export_events_to_parquet()."""
+
+    def test_hive_layout_round_trips(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Rows should land under event_date/event_name and read back intact."""
+        days = {
+            "2024-01-01": [_event("Sign Up", 0, plan="pro"), _event("Log/In", 1)],
+            "2024-01-02": [_event("Sign Up", 2, plan="free")],
+        }
+
+        result = _export(test_credentials, days, tmp_path)
+
+        assert result.rows == 3
+        assert result.days_written == 2
+        assert (tmp_path / "event_date=2024-01-01" / "event_name=Log%2FIn").is_dir()
+        assert not (tmp_path / "_staging").exists()
+        table = ds.dataset(tmp_path, partitioning="hive").to_table()
+        rows = sorted(table.to_pylist(), key=lambda r: r["distinct_id"])
+        assert [(r["event_name"], str(r["event_date"])) for r in rows] == [
+            ("Sign Up", "2024-01-01"),
+            ("Log/In", "2024-01-01"),
+            ("Sign Up", "2024-01-02"),
+        ]
+
+    def test_type_drift_rolls_to_widened_file(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """A widened row group should start a new part file with a wider schema."""
+        days = {"2024-01-01": [_event("E", 0, v=1), _event("E", 1, v=1.5, w="x")]}
+
+        result = _export(test_credentials, days, tmp_path, row_group_size=1)
+
+        part_dir = tmp_path / "event_date=2024-01-01" / "event_name=E"
+        files = sorted(part_dir.iterdir())
+        assert [f.name for f in files] == ["part-00000.parquet", "part-00001.parquet"]
+        assert pq.read_schema(files[0]).field("v").type == pa.int64()
+        assert pq.read_schema(files[1]).field("v").type == pa.float64()
+        assert result.columns["v"] == "double"
+        common = pq.read_schema(tmp_path / "_common_metadata")
+        assert common.field("w").type == pa.string()
+
+    def test_narrower_row_groups_share_a_file(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Row groups that fit the file schema should not start new files."""
+        days = {"2024-01-01": [_event("E", 0, v=1.5, w="x"), _event("E", 1, v=2)]}
+
+        result = _export(test_credentials, days, tmp_path, row_group_size=1)
+
+        assert len(result.files) == 1
+        assert pq.ParquetFile(result.files[0]).num_row_groups == 2
+
+    def test_buffer_cap_flushes_largest_partition(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Hitting max_buffered_rows should write a row group early."""
+        days = {
+            "2024-01-01": [_event("A", n) for n in range(3)] + [_event("B", 3)],
+        }
+
+        result = _export(
+            test_credentials, days, tmp_path, row_group_size=100, max_buffered_rows=4
+        )
+
+        a_file = next(f for f in result.files if "event_name=A" in str(f))
+        assert pq.ParquetFile(a_file).num_row_groups == 1
+        assert result.rows == 4
+
+    def test_rerun_replaces_day(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """Exporting a day again should replace, not duplicate, its rows."""
+        days = {"2024-01-01": [_event("E", 0), _event("E", 1)]}
+        _export(test_credentials, days, tmp_path)
+        days = {"2024-01-01": [_event("E", 0)]}
+
+        _export(test_credentials, days, tmp_path)
+
+        assert ds.dataset(tmp_path, partitioning="hive").count_rows() == 1
+
+    def test_interrupted_replace_is_recovered(
+        self, test_credentials: Session, tmp_path: Path
+    ) -> None:
+        """A day parked aside by a crashed replace is restored on the next run."""
+        days = {"2024-01-01": [_event("E", 0), _event("E", 1)]}
+        _export(test_credentials, days, tmp_path)
+        published = tmp_path / "event_date=2024-01-01"
+        parked = tmp_path / STAGING_DIR / f"{published.name}{REPLACED_SUFFIX}"
+        parked.parent.mkdir()
+        published.rename(parked)
+
+        _export(test_credentials, {"2024-01-02": [_event("E", 2)]}, tmp_path)
+
+        assert ds.dataset(tmp_path, partitioning="hive").count_rows() == 3
+        assert not (tmp_path / STAGING_DIR).exists()
+
+
+class TestProfileBatches:
+    """Tests for ProfileBatchBuilder and iter_batches()."""
+
+    def test_profile_columns(self) -> None:
+        """Profiles should map to distinct_id, last_seen and properties."""
+        builder = ProfileBatchBuilder()
+        builder.append(
+            {
+                "$distinct_id": 42,
+                "$properties": {"$last_seen": "2024-01-15T10:30:00", "n": 1},
+            }
+        )
+
+        assert builder.build().to_pylist() == [
+            {"distinct_id": "42", "last_seen": "2024-01-15T10:30:00", "n": 1}
+        ]
+
+    def test_iter_batches_sizes(self) -> None:
+        """iter_batches() should cut full batches and emit the remainder."""
+        events = [_event("E", n) for n in range(5)]
+
+        sizes = [
+            b.num_rows for b in iter_batches(events, EventBatchBuilder(), batch_size=3)
+        ]
+
+        assert sizes == [3, 2]
@@ -0,0 +1,347 @@
+"""Unit tests for the on-disk query result cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from mixpanel_headless import QueryCacheConfig, Workspace
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.query_cache import (
+    QueryCache,
+    project_now,
+    resolve_relative_ranges,
+)
+from mixpanel_headless._internal.services.live_query import LiveQueryService
+from mixpanel_headless.exceptions import QueryError
+from tests.conftest import make_session
+
+_NOW = datetime(2024, 3, 15, 10, 30)
+
+_INSIGHTS_RESPONSE: dict[str, Any] = {
+    "computed_at": "2024-03-15T10:30:00",
+    "date_range": {"from_date": "2024-03-09", "to_date": "2024-03-15"},
+    "headers": ["$event"],
+    "series": {"Login [Total]": {"2024-03-15": 7}},
+    "meta": {"sampling_factor": 1.0},
+}
+
+
+def _last(days: int) -> dict[str, Any]:
+    """Bookmark params with a relative ``in the last`` time section."""
+    return {
+        "sections": {
+            "time": [
+                {
+                    "dateRangeType": "in the last",
+                    "unit": "day",
+                    "window": {"unit": "day", "value": days},
+                }
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> QueryCache:
+    """Query cache rooted in a temporary directory."""
+    return QueryCache(QueryCacheConfig(directory=tmp_path / "queries"))
+
+
+@pytest.fixture
+def counting_service(
+    mock_client_factory: Callable[
+        [Callable[[httpx.Request], httpx.Response]], MixpanelAPIClient
+    ],
+    cache: QueryCache,
+) -> tuple[LiveQueryService, list[httpx.Request]]:
+    """LiveQueryService with a cache, recording every request sent."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/segmentation"):
+            return httpx.Response(
+                200, json={"data": {"values": {"Login": {"2024-01-01": 3}}}}
+            )
+        return httpx.Response(200, json=_INSIGHTS_RESPONSE)
+
+    return LiveQueryService(mock_client_factory(handler), cache=cache), requests
+
+
+class TestResolveRelativeRanges:
+    """Tests for resolve_relative_ranges()."""
+
+    def test_day_window_becomes_between(self) -> None:
+        """``last=7`` should resolve to the seven days ending today."""
+        resolved = resolve_relative_ranges(_last(7), _NOW)
+
+        assert resolved["sections"]["time"] == [
+            {
+                "dateRangeType": "between",
+                "unit": "day",
+                "value": ["2024-03-09", "2024-03-15"],
+            }
+        ]
+
+    def test_hour_and_month_windows(self) -> None:
+        """Hour windows keep hour precision; month windows use calendar months."""
+        hours = {"dateRangeType": "in the last", "window": {"unit": "hour", "value": 3}}
+        months = {
+            "dateRangeType": "in the last",
+            "window": {"unit": "month", "value": 1},
+        }
+
+        assert resolve_relative_ranges(hours, _NOW)["value"] == [
+            "2024-03-15T08",
+            "2024-03-15T10",
+        ]
+        assert resolve_relative_ranges(months, _NOW)["value"] == [
+            "2024-02-16",
+            "2024-03-15",
+        ]
+
+    def test_absolute_params_unchanged(self) -> None:
+        """Params without relative ranges should come back equal."""
+        params = {"time": [{"dateRangeType": "between", "value": ["a", "b"]}]}
+
+        assert resolve_relative_ranges(params, _NOW) == params
+
+
+class TestQueryCacheKey:
+    """Tests for QueryCache.key()."""
+
+    def test_relative_and_equivalent_absolute_share_key(
+        self, cache: QueryCache
+    ) -> None:
+        """``last=7`` should key like the explicit dates it resolves to."""
+        absolute = {
+            "sections": {
+                "time": [
+                    {
+                        "dateRangeType": "between",
+                        "unit": "day",
+                        "value": ["2024-03-09", "2024-03-15"],
+                    }
+                ]
+            }
+        }
+
+        assert cache.key("query", {}, _last(7), now=_NOW) == cache.key(
+            "query", {}, absolute, now=_NOW
+        )
+
+    def test_key_changes_with_day_and_scope(self, cache: QueryCache) -> None:
+        """A new day or a different workspace should miss."""
+        base = cache.key("query", {"workspace_id": 1}, _last(7), now=_NOW)
+
+        tomorrow = datetime(2024, 3, 16, 10, 30)
+        assert cache.key("query", {"workspace_id": 1}, _last(7), now=tomorrow) != base
+        assert cache.key("query", {"workspace_id": 2}, _last(7), now=_NOW) != base
+
+    def test_key_ignores_dict_order(self, cache: QueryCache) -> None:
+        """Canonical JSON should make key order irrelevant."""
+        assert cache.key("query", {}, {"a": 1, "b": 2}, now=_NOW) == cache.key(
+            "query", {}, {"b": 2, "a": 1}, now=_NOW
+        )
+
+
+class TestProjectNow:
+    """Tests for project_now()."""
+
+    def test_uses_project_timezone(self) -> None:
+        """Zones 26 hours apart should report different wall clocks."""
+        east = project_now("Pacific/Kiritimati")
+        west = project_now("Etc/GMT+12")
+
+        assert abs((east - west) - timedelta(hours=26)) < timedelta(minutes=1)
+
+    def test_unknown_timezone_falls_back_to_utc(self) -> None:
+        """Missing or unknown zones use UTC rather than the machine's zone."""
+        utc = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        for name in (None, "Not/AZone"):
+            assert abs(project_now(name) - utc) < timedelta(minutes=1)
+
+
+class TestQueryCacheStorage:
+    """Tests for QueryCache.get()/put() and eviction."""
+
+    def test_round_trip_and_permissions(self, cache: QueryCache) -> None:
+        """A stored response should read back from a 0o600 file."""
+        cache.put("query", "k", {"series": {}})
+
+        assert cache.get("query", "k") == {"series": {}}
+        assert os.stat(cache.directory / "k.json").st_mode & 0o777 == 0o600
+
+    def test_expired_entry_misses(self, tmp_path: Path) -> None:
+        """Entries older than the type's TTL should be dropped."""
+        cache = QueryCache(
+            QueryCacheConfig(directory=tmp_path, ttl_seconds={"retention": 60})
+        )
+        cache.put("retention", "k", {"series": {}})
+        path = tmp_path / "k.json"
+        data = json.loads(path.read_text())
+        data["cached_at"] -= 61
+        path.write_text(json.dumps(data))
+
+        assert cache.get("retention", "k") is None
+        assert not path.exists()
+
+    def test_zero_ttl_disables_type(self, tmp_path: Path) -> None:
+        """A TTL of zero should neither store nor serve that type."""
+        cache = QueryCache(
+            QueryCacheConfig(directory=tmp_path, ttl_seconds={"funnel": 0})
+        )
+
+        cache.put("funnel", "k", {"series": {}})
+
+        assert not cache.enabled("funnel")
+        assert cache.get("funnel", "k") is None
+        assert not any(tmp_path.iterdir())
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Past max_bytes, the least recently used entry should go first."""
+        payload = {"series": {"x": "y" * 100}}
+        cache = QueryCache(QueryCacheConfig(directory=tmp_path, max_bytes=400))
+        cache.put("query", "a", payload)
+        cache.put("query", "b", payload)
+        os.utime(tmp_path / "a.json", (1, 1))
+        os.utime(tmp_path / "b.json", (2, 2))
+        cache.get("query", "a")  # touch: "b" is now least recently used
+
+        cache.put("query", "c", payload)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "c.json"]
+
+    def test_puts_under_limit_scan_once(self, cache: QueryCache) -> None:
+        """The directory is scanned on the first put, not on every put."""
+        with patch.object(cache, "_scan", wraps=cache._scan) as scan:
+            for key in "abcde":
+                cache.put("query", key, {"series": {}})
+
+        assert scan.call_count == 1
+
+    def test_corrupted_entry_misses(self, cache: QueryCache) -> None:
+        """Unreadable JSON should be treated as a miss and removed."""
+        cache.put("query", "k", {})
+        (cache.directory / "k.json").write_text("{not json")
+
+        assert cache.get("query", "k") is None
+
+    def test_config_validation(self) -> None:
+        """Unknown types, negative TTLs and non-positive sizes are rejected."""
+        with pytest.raises(ValueError, match="Unknown"):
+            QueryCacheConfig(ttl_seconds={"flows": 10})
+        with pytest.raises(ValueError, match="negative"):
+            QueryCacheConfig(ttl_seconds={"query": -1})
+        with pytest.raises(ValueError, match="max_bytes"):
+            QueryCacheConfig(max_bytes=0)
+
+
+class TestLiveQueryServiceCaching:
+    """Tests for LiveQueryService with a QueryCache."""
+
+    def test_query_second_call_hits(
+        self, counting_service: tuple[LiveQueryService, list[httpx.Request]]
+    ) -> None:
+        """An identical query should be served from the cache."""
+        service, requests = counting_service
+
+        first = service.query(_last(7), project_id=12345)
+        second = service.query(_last(7), project_id=12345)
+
+        assert len(requests) == 1
+        assert first.meta["cache_hit"] is False
+        assert second.meta["cache_hit"] is True
+        assert second.series == first.series
+        assert second.meta["sampling_factor"] == 1.0
+
+    @pytest.mark.filterwarnings("ignore:Funnel query returned data")
+    def test_types_and_projects_do_not_collide(
+        self, counting_service: tuple[LiveQueryService, list[httpx.Request]]
+    ) -> None:
+        """Different query types or projects should not share entries."""
+        service, requests = counting_service
+
+        service.query(_last(7), project_id=12345)
+        service.query(_last(7), project_id=999)
+        service.query_funnel(_last(7), project_id=12345)
+
+        assert len(requests) == 3
+
+    def test_segmentation_hits(
+        self, counting_service: tuple[LiveQueryService, list[httpx.Request]]
+    ) -> None:
+        """Segmentation results should carry cache_hit too."""
+        service, requests = counting_service
+
+        service.segmentation("Login", "2024-01-01", "2024-01-01")
+        result = service.segmentation("Login", "2024-01-01", "2024-01-01")
+
+        assert len(requests) == 1
+        assert result.meta == {"cache_hit": True}
+        assert result.total == 3
+
+    def test_error_response_not_cached(
+        self,
+        mock_client_factory: Callable[
+            [Callable[[httpx.Request], httpx.Response]], MixpanelAPIClient
+        ],
+        cache: QueryCache,
+    ) -> None:
+        """Responses the transform rejects should not be stored."""
+        client = mock_client_factory(
+            lambda _r: httpx.Response(200, json={"error": "boom"})
+        )
+        service = LiveQueryService(client, cache=cache)
+
+        with pytest.raises(QueryError):
+            service.query(_last(7), project_id=12345)
+
+        assert not cache.directory.exists() or not any(cache.directory.iterdir())
+
+    def test_without_cache_meta_untouched(
+        self,
+        mock_client_factory: Callable[
+            [Callable[[httpx.Request], httpx.Response]], MixpanelAPIClient
+        ],
+    ) -> None:
+        """Without a cache, results should not report cache_hit."""
+        client = mock_client_factory(
+            lambda _r: httpx.Response(200, json=_INSIGHTS_RESPONSE)
+        )
+
+        result = LiveQueryService(client).query(_last(7), project_id=12345)
+
+        assert "cache_hit" not in result.meta
+
+
+def test_workspace_wires_query_cache(tmp_path: Path) -> None:
+    """Workspace(query_cache=...) should route queries through the cache."""
+    client = MagicMock(spec=MixpanelAPIClient)
+    client.region = "us"
+    client.project_id = "12345"
+    client.workspace_id = None
+    client.insights_query.return_value = _INSIGHTS_RESPONSE
+    ws = Workspace(
+        session=make_session(project_id="12345"),
+        query_cache=QueryCacheConfig(directory=tmp_path),
+        _api_client=client,
+    )
+
+    ws.query("Login", last=7)
+    result = ws.query("Login", last=7)
+
+    assert client.insights_query.call_count == 1
+    assert result.meta["cache_hit"] is True
+    ws.clear_query_cache()
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,220 @@
+"""Unit tests for the client-side RateLimiter and its API client wiring."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mixpanel_headless import RateLimit
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.rate_limit import DEFAULT_RATE_LIMITS, RateLimiter
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+class TestRateLimitValidation:
+    """Tests for RateLimit field validation."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"requests_per_second": 0},
+            {"burst": 0},
+            {"max_concurrent": 0},
+        ],
+    )
+    def test_non_positive_values_rejected(self, kwargs: dict[str, float]) -> None:
+        """Zero or negative budgets should raise ValueError."""
+        with pytest.raises(ValueError):
+            RateLimit(**kwargs)  # type: ignore[arg-type]
+
+
+class TestRateLimiter:
+    """Tests for token bucket and concurrency behaviour."""
+
+    def test_overrides_merge_over_defaults(self) -> None:
+        """Configured families should replace defaults; others keep defaults."""
+        limiter = RateLimiter({"query": RateLimit(max_concurrent=1)})
+
+        assert limiter.limits["query"] == RateLimit(max_concurrent=1)
+        assert limiter.limits["export"] == DEFAULT_RATE_LIMITS["export"]
+
+    def test_concurrency_cap_is_enforced(self) -> None:
+        """No more than max_concurrent bodies should run at once."""
+        limiter = RateLimiter({"query": RateLimit(max_concurrent=2)})
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def work() -> None:
+            nonlocal active, peak
+            with limiter.acquire("query"):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            for future in [pool.submit(work) for _ in range(6)]:
+                future.result()
+
+        assert peak == 2
+
+    def test_token_bucket_spaces_requests(self) -> None:
+        """Requests beyond the burst should wait for tokens to refill."""
+        limiter = RateLimiter({"app": RateLimit(requests_per_second=20, burst=1)})
+
+        start = time.monotonic()
+        for _ in range(4):
+            with limiter.acquire("app"):
+                pass
+        elapsed = time.monotonic() - start
+
+        # First request is free; the next three wait ~50ms each.
+        assert elapsed >= 0.14
+
+    def test_penalize_blocks_family_only(self) -> None:
+        """A penalty should hold back its own family but not others."""
+        limiter = RateLimiter()
+        limiter.penalize("query", 0.1)
+
+        start = time.monotonic()
+        with limiter.acquire("app"):
+            pass
+        assert time.monotonic() - start < 0.05
+
+        with limiter.acquire("query"):
+            pass
+        assert time.monotonic() - start >= 0.09
+
+    def test_unknown_family_passes_through(self) -> None:
+        """None and unconfigured families should not be limited."""
+        limiter = RateLimiter()
+        with limiter.acquire(None), limiter.acquire("unknown"):
+            pass
+
+
+class TestClientIntegration:
+    """Tests for MixpanelAPIClient wiring."""
+
+    @pytest.mark.parametrize(
+        ("url", "family"),
+        [
+            ("https://mixpanel.com/api/query/insights", "query"),
+            ("https://data.mixpanel.com/api/2.0/export", "export"),
+            ("https://mixpanel.com/api/2.0/engage", "engage"),
+            ("https://mixpanel.com/api/app/me", "app"),
+            ("https://storage.googleapis.com/bucket/upload", None),
+        ],
+    )
+    def test_api_family_from_url(
+        self, test_credentials: Session, url: str, family: str | None
+    ) -> None:
+        """URLs should map to the longest matching ENDPOINTS family."""
+        client = MixpanelAPIClient(session=test_credentials)
+        assert client._api_family(url) == family
+
+    def test_parallel_queries_respect_cap(self, test_credentials: Session) -> None:
+        """Concurrent insights queries should never exceed the query cap."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return httpx.Response(200, json={"series": {}})
+
+        client = MixpanelAPIClient(
+            session=test_credentials,
+            rate_limits={"query": RateLimit(max_concurrent=2)},
+            _transport=httpx.MockTransport(handler),
+        )
+        with client, ThreadPoolExecutor(max_workers=8) as pool:
+            # Distinct bodies so single-flight coalescing does not merge them
+            futures = [
+                pool.submit(client.insights_query, {"bookmark": {"n": i}})
+                for i in range(8)
+            ]
+            for future in futures:
+                future.result()
+
+        assert peak == 2
+
+    def test_retry_after_penalizes_family(self, test_credentials: Session) -> None:
+        """A 429 with Retry-After should close the family for all callers."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(429, headers={"Retry-After": "1"})
+            return httpx.Response(200, json={"series": {}})
+
+        client = MixpanelAPIClient(
+            session=test_credentials, _transport=httpx.MockTransport(handler)
+        )
+        with client:
+            client.insights_query({})
+
+        bucket = client._rate_limiter._buckets["query"]
+        assert bucket.blocked_until > 0
+
+    def test_with_project_shares_limiter(self, test_credentials: Session) -> None:
+        """with_project() should draw on the parent's budget, not a copy."""
+        limits = {"query": RateLimit(max_concurrent=1)}
+        client = MixpanelAPIClient(session=test_credentials, rate_limits=limits)
+
+        other = client.with_project("999")
+
+        assert other._rate_limiter is client._rate_limiter
+        assert other._rate_limiter.limits["query"] == limits["query"]
+
+    def test_export_backoff_releases_slot(self, test_credentials: Session) -> None:
+        """A throttled export should not hold its concurrency slot while sleeping."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(429)
+            return httpx.Response(200, content=b'{"event": "E", "properties": {}}\n')
+
+        client = MixpanelAPIClient(
+            session=test_credentials, _transport=httpx.MockTransport(handler)
+        )
+        in_flight: list[int] = []
+
+        def sleep(_seconds: float) -> None:
+            in_flight.append(client._rate_limiter._buckets["export"].in_flight)
+
+        with client, patch.object(time, "sleep", side_effect=sleep):
+            events = list(client.export_events("2024-01-01", "2024-01-01"))
+
+        assert len(events) == 1
+        assert in_flight == [0]
@@ -0,0 +1,229 @@
+"""Unit tests for request metrics, event hooks and their API client wiring."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mixpanel_headless import ClientStats, FamilyStats, RequestEvent
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.metrics import ConnectionTrace, RequestMetrics
+from mixpanel_headless._internal.pagination import paginate_all
+from mixpanel_headless.types import LATENCY_BUCKETS
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _client(session: Session, handler: Any) -> MixpanelAPIClient:
+    """Client backed by a mock transport."""
+    return MixpanelAPIClient(session=session, _transport=httpx.MockTransport(handler))
+
+
+class TestConnectionTrace:
+    """Tests for connection reuse detection."""
+
+    def test_unknown_without_events(self) -> None:
+        """No trace events should leave reuse unknown."""
+        assert ConnectionTrace().reused is None
+
+    def test_new_connection(self) -> None:
+        """A connect event should mark the connection as new."""
+        trace = ConnectionTrace()
+        trace("connection.connect_tcp.started", {})
+        trace("http11.send_request_headers.started", {})
+        assert trace.reused is False
+
+    def test_reused_connection(self) -> None:
+        """Request events without a connect event mean a pooled connection."""
+        trace = ConnectionTrace()
+        trace("http11.send_request_headers.started", {})
+        assert trace.reused is True
+
+
+class TestStatsTypes:
+    """Tests for the public snapshot types."""
+
+    def test_latency_quantile(self) -> None:
+        """Quantiles should map to bucket upper bounds."""
+        histogram = [0] * len(LATENCY_BUCKETS)
+        histogram[LATENCY_BUCKETS.index(0.1)] = 9
+        histogram[LATENCY_BUCKETS.index(5.0)] = 1
+        stats = FamilyStats(requests=10, latency_histogram=tuple(histogram))
+
+        assert stats.latency_quantile(0.5) == 0.1
+        assert stats.latency_quantile(0.95) == 5.0
+        assert FamilyStats().latency_quantile(0.5) == 0.0
+        with pytest.raises(ValueError):
+            stats.latency_quantile(1.5)
+
+    def test_total_sums_families(self) -> None:
+        """ClientStats.total should add counters across families."""
+        stats = ClientStats(
+            families={
+                "query": FamilyStats(requests=2, latency_total=1.0),
+                "app": FamilyStats(requests=3, bytes_received=10),
+            }
+        )
+        assert stats.total.requests == 5
+        assert stats.total.bytes_received == 10
+        assert ClientStats().total == FamilyStats()
+
+
+class TestRequestMetrics:
+    """Tests for the RequestMetrics collector."""
+
+    def test_observe_and_retry(self) -> None:
+        """Responses, 429s, retries and backoff should be counted."""
+        metrics = RequestMetrics()
+        ok = httpx.Response(200, content=b"hello")
+        limited = httpx.Response(429)
+
+        metrics.observe("query", "GET", "https://x/q?a=1", ok, 0.2)
+        metrics.observe("query", "GET", "https://x/q", limited, 0.03)
+        metrics.retry("query", 1.5)
+        metrics.observe(None, "GET", "https://other", None, 0.01)
+
+        snap = metrics.snapshot()
+        query = snap.families["query"]
+        assert query.requests == 2
+        assert query.rate_limited == 1
+        assert query.errors == 1
+        assert query.retries == 1
+        assert query.backoff_seconds == 1.5
+        assert query.bytes_decoded == 5
+        assert sum(query.latency_histogram) == 2
+        assert snap.families["other"].errors == 1
+
+    def test_hooks_receive_events_and_failures_are_swallowed(self) -> None:
+        """Hooks should see each event; a failing hook must not propagate."""
+        metrics = RequestMetrics()
+        events: list[RequestEvent] = []
+
+        def broken(_event: RequestEvent) -> None:
+            raise RuntimeError("boom")
+
+        metrics.add_hook(broken)
+        metrics.add_hook(events.append)
+        metrics.observe("app", "GET", "https://x/me?a=1", httpx.Response(200), 0.1)
+        metrics.remove_hook(events.append)
+        metrics.observe("app", "GET", "https://x/me", httpx.Response(200), 0.1)
+
+        assert len(events) == 1
+        assert events[0].url == "https://x/me"
+        assert events[0].family == "app"
+
+    def test_reset_keeps_hooks(self) -> None:
+        """reset() should zero counters but keep hooks registered."""
+        metrics = RequestMetrics()
+        events: list[RequestEvent] = []
+        metrics.add_hook(events.append)
+        metrics.observe("app", "GET", "u", httpx.Response(200), 0.1)
+
+        metrics.reset()
+        metrics.observe("app", "GET", "u", httpx.Response(200), 0.1)
+
+        assert metrics.snapshot().families["app"].requests == 1
+        assert len(events) == 2
+
+
+class TestClientIntegration:
+    """Tests for MixpanelAPIClient wiring."""
+
+    def test_query_request_is_recorded(self, test_credentials: Session) -> None:
+        """A query request should appear under the query family."""
+        client = _client(
+            test_credentials, lambda _r: httpx.Response(200, json={"series": {}})
+        )
+        events: list[RequestEvent] = []
+        client.add_event_hook(events.append)
+
+        with client:
+            client.insights_query({"bookmark": {}})
+
+        query = client.stats().families["query"]
+        assert query.requests == 1
+        assert query.bytes_decoded > 0
+        assert events[0].method == "POST"
+        assert events[0].status_code == 200
+        assert events[0].url == "https://mixpanel.com/api/query/insights"
+
+    def test_429_retry_is_recorded(self, test_credentials: Session) -> None:
+        """A retried 429 should count as rate limited, retried and slept."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(429, headers={"Retry-After": "1"})
+            return httpx.Response(200, json={})
+
+        client = _client(test_credentials, handler)
+        with client, patch("mixpanel_headless._internal.api_client.time.sleep"):
+            client.app_request("GET", "/me")
+
+        app = client.stats().families["app"]
+        assert app.requests == 2
+        assert app.rate_limited == 1
+        assert app.retries == 1
+        assert app.backoff_seconds == 1.0
+
+    def test_export_stream_is_recorded(self, test_credentials: Session) -> None:
+        """Streamed exports should record decoded bytes once consumed."""
+        body = b"".join(
+            json.dumps({"event": "E", "properties": {"n": i}}).encode() + b"\n"
+            for i in range(3)
+        )
+        client = _client(test_credentials, lambda _r: httpx.Response(200, content=body))
+
+        with client:
+            events = list(client.export_events("2024-01-01", "2024-01-01"))
+
+        export = client.stats().families["export"]
+        assert len(events) == 3
+        assert export.requests == 1
+        assert export.bytes_decoded == len(body)
+
+    def test_paginate_all_is_recorded(self, test_credentials: Session) -> None:
+        """Each page fetched by paginate_all should count as an app request."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            cursor = request.url.params.get("cursor")
+            return httpx.Response(
+                200,
+                json={
+                    "results": [cursor or "first"],
+                    "pagination": {"next_cursor": None if cursor else "c2"},
+                },
+            )
+
+        client = _client(test_credentials, handler)
+        with client:
+            items = list(paginate_all(client, "/projects/12345/dashboards"))
+
+        assert items == ["first", "c2"]
+        assert client.stats().families["app"].requests == 2
+
+    def test_reset_stats(self, test_credentials: Session) -> None:
+        """reset_stats() should clear all families."""
+        client = _client(test_credentials, lambda _r: httpx.Response(200, json={}))
+        with client:
+            client.me()
+            client.reset_stats()
+
+        assert client.stats().families == {}
@@ -0,0 +1,298 @@
+"""Unit tests for transient-failure retries, retry budget and circuit breaker."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mixpanel_headless import CircuitOpenError, RetryPolicy
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.pagination import paginate_all
+from mixpanel_headless._internal.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    retry_delay,
+)
+from mixpanel_headless.exceptions import MixpanelHeadlessError, ServerError
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep() -> Iterator[None]:
+    """Skip backoff sleeps."""
+    with patch("mixpanel_headless._internal.api_client.time.sleep"):
+        yield
+
+
+def _flaky(failures: int, status: int = 503) -> tuple[list[str], object]:
+    """Handler failing ``failures`` times with ``status`` before succeeding."""
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) <= failures:
+            return httpx.Response(status, text="unavailable")
+        return httpx.Response(200, json={"results": {"ok": True}})
+
+    return calls, handler
+
+
+def _client(
+    session: Session, handler: object, retry: RetryPolicy | None = None
+) -> MixpanelAPIClient:
+    """Client backed by a mock transport."""
+    return MixpanelAPIClient(
+        session=session,
+        retry=retry,
+        _transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy validation and backoff."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_retries": -1},
+            {"budget_ratio": -0.1},
+            {"breaker_threshold": 0},
+            {"breaker_cooldown": -1},
+        ],
+    )
+    def test_invalid_values_rejected(self, kwargs: dict[str, float]) -> None:
+        """Out-of-range values should raise ValueError."""
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)  # type: ignore[arg-type]
+
+    def test_delay_is_capped(self) -> None:
+        """Backoff should never exceed backoff_max."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=2.0)
+        assert all(0 <= retry_delay(policy, 10) <= 2.0 for _ in range(50))
+
+
+class TestRetryBudget:
+    """Tests for the shared retry budget."""
+
+    def test_budget_exhausts_and_refills(self) -> None:
+        """Retries should stop at the minimum and resume as requests earn more."""
+        budget = RetryBudget(RetryPolicy(budget_ratio=0.5, budget_min=2))
+
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+
+class TestCircuitBreaker:
+    """Tests for the per-host breaker."""
+
+    URL = "https://mixpanel.com/api/query/events"
+
+    def test_opens_after_threshold_and_is_per_host(self) -> None:
+        """Consecutive failures should open only the failing host."""
+        breaker = CircuitBreaker(RetryPolicy(breaker_threshold=2))
+        for _ in range(2):
+            breaker.record(breaker.check(self.URL), ok=False)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.check(self.URL)
+        assert exc_info.value.host == "mixpanel.com"
+        assert breaker.check("https://data.mixpanel.com/api/2.0/export") == (
+            "data.mixpanel.com"
+        )
+
+    def test_success_resets_count(self) -> None:
+        """A success between failures should keep the breaker closed."""
+        breaker = CircuitBreaker(RetryPolicy(breaker_threshold=2))
+        breaker.record(breaker.check(self.URL), ok=False)
+        breaker.record(breaker.check(self.URL), ok=True)
+        breaker.record(breaker.check(self.URL), ok=False)
+
+        assert breaker.check(self.URL) == "mixpanel.com"
+
+    def test_half_open_allows_one_probe(self) -> None:
+        """After the cooldown one probe passes; its success closes the breaker."""
+        breaker = CircuitBreaker(RetryPolicy(breaker_threshold=1, breaker_cooldown=0))
+        breaker.record(breaker.check(self.URL), ok=False)
+
+        host = breaker.check(self.URL)
+        with pytest.raises(CircuitOpenError):
+            breaker.check(self.URL)
+        breaker.record(host, ok=True)
+
+        assert breaker.check(self.URL) == "mixpanel.com"
+
+    def test_failed_probe_reopens(self) -> None:
+        """A failing probe should open the breaker for another cooldown."""
+        breaker = CircuitBreaker(RetryPolicy(breaker_threshold=1, breaker_cooldown=60))
+        breaker.record(breaker.check(self.URL), ok=False)
+        state = breaker._hosts["mixpanel.com"]
+        state.opened_at = (state.opened_at or 0) - 61
+
+        breaker.record(breaker.check(self.URL), ok=False)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.check(self.URL)
+        assert exc_info.value.retry_after > 59
+
+    def test_disabled(self) -> None:
+        """breaker_threshold=None should never open."""
+        breaker = CircuitBreaker(RetryPolicy(breaker_threshold=None))
+        for _ in range(20):
+            breaker.record(breaker.check(self.URL), ok=False)
+        assert breaker.check(self.URL) == "mixpanel.com"
+
+
+class TestClientRetries:
+    """Tests for MixpanelAPIClient wiring."""
+
+    def test_get_retries_transient_status(self, test_credentials: Session) -> None:
+        """A GET answered with 503 should be retried until it succeeds."""
+        calls, handler = _flaky(2)
+        client = _client(test_credentials, handler)
+
+        with client:
+            assert client.app_request("GET", "/me") == {"ok": True}
+
+        assert len(calls) == 3
+        assert client.stats().families["app"].retries == 2
+
+    def test_500_is_not_retried(self, test_credentials: Session) -> None:
+        """Mixpanel's 500 query errors should surface immediately."""
+        calls, handler = _flaky(1, status=500)
+        client = _client(test_credentials, handler)
+
+        with client, pytest.raises(ServerError):
+            client.get_events()
+
+        assert len(calls) == 1
+
+    def test_retries_exhausted_raises_server_error(
+        self, test_credentials: Session
+    ) -> None:
+        """After max_retries the last 5xx should raise ServerError."""
+        calls, handler = _flaky(10)
+        client = _client(test_credentials, handler, RetryPolicy(max_retries=2))
+
+        with client, pytest.raises(ServerError) as exc_info:
+            client.get_events()
+
+        assert exc_info.value.status_code == 503
+        assert len(calls) == 3
+
+    def test_non_idempotent_post_is_not_retried(
+        self, test_credentials: Session
+    ) -> None:
+        """App API writes should fail on the first 5xx."""
+        calls, handler = _flaky(1)
+        client = _client(test_credentials, handler)
+
+        with client, pytest.raises(ServerError):
+            client.app_request(
+                "POST", "/projects/12345/dashboards", json_body={"title": "x"}
+            )
+
+        assert calls == ["POST"]
+
+    def test_query_post_is_retried(self, test_credentials: Session) -> None:
+        """Read-only query POSTs (insights) should be retried."""
+        calls, handler = _flaky(1)
+        client = _client(test_credentials, handler)
+
+        with client:
+            client.insights_query({"bookmark": {}})
+
+        assert calls == ["POST", "POST"]
+
+    def test_transport_error_is_retried(self, test_credentials: Session) -> None:
+        """Connection resets on a GET should be retried."""
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise httpx.ReadError("connection reset", request=request)
+            return httpx.Response(200, json={"results": {}})
+
+        client = _client(test_credentials, handler)
+        with client:
+            client.me()
+
+        assert attempts == 2
+
+    def test_budget_limits_retries(self, test_credentials: Session) -> None:
+        """An exhausted budget should stop retrying before max_retries."""
+        calls, handler = _flaky(10)
+        policy = RetryPolicy(budget_ratio=0, budget_min=1, breaker_threshold=None)
+        client = _client(test_credentials, handler, policy)
+
+        with client, pytest.raises(ServerError):
+            client.get_events()
+
+        assert len(calls) == 2
+
+    def test_open_breaker_fails_fast(self, test_credentials: Session) -> None:
+        """Once the breaker opens, requests should not reach the server."""
+        calls, handler = _flaky(100)
+        policy = RetryPolicy(max_retries=0, breaker_threshold=2)
+        client = _client(test_credentials, handler, policy)
+
+        with client:
+            for _ in range(2):
+                with pytest.raises(ServerError):
+                    client.get_events()
+            with pytest.raises(CircuitOpenError):
+                client.get_events()
+
+        assert len(calls) == 2
+
+    def test_pagination_retries(self, test_credentials: Session) -> None:
+        """paginate_all should retry a transient failure on a page fetch."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(502)
+            return httpx.Response(
+                200, json={"results": [1], "pagination": {"next_cursor": None}}
+            )
+
+        client = _client(test_credentials, handler)
+        with client:
+            assert list(paginate_all(client, "/projects/12345/dashboards")) == [1]
+
+    def test_export_respects_budget(self, test_credentials: Session) -> None:
+        """Export stream retries should stop when the budget is spent."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadError("reset", request=request)
+
+        policy = RetryPolicy(budget_ratio=0, budget_min=0, breaker_threshold=None)
+        client = _client(test_credentials, handler, policy)
+
+        with client, pytest.raises(MixpanelHeadlessError):
+            list(client.export_events("2024-01-01", "2024-01-01"))
+
+        assert client.stats().families["export"].requests == 1
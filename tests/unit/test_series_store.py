@@ -0,0 +1,410 @@
+"""Tests for incremental refresh of daily timeseries queries."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import SecretStr
+
+from mixpanel_headless import Workspace
+from mixpanel_headless._internal.auth.account import ServiceAccount
+from mixpanel_headless._internal.auth.session import Project, Session
+from mixpanel_headless._internal.query_cache import project_now
+from mixpanel_headless._internal.series_store import (
+    SeriesStore,
+    buckets_between,
+    refresh_series,
+)
+from mixpanel_headless.types import QueryResult, SegmentationResult
+
+_TEST_SESSION = Session(
+    account=ServiceAccount(
+        name="test_account",
+        region="us",
+        username="test_user",
+        secret=SecretStr("test_secret"),
+        default_project="12345",
+    ),
+    project=Project(id="12345"),
+)
+
+_TODAY = date(2024, 3, 31)
+
+
+def _days(start: date, end: date) -> list[str]:
+    """Return every day in an inclusive range."""
+    return [
+        (start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)
+    ]
+
+
+class _Fetch:
+    """Fetch stand-in returning a count of 1 per day and logging ranges."""
+
+    def __init__(self) -> None:
+        """Initialize the call log."""
+        self.ranges: list[tuple[date, date]] = []
+
+    def __call__(self, start: date, end: date) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return one series covering ``start``..``end``."""
+        self.ranges.append((start, end))
+        return {"A": dict.fromkeys(_days(start, end), 1)}, {"n": len(self.ranges)}
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SeriesStore:
+    """Store in a temporary directory."""
+    return SeriesStore(tmp_path / "series")
+
+
+class TestSeriesStore:
+    """Tests for SeriesStore."""
+
+    def test_round_trip_and_permissions(self, store: SeriesStore) -> None:
+        """Saved entries load back; files are private."""
+        entry = {"since": "2024-01-01", "through": "2024-01-02", "series": {}}
+        store.save("k", entry)
+
+        assert store.load("k") == entry
+        assert (store.directory / "k.json").stat().st_mode & 0o777 == 0o600
+
+    def test_corrupt_entry_is_dropped(self, store: SeriesStore) -> None:
+        """An unreadable entry loads as missing and is removed."""
+        store.directory.mkdir(parents=True)
+        (store.directory / "k.json").write_text("{not json")
+
+        assert store.load("k") is None
+        assert not (store.directory / "k.json").exists()
+
+    def test_key_ignores_dict_order(self, store: SeriesStore) -> None:
+        """Keys depend on content, not insertion order."""
+        assert store.key("query", {"p": 1}, {"a": 1, "b": 2}) == store.key(
+            "query", {"p": 1}, {"b": 2, "a": 1}
+        )
+        assert store.key("query", {"p": 1}, {}) != store.key("query", {"p": 2}, {})
+
+
+class TestRefreshSeries:
+    """Tests for refresh_series()."""
+
+    def test_second_refresh_fetches_only_mutable_days(self, store: SeriesStore) -> None:
+        """Settled buckets are reused; only the trailing days are fetched."""
+        fetch = _Fetch()
+        start = _TODAY - timedelta(days=89)
+        for _ in range(2):
+            series, _extra, fetched = refresh_series(
+                store,
+                "k",
+                from_date=start,
+                to_date=_TODAY,
+                mutable_days=3,
+                fetch=fetch,
+                today=_TODAY,
+            )
+
+        assert fetch.ranges == [(start, _TODAY), (date(2024, 3, 29), _TODAY)]
+        assert fetched == date(2024, 3, 29)
+        assert series["A"] == dict.fromkeys(_days(start, _TODAY), 1)
+
+    def test_sliding_range_fetches_new_days(self, store: SeriesStore) -> None:
+        """A range moved forward a day fetches the new day and the tail."""
+        fetch = _Fetch()
+        start = _TODAY - timedelta(days=89)
+        refresh_series(
+            store,
+            "k",
+            from_date=start,
+            to_date=_TODAY,
+            mutable_days=3,
+            fetch=fetch,
+            today=_TODAY,
+        )
+        tomorrow = _TODAY + timedelta(days=1)
+
+        series, _extra, _fetched = refresh_series(
+            store,
+            "k",
+            from_date=start + timedelta(days=1),
+            to_date=tomorrow,
+            mutable_days=3,
+            fetch=fetch,
+            today=tomorrow,
+        )
+
+        assert fetch.ranges[-1] == (date(2024, 3, 29), tomorrow)
+        assert len(series["A"]) == 90
+        assert start.isoformat() not in series["A"]
+
+    def test_earlier_start_refetches_everything(self, store: SeriesStore) -> None:
+        """Stored buckets that do not reach back to from_date are not used."""
+        fetch = _Fetch()
+        kwargs: dict[str, Any] = {
+            "to_date": _TODAY,
+            "mutable_days": 3,
+            "fetch": fetch,
+            "today": _TODAY,
+        }
+        refresh_series(store, "k", from_date=date(2024, 3, 1), **kwargs)
+
+        refresh_series(store, "k", from_date=date(2024, 2, 1), **kwargs)
+
+        assert fetch.ranges[-1] == (date(2024, 2, 1), _TODAY)
+
+    def test_fully_settled_range_is_not_refetched(self, store: SeriesStore) -> None:
+        """A past range is served from the store with the stored metadata."""
+        fetch = _Fetch()
+        kwargs: dict[str, Any] = {
+            "from_date": date(2024, 1, 1),
+            "to_date": date(2024, 1, 31),
+            "mutable_days": 3,
+            "fetch": fetch,
+            "today": _TODAY,
+        }
+        refresh_series(store, "k", **kwargs)
+
+        series, extra, fetched = refresh_series(store, "k", **kwargs)
+
+        assert len(fetch.ranges) == 1
+        assert fetched is None
+        assert extra == {"n": 1}
+        assert sum(series["A"].values()) == 31
+
+    def test_alternating_ranges_keep_older_buckets(self, store: SeriesStore) -> None:
+        """A shorter window merges into the entry instead of shrinking it."""
+        fetch = _Fetch()
+        long_start = _TODAY - timedelta(days=89)
+        short_start = _TODAY - timedelta(days=29)
+        for start in (long_start, short_start, long_start, short_start):
+            series, _extra, _fetched = refresh_series(
+                store,
+                "k",
+                from_date=start,
+                to_date=_TODAY,
+                mutable_days=3,
+                fetch=fetch,
+                today=_TODAY,
+            )
+
+        assert [(end - start).days + 1 for start, end in fetch.ranges] == [
+            90,
+            3,
+            3,
+            3,
+        ]
+        assert series["A"] == dict.fromkeys(_days(short_start, _TODAY), 1)
+        entry = store.load("k")
+        assert entry is not None
+        assert entry["since"] == long_start.isoformat()
+
+    def test_disjoint_entry_is_replaced(self, store: SeriesStore) -> None:
+        """A range that does not touch the entry never leaves a gap in it."""
+        fetch = _Fetch()
+        kwargs: dict[str, Any] = {"mutable_days": 3, "fetch": fetch, "today": _TODAY}
+        refresh_series(
+            store, "k", from_date=date(2024, 1, 1), to_date=date(2024, 1, 10), **kwargs
+        )
+        refresh_series(
+            store, "k", from_date=date(2024, 2, 1), to_date=date(2024, 2, 10), **kwargs
+        )
+
+        series, _extra, fetched = refresh_series(
+            store, "k", from_date=date(2024, 1, 1), to_date=date(2024, 2, 10), **kwargs
+        )
+
+        assert fetched == date(2024, 1, 1)
+        assert len(series["A"]) == 41
+
+    def test_range_aggregates_are_dropped(self, store: SeriesStore) -> None:
+        """$overall covers only the fetched days, so no call returns it."""
+        calls: list[tuple[date, date]] = []
+
+        def fetch(start: date, end: date) -> tuple[dict[str, Any], dict[str, Any]]:
+            calls.append((start, end))
+            days = _days(start, end)
+            return {"A": dict.fromkeys(days, 1), "$overall": {"all": len(days)}}, {}
+
+        kwargs: dict[str, Any] = {
+            "from_date": _TODAY - timedelta(days=30),
+            "to_date": _TODAY,
+            "mutable_days": 3,
+            "fetch": fetch,
+            "today": _TODAY,
+        }
+        first, _extra, _fetched = refresh_series(store, "k", **kwargs)
+        second, _extra, _fetched = refresh_series(store, "k", **kwargs)
+
+        assert len(calls) == 2
+        assert "$overall" not in first
+        assert "$overall" not in second
+        assert second == first
+        assert sum(second["A"].values()) == 31
+
+    def test_buckets_between(self) -> None:
+        """Only date-keyed leaves inside the range are kept."""
+        series = {
+            "A": {"2024-01-01T00:00:00-08:00": 1, "2024-01-03": 2},
+            "$overall": {"all": 3},
+        }
+
+        kept = buckets_between(series, date(2024, 1, 1), date(2024, 1, 2))
+
+        assert kept == {"A": {"2024-01-01T00:00:00-08:00": 1}}
+
+
+class _FakeService:
+    """LiveQueryService stand-in returning one count per day."""
+
+    def __init__(self) -> None:
+        """Initialize the call log."""
+        self.ranges: list[tuple[str, str]] = []
+
+    def segmentation(
+        self, *, event: str, from_date: str, to_date: str, **kw: Any
+    ) -> SegmentationResult:
+        """Fake segmentation query."""
+        self.ranges.append((from_date, to_date))
+        days = _days(date.fromisoformat(from_date), date.fromisoformat(to_date))
+        return SegmentationResult(
+            event=event,
+            from_date=from_date,
+            to_date=to_date,
+            unit=kw["unit"],
+            segment_property=kw["on"],
+            total=len(days),
+            series={event: dict.fromkeys(days, 1)},
+        )
+
+    def query(self, *, bookmark_params: dict[str, Any], project_id: int) -> Any:
+        """Fake insights query reading the range from the params."""
+        from_date, to_date = bookmark_params["sections"]["time"][0]["value"]
+        self.ranges.append((from_date, to_date))
+        days = _days(date.fromisoformat(from_date), date.fromisoformat(to_date))
+        return QueryResult(
+            computed_at="2024-03-31T12:00:00",
+            from_date=f"{from_date}T00:00:00-07:00",
+            to_date=f"{to_date}T23:59:59-07:00",
+            headers=["$metric"],
+            series={"Login [Total Events]": {f"{d}T00:00:00-07:00": 1 for d in days}},
+            params=bookmark_params,
+        )
+
+
+@pytest.fixture
+def service() -> _FakeService:
+    """Fake live query service."""
+    return _FakeService()
+
+
+@pytest.fixture
+def workspace(
+    service: _FakeService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Workspace:
+    """Workspace whose live query service is ``service``."""
+    from mixpanel_headless._internal.api_client import MixpanelAPIClient
+
+    monkeypatch.setenv("MP_OAUTH_STORAGE_DIR", str(tmp_path))
+    ws = Workspace(session=_TEST_SESSION, _api_client=MagicMock(spec=MixpanelAPIClient))
+    ws._live_query = service  # type: ignore[assignment]
+    return ws
+
+
+class TestWorkspaceIncremental:
+    """Tests for ``incremental_days=`` on the Workspace query methods."""
+
+    def test_segmentation(self, workspace: Workspace, service: _FakeService) -> None:
+        """The second call fetches only the trailing days."""
+        today = project_now(None).date()
+        start = (today - timedelta(days=89)).isoformat()
+        for _ in range(2):
+            result = workspace.segmentation(
+                "Login", from_date=start, to_date=today.isoformat(), incremental_days=3
+            )
+
+        assert service.ranges[-1][0] == (today - timedelta(days=2)).isoformat()
+        assert result.total == 90
+        assert result.from_date == start
+        assert result.meta["incremental_from"] == service.ranges[-1][0]
+
+    def test_query(self, workspace: Workspace, service: _FakeService) -> None:
+        """A relative range is resolved and spliced into one QueryResult."""
+        workspace.query("Login", last=90, incremental_days=3)
+        result = workspace.query("Login", last=90, incremental_days=3)
+
+        today = project_now(None).date()
+        assert len(service.ranges) == 2
+        assert service.ranges[-1][0] == (today - timedelta(days=2)).isoformat()
+        assert len(result.series["Login [Total Events]"]) == 90
+        assert result.from_date.endswith("T00:00:00-07:00")
+        assert result.params["sections"]["time"][0]["dateRangeType"] == "in the last"
+        assert result.meta["incremental_from"] == service.ranges[-1][0]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"unit": "week"}, "unit='week'"),
+            ({"mode": "total"}, "mode='total'"),
+            ({"cumulative": True}, "cumulative"),
+            ({"group_by": "$browser"}, "group_by"),
+            ({"incremental_days": 0}, "at least 1"),
+            ({"window_days": 30}, "cannot be combined"),
+        ],
+    )
+    def test_query_rejected(
+        self,
+        workspace: Workspace,
+        service: _FakeService,
+        kwargs: dict[str, Any],
+        match: str,
+    ) -> None:
+        """Settings whose past buckets can change raise before any request."""
+        args: dict[str, Any] = {"incremental_days": 3, **kwargs}
+        with pytest.raises(ValueError, match=match):
+            workspace.query(
+                "Login", from_date="2024-01-01", to_date="2024-03-31", **args
+            )
+        assert service.ranges == []
+
+    def test_segmentation_on_rejected(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """Per-day top segment values cannot be stored and reused."""
+        with pytest.raises(ValueError, match="segment property"):
+            workspace.segmentation(
+                "Login",
+                from_date="2024-01-01",
+                to_date="2024-03-31",
+                on="$browser",
+                incremental_days=3,
+            )
+        assert service.ranges == []
+
+    def test_today_is_the_projects_date(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """The mutable days end on the current date in the project's timezone."""
+        zone = "Pacific/Kiritimati"  # UTC+14: usually a day ahead of UTC
+        workspace._session = _TEST_SESSION.replace(
+            project=Project(id="12345", timezone=zone)
+        )
+        today = project_now(zone).date()
+        start = (today - timedelta(days=29)).isoformat()
+        for _ in range(2):
+            workspace.segmentation(
+                "Login", from_date=start, to_date=today.isoformat(), incremental_days=1
+            )
+
+        assert service.ranges[-1] == (today.isoformat(), today.isoformat())
+
+    def test_clear_query_cache(
+        self, workspace: Workspace, service: _FakeService
+    ) -> None:
+        """clear_query_cache() drops stored buckets."""
+        workspace.query("Login", last=30, incremental_days=3)
+        workspace.clear_query_cache()
+        workspace.query("Login", last=30, incremental_days=3)
+
+        assert service.ranges[0] == service.ranges[1]
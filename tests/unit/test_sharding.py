@@ -0,0 +1,239 @@
+"""Unit tests for shard planning and bounded parallel iteration."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.sharding import day_shards, iter_parallel
+from mixpanel_headless.exceptions import QueryError
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+class TestDayShards:
+    """Tests for day_shards()."""
+
+    def test_spans_month_boundary(self) -> None:
+        """Shards should cover every day inclusively across months."""
+        assert day_shards("2024-01-30", "2024-02-01") == [
+            ("2024-01-30", "2024-01-30"),
+            ("2024-01-31", "2024-01-31"),
+            ("2024-02-01", "2024-02-01"),
+        ]
+
+    def test_single_day(self) -> None:
+        """A one-day range should produce one shard."""
+        assert day_shards("2024-01-01", "2024-01-01") == [("2024-01-01", "2024-01-01")]
+
+    def test_reversed_range_rejected(self) -> None:
+        """from_date after to_date should raise ValueError."""
+        with pytest.raises(ValueError, match="after"):
+            day_shards("2024-01-02", "2024-01-01")
+
+
+class TestIterParallel:
+    """Tests for iter_parallel()."""
+
+    def test_unordered_yields_every_item(self) -> None:
+        """Unordered mode should yield the union of all shard items."""
+        items = list(
+            iter_parallel(
+                [1, 2, 3], lambda n: [n * 10 + i for i in range(3)], workers=3
+            )
+        )
+        assert sorted(items) == [10, 11, 12, 20, 21, 22, 30, 31, 32]
+
+    def test_ordered_preserves_shard_order(self) -> None:
+        """Ordered mode should emit shards in input order even if later ones finish first."""
+
+        def fetch(n: int) -> Iterator[int]:
+            # Earlier shards are slower, so arrival order is reversed.
+            time.sleep(0.03 * (3 - n))
+            yield from (n * 10 + i for i in range(3))
+
+        items = list(iter_parallel([0, 1, 2], fetch, workers=3, ordered=True))
+
+        assert items == [0, 1, 2, 10, 11, 12, 20, 21, 22]
+
+    def test_worker_error_propagates(self) -> None:
+        """An exception in any shard should surface in the consumer."""
+
+        def fetch(n: int) -> list[int]:
+            if n == 2:
+                raise QueryError("bad shard")
+            return [n]
+
+        with pytest.raises(QueryError, match="bad shard"):
+            list(iter_parallel([1, 2, 3], fetch, workers=2))
+
+    def test_buffer_bounds_in_flight_items(self) -> None:
+        """Producers should block once the buffer is full."""
+        produced = 0
+        lock = threading.Lock()
+
+        def fetch(_n: int) -> Iterator[int]:
+            nonlocal produced
+            for i in range(100):
+                with lock:
+                    produced += 1
+                yield i
+
+        iterator = iter_parallel([0], fetch, workers=1, buffer_size=5)
+        next(iterator)
+        time.sleep(0.05)
+
+        # One consumed + five buffered + one blocked in put().
+        assert produced <= 7
+        iterator.close()
+
+    def test_early_close_stops_workers(self) -> None:
+        """Closing the iterator should cancel and close shard generators."""
+        closed = threading.Event()
+
+        def fetch(_n: int) -> Iterator[int]:
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        iterator = iter_parallel([0, 1], fetch, workers=2, buffer_size=2)
+        next(iterator)
+        iterator.close()
+
+        assert closed.wait(timeout=1.0)
+
+    def test_invalid_workers_rejected(self) -> None:
+        """workers < 1 should raise ValueError."""
+        with pytest.raises(ValueError, match="workers"):
+            list(iter_parallel([1], lambda n: [n], workers=0))
+
+
+class TestExportEventsParallel:
+    """Tests for MixpanelAPIClient.export_events_parallel()."""
+
+    def test_one_request_per_day(self, test_credentials: Session) -> None:
+        """Each day in the range should be fetched with its own request."""
+        days: list[tuple[str, str]] = []
+        lock = threading.Lock()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = request.url.params
+            with lock:
+                days.append((params["from_date"], params["to_date"]))
+            body = (
+                f'{{"event": "E", "properties": {{"day": "{params["from_date"]}"}}}}\n'
+            )
+            return httpx.Response(200, content=body.encode())
+
+        client = MixpanelAPIClient(
+            session=test_credentials, _transport=httpx.MockTransport(handler)
+        )
+        with client:
+            events: list[dict[str, Any]] = list(
+                client.export_events_parallel(
+                    "2024-01-01", "2024-01-04", workers=2, ordered=True
+                )
+            )
+
+        assert sorted(days) == [(f"2024-01-0{d}", f"2024-01-0{d}") for d in range(1, 5)]
+        assert [e["properties"]["day"] for e in events] == [
+            "2024-01-01",
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+        ]
+
+
+class TestExportProfilesParallel:
+    """Tests for MixpanelAPIClient.export_profiles_parallel()."""
+
+    @staticmethod
+    def _client(
+        test_credentials: Session, pages: list[list[str]], total: int | None = None
+    ) -> tuple[MixpanelAPIClient, list[dict[str, Any]]]:
+        """Build a client serving ``pages`` of distinct IDs from /engage."""
+        requests: list[dict[str, Any]] = []
+        lock = threading.Lock()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = json.loads(request.content)
+            with lock:
+                requests.append(params)
+            page = int(params["page"])
+            profiles = [{"$distinct_id": d, "$properties": {}} for d in pages[page]]
+            body: dict[str, Any] = {
+                "results": profiles,
+                "page": page,
+                "page_size": 2,
+            }
+            if page + 1 < len(pages):
+                body["session_id"] = "sess-1"
+            if page == 0 and total is not None:
+                body["total"] = total
+            return httpx.Response(200, json=body)
+
+        client = MixpanelAPIClient(
+            session=test_credentials, _transport=httpx.MockTransport(handler)
+        )
+        return client, requests
+
+    def test_pages_fetched_with_first_session(self, test_credentials: Session) -> None:
+        """Later pages reuse page 0's session_id; each page stays contiguous."""
+        pages = [["a", "b"], ["c", "d"], ["e", "f"], ["g"]]
+        client, requests = self._client(test_credentials, pages, total=7)
+        with client:
+            ids = [
+                p["$distinct_id"]
+                for p in client.export_profiles_parallel(where="x", workers=3)
+            ]
+
+        assert sorted(ids) == list("abcdefg")
+        assert ids[:2] == ["a", "b"]
+        for page in pages[1:]:
+            start = ids.index(page[0])
+            assert ids[start : start + len(page)] == page
+        assert sorted(int(r["page"]) for r in requests) == [0, 1, 2, 3]
+        assert all(r["session_id"] == "sess-1" for r in requests if int(r["page"]) != 0)
+        assert all(r["where"] == "x" for r in requests)
+
+    def test_without_total_pages_sequentially(self, test_credentials: Session) -> None:
+        """A response with no total falls back to session-chained paging."""
+        client, requests = self._client(test_credentials, [["a", "b"], ["c"]])
+        with client:
+            ids = [p["$distinct_id"] for p in client.export_profiles_parallel()]
+
+        assert ids == ["a", "b", "c"]
+        assert [int(r["page"]) for r in requests] == [0, 1]
+
+    def test_invalid_arguments(self, test_credentials: Session) -> None:
+        """workers < 1 and conflicting filters fail before any request."""
+        client, requests = self._client(test_credentials, [["a"]])
+        with client:
+            with pytest.raises(ValueError, match="workers"):
+                list(client.export_profiles_parallel(workers=0))
+            with pytest.raises(ValueError, match="mutually exclusive"):
+                list(
+                    client.export_profiles_parallel(distinct_id="a", distinct_ids=["b"])
+                )
+
+        assert requests == []
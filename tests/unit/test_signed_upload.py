@@ -0,0 +1,248 @@
+"""Unit tests for streaming and resumable signed-URL uploads."""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.signed_upload import RESUMABLE_CHUNK_ALIGNMENT
+from mixpanel_headless.exceptions import MixpanelHeadlessError
+from tests.conftest import make_session
+
+SIGNED_URL = "https://storage.googleapis.com/bucket/table.csv?X-Goog-Signature=x"
+SESSION_URL = "https://storage.googleapis.com/upload/session-1"
+CHUNK = RESUMABLE_CHUNK_ALIGNMENT
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep() -> Iterator[None]:
+    """Skip backoff sleeps."""
+    with patch("mixpanel_headless._internal.signed_upload.time.sleep"):
+        yield
+
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    """A CSV spanning several resumable chunks."""
+    path = tmp_path / "table.csv"
+    rows = "".join(f"{i},name-{i}\n" for i in range(80_000))
+    path.write_text("id,name\n" + rows)
+    return path
+
+
+def _client(session: Session, handler: object) -> MixpanelAPIClient:
+    """Client backed by a mock transport."""
+    return MixpanelAPIClient(
+        session=session,
+        _transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+
+
+class FakeGCS:
+    """Resumable-session server that persists whole chunks only."""
+
+    def __init__(
+        self,
+        *,
+        allow_sessions: bool = True,
+        drop_posts: int = 0,
+        fail_puts: int = 0,
+        fail_at: int | None = None,
+    ) -> None:
+        """Initialize an empty object.
+
+        Args:
+            allow_sessions: Whether the signed URL accepts session starts.
+            drop_posts: Number of session starts to fail with a dropped
+                connection.
+            fail_puts: Number of single PUTs to answer with 503.
+            fail_at: Offset of a session chunk to answer once with 503.
+        """
+        self.allow_sessions = allow_sessions
+        self.drop_posts = drop_posts
+        self.fail_puts = fail_puts
+        self.fail_at = fail_at
+        self.chunk_bytes: list[int] = []
+        self.data = b""
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Handle one upload request."""
+        self.requests.append(request)
+        if request.method == "POST":
+            if self.drop_posts:
+                self.drop_posts -= 1
+                raise httpx.ConnectError("connection reset", request=request)
+            if not self.allow_sessions:
+                return httpx.Response(403, text="SignatureDoesNotMatch")
+            return httpx.Response(201, headers={"Location": SESSION_URL})
+        body = request.read()
+        if str(request.url) == SIGNED_URL:
+            if self.fail_puts:
+                self.fail_puts -= 1
+                return httpx.Response(503)
+            self.data = body
+            return httpx.Response(200)
+        content_range = request.headers["Content-Range"]
+        if content_range.startswith("bytes */"):
+            return self._incomplete()
+        self.chunk_bytes.append(len(body))
+        span, _, total = content_range.removeprefix("bytes ").partition("/")
+        start = int(span.partition("-")[0])
+        if start == self.fail_at:
+            self.fail_at = None
+            return httpx.Response(503)
+        assert start == len(self.data)
+        self.data += body
+        if len(self.data) == int(total):
+            return httpx.Response(200)
+        return self._incomplete()
+
+    def _incomplete(self) -> httpx.Response:
+        """308 reporting the persisted prefix."""
+        headers = {"Range": f"bytes=0-{len(self.data) - 1}"} if self.data else {}
+        return httpx.Response(308, headers=headers)
+
+
+class TestUploadFileToSignedUrl:
+    """Tests for MixpanelAPIClient.upload_file_to_signed_url()."""
+
+    def test_streams_single_put(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """The file is sent with a Content-Length and progress reaches 100%."""
+        gcs = FakeGCS()
+        seen: list[tuple[int, int]] = []
+        client = _client(test_credentials, gcs)
+
+        with client:
+            client.upload_file_to_signed_url(
+                SIGNED_URL,
+                csv_file,
+                chunk_size=CHUNK,
+                progress=lambda sent, total: seen.append((sent, total)),
+            )
+
+        size = csv_file.stat().st_size
+        assert gcs.data == csv_file.read_bytes()
+        assert gcs.requests[0].headers["Content-Length"] == str(size)
+        assert len(seen) > 1
+        assert seen[-1] == (size, size)
+
+    def test_compress(self, test_credentials: Session, csv_file: Path) -> None:
+        """compress=True uploads gzip data with Content-Encoding set."""
+        gcs = FakeGCS()
+        client = _client(test_credentials, gcs)
+
+        with client:
+            client.upload_file_to_signed_url(SIGNED_URL, csv_file, compress=True)
+
+        assert gcs.requests[0].headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(gcs.data) == csv_file.read_bytes()
+
+    def test_single_put_restarts_on_transient_failure(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """A 503 restarts the PUT from the start of the file."""
+        gcs = FakeGCS(fail_puts=1)
+        client = _client(test_credentials, gcs)
+
+        with client:
+            client.upload_file_to_signed_url(SIGNED_URL, csv_file)
+
+        assert len(gcs.requests) == 2
+        assert gcs.data == csv_file.read_bytes()
+
+    def test_resumable_resumes_from_persisted_offset(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """After a failed chunk only that chunk is re-sent."""
+        gcs = FakeGCS(fail_at=2 * CHUNK)
+        client = _client(test_credentials, gcs)
+
+        with client:
+            client.upload_file_to_signed_url(
+                SIGNED_URL, csv_file, resumable=True, chunk_size=CHUNK
+            )
+
+        assert gcs.data == csv_file.read_bytes()
+        assert gcs.requests[0].method == "POST"
+        assert sum(gcs.chunk_bytes) == csv_file.stat().st_size + CHUNK
+        assert any(
+            r.headers.get("Content-Range", "").startswith("bytes */")
+            for r in gcs.requests
+        )
+
+    def test_session_start_retried_on_transport_error(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """A dropped connection while opening the session is retried."""
+        gcs = FakeGCS(drop_posts=1)
+        client = _client(test_credentials, gcs)
+
+        with client:
+            client.upload_file_to_signed_url(
+                SIGNED_URL, csv_file, resumable=True, chunk_size=CHUNK
+            )
+
+        assert [r.method for r in gcs.requests[:2]] == ["POST", "POST"]
+        assert str(gcs.requests[2].url) == SESSION_URL
+        assert gcs.data == csv_file.read_bytes()
+
+    def test_resumable_falls_back_to_single_put(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """A URL that rejects sessions is uploaded with one PUT."""
+        gcs = FakeGCS(allow_sessions=False)
+        client = _client(test_credentials, gcs)
+
+        with client:
+            client.upload_file_to_signed_url(
+                SIGNED_URL, csv_file, resumable=True, chunk_size=CHUNK
+            )
+
+        assert [r.method for r in gcs.requests] == ["POST", "PUT"]
+        assert gcs.data == csv_file.read_bytes()
+
+    def test_misaligned_resumable_chunk_rejected(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """Resumable chunks must be multiples of 256 KiB."""
+        client = _client(test_credentials, FakeGCS())
+
+        with client, pytest.raises(ValueError, match="multiple"):
+            client.upload_file_to_signed_url(
+                SIGNED_URL, csv_file, resumable=True, chunk_size=1000
+            )
+
+    def test_failure_raises_upload_error(
+        self, test_credentials: Session, csv_file: Path
+    ) -> None:
+        """A non-retryable rejection raises UPLOAD_ERROR."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(403, text="SignatureDoesNotMatch")
+
+        client = _client(test_credentials, handler)
+        with client, pytest.raises(MixpanelHeadlessError) as exc_info:
+            client.upload_file_to_signed_url(SIGNED_URL, csv_file)
+
+        assert exc_info.value.code == "UPLOAD_ERROR"
@@ -0,0 +1,211 @@
+"""Unit tests for single-flight request coalescing and its API client wiring."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Session
+from mixpanel_headless._internal.single_flight import SingleFlight, request_key
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def test_credentials() -> Session:
+    """Create test credentials."""
+    return make_session(
+        username="test_user",
+        secret="test_secret",
+        project_id="12345",
+        region="us",
+    )
+
+
+def _run_concurrently(n: int, fn: Any) -> list[Any]:
+    """Start ``n`` calls of ``fn`` together and return their results."""
+    barrier = threading.Barrier(n)
+
+    def call() -> Any:
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(call) for _ in range(n)]
+        return [future.result() for future in futures]
+
+
+class TestRequestKey:
+    """Tests for coalescing key construction."""
+
+    def test_param_order_does_not_matter(self) -> None:
+        """Equivalent params in a different order should share a key."""
+        a = request_key("get", "https://x/a", {"a": 1, "b": 2}, None)
+        b = request_key("GET", "https://x/a", {"b": 2, "a": 1}, None)
+        assert a == b
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ("POST", "https://x/a", {"a": 1}, None, "t"),
+            ("GET", "https://x/b", {"a": 1}, None, "t"),
+            ("GET", "https://x/a", {"a": 2}, None, "t"),
+            ("GET", "https://x/a", {"a": 1}, {"body": 1}, "t"),
+            ("GET", "https://x/a", {"a": 1}, None, "other"),
+        ],
+    )
+    def test_any_difference_changes_key(
+        self, other: tuple[str, str, dict[str, Any], Any, str]
+    ) -> None:
+        """Method, URL, params, body and auth should all be part of the key."""
+        base = request_key("GET", "https://x/a", {"a": 1}, None, auth="t")
+        method, url, params, body, auth = other
+        assert request_key(method, url, params, body, auth=auth) != base
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight primitive."""
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        """Callers arriving while the leader runs should not call fn again."""
+        flight = SingleFlight()
+        calls = 0
+
+        def fn() -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.1)
+            return {"value": [1, 2]}
+
+        results = _run_concurrently(6, lambda: flight.do("k", fn))
+
+        assert calls == 1
+        assert all(result == {"value": [1, 2]} for result in results)
+
+    def test_followers_get_independent_copies(self) -> None:
+        """Mutating one caller's result should not leak into another's."""
+        flight = SingleFlight()
+
+        def fn() -> dict[str, Any]:
+            time.sleep(0.1)
+            return {"items": []}
+
+        results = _run_concurrently(3, lambda: flight.do("k", fn))
+        results[0]["items"].append("x")
+
+        assert results[1] == {"items": []}
+        assert results[2] == {"items": []}
+
+    def test_error_is_shared(self) -> None:
+        """Followers should re-raise the leader's exception."""
+        flight = SingleFlight()
+        calls = 0
+
+        def fn() -> None:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        def call() -> str:
+            try:
+                flight.do("k", fn)
+            except ValueError as e:
+                return str(e)
+            return "no error"
+
+        assert _run_concurrently(3, call) == ["boom"] * 3
+        assert calls == 1
+
+    def test_sequential_calls_are_not_coalesced(self) -> None:
+        """A call made after the leader returned should run again."""
+        flight = SingleFlight()
+        calls = 0
+
+        def fn() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert flight.do("k", fn) == 1
+        assert flight.do("k", fn) == 2
+        assert flight._calls == {}
+
+
+class TestClientIntegration:
+    """Tests for MixpanelAPIClient wiring."""
+
+    def _client(self, session: Session, counts: dict[str, int]) -> MixpanelAPIClient:
+        """Client whose transport counts requests per path and is slow."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            counts[request.url.path] = counts.get(request.url.path, 0) + 1
+            time.sleep(0.1)
+            return httpx.Response(200, json={"results": {"id": 1}})
+
+        return MixpanelAPIClient(
+            session=session, _transport=httpx.MockTransport(handler)
+        )
+
+    def test_identical_insights_queries_coalesce(
+        self, test_credentials: Session
+    ) -> None:
+        """Concurrent identical insights POSTs should hit the network once."""
+        counts: dict[str, int] = {}
+        client = self._client(test_credentials, counts)
+        body = {"bookmark": {"sections": {}}, "project_id": 12345}
+
+        with client:
+            _run_concurrently(5, lambda: client.insights_query(body))
+
+        assert counts == {"/api/query/insights": 1}
+
+    def test_distinct_queries_are_not_coalesced(
+        self, test_credentials: Session
+    ) -> None:
+        """Different bodies should each get their own request."""
+        counts: dict[str, int] = {}
+        client = self._client(test_credentials, counts)
+        seq = iter(range(4))
+        lock = threading.Lock()
+
+        def query() -> Any:
+            with lock:
+                n = next(seq)
+            return client.insights_query({"bookmark": {"n": n}})
+
+        with client:
+            _run_concurrently(4, query)
+
+        assert counts == {"/api/query/insights": 4}
+
+    def test_app_get_coalesces(self, test_credentials: Session) -> None:
+        """Concurrent identical App API GETs should share one call."""
+        counts: dict[str, int] = {}
+        client = self._client(test_credentials, counts)
+
+        with client:
+            results = _run_concurrently(4, client.me)
+
+        assert counts == {"/api/app/me": 1}
+        assert all(result == {"id": 1} for result in results)
+
+    def test_app_writes_are_not_coalesced(self, test_credentials: Session) -> None:
+        """Non-GET App API requests should never be merged."""
+        counts: dict[str, int] = {}
+        client = self._client(test_credentials, counts)
+
+        with client:
+            _run_concurrently(
+                3,
+                lambda: client.app_request(
+                    "POST", "/projects/12345/dashboards", json_body={"title": "x"}
+                ),
+            )
+
+        assert counts == {"/api/app/projects/12345/dashboards": 3}
@@ -392,21 +392,22 @@ class TestConcurrentRefresh:
 
     The realistic scenario: an in-process Workspace fans out N parallel API
     calls; each lazily resolves the bearer; they all observe the same
-    expired ``tokens.json`` and race ``_refresh_and_persist``. The contract
-    we want to lock:
+    expired ``tokens.json`` and race to refresh. The contract we want to
+    lock:
 
-    1. Both callers receive a valid (non-empty) access token.
+    1. Both callers receive the same valid access token.
     2. The on-disk ``tokens.json`` parses cleanly (no torn write).
-    3. The IdP is called once-per-thread — there is no single-flight guard
-       at this layer (a future enhancement could add one; for now we
-       document the actual behaviour).
+    3. The IdP is called exactly once — the refresh is single-flight, and
+       the waiting thread reuses the token the refresher persisted instead
+       of spending the rotated refresh token a second time.
     """
 
-    def test_two_threads_racing_refresh_both_get_tokens_and_disk_is_valid(
+    def test_two_threads_racing_refresh_share_one_idp_call(
         self, isolated_home: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Two threads race ``_refresh_and_persist``; assert the contract above."""
+        """Two threads race the refresh; assert the contract above."""
         import threading
+        import time
 
         from mixpanel_headless._internal.auth import flow as flow_mod
         from mixpanel_headless._internal.auth import storage as storage_mod
@@ -438,11 +439,10 @@ class TestConcurrentRefresh:
             ),
         )
 
-        # Use a Barrier to release both threads into ``refresh_tokens`` at the
-        # same instant, maximising the window where they would have collided
-        # on a fixed tmp filename. ``atomic_write_bytes`` derives tmp paths
-        # from pid+tid so each thread picks a distinct one.
-        barrier = threading.Barrier(2)
+        # The first refresher parks inside ``refresh_tokens`` until the test
+        # thread releases it, so the second thread is guaranteed to have
+        # observed the expired token and queued on the refresh lock.
+        entered = threading.Event()
         gate = threading.Event()
         call_count = 0
         call_lock = threading.Lock()
@@ -455,14 +455,14 @@ class TestConcurrentRefresh:
             client_id: str,  # noqa: ARG001
             account_name: str | None = None,  # noqa: ARG001
         ) -> OAuthTokens:
-            """Return refreshed tokens after a controlled barrier sync."""
+            """Return refreshed tokens once the test thread opens the gate."""
             nonlocal call_count
             with call_lock:
                 call_count += 1
                 my_n = call_count
-            # Both threads wait at the barrier; the test thread releases
-            # them via ``gate.set()`` so they enter the write path together.
-            barrier.wait(timeout=2)
+            assert tokens.refresh_token is not None
+            assert tokens.refresh_token.get_secret_value() == "brw-refresh-1"
+            entered.set()
             gate.wait(timeout=2)
             return OAuthTokens(
                 access_token=SecretStr(f"brw-tok-new-{my_n}"),
@@ -487,23 +487,63 @@ class TestConcurrentRefresh:
         t2 = threading.Thread(target=_worker, args=(1,))
         t1.start()
         t2.start()
-        # Give both threads time to reach the barrier in the stub.
+        assert entered.wait(timeout=2)
+        # Give the other thread time to read the expired file and block.
+        time.sleep(0.1)
         gate.set()
         t1.join(timeout=5)
         t2.join(timeout=5)
 
-        # Both calls returned tokens (no exception).
-        for r in results:
-            assert isinstance(r, str), f"thread raised: {r!r}"
-            assert r.startswith("brw-tok-new-")
+        # Both calls returned the refresher's token (no exception).
+        assert results == ["brw-tok-new-1", "brw-tok-new-1"], results
 
         # Final on-disk file parses cleanly (no torn / partial write).
         payload = json.loads(path.read_text(encoding="utf-8"))
-        assert payload["access_token"].startswith("brw-tok-new-")
-        assert payload["refresh_token"].startswith("brw-refresh-")
-        # Both threads triggered an IdP call (the resolver does NOT have a
-        # single-flight guard; this assertion documents the current behaviour).
-        assert call_count == 2
+        assert payload["access_token"] == "brw-tok-new-1"
+        assert payload["refresh_token"] == "brw-refresh-2"
+        assert call_count == 1
+
+    def test_waiter_rereads_token_persisted_by_another_process(
+        self, isolated_home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A token refreshed on disk while waiting for the lock is reused."""
+        from mixpanel_headless._internal.auth import flow as flow_mod
+        from mixpanel_headless._internal.auth import token_resolver as mod
+
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        _write_tokens_file(
+            isolated_home,
+            name="me",
+            access_token="expired-tok",
+            expires_at=past,
+            refresh_token="brw-refresh-1",
+        )
+        real_lock = mod.exclusive_lock
+
+        def _lock_after_other_refresher(lock_path: Path) -> object:
+            # Simulate another process finishing its refresh while this
+            # one was blocked on the lock.
+            future = datetime.now(timezone.utc) + timedelta(hours=1)
+            tokens = lock_path.parent / "tokens.json"
+            tokens.unlink()
+            _write_tokens_file(
+                isolated_home,
+                name="me",
+                access_token="other-process-tok",
+                expires_at=future,
+                refresh_token="brw-refresh-2",
+            )
+            return real_lock(lock_path)
+
+        def _unexpected_refresh(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("refresh_tokens must not be called")
+
+        monkeypatch.setattr(mod, "exclusive_lock", _lock_after_other_refresher)
+        monkeypatch.setattr(flow_mod.OAuthFlow, "refresh_tokens", _unexpected_refresh)
+
+        token = OnDiskTokenResolver().get_browser_token("me", "us")
+
+        assert token == "other-process-tok"
 
 
 class TestSymlinkRejection:
@@ -558,3 +598,107 @@ class TestSymlinkRejection:
         resolver = OnDiskTokenResolver()
         with pytest.raises(OAuthError, match="symlink"):
             resolver.get_browser_token("personal", "us")
+
+
+class TestBrowserTokenCache:
+    """In-memory caching of parsed browser tokens."""
+
+    @pytest.fixture
+    def reads(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        """Record every real read of a tokens file."""
+        from mixpanel_headless._internal.auth import token_resolver as mod
+
+        calls: list[Path] = []
+        real_read = mod.read_credential_bytes
+
+        def _counting_read(path: Path) -> bytes:
+            calls.append(path)
+            return real_read(path)
+
+        monkeypatch.setattr(mod, "read_credential_bytes", _counting_read)
+        return calls
+
+    def test_repeat_calls_read_disk_once(
+        self, isolated_home: Path, reads: list[Path]
+    ) -> None:
+        """An unchanged file is parsed once and served from memory after."""
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        _write_tokens_file(
+            isolated_home, name="me", access_token="tok-1", expires_at=future
+        )
+        resolver = OnDiskTokenResolver()
+
+        assert [resolver.get_browser_token("me", "us") for _ in range(5)] == [
+            "tok-1"
+        ] * 5
+        assert len(reads) == 1
+
+    def test_rewritten_file_is_reread(
+        self, isolated_home: Path, reads: list[Path]
+    ) -> None:
+        """A file replaced on disk (e.g. by `mp login`) invalidates the cache."""
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        path = _write_tokens_file(
+            isolated_home, name="me", access_token="tok-1", expires_at=future
+        )
+        resolver = OnDiskTokenResolver()
+        assert resolver.get_browser_token("me", "us") == "tok-1"
+
+        path.unlink()
+        _write_tokens_file(
+            isolated_home, name="me", access_token="tok-22", expires_at=future
+        )
+
+        assert resolver.get_browser_token("me", "us") == "tok-22"
+        assert len(reads) == 2
+
+    def test_near_expiry_cached_token_is_reread(
+        self, isolated_home: Path, reads: list[Path]
+    ) -> None:
+        """A cached token inside the expiry buffer is not served from memory."""
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        path = _write_tokens_file(
+            isolated_home, name="me", access_token="tok-1", expires_at=future
+        )
+        resolver = OnDiskTokenResolver()
+        resolver.get_browser_token("me", "us")
+        fingerprint, tokens = resolver._cache[path]
+        soon = datetime.now(timezone.utc) + timedelta(seconds=5)
+        resolver._cache[path] = (
+            fingerprint,
+            tokens.model_copy(update={"expires_at": soon}),
+        )
+
+        assert resolver.get_browser_token("me", "us") == "tok-1"
+        assert len(reads) == 2
+
+    def test_removed_file_raises(self, isolated_home: Path) -> None:
+        """Deleting the tokens file (logout) is noticed immediately."""
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        path = _write_tokens_file(
+            isolated_home, name="me", access_token="tok-1", expires_at=future
+        )
+        resolver = OnDiskTokenResolver()
+        resolver.get_browser_token("me", "us")
+
+        path.unlink()
+
+        with pytest.raises(OAuthError):
+            resolver.get_browser_token("me", "us")
+
+    @_REQUIRES_O_NOFOLLOW
+    def test_symlink_swap_after_caching_raises(self, isolated_home: Path) -> None:
+        """Replacing a cached file with a symlink still hits the symlink check."""
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        path = _write_tokens_file(
+            isolated_home, name="me", access_token="tok-1", expires_at=future
+        )
+        resolver = OnDiskTokenResolver()
+        resolver.get_browser_token("me", "us")
+
+        other = isolated_home / "other.json"
+        path.rename(other)
+        path.symlink_to(other)
+
+        with pytest.raises(OAuthError, match="symlink"):
+            resolver.get_browser_token("me", "us")
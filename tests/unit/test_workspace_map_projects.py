@@ -0,0 +1,179 @@
+"""Tests for Workspace.map_projects and Workspace.map_targets."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+import mixpanel_headless.workspace as workspace_module
+from mixpanel_headless import ProjectOutcome
+from mixpanel_headless._internal.api_client import MixpanelAPIClient
+from mixpanel_headless._internal.auth.session import Project
+from mixpanel_headless.exceptions import MixpanelHeadlessError
+from mixpanel_headless.types import Target
+from mixpanel_headless.workspace import Workspace
+from tests.conftest import make_session
+
+
+class _Api:
+    """Mock transport handler serving ``/events/names`` per project."""
+
+    def __init__(self) -> None:
+        """Initialize with no failing projects."""
+        self.failing: set[str] = set()
+        self.projects: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Return one event named after the requested project."""
+        project_id = request.url.params["project_id"]
+        with self._lock:
+            self.projects.append(project_id)
+        if project_id in self.failing:
+            return httpx.Response(400, json={"error": "bad project"})
+        return httpx.Response(200, json=[f"event-{project_id}"])
+
+
+@pytest.fixture
+def api() -> _Api:
+    """Fake Query API."""
+    return _Api()
+
+
+@pytest.fixture
+def workspace(api: _Api) -> Workspace:
+    """Workspace whose client is backed by a mock transport."""
+    session = make_session(project_id="1")
+    client = MixpanelAPIClient(session=session, _transport=httpx.MockTransport(api))
+    return Workspace(session=session, _api_client=client)
+
+
+class TestForSession:
+    """Tests for MixpanelAPIClient.for_session()."""
+
+    def test_shares_pool_and_limits(self, workspace: Workspace) -> None:
+        """Derived clients share the pool, resolver and rate limiter."""
+        parent = workspace.api
+        derived = parent.for_session(parent.session.replace(project=Project(id="2")))
+
+        assert derived.project_id == "2"
+        assert parent.project_id == "1"
+        assert derived._client is parent._client
+        assert derived._token_resolver is parent._token_resolver
+        assert derived._rate_limiter is parent._rate_limiter
+        assert derived._breaker is parent._breaker
+        assert derived._metrics is parent._metrics
+
+    def test_session_state_is_not_shared(self, workspace: Workspace) -> None:
+        """Workspace scoping and request coalescing stay per client."""
+        parent = workspace.api
+        derived = parent.for_session(parent.session)
+
+        derived.set_workspace_id(7)
+
+        assert parent.workspace_id is None
+        assert derived._single_flight is not parent._single_flight
+
+    def test_close_keeps_shared_pool_open(self, workspace: Workspace) -> None:
+        """Closing a derived client leaves the parent's pool usable."""
+        parent = workspace.api
+        derived = parent.for_session(parent.session)
+
+        derived.close()
+
+        assert parent._client is not None
+        assert not parent._client.is_closed
+        assert parent.get_events() == ["event-1"]
+
+
+class TestMapProjects:
+    """Tests for Workspace.map_projects()."""
+
+    def test_runs_fn_per_project(self, workspace: Workspace, api: _Api) -> None:
+        """Each project gets its own Workspace; results keep input order."""
+        projects = ["3", Project(id="2"), "5"]
+
+        outcomes = workspace.map_projects(lambda ws: ws.events(), projects)
+
+        assert list(outcomes) == ["3", "2", "5"]
+        assert outcomes["2"].result == ["event-2"]
+        assert all(isinstance(o, ProjectOutcome) and o.ok for o in outcomes.values())
+        assert sorted(api.projects) == ["2", "3", "5"]
+        assert workspace.project.id == "1"
+
+    def test_errors_are_per_project(self, workspace: Workspace, api: _Api) -> None:
+        """A failing project is recorded without stopping the others."""
+        api.failing.add("2")
+
+        outcomes = workspace.map_projects(lambda ws: ws.events(), ["2", "3"])
+
+        assert not outcomes["2"].ok
+        assert outcomes["2"].result is None
+        with pytest.raises(MixpanelHeadlessError):
+            outcomes["2"].unwrap()
+        assert outcomes["3"].unwrap() == ["event-3"]
+
+    def test_snapshots_share_client_resources(self, workspace: Workspace) -> None:
+        """Every snapshot uses the parent's pool, rate limiter and cache."""
+        parent = workspace.api
+        workspace._query_cache = MagicMock()
+
+        def probe(ws: Workspace) -> Any:
+            return ws.api._client, ws.api._rate_limiter, ws._query_cache
+
+        outcomes = workspace.map_projects(probe, ["2", "3", "4"], workers=3)
+
+        for outcome in outcomes.values():
+            assert outcome.result == (
+                parent._client,
+                parent._rate_limiter,
+                workspace._query_cache,
+            )
+        assert parent._client is not None
+        assert not parent._client.is_closed
+
+    def test_defaults_to_accessible_projects(self, workspace: Workspace) -> None:
+        """Without ``projects`` every accessible project is visited."""
+        accessible = [Project(id="7"), Project(id="8")]
+        with patch.object(workspace, "projects", return_value=accessible):
+            outcomes = workspace.map_projects(lambda ws: ws.project.id)
+
+        assert {k: o.result for k, o in outcomes.items()} == {"7": "7", "8": "8"}
+
+    def test_empty_and_invalid_workers(self, workspace: Workspace) -> None:
+        """No projects gives no outcomes; workers must be positive."""
+        assert workspace.map_projects(lambda _ws: None, []) == {}
+        with pytest.raises(ValueError, match="workers"):
+            workspace.map_projects(lambda _ws: None, ["2"], workers=0)
+
+
+class TestMapTargets:
+    """Tests for Workspace.map_targets()."""
+
+    def test_runs_fn_per_target(self, workspace: Workspace) -> None:
+        """Each target's session is resolved and recorded on its outcome."""
+        config = MagicMock()
+        config.list_targets.return_value = [
+            Target(name="ecom", account="test_account", project="10"),
+            Target(name="games", account="test_account", project="20"),
+        ]
+        projects = {"ecom": "10", "games": "20"}
+
+        def resolve(*, target: str, **_kwargs: Any) -> Any:
+            return make_session(project_id=projects[target])
+
+        with (
+            patch.object(workspace_module, "ConfigManager", return_value=config),
+            patch.object(workspace_module, "_load_bridge", return_value=None),
+            patch.object(workspace_module, "_resolve_session", side_effect=resolve),
+        ):
+            outcomes = workspace.map_targets(lambda ws: ws.events())
+
+        assert list(outcomes) == ["ecom", "games"]
+        assert outcomes["ecom"].target == "ecom"
+        assert outcomes["ecom"].project_id == "10"
+        assert outcomes["games"].result == ["event-20"]
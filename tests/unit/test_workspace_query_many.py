@@ -0,0 +1,196 @@
+"""Tests for Workspace.query_many batch execution."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import SecretStr
+
+from mixpanel_headless import QueryOutcome, QuerySpec, Workspace
+from mixpanel_headless._internal.auth.account import ServiceAccount
+from mixpanel_headless._internal.auth.session import Project, Session
+from mixpanel_headless.exceptions import QueryError
+
+_TEST_SESSION = Session(
+    account=ServiceAccount(
+        name="test_account",
+        region="us",
+        username="test_user",
+        secret=SecretStr("test_secret"),
+        default_project="12345",
+    ),
+    project=Project(id="12345"),
+)
+
+
+@pytest.fixture
+def workspace() -> Workspace:
+    """Workspace with a mocked API client."""
+    from mixpanel_headless._internal.api_client import MixpanelAPIClient
+
+    client = MagicMock(spec=MixpanelAPIClient)
+    return Workspace(session=_TEST_SESSION, _api_client=client)
+
+
+class _ConcurrencyProbe:
+    """Fake query method that records how many calls overlap."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        """Initialize.
+
+        Args:
+            delay: Seconds each call takes.
+        """
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs: Any) -> Any:
+        """Simulate one query."""
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return kwargs
+
+
+class TestQuerySpec:
+    """Tests for the QuerySpec type."""
+
+    @pytest.mark.parametrize(
+        ("factory", "kind"),
+        [
+            (QuerySpec.insights, "insights"),
+            (QuerySpec.funnel, "funnel"),
+            (QuerySpec.retention, "retention"),
+            (QuerySpec.flow, "flow"),
+            (QuerySpec.segmentation, "segmentation"),
+            (QuerySpec.saved_report, "saved_report"),
+            (QuerySpec.saved_flows, "saved_flows"),
+        ],
+    )
+    def test_factories(self, factory: Callable[..., QuerySpec], kind: str) -> None:
+        """Each factory records its kind, arguments by name and label."""
+        args = ("a", "b") if kind == "retention" else ("a",)
+        extra = {} if kind == "saved_flows" else {"from_date": "d", "to_date": "d"}
+        spec = factory(*args, label="x", **extra)
+
+        assert spec.kind == kind
+        assert tuple(spec.kwargs.values())[: len(args)] == args
+        assert {k: spec.kwargs[k] for k in extra} == extra
+        assert spec.label == "x"
+
+    def test_arguments_are_named(self) -> None:
+        """Leading arguments are stored under the method's parameter names."""
+        spec = QuerySpec.retention("Signup", "Login", last=7)
+
+        assert spec.kwargs == {
+            "born_event": "Signup",
+            "return_event": "Login",
+            "last": 7,
+        }
+
+    def test_missing_required_argument_rejected(self) -> None:
+        """A spec that cannot be run fails at construction."""
+        with pytest.raises(ValueError, match="requires from_date, to_date"):
+            QuerySpec.segmentation("Login")
+        with pytest.raises(ValueError, match="requires steps"):
+            QuerySpec("funnel")
+
+    def test_unknown_kind_rejected(self) -> None:
+        """An unknown kind fails at construction."""
+        with pytest.raises(ValueError, match="Unknown query kind"):
+            QuerySpec("jql")  # type: ignore[arg-type]
+
+
+class TestQueryMany:
+    """Tests for Workspace.query_many()."""
+
+    def test_dispatches_and_preserves_order(self, workspace: Workspace) -> None:
+        """Each spec runs its method; outcomes follow input order."""
+        names = [
+            "query",
+            "query_funnel",
+            "query_retention",
+            "query_flow",
+            "segmentation",
+            "query_saved_report",
+        ]
+        specs = [
+            QuerySpec.insights("Login", last=7),
+            QuerySpec.funnel(["Signup", "Purchase"]),
+            QuerySpec.retention("Signup", "Login"),
+            QuerySpec.flow("Login", forward=2),
+            QuerySpec.segmentation(
+                "Login", from_date="2024-01-01", to_date="2024-01-31"
+            ),
+            QuerySpec.saved_report(42),
+        ]
+        patches = [
+            patch.object(workspace, name, side_effect=lambda *a, n=name, **k: (n, a, k))
+            for name in names
+        ]
+        for p in patches:
+            p.start()
+        try:
+            outcomes = workspace.query_many(specs)
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert [o.spec for o in outcomes] == specs
+        assert [o.result[0] for o in outcomes] == names
+        assert outcomes[0].result[1:] == ((), {"events": "Login", "last": 7})
+        assert all(o.ok for o in outcomes)
+
+    def test_errors_are_per_item(self, workspace: Workspace) -> None:
+        """A failing query is reported without stopping the others."""
+
+        def fake_query(events: str, **_kwargs: Any) -> str:
+            if events == "Bad":
+                raise QueryError("Unknown event")
+            return events
+
+        specs = [QuerySpec.insights(e) for e in ["A", "Bad", "C"]]
+        with patch.object(workspace, "query", side_effect=fake_query):
+            outcomes = workspace.query_many(specs)
+
+        assert [o.ok for o in outcomes] == [True, False, True]
+        assert [o.result for o in outcomes] == ["A", None, "C"]
+        assert isinstance(outcomes[1].error, QueryError)
+        with pytest.raises(QueryError, match="Unknown event"):
+            outcomes[1].unwrap()
+        assert outcomes[2].unwrap() == "C"
+
+    def test_worker_limit(self, workspace: Workspace) -> None:
+        """No more than max_workers queries run at once."""
+        probe = _ConcurrencyProbe()
+        specs = [QuerySpec.insights(str(i)) for i in range(12)]
+
+        with patch.object(workspace, "query", side_effect=probe):
+            outcomes = workspace.query_many(specs, max_workers=3)
+
+        assert 1 < probe.peak <= 3
+        assert [o.result for o in outcomes] == [{"events": str(i)} for i in range(12)]
+
+    def test_empty_and_invalid_workers(self, workspace: Workspace) -> None:
+        """No specs gives no outcomes; max_workers must be positive."""
+        assert workspace.query_many([]) == []
+        with pytest.raises(ValueError, match="max_workers"):
+            workspace.query_many([QuerySpec.insights("A")], max_workers=0)
+
+    def test_outcome_elapsed(self, workspace: Workspace) -> None:
+        """Outcomes record the time spent on each query."""
+        with patch.object(workspace, "query", side_effect=_ConcurrencyProbe(0.01)):
+            (outcome,) = workspace.query_many([QuerySpec.insights("A")])
+
+        assert isinstance(outcome, QueryOutcome)
+        assert outcome.elapsed >= 0.01
@@ -0,0 +1,184 @@
+"""Tests for Workspace.run_dashboard concurrent dashboard evaluation."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import SecretStr
+
+from mixpanel_headless import Workspace
+from mixpanel_headless._internal.auth.account import ServiceAccount
+from mixpanel_headless._internal.auth.session import Project, Session
+from mixpanel_headless.exceptions import QueryError
+from mixpanel_headless.types import Bookmark, Dashboard
+
+_TEST_SESSION = Session(
+    account=ServiceAccount(
+        name="test_account",
+        region="us",
+        username="test_user",
+        secret=SecretStr("test_secret"),
+        default_project="12345",
+    ),
+    project=Project(id="12345"),
+)
+
+_MODIFIED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bookmark(bookmark_id: int, bookmark_type: str, modified: datetime) -> Bookmark:
+    """Build a Bookmark as returned by list_bookmarks_v2."""
+    return Bookmark.model_validate(
+        {
+            "id": bookmark_id,
+            "name": f"Report {bookmark_id}",
+            "type": bookmark_type,
+            "modified": modified.isoformat(),
+        }
+    )
+
+
+class _FakeApp:
+    """Dashboard, bookmark and saved-report stand-ins for one Workspace."""
+
+    def __init__(self) -> None:
+        """Initialize a dashboard with insights, funnel and flows reports."""
+        self.types = {1: "insights", 2: "funnels", 3: "flows"}
+        self.modified = dict.fromkeys(self.types, _MODIFIED)
+        self.failing: set[int] = set()
+        self.calls: list[int] = []
+
+    def get_dashboard(self, dashboard_id: int) -> Dashboard:
+        """Return the dashboard, with a text card and a duplicate report."""
+        report = {
+            str(100 + bid): {"id": bid, "type": btype, "name": f"Report {bid}"}
+            for bid, btype in self.types.items()
+        }
+        report["199"] = {"id": 1, "type": "insights", "name": "Report 1 (link)"}
+        return Dashboard.model_validate(
+            {
+                "id": dashboard_id,
+                "title": "KPIs",
+                "contents": {"report": report, "text": {"5": {"markdown": "hi"}}},
+            }
+        )
+
+    def list_bookmarks_v2(self, *, ids: list[int], **_kwargs: Any) -> list[Bookmark]:
+        """Return bookmark metadata for ``ids``."""
+        return [_bookmark(i, self.types[i], self.modified[i]) for i in ids]
+
+    def query_saved_report(self, bookmark_id: int, **kwargs: Any) -> Any:
+        """Fake saved-report query."""
+        self.calls.append(bookmark_id)
+        if bookmark_id in self.failing:
+            raise QueryError("Report failed")
+        return ("report", bookmark_id, kwargs["bookmark_type"])
+
+    def query_saved_flows(self, bookmark_id: int) -> Any:
+        """Fake saved-flows query."""
+        self.calls.append(bookmark_id)
+        return ("flows", bookmark_id)
+
+
+@pytest.fixture
+def app() -> _FakeApp:
+    """Fake App API state."""
+    return _FakeApp()
+
+
+@pytest.fixture
+def workspace(app: _FakeApp) -> Iterator[Workspace]:
+    """Workspace whose dashboard and report methods use ``app``."""
+    from mixpanel_headless._internal.api_client import MixpanelAPIClient
+
+    ws = Workspace(session=_TEST_SESSION, _api_client=MagicMock(spec=MixpanelAPIClient))
+    names = [
+        "get_dashboard",
+        "list_bookmarks_v2",
+        "query_saved_report",
+        "query_saved_flows",
+    ]
+    patches = [patch.object(ws, n, side_effect=getattr(app, n)) for n in names]
+    for p in patches:
+        p.start()
+    yield ws
+    for p in patches:
+        p.stop()
+
+
+class TestRunDashboard:
+    """Tests for Workspace.run_dashboard()."""
+
+    def test_runs_each_report_once(self, workspace: Workspace, app: _FakeApp) -> None:
+        """Every distinct report runs with the method for its type."""
+        reports = workspace.run_dashboard(7)
+
+        assert list(reports) == [1, 2, 3]
+        assert reports[1].result == ("report", 1, "insights")
+        assert reports[2].result == ("report", 2, "funnels")
+        assert reports[3].result == ("flows", 3)
+        assert reports[2].name == "Report 2"
+        assert all(r.ok and not r.cached for r in reports.values())
+        assert sorted(app.calls) == [1, 2, 3]
+
+    def test_unchanged_reports_are_cached(
+        self, workspace: Workspace, app: _FakeApp
+    ) -> None:
+        """A second run only recomputes reports whose bookmark changed."""
+        workspace.run_dashboard(7)
+        app.calls.clear()
+        app.modified[2] = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+        reports = workspace.run_dashboard(7)
+
+        assert app.calls == [2]
+        assert reports[1].cached and reports[1].result == ("report", 1, "insights")
+        assert not reports[2].cached
+        assert reports[2].modified == app.modified[2]
+
+    def test_refresh_and_ttl_bypass_cache(
+        self, workspace: Workspace, app: _FakeApp
+    ) -> None:
+        """refresh=True and an expired TTL both recompute every report."""
+        workspace.run_dashboard(7)
+        app.calls.clear()
+        workspace.run_dashboard(7, refresh=True)
+        assert sorted(app.calls) == [1, 2, 3]
+
+        app.calls.clear()
+        workspace.run_dashboard(7, cache_ttl=0)
+        assert sorted(app.calls) == [1, 2, 3]
+
+    def test_clear_query_cache(self, workspace: Workspace, app: _FakeApp) -> None:
+        """clear_query_cache() drops cached dashboard results."""
+        workspace.run_dashboard(7)
+        app.calls.clear()
+
+        workspace.clear_query_cache()
+        workspace.run_dashboard(7)
+
+        assert sorted(app.calls) == [1, 2, 3]
+
+    def test_failed_report_is_isolated_and_not_cached(
+        self, workspace: Workspace, app: _FakeApp
+    ) -> None:
+        """A failing report is reported per item and retried next run."""
+        app.failing.add(1)
+
+        reports = workspace.run_dashboard(7)
+
+        assert isinstance(reports[1].error, QueryError)
+        assert reports[2].ok and reports[3].ok
+        app.failing.clear()
+        app.calls.clear()
+        assert workspace.run_dashboard(7)[1].ok
+        assert app.calls == [1]
+
+    def test_invalid_workers(self, workspace: Workspace) -> None:
+        """workers must be positive."""
+        with pytest.raises(ValueError, match="workers"):
+            workspace.run_dashboard(7, workers=0)
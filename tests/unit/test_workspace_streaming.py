@@ -7,6 +7,7 @@ stream data directly from the Mixpanel API.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
@@ -742,3 +743,225 @@ class TestRawProfileFormat:
             assert profile["$properties"]["$last_seen"] == "2024-01-15T14:30:00"
         finally:
             ws.close()
+
+
+class TestStreamEventsParallel:
+    """Tests for stream_events(parallel=...)."""
+
+    def test_parallel_uses_sharded_export(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+    ) -> None:
+        """parallel=N should route through export_events_parallel."""
+        ws = workspace_factory()
+        mock_api_client.export_events_parallel.return_value = iter(
+            [raw_event("PageView", "user_1")]
+        )
+
+        events = list(
+            ws.stream_events(
+                from_date="2024-01-01",
+                to_date="2024-01-31",
+                events=["PageView"],
+                parallel=8,
+                ordered=True,
+            )
+        )
+
+        assert events[0]["event_name"] == "PageView"
+        mock_api_client.export_events_parallel.assert_called_once_with(
+            "2024-01-01",
+            "2024-01-31",
+            events=["PageView"],
+            where=None,
+            workers=8,
+            ordered=True,
+        )
+        mock_api_client.export_events.assert_not_called()
+
+    def test_parallel_with_limit_rejected(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+    ) -> None:
+        """limit is per-request, so it cannot be combined with parallel."""
+        ws = workspace_factory()
+
+        with pytest.raises(ValueError, match="parallel"):
+            list(
+                ws.stream_events(
+                    from_date="2024-01-01", to_date="2024-01-02", limit=10, parallel=2
+                )
+            )
+        mock_api_client.export_events_parallel.assert_not_called()
+
+
+class TestStreamProfilesParallel:
+    """Tests for stream_profiles(parallel=...)."""
+
+    def test_parallel_uses_concurrent_pages(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+    ) -> None:
+        """parallel=N should route through export_profiles_parallel."""
+        ws = workspace_factory()
+        mock_api_client.export_profiles_parallel.return_value = iter(
+            [raw_profile("user_1", "2024-01-15T10:00:00")]
+        )
+
+        profiles = list(ws.stream_profiles(cohort_id="42", parallel=5))
+
+        assert profiles[0]["distinct_id"] == "user_1"
+        mock_api_client.export_profiles_parallel.assert_called_once_with(
+            where=None,
+            cohort_id="42",
+            output_properties=None,
+            distinct_id=None,
+            distinct_ids=None,
+            group_id=None,
+            behaviors=None,
+            as_of_timestamp=None,
+            include_all_users=False,
+            workers=5,
+        )
+        mock_api_client.export_profiles.assert_not_called()
+
+
+class TestExportEventsToJsonl:
+    """Tests for export_events_to_jsonl()."""
+
+    def test_writes_manifest_next_to_output(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Each day should be fetched separately and checkpointed."""
+        ws = workspace_factory()
+        mock_api_client.export_events.side_effect = lambda *_a, **_k: iter(
+            [raw_event("PageView")]
+        )
+        out = tmp_path / "events.jsonl"
+
+        result = ws.export_events_to_jsonl(
+            out, from_date="2024-01-01", to_date="2024-01-02"
+        )
+
+        assert result.lines == 2
+        assert result.manifest_path == tmp_path / "events.jsonl.manifest.json"
+        assert result.manifest_path.exists()
+        assert mock_api_client.export_events.call_count == 2
+
+
+class TestExportEventsToParquet:
+    """Tests for export_events_to_parquet()."""
+
+    def test_writes_partitioned_dataset(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Events should be written under event_date/event_name partitions."""
+        ws = workspace_factory()
+        mock_api_client.export_events.side_effect = lambda *_a, **_k: iter(
+            [raw_event("PageView")]
+        )
+
+        result = ws.export_events_to_parquet(
+            tmp_path, from_date="2024-01-01", to_date="2024-01-02"
+        )
+
+        assert result.rows == 2
+        assert result.days_written == 2
+        assert {f.parent.parent.name for f in result.files} == {
+            "event_date=2024-01-01",
+            "event_date=2024-01-02",
+        }
+        assert {f.parent.name for f in result.files} == {"event_name=PageView"}
+        assert mock_api_client.export_events.call_count == 2
+
+
+class TestStreamArrowFormat:
+    """Tests for stream_events()/stream_profiles() with format="arrow"."""
+
+    def test_events_batched_with_fixed_columns(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+    ) -> None:
+        """Events should arrive as RecordBatches of at most batch_size rows."""
+        pa = pytest.importorskip("pyarrow")
+        ws = workspace_factory()
+        mock_api_client.export_events.return_value = iter(
+            [raw_event(timestamp=1705328400 + n, plan="pro") for n in range(5)]
+        )
+
+        batches = list(
+            ws.stream_events(
+                from_date="2024-01-01",
+                to_date="2024-01-01",
+                format="arrow",
+                batch_size=2,
+            )
+        )
+
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+        first = batches[0]
+        assert first.schema.names == [
+            "event_name",
+            "event_time",
+            "distinct_id",
+            "insert_id",
+            "plan",
+        ]
+        assert first.schema.field("event_time").type == pa.timestamp("us", tz="UTC")
+        assert first.column("insert_id").to_pylist() == [
+            "evt_1705328400",
+            "evt_1705328401",
+        ]
+
+    def test_profiles_batched(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+    ) -> None:
+        """Profiles should arrive as RecordBatches with flattened properties."""
+        pytest.importorskip("pyarrow")
+        ws = workspace_factory()
+        mock_api_client.export_profiles.return_value = iter(
+            [raw_profile("a", plan="pro"), raw_profile("b", last_seen=None)]
+        )
+
+        (batch,) = ws.stream_profiles(format="arrow")
+
+        assert batch.to_pylist() == [
+            {"distinct_id": "a", "last_seen": "2024-01-15T14:30:00", "plan": "pro"},
+            {"distinct_id": "b", "last_seen": None, "plan": None},
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"format": "arrow", "raw": True},
+            {"format": "arrow", "batch_size": 0},
+            {"format": "csv"},
+        ],
+    )
+    def test_invalid_format_options_rejected(
+        self,
+        workspace_factory: Callable[..., Workspace],
+        mock_api_client: MagicMock,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Bad format combinations should raise before any API call."""
+        ws = workspace_factory()
+
+        with pytest.raises(ValueError):
+            list(
+                ws.stream_events(from_date="2024-01-01", to_date="2024-01-01", **kwargs)
+            )
+
+        mock_api_client.export_events.assert_not_called()